@@ -7,7 +7,7 @@
 import os
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 
 class Config:
@@ -126,26 +126,123 @@ class Config:
         return {
             # 통일된 키 사용
             "media_dir": "",
+            "media_roots": [],                # 여러 디스크의 미디어 루트 목록 (비어 있으면 media_dir 하나)
+                                              # 항목은 경로 문자열 또는 {"path": ..., "scan_workers": ...}
             "output_dir": "",
             "delete_original": False,
             "extract_english": True,
             "convert_broken": True,
+            "output_suffix": "_utf8",         # 덮어쓰지 않을 때 변환 파일명 접미사
+            "overwrite": True,                # 인코딩 변환 시 원본 덮어쓰기 여부
             "process_multi": True,
             "extract_from_media": False,
             
             # 추가 설정
             "media_extensions": [".mp4", ".mkv", ".avi", ".mov", ".wmv"],
             "subtitle_extension": ".srt",
+            "subtitle_extensions": [".srt", ".vtt", ".smi", ".ass", ".ssa"],
             "min_english_ratio": 0.2,
+            "tag_mixed_language_lines": True,  # 다국어 자막의 줄 단위 언어 태깅 여부
+            "index_sentences": True,          # 큐에 걸친 문장 인덱스(문장 단위 검색) 생성 여부
+            "scan_use_manifest": True,        # 증분 스캔 시 수정 시간이 같은 디렉토리는 저장된 목록 사용
+            "scan_workers": 8,                # 디렉토리 동시 나열 스레드 수 (1이면 순차 나열, NAS 등 지연이 큰 볼륨용)
+            "scan_directory_timeout": 60,     # 디렉토리 하나를 나열할 때 기다릴 최대 시간(초), 넘으면 건너뜀
+            "scan_queue_size": 1024,          # 스캔 → 인덱싱 사이 큐에 담아 둘 최대 미디어 파일 수 (우선순위로 고르는 범위)
+            "scan_reconcile": True,           # 스캔 완료 후 디스크에서 사라진 미디어를 데이터베이스에서 정리
+            "scan_detect_changes": False,     # 증분 스캔에서 크기/수정 시간이 바뀐 인덱싱된 파일을 다시 처리
+            "scan_dedupe": True,              # 하드 링크/복사본은 대표 미디어 하나만 인덱싱하고 나머지는 별칭으로 기록
+            "scan_rules": [],                 # gitignore 형식 포함/제외 규칙 (미디어 루트 기준, 예: "Samples/", "!Extras/Keep/")
+                                              # 제외된 디렉토리는 하위 전체를 나열하지 않음
+            "scan_rules_ignore_case": True,   # 스캔 규칙 비교 시 대소문자 무시
             "db_path": "media_index.db",
             "max_threads": os.cpu_count() or 4,
+            "indexer_parse_workers": os.cpu_count() or 4,  # 자막 파싱 프로세스 수
+            "indexer_pipeline": {},          # 인덱싱 파이프라인 단계별 설정 (discover/read/decode/parse/normalize/write)
+                                             # 예: {"read": {"workers": 8, "queue_size": 128}, "parse": {"workers": 4, "processes": True}}
+            "indexer_priority": {},          # 인덱싱 우선순위 (enabled, requested/searched/bookmarked/recency/size 가중치, recency_days)
+                                             # 예: {"recency": 50, "size": 0} - 최근 파일을 더 먼저, 크기는 무시
             "last_scan_time": None,
             "indexer_retry_count": 3,        # 인덱싱 오류 시 최대 재시도 횟수
             "indexer_retry_interval": 10,    # 인덱싱 재시도 간격(초)
-            "auto_restart_indexing": False,   # 오류 발생 시 자동 재시작 여부 (False로 변경)
+            "auto_restart_indexing": False,   # 서버 시작 시 중단된 인덱싱의 끝나지 않은 파일 자동 이어서 처리 여부
+            "watch_enabled": False,          # 시작 시 감시 모드(변경 파일만 인덱싱) 자동 실행 여부
+            "watch_use_inotify": True,       # Linux에서 inotify 사용 (False면 폴링)
+            "watch_debounce_seconds": 2.0,   # 같은 미디어의 변경을 모으는 대기 시간(초)
+            "watch_poll_interval": 10.0,     # 폴링 감시 시 파일 목록 비교 간격(초)
             "default_search_method": "like"  # 기본 검색 방식 ('like' 또는 'fts')
         }
     
+    def get_media_roots(self) -> List[Dict[str, Any]]:
+        """
+        미디어 루트 목록 반환
+        
+        media_roots가 비어 있으면 media_dir 하나를 루트로 사용합니다.
+        루트마다 디렉토리 나열 스레드 수(scan_workers)를 따로 지정할 수 있고, 없으면 전역 scan_workers를 사용합니다.
+        
+        Returns:
+            List[Dict[str, Any]]: 루트 목록 (path, scan_workers), 중복 경로는 한 번만 포함
+        """
+        entries = self.data.get("media_roots") or [self.data.get("media_dir", "")]
+        default_workers = self.data.get("scan_workers", 8)
+        
+        roots = []
+        seen = set()
+        for entry in entries:
+            if isinstance(entry, dict):
+                path = entry.get("path", "")
+                scan_workers = entry.get("scan_workers") or default_workers
+            else:
+                path = entry
+                scan_workers = default_workers
+            
+            if not path:
+                continue
+            path = os.path.normpath(path)
+            if path in seen:
+                continue
+            seen.add(path)
+            roots.append({"path": path, "scan_workers": scan_workers})
+        
+        return roots
+    
+    def get_subtitle_extensions(self) -> List[str]:
+        """
+        인덱싱할 자막 파일 확장자 목록 반환
+        
+        config.get은 기본값을 합치지 않으므로, 예전 설정 파일처럼 subtitle_extensions가 없으면
+        기본 목록(.srt, .vtt, .smi, .ass, .ssa)에 예전 단일 설정(subtitle_extension)을 더해 사용합니다.
+        
+        Returns:
+            List[str]: 자막 파일 확장자 목록 (소문자, 중복 없음)
+        """
+        extensions = self.data.get("subtitle_extensions")
+        if not extensions:
+            extensions = list(self._get_default_config()["subtitle_extensions"])
+            legacy = self.data.get("subtitle_extension")
+            if legacy:
+                extensions.append(legacy)
+        
+        return list(dict.fromkeys(ext.lower() for ext in extensions if ext))
+    
+    def find_media_root(self, path: str) -> Optional[str]:
+        """
+        경로가 속한 미디어 루트 찾기 (여러 루트가 겹치면 가장 깊은 루트)
+        
+        Args:
+            path: 파일 또는 디렉토리 경로
+            
+        Returns:
+            Optional[str]: 미디어 루트 경로 (어느 루트에도 속하지 않으면 None)
+        """
+        path = os.path.normpath(path)
+        found = None
+        for root in self.get_media_roots():
+            root_dir = root["path"]
+            if path == root_dir or path.startswith(root_dir.rstrip(os.sep) + os.sep):
+                if found is None or len(root_dir) > len(found):
+                    found = root_dir
+        return found
+    
     def get_absolute_media_path(self, relative_path: str) -> str:
         """
         상대 경로를 절대 경로로 변환
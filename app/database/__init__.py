@@ -166,7 +166,8 @@ class Database:
         """특정 미디어의 모든 자막 삭제"""
         return clear_subtitles_for_media(media_id)
     
-    def search_subtitles(self, query, lang=None, start_time=None, end_time=None, page=1, per_page=50, search_method='fts'):
+    def search_subtitles(self, query, lang=None, start_time=None, end_time=None, page=1, per_page=50, search_method='fts', scope='cue',
+                         **media_filters):
         """
         자막 내용 검색
         
@@ -178,15 +179,17 @@ class Database:
             page: 페이지 번호 (1부터 시작)
             per_page: 페이지당 결과 수
             search_method: 검색 방식 ('like' 또는 'fts', 기본값: 'fts')
+            scope: 검색 범위 ('cue' 또는 'sentence', 기본값: 'cue')
+            **media_filters: 미디어 메타데이터 필터 (show, season, episode, year, resolution, root)
             
         Returns:
             List[Dict[str, Any]]: 검색 결과 목록
         """
-        return search_subtitles(query, lang, start_time, end_time, page, per_page, search_method)
+        return search_subtitles(query, lang, start_time, end_time, page, per_page, search_method, scope, **media_filters)
     
-    def estimate_total_count(self, query, lang=None, start_time=None, end_time=None):
+    def estimate_total_count(self, query, lang=None, start_time=None, end_time=None, scope='cue', **media_filters):
         """검색 조건에 맞는 총 결과 수 추정"""
-        return estimate_total_count(query, lang, start_time, end_time)
+        return estimate_total_count(query, lang, start_time, end_time, scope=scope, **media_filters)
     
     def get_all_stats(self):
         """모든 통계 정보를 반환"""
@@ -20,11 +20,33 @@ from app.database.jobs.retry_policy import (
     reset_retry_count
 )
 
+from app.database.jobs.indexing_files import (
+    FILE_STATE_QUEUED,
+    FILE_STATE_PARSING,
+    FILE_STATE_WRITTEN,
+    FILE_STATE_FAILED,
+    queue_indexing_files,
+    start_indexing_files,
+    mark_indexing_file_written,
+    mark_indexing_file_failed,
+    requeue_indexing_files,
+    fail_exhausted_indexing_files,
+    get_unfinished_indexing_files,
+    get_indexing_file_counts,
+    get_failed_indexing_files
+)
+
 __all__ = [
     # 작업 상태 관리
     'get_job_status', 'update_job_status', 'get_all_jobs',
     'create_job', 'complete_job', 'fail_job', 'get_job_progress',
     
     # 재시도 정책
-    'should_retry_job', 'increment_retry_count', 'reset_retry_count'
+    'should_retry_job', 'increment_retry_count', 'reset_retry_count',
+    
+    # 인덱싱 파일 상태
+    'FILE_STATE_QUEUED', 'FILE_STATE_PARSING', 'FILE_STATE_WRITTEN', 'FILE_STATE_FAILED',
+    'queue_indexing_files', 'start_indexing_files', 'mark_indexing_file_written', 'mark_indexing_file_failed',
+    'requeue_indexing_files', 'fail_exhausted_indexing_files', 'get_unfinished_indexing_files',
+    'get_indexing_file_counts', 'get_failed_indexing_files'
 ]
@@ -0,0 +1,335 @@
+"""
+인덱싱 파일 상태 모듈
+
+자막 파일(MKV 내장 자막은 미디어 파일)마다 인덱싱 상태를 데이터베이스에 기록합니다.
+queued(스캔에서 처리 대상으로 확인) → parsing(파이프라인에서 처리 시작) → written(자막 저장 완료) 또는 failed
+
+written은 자막 행과 같은 트랜잭션에서 기록되므로, 프로세스가 중간에 종료되어도
+written이 아닌 파일에는 저장된 자막이 없고 그 파일만 다시 처리하면 됩니다.
+"""
+
+import logging
+from typing import List, Dict, Any, Optional, Iterable
+
+from app.utils.logging import setup_module_logger
+from app.database.connection import get_connection, execute_query, fetch_one, fetch_all, connection_context
+
+# 로거 초기화
+logger = setup_module_logger("database.jobs.indexing_files")
+
+# 파일 상태 상수
+FILE_STATE_QUEUED = "queued"
+FILE_STATE_PARSING = "parsing"
+FILE_STATE_WRITTEN = "written"
+FILE_STATE_FAILED = "failed"
+
+# 끝나지 않은 상태 (다시 처리할 대상)
+UNFINISHED_FILE_STATES = (FILE_STATE_QUEUED, FILE_STATE_PARSING)
+
+def _set_file_states(media_id: int, paths: Iterable[str], state: str, count_attempt: bool) -> bool:
+    """
+    미디어의 자막 파일 상태를 한 트랜잭션으로 기록
+
+    Args:
+        media_id: 미디어 ID
+        paths: 자막 파일 경로 목록
+        state: 기록할 상태
+        count_attempt: 처리 시도 횟수를 늘릴지 여부
+
+    Returns:
+        bool: 성공 여부
+    """
+    rows = [(path, media_id, state, int(count_attempt)) for path in paths if path]
+    if not rows:
+        return True
+
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(f'''
+        INSERT INTO indexing_files (path, media_id, state, attempts, updated_at)
+        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(path) DO UPDATE SET
+            media_id = excluded.media_id,
+            state = excluded.state,
+            error = NULL,
+            attempts = indexing_files.attempts + {int(count_attempt)},
+            updated_at = CURRENT_TIMESTAMP
+        ''', rows)
+        cursor.execute("COMMIT")
+        return True
+
+    except Exception as e:
+        if conn:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"인덱싱 파일 상태 기록 중 오류 발생: {e} - media_id={media_id}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return False
+
+    finally:
+        if conn:
+            conn.close()
+
+def queue_indexing_files(media_id: int, paths: Iterable[str]) -> bool:
+    """
+    자막 파일을 처리 대상(queued)으로 기록
+
+    Args:
+        media_id: 미디어 ID
+        paths: 자막 파일 경로 목록
+
+    Returns:
+        bool: 성공 여부
+    """
+    return _set_file_states(media_id, paths, FILE_STATE_QUEUED, count_attempt=False)
+
+def start_indexing_files(media_id: int, paths: Iterable[str]) -> bool:
+    """
+    자막 파일 처리 시작(parsing) 기록 (처리 시도 횟수 증가)
+
+    Args:
+        media_id: 미디어 ID
+        paths: 자막 파일 경로 목록
+
+    Returns:
+        bool: 성공 여부
+    """
+    return _set_file_states(media_id, paths, FILE_STATE_PARSING, count_attempt=True)
+
+def mark_indexing_file_written(path: str, subtitle_count: int = 0, external_conn=None) -> bool:
+    """
+    자막 파일 저장 완료(written) 기록
+
+    자막 삽입 트랜잭션의 연결을 전달하면 같은 트랜잭션에서 기록되어,
+    자막 행이 커밋되었으면 상태도 반드시 written입니다.
+
+    Args:
+        path: 자막 파일 경로
+        subtitle_count: 저장된 자막 수
+        external_conn: 외부에서 전달된 데이터베이스 연결 (있으면 커밋하지 않음)
+
+    Returns:
+        bool: 성공 여부
+    """
+    conn = external_conn
+    conn_created = False
+    try:
+        if conn is None:
+            conn = get_connection()
+            conn_created = True
+
+        conn.execute('''
+        UPDATE indexing_files
+        SET state = ?, subtitle_count = ?, error = NULL, updated_at = CURRENT_TIMESTAMP
+        WHERE path = ?
+        ''', (FILE_STATE_WRITTEN, subtitle_count, path))
+
+        if conn_created:
+            conn.commit()
+        return True
+
+    except Exception as e:
+        if external_conn is not None:
+            raise
+        logger.error(f"인덱싱 파일 완료 기록 중 오류 발생: {e} - {path}")
+        return False
+
+    finally:
+        if conn_created and conn:
+            conn.close()
+
+def mark_indexing_file_failed(path: str, error: str) -> bool:
+    """
+    자막 파일 처리 실패(failed) 기록
+
+    Args:
+        path: 자막 파일 경로
+        error: 오류 메시지
+
+    Returns:
+        bool: 성공 여부
+    """
+    try:
+        execute_query('''
+        UPDATE indexing_files
+        SET state = ?, error = ?, updated_at = CURRENT_TIMESTAMP
+        WHERE path = ?
+        ''', (FILE_STATE_FAILED, str(error)[:500], path))
+        return True
+    except Exception as e:
+        logger.error(f"인덱싱 파일 실패 기록 중 오류 발생: {e} - {path}")
+        return False
+
+def requeue_indexing_files(paths: Iterable[str]) -> int:
+    """
+    처리 중(parsing)이던 자막 파일을 다시 처리 대상으로 되돌림 (인덱싱을 중지한 경우)
+
+    중지는 파일 문제가 아니므로 처리 시도 횟수도 되돌립니다.
+
+    Args:
+        paths: 자막 파일 경로 목록
+
+    Returns:
+        int: 되돌린 파일 수
+    """
+    rows = [(path,) for path in paths if path]
+    if not rows:
+        return 0
+
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("BEGIN IMMEDIATE")
+        before = conn.total_changes
+        cursor.executemany(f'''
+        UPDATE indexing_files
+        SET state = '{FILE_STATE_QUEUED}', attempts = MAX(attempts - 1, 0), updated_at = CURRENT_TIMESTAMP
+        WHERE path = ? AND state = '{FILE_STATE_PARSING}'
+        ''', rows)
+        changed = conn.total_changes - before
+        cursor.execute("COMMIT")
+        return changed
+
+    except Exception as e:
+        if conn:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"인덱싱 파일 상태 되돌리기 중 오류 발생: {e}")
+        return 0
+
+    finally:
+        if conn:
+            conn.close()
+
+def fail_exhausted_indexing_files(max_attempts: int) -> int:
+    """
+    처리 시도 횟수를 다 쓴 미완료 파일을 실패로 기록
+
+    처리 중에 프로세스가 여러 번 종료된 파일(파서 충돌 등)을 계속 다시 시도하지 않도록 합니다.
+
+    Args:
+        max_attempts: 최대 처리 시도 횟수
+
+    Returns:
+        int: 실패로 기록한 파일 수
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(f'''
+        UPDATE indexing_files
+        SET state = '{FILE_STATE_FAILED}',
+            error = '처리 중 프로세스가 ' || attempts || '번 종료되어 건너뜀',
+            updated_at = CURRENT_TIMESTAMP
+        WHERE state = '{FILE_STATE_PARSING}' AND attempts >= ?
+        ''', (max_attempts,))
+
+        conn.commit()
+        return cursor.rowcount
+
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        logger.error(f"반복 실패 파일 기록 중 오류 발생: {e}")
+        return 0
+
+    finally:
+        if conn:
+            conn.close()
+
+def get_unfinished_indexing_files(root_dir: Optional[str] = None) -> Dict[int, Dict[str, Any]]:
+    """
+    끝나지 않은(queued, parsing) 자막 파일을 미디어별로 조회
+
+    연결이 끊긴 미디어 루트의 미디어는 제외합니다.
+
+    Args:
+        root_dir: 이 디렉토리 아래 미디어만 조회 (None이면 전체)
+
+    Returns:
+        Dict[int, Dict[str, Any]]: 미디어 ID → id, path, subtitle_files (미디어 ID 순)
+    """
+    try:
+        sql = f'''
+        SELECT f.path, f.media_id, m.path AS media_path
+        FROM indexing_files f
+        JOIN media_files m ON m.id = f.media_id
+        WHERE f.state IN ({", ".join(f"'{state}'" for state in UNFINISHED_FILE_STATES)}) AND m.available = 1
+        '''
+        params: List[Any] = []
+
+        if root_dir:
+            import os
+            prefix = root_dir.rstrip(os.sep) + os.sep
+            sql += " AND substr(m.path, 1, ?) = ?"
+            params.extend([len(prefix), prefix])
+
+        sql += " ORDER BY f.media_id, f.path"
+
+        media: Dict[int, Dict[str, Any]] = {}
+        for row in fetch_all(sql, tuple(params)):
+            item = media.get(row["media_id"])
+            if item is None:
+                item = media[row["media_id"]] = {
+                    "id": row["media_id"],
+                    "path": row["media_path"],
+                    "subtitle_files": []
+                }
+            item["subtitle_files"].append(row["path"])
+        return media
+
+    except Exception as e:
+        logger.error(f"미완료 인덱싱 파일 조회 중 오류 발생: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return {}
+
+def get_indexing_file_counts() -> Dict[str, int]:
+    """
+    상태별 자막 파일 수
+
+    Returns:
+        Dict[str, int]: 상태 → 파일 수 (queued, parsing, written, failed)
+    """
+    counts = {state: 0 for state in (FILE_STATE_QUEUED, FILE_STATE_PARSING, FILE_STATE_WRITTEN, FILE_STATE_FAILED)}
+    try:
+        for row in fetch_all("SELECT state, COUNT(*) AS count FROM indexing_files GROUP BY state"):
+            counts[row["state"]] = row["count"]
+    except Exception as e:
+        logger.error(f"인덱싱 파일 상태 집계 중 오류 발생: {e}")
+    return counts
+
+def get_failed_indexing_files(limit: int = 100) -> List[Dict[str, Any]]:
+    """
+    처리에 실패한 자막 파일 목록 (최근 순)
+
+    Args:
+        limit: 최대 개수
+
+    Returns:
+        List[Dict[str, Any]]: path, media_id, error, attempts, updated_at
+    """
+    try:
+        return fetch_all(f'''
+        SELECT path, media_id, error, attempts, updated_at
+        FROM indexing_files
+        WHERE state = '{FILE_STATE_FAILED}'
+        ORDER BY updated_at DESC
+        LIMIT ?
+        ''', (limit,))
+    except Exception as e:
+        logger.error(f"실패한 인덱싱 파일 조회 중 오류 발생: {e}")
+        return []
@@ -8,7 +8,8 @@ from app.database.media.insert import (
     insert_media,
     upsert_media,
     update_subtitle_status,
-    delete_media
+    delete_media,
+    rename_media_path
 )
 
 from app.database.media.query import (
@@ -17,30 +18,84 @@ from app.database.media.query import (
     get_all_media,
     count_media,
     get_total_media_count,
-    get_indexed_media_paths
+    get_indexed_media_paths,
+    iter_media_path_stats,
+    get_media_under_directory,
+    count_media_under_directory,
+    get_bookmarked_media_paths
 )
 
 from app.database.media.stats import (
     get_media_stats
 )
 
+from app.database.media.directories import (
+    get_directory_path,
+    backfill_media_directories
+)
+
+from app.database.media.availability import (
+    is_root_available,
+    set_root_availability,
+    count_unavailable_media,
+    get_offline_roots
+)
+
+from app.database.media.duplicates import (
+    find_duplicate_media,
+    add_media_alias,
+    get_media_aliases,
+    load_alias_paths,
+    delete_media_aliases,
+    promote_media_aliases,
+    merge_duplicate_media
+)
+
+from app.database.media.manifest import (
+    load_scan_manifest,
+    count_scan_directories,
+    save_scan_manifest,
+    clear_scan_manifest
+)
+
 # 향후 cleanup 모듈에서 함수 추가 예정
 from app.database.media.cleanup import (
     remove_missing_media,
+    reconcile_media_paths,
+    delete_media_ids,
+    delete_media_under_directory,
+    clear_subtitles_under_directory,
     clear_all_media
 )
 
 __all__ = [
     # 삽입 및 수정
     'insert_media', 'upsert_media', 'update_subtitle_status', 'delete_media',
+    'rename_media_path',
     
     # 조회
     'get_media_info', 'get_media_by_path', 'get_all_media', 'count_media',
-    'get_total_media_count', 'get_indexed_media_paths',
+    'get_total_media_count', 'get_indexed_media_paths', 'iter_media_path_stats',
+    'get_media_under_directory',
+    'count_media_under_directory', 'get_bookmarked_media_paths',
     
     # 통계
     'get_media_stats',
     
+    # 디렉토리 사전
+    'get_directory_path', 'backfill_media_directories',
+    
+    # 미디어 루트 가용성
+    'is_root_available', 'set_root_availability', 'count_unavailable_media', 'get_offline_roots',
+    
+    # 중복 미디어 (별칭)
+    'find_duplicate_media', 'add_media_alias', 'get_media_aliases', 'load_alias_paths',
+    'delete_media_aliases', 'promote_media_aliases', 'merge_duplicate_media',
+    
+    # 스캔 매니페스트
+    'load_scan_manifest', 'count_scan_directories', 'save_scan_manifest', 'clear_scan_manifest',
+    
     # 정리
-    'remove_missing_media', 'clear_all_media',
+    'remove_missing_media', 'reconcile_media_paths', 'delete_media_ids',
+    'delete_media_under_directory', 'clear_subtitles_under_directory', 'clear_all_media',
 ]
@@ -0,0 +1,132 @@
+"""
+미디어 루트 가용성 모듈
+
+외장 디스크처럼 분리될 수 있는 미디어 루트가 연결되어 있는지 확인하고,
+연결이 끊긴 루트의 미디어는 삭제하지 않고 media_files.available = 0으로 표시합니다.
+루트가 다시 연결되면 표시를 되돌리며, 인덱스(자막, FTS, 매니페스트)는 그대로 남아 있으므로 증분 스캔으로 이어집니다.
+"""
+
+import os
+import logging
+from typing import List, Dict, Any, Optional
+
+from app.utils.logging import setup_module_logger
+from app.database.connection import get_connection, execute_query, fetch_one, fetch_all, connection_context
+
+# 로거 초기화
+logger = setup_module_logger("database.media.availability")
+
+def _has_media_under(root_dir: str) -> bool:
+    """
+    루트 아래에 인덱싱된 미디어가 있는지 확인
+
+    Args:
+        root_dir: 미디어 루트
+
+    Returns:
+        bool: 미디어 존재 여부
+    """
+    from app.database.media.manifest import _subtree_params
+    _, prefix, upper = _subtree_params(root_dir)
+    return fetch_one("SELECT 1 AS found FROM media_files WHERE path >= ? AND path < ? LIMIT 1",
+                     (prefix, upper)) is not None
+
+def is_root_available(root_dir: str) -> bool:
+    """
+    미디어 루트가 연결되어 있는지 확인
+
+    디렉토리가 없거나 열 수 없으면 연결되지 않은 것으로 봅니다.
+    마운트가 빠진 마운트 지점처럼 디렉토리가 비어 있는데 인덱싱된 미디어가 있는 경우도 연결되지 않은 것으로 봅니다.
+
+    Args:
+        root_dir: 미디어 루트
+
+    Returns:
+        bool: 연결 여부
+    """
+    if not root_dir:
+        return False
+
+    try:
+        with os.scandir(root_dir) as entries:
+            empty = next(entries, None) is None
+    except OSError:
+        return False
+
+    return not (empty and _has_media_under(root_dir))
+
+def set_root_availability(root_dir: str, available: bool) -> int:
+    """
+    루트 아래 미디어의 가용성 표시 변경 (상태가 바뀌는 행만 갱신)
+
+    Args:
+        root_dir: 미디어 루트
+        available: 사용 가능 여부
+
+    Returns:
+        int: 변경된 미디어 수 (오류 시 0)
+    """
+    conn = None
+    try:
+        from app.database.media.manifest import _subtree_params
+        _, prefix, upper = _subtree_params(root_dir)
+
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "UPDATE media_files SET available = ? WHERE path >= ? AND path < ? AND available != ?",
+            (int(available), prefix, upper, int(available))
+        )
+        return cursor.rowcount
+
+    except Exception as e:
+        logger.error(f"미디어 가용성 변경 중 오류 발생: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return 0
+
+    finally:
+        if conn:
+            conn.close()
+
+def count_unavailable_media(root_dir: Optional[str] = None) -> int:
+    """
+    사용할 수 없는(연결이 끊긴 루트의) 미디어 수 조회
+
+    Args:
+        root_dir: 이 루트 아래만 셈 (기본값: 전체)
+
+    Returns:
+        int: 미디어 수
+    """
+    try:
+        sql = "SELECT COUNT(*) AS count FROM media_files WHERE available = 0"
+        params = ()
+        if root_dir:
+            from app.database.media.manifest import _subtree_params
+            _, prefix, upper = _subtree_params(root_dir)
+            sql += " AND path >= ? AND path < ?"
+            params = (prefix, upper)
+
+        result = fetch_one(sql, params)
+        return result["count"] if result else 0
+
+    except Exception as e:
+        logger.error(f"사용할 수 없는 미디어 수 조회 중 오류 발생: {e}")
+        return 0
+
+def get_offline_roots(roots: Optional[List[str]] = None) -> List[str]:
+    """
+    연결되지 않은 미디어 루트 목록
+
+    Args:
+        roots: 확인할 루트 목록 (기본값: 설정의 미디어 루트)
+
+    Returns:
+        List[str]: 연결되지 않은 루트 경로 목록
+    """
+    if roots is None:
+        from app.config import config
+        roots = [root["path"] for root in config.get_media_roots()]
+
+    return [root_dir for root_dir in roots if not is_root_available(root_dir)]
@@ -4,7 +4,7 @@
 
 import logging
 import os
-from typing import List, Dict, Any, Optional, Tuple, Union
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterable
 
 from app.utils.logging import setup_module_logger
 from app.database.connection import get_connection, execute_query, fetch_one, fetch_all, connection_context
@@ -12,39 +12,327 @@ from app.database.connection import get_connection, execute_query, fetch_one, fe
 # 로거 초기화
 logger = setup_module_logger("database.media.cleanup")
 
+def _delete_media_in_temp_table(cursor, table: str) -> Dict[str, int]:
+    """
+    임시 테이블에 담긴 미디어 ID의 자막, 문장, FTS, 자막 파일 기록과 미디어 행을 한 번에 삭제
+    
+    FTS는 delete_rows_with_fts로 원본 행과 함께 지웁니다 (FTS 오류가 나도 미디어 삭제는 유지).
+    트랜잭션은 호출자가 관리합니다.
+    
+    Args:
+        cursor: 데이터베이스 커서
+        table: 삭제할 미디어 ID(id 컬럼)를 담은 임시 테이블 이름
+        
+    Returns:
+        Dict[str, int]: 테이블별 삭제된 행 수
+    """
+    from app.database.subtitles.fts import delete_rows_with_fts
+    
+    counts = {}
+    media_filter = f"media_id IN (SELECT id FROM {table})"
+    
+    counts["sentences"] = delete_rows_with_fts(cursor, "subtitle_sentences", "subtitle_sentences_fts", media_filter)
+    counts["subtitles"] = delete_rows_with_fts(cursor, "subtitles", "subtitles_fts", media_filter)
+    
+    cursor.execute(f"DELETE FROM subtitle_files WHERE media_id IN (SELECT id FROM {table})")
+    counts["subtitle_files"] = cursor.rowcount
+    
+    cursor.execute(f"DELETE FROM media_files WHERE id IN (SELECT id FROM {table})")
+    counts["media"] = cursor.rowcount
+    
+    if counts["media"]:
+        from app.database.media.directories import prune_directories
+        prune_directories(cursor)
+    
+    return counts
+
+def reconcile_media_paths(root_dir: str, seen_paths: Iterable[str]) -> Dict[str, Any]:
+    """
+    스캔에서 확인한 경로 집합과 media_files를 비교하여 사라진 미디어를 한 번에 삭제
+    
+    확인한 경로를 임시 테이블에 넣고 루트 디렉토리 아래에서 그 안에 없는 미디어를
+    DELETE ... WHERE ... NOT IN 으로 지웁니다. 자막, 문장, FTS 삭제까지 한 트랜잭션에서 처리합니다.
+    
+    Args:
+        root_dir: 스캔한 루트 디렉토리 (이 아래 경로만 비교)
+        seen_paths: 스캔에서 확인한 미디어 파일 경로 (자막 유무와 관계없이 모두)
+        
+    Returns:
+        Dict[str, Any]: 결과 (success, media, subtitles, sentences, subtitle_files 삭제 수)
+    """
+    conn = None
+    try:
+        from app.database.media.manifest import _subtree_params
+        
+        _, prefix, upper = _subtree_params(root_dir)
+        
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS seen_media_paths (path TEXT PRIMARY KEY)")
+        cursor.execute("DELETE FROM seen_media_paths")
+        cursor.executemany("INSERT OR IGNORE INTO seen_media_paths (path) VALUES (?)",
+                           ((path,) for path in seen_paths))
+        
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS missing_media (id INTEGER PRIMARY KEY)")
+        cursor.execute("DELETE FROM missing_media")
+        cursor.execute('''
+        INSERT INTO missing_media (id)
+        SELECT id FROM media_files
+        WHERE path >= ? AND path < ?
+          AND path NOT IN (SELECT path FROM seen_media_paths)
+        ''', (prefix, upper))
+        
+        counts = _delete_media_in_temp_table(cursor, "missing_media")
+        
+        cursor.execute("DELETE FROM seen_media_paths")
+        cursor.execute("DELETE FROM missing_media")
+        cursor.execute("COMMIT")
+        
+        if counts["media"]:
+            logger.info(f"사라진 미디어 정리: 미디어 {counts['media']}개, 자막 {counts['subtitles']}개, "
+                        f"문장 {counts['sentences']}개 삭제")
+        return {"success": True, **counts}
+        
+    except Exception as e:
+        if conn:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"미디어 경로 대조 중 오류 발생: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return {"success": False, "message": str(e), "media": 0, "subtitles": 0, "sentences": 0, "subtitle_files": 0}
+        
+    finally:
+        if conn:
+            conn.close()
+
+def delete_media_ids(media_ids: Iterable[int]) -> Dict[str, Any]:
+    """
+    미디어 ID 목록의 미디어와 자막, 문장, FTS, 자막 파일 기록을 한 트랜잭션에서 삭제
+
+    스캔에서 경로 대신 ID로 사라진 미디어를 판별한 경우에 사용합니다.
+
+    Args:
+        media_ids: 삭제할 미디어 ID
+
+    Returns:
+        Dict[str, Any]: 결과 (success, media, subtitles, sentences, subtitle_files 삭제 수)
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS missing_media (id INTEGER PRIMARY KEY)")
+        cursor.execute("DELETE FROM missing_media")
+        cursor.executemany("INSERT OR IGNORE INTO missing_media (id) VALUES (?)",
+                           ((int(media_id),) for media_id in media_ids))
+
+        counts = _delete_media_in_temp_table(cursor, "missing_media")
+
+        cursor.execute("DELETE FROM missing_media")
+        cursor.execute("COMMIT")
+
+        if counts["media"]:
+            logger.info(f"사라진 미디어 정리: 미디어 {counts['media']}개, 자막 {counts['subtitles']}개, "
+                        f"문장 {counts['sentences']}개 삭제")
+        return {"success": True, **counts}
+
+    except Exception as e:
+        if conn:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"미디어 ID 삭제 중 오류 발생: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return {"success": False, "message": str(e), "media": 0, "subtitles": 0, "sentences": 0, "subtitle_files": 0}
+
+    finally:
+        if conn:
+            conn.close()
+
+def _collect_media_under_directory(cursor, directory: str, table: str) -> int:
+    """
+    디렉토리 아래(하위 디렉토리 포함) 미디어 ID를 임시 테이블에 담기
+
+    디렉토리 사전 트리에서 하위 디렉토리 ID를 모아 idx_media_dir_id 인덱스로 대상 미디어를 찾습니다.
+    트랜잭션은 호출자가 관리합니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        directory: 디렉토리 경로
+        table: 미디어 ID(id 컬럼)를 담을 임시 테이블 이름
+
+    Returns:
+        int: 담은 미디어 수
+    """
+    from app.database.media.directories import find_directory_id, subtree_cte, _subtree_base
+
+    cursor.execute(f"CREATE TEMP TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY)")
+    cursor.execute(f"DELETE FROM {table}")
+
+    directory_id = find_directory_id(cursor, directory)
+    if directory_id is None:
+        return 0
+
+    cursor.execute(subtree_cte() + f'''
+    INSERT INTO {table} (id)
+    SELECT m.id FROM subtree_dirs s JOIN media_files m ON m.dir_id = s.id
+    ''', (_subtree_base(directory), directory_id))
+    
+    # WITH로 시작하는 문장은 rowcount가 -1이므로 직접 셈
+    cursor.execute(f"SELECT COUNT(*) AS count FROM {table}")
+    return cursor.fetchone()["count"]
+
+def delete_media_under_directory(directory: str) -> Dict[str, Any]:
+    """
+    디렉토리 아래(하위 디렉토리 포함)의 모든 미디어와 자막, 문장, FTS, 자막 파일 기록을 한 트랜잭션에서 삭제
+
+    Args:
+        directory: 디렉토리 경로
+
+    Returns:
+        Dict[str, Any]: 결과 (success, media, subtitles, sentences, subtitle_files 삭제 수)
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+
+        _collect_media_under_directory(cursor, directory, "missing_media")
+        counts = _delete_media_in_temp_table(cursor, "missing_media")
+
+        cursor.execute("DELETE FROM missing_media")
+        cursor.execute("COMMIT")
+
+        if counts["media"]:
+            logger.info(f"디렉토리 미디어 삭제: {directory} - 미디어 {counts['media']}개, "
+                        f"자막 {counts['subtitles']}개, 문장 {counts['sentences']}개 삭제")
+        return {"success": True, **counts}
+
+    except Exception as e:
+        if conn:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"디렉토리 미디어 삭제 중 오류 발생: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return {"success": False, "message": str(e), "media": 0, "subtitles": 0, "sentences": 0, "subtitle_files": 0}
+
+    finally:
+        if conn:
+            conn.close()
+
+def clear_subtitles_under_directory(directory: str) -> Dict[str, Any]:
+    """
+    디렉토리 아래(하위 디렉토리 포함) 미디어의 자막, 문장, FTS를 한 트랜잭션에서 삭제 (재인덱싱 준비)
+
+    미디어 행과 자막 파일 기록(인코딩/언어 판별 결과)은 남겨 두므로 재인덱싱에서 다시 사용됩니다.
+
+    Args:
+        directory: 디렉토리 경로
+
+    Returns:
+        Dict[str, Any]: 결과 (success, media 대상 수, subtitles, sentences 삭제 수)
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+
+        from app.database.subtitles.fts import delete_rows_with_fts
+
+        media_count = _collect_media_under_directory(cursor, directory, "reindex_media")
+
+        media_filter = "media_id IN (SELECT id FROM reindex_media)"
+        sentence_count = delete_rows_with_fts(cursor, "subtitle_sentences", "subtitle_sentences_fts", media_filter)
+        subtitle_count = delete_rows_with_fts(cursor, "subtitles", "subtitles_fts", media_filter)
+
+        cursor.execute("UPDATE media_files SET has_subtitle = 0 WHERE id IN (SELECT id FROM reindex_media)")
+
+        cursor.execute("DELETE FROM reindex_media")
+        cursor.execute("COMMIT")
+
+        return {"success": True, "media": media_count, "subtitles": subtitle_count, "sentences": sentence_count}
+
+    except Exception as e:
+        if conn:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"디렉토리 자막 삭제 중 오류 발생: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return {"success": False, "message": str(e), "media": 0, "subtitles": 0, "sentences": 0}
+
+    finally:
+        if conn:
+            conn.close()
+
 def remove_missing_media() -> int:
     """
     실제로 존재하지 않는 미디어 파일 정보 삭제
     
+    존재 여부는 파일마다 확인하지만, 삭제는 한 트랜잭션에서 집합 단위로 처리합니다 (FTS 포함).
+    스캔 중에는 reconcile_media_paths가 파일 확인 없이 같은 삭제를 수행합니다.
+    연결되지 않은 미디어 루트(분리된 외장 디스크 등)의 미디어는 삭제하지 않고 사용 불가로 표시합니다.
+    
     Returns:
         int: 삭제된 미디어 파일 수
     """
     conn = None
     try:
+        from app.database.media.availability import get_offline_roots, set_root_availability
+        from app.database.media.manifest import _subtree_params
+        
+        offline_roots = get_offline_roots()
+        for root_dir in offline_roots:
+            marked = set_root_availability(root_dir, False)
+            logger.warning(f"연결되지 않은 미디어 루트는 정리하지 않습니다: {root_dir} (미디어 {marked}개를 사용 불가로 표시)")
+        offline_prefixes = tuple(_subtree_params(root_dir)[1] for root_dir in offline_roots)
+        
         conn = get_connection()
         cursor = conn.cursor()
         
-        # 모든 미디어 파일 경로 가져오기
+        # 모든 미디어 파일 경로 가져오기 (연결되지 않은 루트 아래는 확인하지 않음)
         cursor.execute("SELECT id, path FROM media_files")
-        media_files = cursor.fetchall()
-        
-        deleted_count = 0
-        for media in media_files:
-            if not os.path.exists(media["path"]):
-                # 자막 먼저 삭제 (외래 키 제약 조건)
-                cursor.execute("DELETE FROM subtitles WHERE media_id = ?", (media["id"],))
-                
-                # 미디어 파일 정보 삭제
-                cursor.execute("DELETE FROM media_files WHERE id = ?", (media["id"],))
-                
-                deleted_count += 1
-                
-        conn.commit()
-        return deleted_count
+        missing_ids = [
+            (media["id"],) for media in cursor.fetchall()
+            if not (offline_prefixes and media["path"].startswith(offline_prefixes)) and not os.path.exists(media["path"])
+        ]
+        
+        if not missing_ids:
+            return 0
+        
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS missing_media (id INTEGER PRIMARY KEY)")
+        cursor.execute("DELETE FROM missing_media")
+        cursor.executemany("INSERT OR IGNORE INTO missing_media (id) VALUES (?)", missing_ids)
+        
+        counts = _delete_media_in_temp_table(cursor, "missing_media")
+        
+        cursor.execute("DELETE FROM missing_media")
+        cursor.execute("COMMIT")
+        return counts["media"]
         
     except Exception as e:
         if conn:
-            conn.rollback()
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
         logger.error(f"존재하지 않는 미디어 파일 정리 중 오류 발생: {e}")
         import traceback
         logger.error(traceback.format_exc())
@@ -65,19 +353,29 @@ def clear_all_media() -> bool:
     try:
         conn = get_connection()
         cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
         
         # 자막 먼저 삭제 (외래 키 제약 조건)
+        # 외부 콘텐츠 FTS는 원본 테이블을 비워도 토큰이 남으므로 'delete-all'로 함께 비움
+        cursor.execute("DELETE FROM subtitle_sentences")
+        cursor.execute("INSERT INTO subtitle_sentences_fts(subtitle_sentences_fts) VALUES('delete-all')")
         cursor.execute("DELETE FROM subtitles")
+        cursor.execute("INSERT INTO subtitles_fts(subtitles_fts) VALUES('delete-all')")
+        cursor.execute("DELETE FROM subtitle_files")
         
         # 미디어 파일 정보 삭제
         cursor.execute("DELETE FROM media_files")
+        cursor.execute("DELETE FROM directories")
         
-        conn.commit()
+        cursor.execute("COMMIT")
         return True
         
     except Exception as e:
         if conn:
-            conn.rollback()
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
         logger.error(f"모든 미디어 파일 정보 삭제 중 오류 발생: {e}")
         import traceback
         logger.error(traceback.format_exc())
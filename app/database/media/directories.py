@@ -0,0 +1,273 @@
+"""
+디렉토리 사전 모듈
+
+미디어 파일 경로의 디렉토리 부분을 directories(id, parent_id, name) 트리에 한 번만 저장하고,
+media_files는 dir_id로 디렉토리를 참조합니다.
+폴더 아래 미디어 조회/삭제는 경로 문자열 LIKE 대신 디렉토리 트리를 따라 idx_media_dir_id 인덱스로 처리합니다.
+
+경로 저장 공간은 줄이지 않습니다. 정확한 경로 조회, 이름 변경, 검색과 인덱서가 전체 경로를 읽으므로
+media_files.path와 idx_media_path는 그대로 두고, 디렉토리 사전은 행마다 정수 dir_id와
+디렉토리 이름 행을 추가로 저장합니다.
+
+최상위 항목(예: "/", "C:\\")은 parent_id 0, 이름은 구분자를 포함한 앵커로 저장합니다.
+"""
+
+import os
+import logging
+import sqlite3
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+from app.utils.logging import setup_module_logger
+from app.database.connection import get_connection, execute_query, fetch_one, fetch_all, connection_context
+
+# 로거 초기화
+logger = setup_module_logger("database.media.directories")
+
+# 최상위 디렉토리의 parent_id (UNIQUE(parent_id, name)가 NULL을 구분하지 않으므로 0 사용)
+ROOT_PARENT_ID = 0
+
+def split_media_path(path: str) -> Tuple[str, str]:
+    """
+    미디어 경로를 디렉토리와 파일 이름으로 분리
+
+    Args:
+        path: 미디어 파일 경로
+
+    Returns:
+        Tuple[str, str]: (디렉토리 경로, 파일 이름)
+    """
+    return os.path.split(path)
+
+def _directory_parts(directory: str) -> List[str]:
+    """
+    디렉토리 경로를 앵커부터 순서대로 이름 목록으로 분리
+
+    Args:
+        directory: 디렉토리 경로
+
+    Returns:
+        List[str]: 이름 목록 (첫 항목은 "/" 같은 앵커, 상대 경로면 빈 문자열)
+    """
+    parts = []
+    head = directory.rstrip(os.sep) or directory
+    while True:
+        parent, name = os.path.split(head)
+        if not name:
+            parts.append(parent)
+            break
+        parts.append(name)
+        head = parent
+    parts.reverse()
+    return parts
+
+def _subtree_base(directory: str) -> str:
+    """
+    하위 경로를 이어 붙일 디렉토리 경로 (끝의 구분자 제거, 루트는 빈 문자열)
+
+    Args:
+        directory: 디렉토리 경로
+
+    Returns:
+        str: 이어 붙일 기준 경로
+    """
+    return directory.rstrip(os.sep)
+
+def ensure_directory_id(cursor, directory: str, cache: Optional[Dict[str, int]] = None) -> int:
+    """
+    디렉토리 ID 조회 (없으면 상위 디렉토리부터 생성)
+
+    트랜잭션은 호출자가 관리합니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        directory: 디렉토리 경로
+        cache: 같은 트랜잭션 안에서 재사용할 경로 → ID 캐시
+
+    Returns:
+        int: 디렉토리 ID
+    """
+    if cache is not None and directory in cache:
+        return cache[directory]
+
+    parent_id = ROOT_PARENT_ID
+    for name in _directory_parts(directory):
+        cursor.execute("SELECT id FROM directories WHERE parent_id = ? AND name = ?", (parent_id, name))
+        row = cursor.fetchone()
+        if row:
+            parent_id = row["id"]
+            continue
+
+        try:
+            cursor.execute("INSERT INTO directories (parent_id, name) VALUES (?, ?)", (parent_id, name))
+            parent_id = cursor.lastrowid
+        except sqlite3.IntegrityError:
+            # 다른 연결(동시에 스캔 중인 다른 루트)이 같은 디렉토리를 먼저 만든 경우
+            cursor.execute("SELECT id FROM directories WHERE parent_id = ? AND name = ?", (parent_id, name))
+            parent_id = cursor.fetchone()["id"]
+
+    if cache is not None:
+        cache[directory] = parent_id
+    return parent_id
+
+def find_directory_id(cursor, directory: str) -> Optional[int]:
+    """
+    디렉토리 ID 조회 (생성하지 않음)
+
+    Args:
+        cursor: 데이터베이스 커서
+        directory: 디렉토리 경로
+
+    Returns:
+        Optional[int]: 디렉토리 ID 또는 None (저장된 미디어가 없는 디렉토리)
+    """
+    parent_id = ROOT_PARENT_ID
+    for name in _directory_parts(directory):
+        cursor.execute("SELECT id FROM directories WHERE parent_id = ? AND name = ?", (parent_id, name))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        parent_id = row["id"]
+    return parent_id
+
+def assign_media_directories(cursor, rows: Iterable[Tuple[int, str]],
+                             cache: Optional[Dict[str, int]] = None) -> int:
+    """
+    미디어 행의 dir_id를 경로에서 다시 계산하여 저장
+
+    트랜잭션은 호출자가 관리합니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        rows: (미디어 ID, 경로) 목록
+        cache: 디렉토리 경로 → ID 캐시
+
+    Returns:
+        int: 갱신한 행 수
+    """
+    if cache is None:
+        cache = {}
+
+    updates = []
+    for media_id, path in rows:
+        directory, _ = split_media_path(path)
+        updates.append((ensure_directory_id(cursor, directory, cache), media_id))
+
+    cursor.executemany("UPDATE media_files SET dir_id = ? WHERE id = ?", updates)
+    return len(updates)
+
+def subtree_cte(directory_param: str = "?") -> str:
+    """
+    디렉토리와 모든 하위 디렉토리의 (id, path)를 만드는 재귀 CTE
+
+    매개변수 2개: 기준 경로(_subtree_base), 디렉토리 ID
+
+    Args:
+        directory_param: 디렉토리 ID 자리 표시자
+
+    Returns:
+        str: WITH RECURSIVE 절 (subtree_dirs(id, path))
+    """
+    return f'''
+    WITH RECURSIVE subtree_dirs(id, path) AS (
+        SELECT id, ? FROM directories WHERE id = {directory_param}
+        UNION ALL
+        SELECT d.id, s.path || '{os.sep}' || d.name
+        FROM directories d JOIN subtree_dirs s ON d.parent_id = s.id
+    )
+    '''
+
+def get_directory_path(directory_id: int) -> Optional[str]:
+    """
+    디렉토리 ID로 전체 경로 복원
+
+    Args:
+        directory_id: 디렉토리 ID
+
+    Returns:
+        Optional[str]: 디렉토리 경로 또는 None (없는 ID)
+    """
+    try:
+        results = fetch_all('''
+        WITH RECURSIVE ancestors(id, parent_id, name, depth) AS (
+            SELECT id, parent_id, name, 0 FROM directories WHERE id = ?
+            UNION ALL
+            SELECT d.id, d.parent_id, d.name, a.depth + 1
+            FROM directories d JOIN ancestors a ON d.id = a.parent_id
+        )
+        SELECT name FROM ancestors ORDER BY depth DESC
+        ''', (directory_id,))
+        if not results:
+            return None
+        return os.path.join(*(row["name"] for row in results))
+    except Exception as e:
+        logger.error(f"디렉토리 경로 복원 중 오류 발생: {e}")
+        return None
+
+def prune_directories(cursor) -> int:
+    """
+    미디어도 하위 디렉토리도 없는 디렉토리 행 삭제 (잎부터 반복)
+
+    트랜잭션은 호출자가 관리합니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+
+    Returns:
+        int: 삭제된 디렉토리 수
+    """
+    removed = 0
+    while True:
+        cursor.execute('''
+        DELETE FROM directories
+        WHERE NOT EXISTS (SELECT 1 FROM media_files m WHERE m.dir_id = directories.id)
+          AND NOT EXISTS (SELECT 1 FROM directories c WHERE c.parent_id = directories.id)
+        ''')
+        if cursor.rowcount <= 0:
+            return removed
+        removed += cursor.rowcount
+
+def backfill_media_directories(batch_size: int = 5000) -> int:
+    """
+    dir_id가 비어 있는 기존 미디어 행을 디렉토리 사전에 연결 (스키마 초기화 시 호출)
+
+    Args:
+        batch_size: 한 트랜잭션에서 처리할 행 수
+
+    Returns:
+        int: 연결한 행 수
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        cache: Dict[str, int] = {}
+        total = 0
+
+        while True:
+            cursor.execute("SELECT id, path FROM media_files WHERE dir_id IS NULL LIMIT ?", (batch_size,))
+            rows = [(row["id"], row["path"]) for row in cursor.fetchall()]
+            if not rows:
+                break
+
+            cursor.execute("BEGIN IMMEDIATE")
+            total += assign_media_directories(cursor, rows, cache)
+            cursor.execute("COMMIT")
+
+        if total:
+            logger.info(f"디렉토리 사전 연결: 미디어 {total}개, 디렉토리 {len(cache)}개")
+        return total
+
+    except Exception as e:
+        if conn:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"디렉토리 사전 연결 중 오류 발생: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return 0
+
+    finally:
+        if conn:
+            conn.close()
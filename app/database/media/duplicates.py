@@ -0,0 +1,418 @@
+"""
+중복 미디어 모듈
+
+같은 미디어가 여러 경로에 있으면(하드 링크, "Downloads"와 "Library"의 복사본) 대표 미디어 하나만 인덱싱하고
+나머지 경로는 media_aliases에 별칭으로 기록합니다.
+하드 링크는 (dev, inode)로, 복사본은 크기가 같은 파일끼리만 샘플 해시(fingerprint)를 계산하여 찾습니다.
+"""
+
+import os
+import logging
+from typing import List, Dict, Any, Optional, Iterable, Tuple, Set
+
+from app.utils.logging import setup_module_logger
+from app.utils.media_fingerprint import file_identity, sampled_fingerprint
+from app.database.connection import get_connection, execute_query, fetch_one, fetch_all, connection_context
+
+# 로거 초기화
+logger = setup_module_logger("database.media.duplicates")
+
+# 별칭 사유
+ALIAS_INODE = "inode"
+ALIAS_FINGERPRINT = "fingerprint"
+
+# IN (...) 매개변수 하나에 넣을 최대 ID 수
+_ID_CHUNK = 500
+
+def _same_file(path: str, dev: int, inode: int) -> bool:
+    """경로가 여전히 같은 (dev, inode) 파일인지 확인 (inode 재사용 대비)"""
+    try:
+        return file_identity(os.stat(path)) == (dev, inode)
+    except OSError:
+        return False
+
+def _stored_fingerprint(cursor, media_id: int, path: str, size: int, fingerprint: Optional[str]) -> Optional[str]:
+    """
+    저장된 샘플 해시 반환 (없으면 계산하여 저장)
+
+    Args:
+        cursor: 데이터베이스 커서
+        media_id: 미디어 ID
+        path: 미디어 경로
+        size: 파일 크기
+        fingerprint: 저장된 샘플 해시
+
+    Returns:
+        Optional[str]: 샘플 해시 (파일을 읽을 수 없으면 None)
+    """
+    if fingerprint:
+        return fingerprint
+
+    fingerprint = sampled_fingerprint(path, size)
+    if fingerprint:
+        cursor.execute("UPDATE media_files SET fingerprint = ? WHERE id = ?", (fingerprint, media_id))
+    return fingerprint
+
+def find_duplicate_media(path: str) -> Optional[Dict[str, Any]]:
+    """
+    이미 인덱싱된 같은 미디어 찾기
+
+    (dev, inode)가 같으면 하드 링크, 크기와 샘플 해시가 같으면 복사본으로 봅니다.
+    샘플 해시는 크기가 같은 미디어가 있을 때만 계산합니다.
+
+    Args:
+        path: 새로 발견한 미디어 경로
+
+    Returns:
+        Optional[Dict[str, Any]]: 대표 미디어 (id, path, reason) 또는 None
+    """
+    conn = None
+    try:
+        stat = os.stat(path)
+        dev, inode = file_identity(stat)
+
+        conn = get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT id, path FROM media_files WHERE dev = ? AND inode = ? AND path != ? AND available = 1",
+            (dev, inode, path)
+        )
+        for row in cursor.fetchall():
+            if _same_file(row["path"], dev, inode):
+                return {"id": row["id"], "path": row["path"], "reason": ALIAS_INODE}
+
+        if not stat.st_size:
+            return None
+
+        cursor.execute(
+            "SELECT id, path, fingerprint FROM media_files WHERE size = ? AND path != ? AND available = 1",
+            (stat.st_size, path)
+        )
+        candidates = cursor.fetchall()
+        if not candidates:
+            return None
+
+        fingerprint = sampled_fingerprint(path, stat.st_size)
+        if not fingerprint:
+            return None
+
+        for row in candidates:
+            if _stored_fingerprint(cursor, row["id"], row["path"], stat.st_size, row["fingerprint"]) == fingerprint:
+                return {"id": row["id"], "path": row["path"], "reason": ALIAS_FINGERPRINT}
+
+        return None
+
+    except OSError:
+        return None
+
+    except Exception as e:
+        logger.error(f"중복 미디어 확인 중 오류 발생: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return None
+
+    finally:
+        if conn:
+            conn.close()
+
+def add_media_alias(path: str, media_id: int, reason: str) -> bool:
+    """
+    중복 미디어 경로를 대표 미디어의 별칭으로 기록
+
+    Args:
+        path: 중복 미디어 경로
+        media_id: 대표 미디어 ID
+        reason: 별칭 사유 ('inode' 또는 'fingerprint')
+
+    Returns:
+        bool: 성공 여부
+    """
+    try:
+        execute_query(
+            "INSERT OR REPLACE INTO media_aliases (path, media_id, reason) VALUES (?, ?, ?)",
+            (path, media_id, reason)
+        )
+        return True
+
+    except Exception as e:
+        logger.error(f"미디어 별칭 기록 중 오류 발생: {e}")
+        return False
+
+def get_media_aliases(media_id: int) -> List[Dict[str, Any]]:
+    """
+    대표 미디어의 별칭 목록 조회
+
+    Args:
+        media_id: 대표 미디어 ID
+
+    Returns:
+        List[Dict[str, Any]]: 별칭 목록 (path, reason, created_at)
+    """
+    try:
+        return fetch_all(
+            "SELECT path, reason, created_at FROM media_aliases WHERE media_id = ? ORDER BY path",
+            (media_id,)
+        ) or []
+
+    except Exception as e:
+        logger.error(f"미디어 별칭 조회 중 오류 발생: {e}")
+        return []
+
+def load_alias_paths(root_dir: str) -> Dict[str, int]:
+    """
+    루트 아래 별칭 경로 조회 (스캔에서 별칭은 다시 확인하지 않고 건너뜀)
+
+    Args:
+        root_dir: 루트 디렉토리
+
+    Returns:
+        Dict[str, int]: 별칭 경로 → 대표 미디어 ID
+    """
+    try:
+        from app.database.media.manifest import _subtree_params
+        _, prefix, upper = _subtree_params(root_dir)
+
+        rows = fetch_all(
+            "SELECT path, media_id FROM media_aliases WHERE path >= ? AND path < ?",
+            (prefix, upper)
+        ) or []
+        return {row["path"]: row["media_id"] for row in rows}
+
+    except Exception as e:
+        logger.error(f"미디어 별칭 로드 중 오류 발생: {e}")
+        return {}
+
+def delete_media_aliases(paths: Iterable[str]) -> int:
+    """
+    별칭 삭제 (디스크에서 사라진 중복 경로)
+
+    Args:
+        paths: 별칭 경로 목록
+
+    Returns:
+        int: 삭제된 별칭 수
+    """
+    conn = None
+    try:
+        rows = [(path,) for path in paths]
+        if not rows:
+            return 0
+
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany("DELETE FROM media_aliases WHERE path = ?", rows)
+        cursor.execute("COMMIT")
+        return len(rows)
+
+    except Exception as e:
+        if conn:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"미디어 별칭 삭제 중 오류 발생: {e}")
+        return 0
+
+    finally:
+        if conn:
+            conn.close()
+
+def promote_media_aliases(media_ids: Iterable[int], present_paths: Set[str]) -> Set[int]:
+    """
+    사라진 대표 미디어를 남아 있는 별칭 경로로 옮김 (자막을 다시 인덱싱하지 않음)
+
+    Args:
+        media_ids: 디스크에서 사라진 미디어 ID 목록
+        present_paths: 이번 스캔에서 확인한 별칭 경로
+
+    Returns:
+        Set[int]: 별칭 경로로 옮겨 삭제하지 않아도 되는 미디어 ID
+    """
+    media_ids = list(media_ids)
+    if not media_ids or not present_paths:
+        return set()
+
+    replacements: Dict[int, Tuple[str, str]] = {}
+    for start in range(0, len(media_ids), _ID_CHUNK):
+        chunk = media_ids[start:start + _ID_CHUNK]
+        rows = fetch_all(f'''
+        SELECT a.media_id, a.path AS alias_path, m.path
+        FROM media_aliases a JOIN media_files m ON m.id = a.media_id
+        WHERE a.media_id IN ({", ".join("?" for _ in chunk)})
+        ORDER BY a.path
+        ''', tuple(chunk)) or []
+
+        for row in rows:
+            if row["media_id"] not in replacements and row["alias_path"] in present_paths:
+                replacements[row["media_id"]] = (row["path"], row["alias_path"])
+
+    from app.database.media.insert import rename_media_path
+
+    promoted = set()
+    for media_id, (old_path, alias_path) in replacements.items():
+        # 별칭 행을 먼저 지워야 같은 경로로 옮길 수 있음
+        execute_query("DELETE FROM media_aliases WHERE path = ?", (alias_path,))
+        if rename_media_path(old_path, alias_path):
+            promoted.add(media_id)
+            logger.info(f"대표 미디어 경로 변경 (원본 사라짐): {old_path} -> {alias_path}")
+
+    return promoted
+
+def _fill_file_identity(cursor, batch_size: int = 1000) -> int:
+    """
+    장치/inode가 비어 있는 미디어 행 채우기 (이 기능 이전에 인덱싱된 행)
+
+    Args:
+        cursor: 데이터베이스 커서
+        batch_size: 한 번에 갱신할 행 수
+
+    Returns:
+        int: 갱신한 행 수
+    """
+    cursor.execute("SELECT id, path FROM media_files WHERE inode IS NULL AND available = 1")
+    updates = []
+    for row in cursor.fetchall():
+        try:
+            stat = os.stat(row["path"])
+        except OSError:
+            continue
+        updates.append((stat.st_size,) + file_identity(stat) + (row["id"],))
+
+    for start in range(0, len(updates), batch_size):
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany("UPDATE media_files SET size = ?, dev = ?, inode = ? WHERE id = ?",
+                           updates[start:start + batch_size])
+        cursor.execute("COMMIT")
+
+    return len(updates)
+
+def _pick_canonical(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """자막이 인덱싱된 행 중 가장 먼저 저장된 행을 대표로 선택"""
+    return min(rows, key=lambda row: (not row["has_subtitle"], row["id"]))
+
+def merge_duplicate_media() -> Dict[str, Any]:
+    """
+    이미 인덱싱된 중복 미디어를 대표 미디어 하나로 합침
+
+    (dev, inode) 또는 크기 + 샘플 해시가 같은 미디어 중 하나만 남기고,
+    나머지는 별칭으로 기록한 뒤 자막, 문장, FTS와 함께 한 트랜잭션에서 삭제합니다.
+
+    Returns:
+        Dict[str, Any]: 정리 결과 (removed_count, kept_count, total_before, total_after)
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT COUNT(*) AS count FROM media_files")
+        total_before = cursor.fetchone()["count"]
+
+        _fill_file_identity(cursor)
+
+        duplicates: Dict[int, Tuple[int, str, str]] = {}   # 중복 ID → (대표 ID, 경로, 사유)
+        kept = set()
+
+        # 하드 링크: (dev, inode)가 같은 행
+        cursor.execute('''
+        SELECT id, path, has_subtitle, dev, inode FROM media_files
+        WHERE (dev, inode) IN (
+            SELECT dev, inode FROM media_files
+            WHERE inode IS NOT NULL AND available = 1
+            GROUP BY dev, inode HAVING COUNT(*) > 1
+        )
+        ORDER BY dev, inode
+        ''')
+        groups: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+        for row in cursor.fetchall():
+            groups.setdefault((row["dev"], row["inode"]), []).append(row)
+
+        for rows in groups.values():
+            canonical = _pick_canonical(rows)
+            kept.add(canonical["id"])
+            for row in rows:
+                if row["id"] != canonical["id"]:
+                    duplicates[row["id"]] = (canonical["id"], row["path"], ALIAS_INODE)
+
+        # 복사본: 크기가 같은 행끼리만 샘플 해시 비교
+        cursor.execute('''
+        SELECT id, path, has_subtitle, size, fingerprint FROM media_files
+        WHERE available = 1 AND size IN (
+            SELECT size FROM media_files
+            WHERE size > 0 AND available = 1
+            GROUP BY size HAVING COUNT(*) > 1
+        )
+        ORDER BY size
+        ''')
+        by_size: Dict[int, List[Dict[str, Any]]] = {}
+        for row in cursor.fetchall():
+            if row["id"] not in duplicates:
+                by_size.setdefault(row["size"], []).append(row)
+
+        for size, rows in by_size.items():
+            by_fingerprint: Dict[str, List[Dict[str, Any]]] = {}
+            for row in rows:
+                fingerprint = _stored_fingerprint(cursor, row["id"], row["path"], size, row["fingerprint"])
+                if fingerprint:
+                    by_fingerprint.setdefault(fingerprint, []).append(row)
+
+            for same in by_fingerprint.values():
+                if len(same) < 2:
+                    continue
+                canonical = _pick_canonical(same)
+                kept.add(canonical["id"])
+                for row in same:
+                    if row["id"] != canonical["id"]:
+                        duplicates[row["id"]] = (canonical["id"], row["path"], ALIAS_FINGERPRINT)
+
+        if not duplicates:
+            return {"success": True, "removed_count": 0, "kept_count": 0,
+                    "total_before": total_before, "total_after": total_before}
+
+        from app.database.media.cleanup import _delete_media_in_temp_table
+
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS duplicate_media (id INTEGER PRIMARY KEY)")
+        cursor.execute("DELETE FROM duplicate_media")
+        cursor.executemany("INSERT INTO duplicate_media (id) VALUES (?)", [(media_id,) for media_id in duplicates])
+
+        counts = _delete_media_in_temp_table(cursor, "duplicate_media")
+
+        # 별칭은 중복 행을 지운 뒤 기록 (같은 경로의 별칭이 삭제에 함께 지워지지 않도록)
+        cursor.executemany(
+            "INSERT OR REPLACE INTO media_aliases (path, media_id, reason) VALUES (?, ?, ?)",
+            [(path, canonical_id, reason) for canonical_id, path, reason in duplicates.values()]
+        )
+
+        cursor.execute("DELETE FROM duplicate_media")
+        cursor.execute("COMMIT")
+
+        logger.info(f"중복 미디어 정리: 미디어 {counts['media']}개를 별칭으로 변경, "
+                    f"자막 {counts['subtitles']}개, 문장 {counts['sentences']}개 삭제")
+
+        return {
+            "success": True,
+            "removed_count": counts["media"],
+            "kept_count": len(kept),
+            "subtitles": counts["subtitles"],
+            "sentences": counts["sentences"],
+            "total_before": total_before,
+            "total_after": total_before - counts["media"]
+        }
+
+    except Exception as e:
+        if conn:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"중복 미디어 정리 중 오류 발생: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return {"success": False, "message": f"오류 발생: {str(e)}"}
+
+    finally:
+        if conn:
+            conn.close()
@@ -15,7 +15,8 @@ from app.database.connection import get_connection, execute_query, fetch_one, fe
 logger = setup_module_logger("database.media.insert")
 
 def insert_media(path: str, has_subtitle: bool = False, 
-               size: int = 0, last_modified: str = None) -> Optional[int]:
+               size: int = 0, last_modified: str = None,
+               dev: Optional[int] = None, inode: Optional[int] = None) -> Optional[int]:
     """
     미디어 파일 정보 저장
     
@@ -24,6 +25,8 @@ def insert_media(path: str, has_subtitle: bool = False,
         has_subtitle: 자막 포함 여부
         size: 파일 크기 (바이트)
         last_modified: 마지막 수정 시간 (ISO 형식)
+        dev: 파일 장치 번호 (중복 판단용)
+        inode: 파일 inode 번호 (중복 판단용)
         
     Returns:
         Optional[int]: 삽입된 미디어 ID 또는 None (실패 시)
@@ -43,12 +46,21 @@ def insert_media(path: str, has_subtitle: bool = False,
         # 마지막 수정 시간이 없으면 현재 시간 사용
         if not last_modified:
             last_modified = datetime.now().isoformat()
+        
+        # 디렉토리 사전에 디렉토리 등록
+        from app.database.media.directories import ensure_directory_id, split_media_path
+        directory, _ = split_media_path(path)
+        dir_id = ensure_directory_id(cursor, directory)
+        
+        # 파일 이름 메타데이터 (작품 제목, 시즌, 에피소드, 연도, 해상도)
+        from app.database.media.metadata import METADATA_COLUMNS, media_metadata_values
             
         # 미디어 파일 정보 삽입
-        cursor.execute('''
-        INSERT INTO media_files (path, has_subtitle, size, last_modified)
-        VALUES (?, ?, ?, ?)
-        ''', (path, has_subtitle, size, last_modified))
+        cursor.execute(f'''
+        INSERT INTO media_files (path, has_subtitle, size, last_modified, dev, inode, dir_id,
+                                 {", ".join(METADATA_COLUMNS)})
+        VALUES (?, ?, ?, ?, ?, ?, ?, {", ".join("?" for _ in METADATA_COLUMNS)})
+        ''', (path, has_subtitle, size, last_modified, dev, inode, dir_id) + media_metadata_values(path))
         
         # 삽입된 ID 반환
         media_id = cursor.lastrowid
@@ -79,29 +91,33 @@ def upsert_media(media_path: str) -> int:
         int: 미디어 ID
     """
     try:
-        # 파일 정보 가져오기
-        if os.path.exists(media_path):
-            size = os.path.getsize(media_path)
-            last_modified = datetime.fromtimestamp(os.path.getmtime(media_path)).isoformat()
-        else:
+        # 파일 정보 가져오기 (stat 한 번으로 크기, 수정 시간, 장치/inode)
+        try:
+            from app.utils.media_fingerprint import file_identity
+            stat = os.stat(media_path)
+            size = stat.st_size
+            last_modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
+            dev, inode = file_identity(stat)
+        except OSError:
             size = 0
             last_modified = datetime.now().isoformat()
+            dev = inode = None
             
         # 이미 존재하는지 확인
         existing = fetch_one("SELECT id FROM media_files WHERE path = ?", (media_path,))
         
         if existing:
-            # 업데이트
+            # 업데이트 (내용이 바뀌었을 수 있으므로 샘플 해시는 다시 계산하도록 비움)
             execute_query('''
             UPDATE media_files 
-            SET size = ?, last_modified = ?
+            SET size = ?, last_modified = ?, dev = ?, inode = ?, fingerprint = NULL
             WHERE path = ?
-            ''', (size, last_modified, media_path))
+            ''', (size, last_modified, dev, inode, media_path))
             
             return existing["id"]
         else:
             # 삽입
-            return insert_media(media_path, False, size, last_modified)
+            return insert_media(media_path, False, size, last_modified, dev, inode)
             
     except Exception as e:
         logger.error(f"미디어 정보 갱신 중 오류 발생: {e}")
@@ -150,33 +166,81 @@ def delete_media(media_id: int) -> bool:
     """
     미디어 파일 정보 삭제
     
+    스캔 정리 경로와 같은 delete_media_ids로 자막, 문장, FTS, 자막 파일 기록을 함께 지우고
+    비게 된 디렉토리 사전 항목도 정리합니다.
+    
     Args:
         media_id: 미디어 ID
         
     Returns:
         bool: 성공 여부
     """
+    from app.database.media.cleanup import delete_media_ids
+    
+    return delete_media_ids([media_id])["success"]
+
+def rename_media_path(old_path: str, new_path: str) -> int:
+    """
+    이름이 바뀐 미디어 파일 또는 디렉토리의 경로 갱신 (자막 데이터는 그대로 유지)
+    
+    디렉토리이면 그 아래 모든 미디어와 자막 파일 기록의 경로 앞부분을 바꾸고,
+    바뀐 미디어 행은 디렉토리 사전에 다시 연결하고 파일 이름 메타데이터도 다시 추출합니다.
+    
+    Args:
+        old_path: 이전 경로
+        new_path: 새 경로
+        
+    Returns:
+        int: 경로가 바뀐 미디어 수
+    """
     conn = None
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
+        from app.database.media.manifest import _subtree_params
         
-        # 자막 먼저 삭제 (외래 키 제약 조건)
-        cursor.execute("DELETE FROM subtitles WHERE media_id = ?", (media_id,))
+        _, prefix, upper = _subtree_params(old_path)
         
-        # 미디어 파일 정보 삭제
-        cursor.execute("DELETE FROM media_files WHERE id = ?", (media_id,))
-        
-        conn.commit()
-        return True
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        
+        renamed_count = 0
+        for table in ("media_files", "subtitle_files"):
+            cursor.execute(f"UPDATE {table} SET path = ? WHERE path = ?", (new_path, old_path))
+            changed = cursor.rowcount
+            cursor.execute(f'''
+            UPDATE {table} SET path = ? || substr(path, ?)
+            WHERE path >= ? AND path < ?
+            ''', (new_path, len(old_path) + 1, prefix, upper))
+            if table == "media_files":
+                renamed_count = changed + cursor.rowcount
+        
+        if renamed_count:
+            from app.database.media.directories import assign_media_directories, prune_directories
+            from app.database.media.metadata import assign_media_metadata
+            
+            _, new_prefix, new_upper = _subtree_params(new_path)
+            cursor.execute('''
+            SELECT id, path FROM media_files
+            WHERE path = ? OR (path >= ? AND path < ?)
+            ''', (new_path, new_prefix, new_upper))
+            moved = [(row["id"], row["path"]) for row in cursor.fetchall()]
+            assign_media_directories(cursor, moved)
+            assign_media_metadata(cursor, moved)
+            prune_directories(cursor)
+        
+        cursor.execute("COMMIT")
+        return renamed_count
         
     except Exception as e:
         if conn:
-            conn.rollback()
-        logger.error(f"미디어 정보 삭제 중 오류 발생: {e}")
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"미디어 경로 변경 중 오류 발생: {e}")
         import traceback
         logger.error(traceback.format_exc())
-        return False
+        return 0
         
     finally:
         if conn:
@@ -0,0 +1,199 @@
+"""
+스캔 매니페스트 모듈
+
+디렉토리별 수정 시간, 하위 항목 수, 확인한 미디어/자막 파일을 저장합니다.
+증분 스캔은 수정 시간이 바뀌지 않은 디렉토리를 다시 나열하지 않고 이 기록을 사용합니다.
+"""
+
+import os
+import logging
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+from app.utils.logging import setup_module_logger
+from app.database.connection import get_connection, execute_query, fetch_one, fetch_all, connection_context
+
+# 로거 초기화
+logger = setup_module_logger("database.media.manifest")
+
+def _subtree_condition(column: str) -> str:
+    """
+    루트 디렉토리와 그 하위 경로를 찾는 조건 (LIKE 대신 범위 비교로 인덱스 사용, 특수 문자 안전)
+
+    Args:
+        column: 경로 컬럼 이름
+
+    Returns:
+        str: SQL 조건 (매개변수 3개: 루트, 루트 + 구분자, 루트 + 구분자 다음 문자)
+    """
+    return f"({column} = ? OR ({column} >= ? AND {column} < ?))"
+
+def _subtree_params(root_dir: str) -> Tuple[str, str, str]:
+    """
+    _subtree_condition 매개변수 생성
+
+    Args:
+        root_dir: 루트 디렉토리
+
+    Returns:
+        Tuple[str, str, str]: (루트, 루트 + 구분자, 루트 + 구분자 다음 문자)
+    """
+    root_dir = root_dir.rstrip(os.sep) or os.sep
+    prefix = root_dir if root_dir.endswith(os.sep) else root_dir + os.sep
+    return root_dir, prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+def load_scan_manifest(root_dir: str) -> Dict[str, Dict[str, Any]]:
+    """
+    루트 디렉토리 아래의 스캔 매니페스트 조회
+
+    Args:
+        root_dir: 루트 디렉토리
+
+    Returns:
+        Dict[str, Dict[str, Any]]: 디렉토리 경로별 mtime, subdirectories, media_files, subtitle_files
+    """
+    try:
+        params = _subtree_params(root_dir)
+
+        directories = fetch_all(
+            f"SELECT path, parent_path, mtime FROM scan_directories WHERE {_subtree_condition('path')}",
+            params
+        ) or []
+
+        manifest = {
+            row["path"]: {"mtime": row["mtime"], "subdirectories": [], "media_files": [], "subtitle_files": []}
+            for row in directories
+        }
+
+        for row in directories:
+            parent = manifest.get(row["parent_path"])
+            if parent is not None:
+                parent["subdirectories"].append(row["path"])
+
+        files = fetch_all(
+            f"SELECT path, dir_path, kind FROM scan_files WHERE {_subtree_condition('dir_path')}",
+            params
+        ) or []
+
+        for row in files:
+            entry = manifest.get(row["dir_path"])
+            if entry is not None:
+                entry["media_files" if row["kind"] == "media" else "subtitle_files"].append(row["path"])
+
+        return manifest
+
+    except Exception as e:
+        logger.error(f"스캔 매니페스트 조회 중 오류 발생: {e}")
+        return {}
+
+def count_scan_directories(root_dir: str) -> int:
+    """
+    루트 디렉토리 아래에 기록된 디렉토리 수 (지난 스캔 기준)
+
+    Args:
+        root_dir: 루트 디렉토리
+
+    Returns:
+        int: 디렉토리 수 (기록이 없으면 0)
+    """
+    try:
+        result = fetch_one(
+            f"SELECT COUNT(*) AS count FROM scan_directories WHERE {_subtree_condition('path')}",
+            _subtree_params(root_dir)
+        )
+        return result["count"] if result else 0
+
+    except Exception as e:
+        logger.error(f"스캔 디렉토리 수 조회 중 오류 발생: {e}")
+        return 0
+
+def save_scan_manifest(root_dir: str, listings: Iterable[Dict[str, Any]],
+                       visited: Optional[Iterable[str]] = None) -> bool:
+    """
+    다시 나열한 디렉토리 기록 저장
+
+    Args:
+        root_dir: 루트 디렉토리
+        listings: 디렉토리 기록 목록 (path, parent_path, mtime, media_files, subtitle_files, subdir_count)
+        visited: 이번 스캔에서 확인한 모든 디렉토리 (지정하면 목록에 없는 디렉토리 기록 삭제 -
+                 스캔이 끝까지 완료된 경우에만 지정)
+
+    Returns:
+        bool: 성공 여부
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+
+        for listing in listings:
+            path = listing["path"]
+            cursor.execute('''
+            INSERT INTO scan_directories (path, parent_path, mtime, media_count, subtitle_count, subdir_count, scanned_at)
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(path) DO UPDATE SET
+                parent_path = excluded.parent_path,
+                mtime = excluded.mtime,
+                media_count = excluded.media_count,
+                subtitle_count = excluded.subtitle_count,
+                subdir_count = excluded.subdir_count,
+                scanned_at = excluded.scanned_at
+            ''', (path, listing["parent_path"], listing["mtime"], len(listing["media_files"]),
+                  len(listing["subtitle_files"]), listing["subdir_count"]))
+
+            cursor.execute("DELETE FROM scan_files WHERE dir_path = ?", (path,))
+            cursor.executemany(
+                "INSERT OR REPLACE INTO scan_files (path, dir_path, kind) VALUES (?, ?, ?)",
+                [(file_path, path, "media") for file_path in listing["media_files"]]
+                + [(file_path, path, "subtitle") for file_path in listing["subtitle_files"]]
+            )
+
+        removed_count = 0
+        if visited is not None:
+            visited = set(visited)
+            cursor.execute(
+                f"SELECT path FROM scan_directories WHERE {_subtree_condition('path')}",
+                _subtree_params(root_dir)
+            )
+            removed = [(row["path"],) for row in cursor.fetchall() if row["path"] not in visited]
+
+            cursor.executemany("DELETE FROM scan_files WHERE dir_path = ?", removed)
+            cursor.executemany("DELETE FROM scan_directories WHERE path = ?", removed)
+            removed_count = len(removed)
+
+        cursor.execute("COMMIT")
+
+        if removed_count:
+            logger.info(f"스캔 매니페스트에서 사라진 디렉토리 {removed_count}개 삭제")
+        return True
+
+    except Exception as e:
+        if conn:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"스캔 매니페스트 저장 중 오류 발생: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return False
+
+    finally:
+        if conn:
+            conn.close()
+
+def clear_scan_manifest() -> bool:
+    """
+    스캔 매니페스트 전체 삭제 (다음 증분 스캔은 모든 디렉토리를 다시 나열)
+
+    Returns:
+        bool: 성공 여부
+    """
+    try:
+        execute_query("DELETE FROM scan_files")
+        execute_query("DELETE FROM scan_directories")
+        return True
+
+    except Exception as e:
+        logger.error(f"스캔 매니페스트 삭제 중 오류 발생: {e}")
+        return False
@@ -0,0 +1,156 @@
+"""
+미디어 메타데이터 컬럼 모듈
+
+파일 이름에서 추출한 작품 제목, 시즌, 에피소드, 연도, 해상도를 media_files 컬럼에 저장하고,
+검색에서 사용할 SQL 필터 조건을 만듭니다.
+"""
+
+import logging
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+from app.utils.logging import setup_module_logger
+from app.utils.media_metadata import (
+    METADATA_VERSION, parse_media_metadata, normalize_title_key, normalize_resolution
+)
+from app.database.connection import get_connection, execute_query, fetch_one, fetch_all, connection_context
+
+# 로거 초기화
+logger = setup_module_logger("database.media.metadata")
+
+# media_files에 저장하는 메타데이터 컬럼 (순서는 media_metadata_values와 같음)
+METADATA_COLUMNS = ("show_title", "show_key", "season", "episode", "year", "resolution", "metadata_version")
+
+def media_metadata_values(path: str) -> Tuple[Any, ...]:
+    """
+    경로에서 메타데이터 컬럼 값 추출
+
+    Args:
+        path: 미디어 파일 경로
+
+    Returns:
+        Tuple[Any, ...]: METADATA_COLUMNS 순서의 값
+    """
+    metadata = parse_media_metadata(path)
+    return (metadata["show_title"], metadata["show_key"], metadata["season"], metadata["episode"],
+            metadata["year"], metadata["resolution"], METADATA_VERSION)
+
+def assign_media_metadata(cursor, rows: Iterable[Tuple[int, str]]) -> int:
+    """
+    미디어 행의 메타데이터 컬럼을 경로에서 다시 추출하여 저장
+
+    트랜잭션은 호출자가 관리합니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        rows: (미디어 ID, 경로) 목록
+
+    Returns:
+        int: 갱신한 행 수
+    """
+    assignments = ", ".join(f"{column} = ?" for column in METADATA_COLUMNS)
+    updates = [media_metadata_values(path) + (media_id,) for media_id, path in rows]
+    cursor.executemany(f"UPDATE media_files SET {assignments} WHERE id = ?", updates)
+    return len(updates)
+
+def backfill_media_metadata(batch_size: int = 5000) -> int:
+    """
+    메타데이터가 없거나 이전 추출 규칙으로 만든 미디어 행 갱신 (스키마 초기화 시 호출)
+
+    Args:
+        batch_size: 한 트랜잭션에서 처리할 행 수
+
+    Returns:
+        int: 갱신한 행 수
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        total = 0
+
+        while True:
+            cursor.execute('''
+            SELECT id, path FROM media_files
+            WHERE metadata_version IS NULL OR metadata_version < ?
+            LIMIT ?
+            ''', (METADATA_VERSION, batch_size))
+            rows = [(row["id"], row["path"]) for row in cursor.fetchall()]
+            if not rows:
+                break
+
+            cursor.execute("BEGIN IMMEDIATE")
+            total += assign_media_metadata(cursor, rows)
+            cursor.execute("COMMIT")
+
+        if total:
+            logger.info(f"미디어 메타데이터 추출: {total}개")
+        return total
+
+    except Exception as e:
+        if conn:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"미디어 메타데이터 추출 중 오류 발생: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return 0
+
+    finally:
+        if conn:
+            conn.close()
+
+def build_media_filter(show: Optional[str] = None, season: Optional[int] = None,
+                       episode: Optional[int] = None, year: Optional[int] = None,
+                       resolution: Optional[str] = None, root: Optional[str] = None) -> Tuple[str, List[Any]]:
+    """
+    메타데이터 필터를 미디어 ID 조건으로 변환
+
+    조건은 "s.media_id IN (SELECT id FROM media_files WHERE ...)" 형태로,
+    메타데이터 인덱스로 대상 미디어를 먼저 좁힌 뒤 자막/FTS 결과와 비교합니다.
+    작품 제목은 제목 키가 같거나 그 뒤에 단어가 이어지는 경우 일치합니다
+    ("the office"는 "The Office US"와도 일치).
+
+    Args:
+        show: 작품 제목
+        season: 시즌 번호
+        episode: 에피소드 번호
+        year: 연도
+        resolution: 해상도 (예: "1080p")
+        root: 미디어 루트 (이 디렉토리 아래 미디어만, 경로 인덱스 범위 비교)
+
+    Returns:
+        Tuple[str, List[Any]]: (" AND ..." SQL 조건, 매개변수), 필터가 없으면 ("", [])
+    """
+    conditions = []
+    params: List[Any] = []
+
+    show_key = normalize_title_key(show)
+    if show_key:
+        conditions.append("(show_key = ? OR (show_key >= ? AND show_key < ?))")
+        params.extend([show_key, show_key + " ", show_key + "!"])
+    if season is not None:
+        conditions.append("season = ?")
+        params.append(season)
+    if episode is not None:
+        conditions.append("episode = ?")
+        params.append(episode)
+    if year is not None:
+        conditions.append("year = ?")
+        params.append(year)
+    resolution = normalize_resolution(resolution)
+    if resolution:
+        conditions.append("resolution = ?")
+        params.append(resolution)
+
+    if root:
+        from app.database.media.manifest import _subtree_params
+        _, prefix, upper = _subtree_params(root)
+        conditions.append("path >= ? AND path < ?")
+        params.extend([prefix, upper])
+
+    if not conditions:
+        return "", []
+
+    return f" AND s.media_id IN (SELECT id FROM media_files WHERE {' AND '.join(conditions)})", params
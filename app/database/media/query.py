@@ -3,7 +3,7 @@
 """
 
 import logging
-from typing import List, Dict, Any, Optional, Tuple, Union
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterator
 
 from app.utils.logging import setup_module_logger
 from app.database.connection import get_connection, execute_query, fetch_one, fetch_all, connection_context
@@ -121,3 +121,141 @@ def get_indexed_media_paths() -> List[str]:
     except Exception as e:
         logger.error(f"인덱싱된 미디어 경로 조회 중 오류 발생: {e}")
         return []
+
+def get_media_under_directory(directory: str) -> List[Dict[str, Any]]:
+    """
+    디렉토리 아래(하위 디렉토리 포함)의 미디어 파일 조회
+    
+    디렉토리 사전 트리를 따라 하위 디렉토리 ID를 모으고 idx_media_dir_id 인덱스로 미디어를 찾습니다.
+    
+    Args:
+        directory: 디렉토리 경로
+        
+    Returns:
+        List[Dict[str, Any]]: 미디어 정보 목록 (id, path)
+    """
+    conn = None
+    try:
+        from app.database.media.directories import find_directory_id, subtree_cte, _subtree_base
+        
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        directory_id = find_directory_id(cursor, directory)
+        if directory_id is None:
+            return []
+        
+        cursor.execute(subtree_cte() + '''
+        SELECT m.id, m.path
+        FROM subtree_dirs s JOIN media_files m ON m.dir_id = s.id
+        ORDER BY m.path
+        ''', (_subtree_base(directory), directory_id))
+        return cursor.fetchall()
+    except Exception as e:
+        logger.error(f"디렉토리 미디어 조회 중 오류 발생: {e}")
+        return []
+    finally:
+        if conn:
+            conn.close()
+
+def count_media_under_directory(directory: str) -> int:
+    """
+    디렉토리 아래(하위 디렉토리 포함)의 미디어 파일 수 조회
+    
+    Args:
+        directory: 디렉토리 경로
+        
+    Returns:
+        int: 미디어 파일 수
+    """
+    conn = None
+    try:
+        from app.database.media.directories import find_directory_id, subtree_cte, _subtree_base
+        
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        directory_id = find_directory_id(cursor, directory)
+        if directory_id is None:
+            return 0
+        
+        cursor.execute(subtree_cte() + '''
+        SELECT COUNT(*) AS count
+        FROM subtree_dirs s JOIN media_files m ON m.dir_id = s.id
+        ''', (_subtree_base(directory), directory_id))
+        result = cursor.fetchone()
+        return result["count"] if result else 0
+    except Exception as e:
+        logger.error(f"디렉토리 미디어 수 조회 중 오류 발생: {e}")
+        return 0
+    finally:
+        if conn:
+            conn.close()
+
+def iter_media_path_stats(root_dir: Optional[str] = None,
+                          batch_size: int = 10000) -> Iterator[Tuple[int, str, int, Optional[str]]]:
+    """
+    미디어 파일의 ID, 경로, 크기, 수정 시간을 튜플로 하나씩 반환
+    
+    딕셔너리 변환 없이 튜플 커서에서 batch_size개씩 읽으므로, 파일이 아주 많아도
+    전체 목록을 메모리에 만들지 않습니다.
+    
+    Args:
+        root_dir: 이 디렉토리 아래 미디어만 조회 (None이면 전체)
+        batch_size: 한 번에 읽을 행 수
+        
+    Yields:
+        Tuple[int, str, int, Optional[str]]: (id, path, size, last_modified)
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        conn.row_factory = None
+        cursor = conn.cursor()
+        
+        if root_dir:
+            from app.database.media.manifest import _subtree_params
+            
+            _, prefix, upper = _subtree_params(root_dir)
+            cursor.execute(
+                "SELECT id, path, size, last_modified FROM media_files WHERE path >= ? AND path < ?",
+                (prefix, upper)
+            )
+        else:
+            cursor.execute("SELECT id, path, size, last_modified FROM media_files")
+        
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
+            
+    except Exception as e:
+        logger.error(f"미디어 경로 조회 중 오류 발생: {e}")
+        
+    finally:
+        if conn:
+            conn.close()
+
+def get_bookmarked_media_paths(limit: int = 1000) -> List[str]:
+    """
+    북마크가 있는 미디어 파일 경로 조회 (최근 북마크 순)
+    
+    Args:
+        limit: 최대 경로 수
+        
+    Returns:
+        List[str]: 미디어 파일 경로 목록
+    """
+    try:
+        rows = fetch_all('''
+        SELECT media_path, MAX(created_at) AS last_created
+        FROM subtitle_bookmarks
+        GROUP BY media_path
+        ORDER BY last_created DESC
+        LIMIT ?
+        ''', (limit,))
+        return [row["media_path"] for row in rows]
+    except Exception as e:
+        logger.error(f"북마크 미디어 경로 조회 중 오류 발생: {e}")
+        return []
@@ -18,6 +18,23 @@ from app.database.connection import get_connection, execute_query, execute_trans
 # 로거 초기화
 logger = setup_module_logger("database.schema")
 
+def _add_missing_columns(cursor, table_name: str, columns: Dict[str, str]) -> None:
+    """
+    기존 테이블에 없는 컬럼 추가 (CREATE TABLE IF NOT EXISTS는 컬럼을 추가하지 않음)
+    
+    Args:
+        cursor: 데이터베이스 커서
+        table_name: 테이블 이름
+        columns: 컬럼 이름 → 컬럼 정의
+    """
+    cursor.execute(f"PRAGMA table_info({table_name})")
+    existing = {row["name"] for row in cursor.fetchall()}
+    
+    for name, definition in columns.items():
+        if name not in existing:
+            cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {name} {definition}")
+            logger.info(f"{table_name} 테이블에 {name} 컬럼 추가")
+
 def create_tables() -> bool:
     """
     필요한 모든 테이블 생성
@@ -41,6 +58,41 @@ def create_tables() -> bool:
                 updated_at TEXT DEFAULT CURRENT_TIMESTAMP
             )
         ''')
+        _add_missing_columns(cursor, 'media_files', {
+            'dir_id': 'INTEGER',
+            'show_title': 'TEXT',
+            'show_key': 'TEXT',
+            'season': 'INTEGER',
+            'episode': 'INTEGER',
+            'year': 'INTEGER',
+            'resolution': 'TEXT',
+            'metadata_version': 'INTEGER',
+            'available': 'INTEGER NOT NULL DEFAULT 1',  # 0이면 연결이 끊긴 미디어 루트의 파일 (인덱스는 유지)
+            'dev': 'INTEGER',                           # (dev, inode)가 같으면 하드 링크
+            'inode': 'INTEGER',
+            'fingerprint': 'TEXT'                       # 크기가 같은 파일이 있을 때만 계산하는 샘플 해시
+        })
+        
+        # directories 테이블 생성 (미디어 경로의 디렉토리 사전 - 최상위 항목은 parent_id 0)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS directories (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                parent_id INTEGER NOT NULL DEFAULT 0,
+                name TEXT NOT NULL,
+                UNIQUE(parent_id, name)
+            )
+        ''')
+        
+        # media_aliases 테이블 생성 (인덱싱하지 않은 중복 미디어 경로 → 대표 미디어)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS media_aliases (
+                path TEXT PRIMARY KEY,
+                media_id INTEGER NOT NULL,
+                reason TEXT NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (media_id) REFERENCES media_files (id) ON DELETE CASCADE
+            )
+        ''')
         
         # subtitles 테이블 생성 (시간을 밀리초 정수로 저장)
         cursor.execute('''
@@ -80,6 +132,83 @@ def create_tables() -> bool:
             )
         ''')
         
+        # subtitle_files 테이블 생성 (파일별 인코딩 기록 - 재인덱싱 시 감지 생략)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS subtitle_files (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT NOT NULL UNIQUE,
+                media_id INTEGER,
+                encoding TEXT,
+                encoding_score REAL DEFAULT 0,
+                size INTEGER DEFAULT 0,
+                mtime REAL,
+                multi_language BOOLEAN DEFAULT 0,
+                lang TEXT,
+                normalize_status TEXT,
+                normalized_at TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        _add_missing_columns(cursor, 'subtitle_files', {
+            'lang': 'TEXT',
+            'normalize_status': 'TEXT',
+            'normalized_at': 'TEXT'
+        })
+
+        # subtitle_sentences 테이블 생성 (여러 큐에 걸친 문장 - 문장 단위 검색용)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS subtitle_sentences (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                media_id INTEGER NOT NULL,
+                first_subtitle_id INTEGER NOT NULL,
+                last_subtitle_id INTEGER NOT NULL,
+                start_time INTEGER,
+                end_time INTEGER,
+                content TEXT NOT NULL,
+                lang TEXT,
+                FOREIGN KEY (media_id) REFERENCES media_files (id) ON DELETE CASCADE
+            )
+        ''')
+
+        # scan_directories 테이블 생성 (디렉토리 목록 - 증분 스캔 시 변경 없는 디렉토리 나열 생략)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS scan_directories (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT NOT NULL UNIQUE,
+                parent_path TEXT,
+                mtime REAL,
+                media_count INTEGER DEFAULT 0,
+                subtitle_count INTEGER DEFAULT 0,
+                subdir_count INTEGER DEFAULT 0,
+                scanned_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # scan_files 테이블 생성 (스캔에서 확인한 미디어/자막 파일)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS scan_files (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT NOT NULL UNIQUE,
+                dir_path TEXT NOT NULL,
+                kind TEXT NOT NULL
+            )
+        ''')
+        
+        # indexing_files 테이블 생성 (자막 파일별 인덱싱 상태 - 중단된 인덱싱을 끝나지 않은 파일부터 이어서 처리)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS indexing_files (
+                path TEXT PRIMARY KEY,
+                media_id INTEGER NOT NULL,
+                state TEXT NOT NULL DEFAULT 'queued',
+                subtitle_count INTEGER DEFAULT 0,
+                attempts INTEGER DEFAULT 0,
+                error TEXT,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (media_id) REFERENCES media_files (id) ON DELETE CASCADE
+            )
+        ''')
+        
         # jobs 테이블 생성
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS jobs (
@@ -100,12 +229,27 @@ def create_tables() -> bool:
         
         # 인덱스 생성
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_media_path ON media_files (path)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_media_dir_id ON media_files (dir_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_media_show ON media_files (show_key, season, episode)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_media_year ON media_files (year)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_media_resolution ON media_files (resolution)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_media_unavailable ON media_files (path) WHERE available = 0')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_media_inode ON media_files (dev, inode)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_media_size ON media_files (size, fingerprint)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_media_aliases_media ON media_aliases (media_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_subtitles_media_id ON subtitles (media_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_subtitles_start_time ON subtitles (start_time)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_subtitles_lang ON subtitles (lang, media_id, start_time)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_tags_media_path ON subtitle_tags (media_path)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_tags_start_time ON subtitle_tags (start_time)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_bookmarks_media_path ON subtitle_bookmarks (media_path)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_bookmarks_start_time ON subtitle_bookmarks (start_time)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_subtitle_files_media_id ON subtitle_files (media_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_sentences_media_id ON subtitle_sentences (media_id, start_time)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_scan_directories_parent ON scan_directories (parent_path)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_scan_files_dir_path ON scan_files (dir_path)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_indexing_files_media ON indexing_files (media_id)')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_indexing_files_unfinished ON indexing_files (state) WHERE state IN ('queued', 'parsing')")
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_type ON jobs (job_type)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_target_id ON jobs (target_id)')
@@ -116,6 +260,14 @@ def create_tables() -> bool:
         # FTS 가상 테이블 생성
         create_fts_table()
         
+        # 디렉토리 사전 컬럼이 추가되기 전의 미디어 행 연결
+        from app.database.media.directories import backfill_media_directories
+        backfill_media_directories()
+        
+        # 파일 이름 메타데이터가 없거나 추출 규칙이 바뀐 미디어 행 갱신
+        from app.database.media.metadata import backfill_media_metadata
+        backfill_media_metadata()
+        
         logger.info("데이터베이스 테이블 생성 완료")
         return True
     except Exception as e:
@@ -146,6 +298,29 @@ def create_fts_table() -> bool:
             )
         ''')
         
+        # 문장 단위 FTS 가상 테이블 생성
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS subtitle_sentences_fts USING fts5(
+                content,
+                content='subtitle_sentences',
+                content_rowid='id'
+            )
+        ''')
+        
+        # FTS 인덱스 상태 테이블 생성 (자막 FTS 추가 시 마지막 인덱싱 ID 기록)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS fts_index_status (
+                id INTEGER PRIMARY KEY,
+                last_indexed_id INTEGER DEFAULT 0,
+                last_indexed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                is_complete INTEGER DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            INSERT OR IGNORE INTO fts_index_status (id, last_indexed_id, is_complete)
+            VALUES (1, 0, 0)
+        ''')
+        
         conn.commit()
         conn.close()
         
@@ -155,6 +330,23 @@ def create_fts_table() -> bool:
         logger.error(f"FTS 테이블 생성 중 오류 발생: {e}")
         return False
 
+def _count_fts_rows(cursor, fts_table: str) -> int:
+    """
+    FTS 인덱스에 실제로 들어 있는 행 수
+
+    외부 콘텐츠 FTS에서 SELECT count(*)는 콘텐츠 테이블(subtitles)을 세므로,
+    인덱싱된 문서마다 한 행씩 있는 _docsize 섀도 테이블을 셉니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        fts_table: FTS 테이블 이름
+
+    Returns:
+        int: 인덱싱된 행 수
+    """
+    cursor.execute(f"SELECT count(*) AS count FROM {fts_table}_docsize")
+    return cursor.fetchone()["count"]
+
 def rebuild_fts_index(force: bool = False) -> bool:
     """
     FTS 인덱스 재구축
@@ -177,19 +369,19 @@ def rebuild_fts_index(force: bool = False) -> bool:
         cursor = conn.cursor()
         
         # 자막 테이블 확인
-        cursor.execute("SELECT count(*) FROM sqlite_master WHERE type='table' AND name='subtitles'")
-        if cursor.fetchone()[0] == 0:
+        cursor.execute("SELECT count(*) AS count FROM sqlite_master WHERE type='table' AND name='subtitles'")
+        if cursor.fetchone()["count"] == 0:
             logger.error("자막 테이블이 존재하지 않습니다.")
             return False
         
         # 자막 데이터 수 확인
-        cursor.execute("SELECT count(*) FROM subtitles")
-        subtitles_count = cursor.fetchone()[0]
+        cursor.execute("SELECT count(*) AS count FROM subtitles")
+        subtitles_count = cursor.fetchone()["count"]
         logger.info(f"자막 데이터 수: {subtitles_count}")
         
         # FTS 테이블 있는지 확인
-        cursor.execute("SELECT count(*) FROM sqlite_master WHERE type='table' AND name='subtitles_fts'")
-        fts_exists = cursor.fetchone()[0] > 0
+        cursor.execute("SELECT count(*) AS count FROM sqlite_master WHERE type='table' AND name='subtitles_fts'")
+        fts_exists = cursor.fetchone()["count"] > 0
         
         if force and fts_exists:
             # 기존 FTS 테이블 삭제
@@ -202,8 +394,7 @@ def rebuild_fts_index(force: bool = False) -> bool:
             create_fts_table()
         
         # FTS 데이터 수 확인
-        cursor.execute("SELECT count(*) FROM subtitles_fts")
-        fts_count = cursor.fetchone()[0]
+        fts_count = _count_fts_rows(cursor, "subtitles_fts")
         logger.info(f"FTS 데이터 수: {fts_count}")
         
         # 데이터가 일치하지 않거나 force가 True이면 인덱스 재구축
@@ -213,35 +404,15 @@ def rebuild_fts_index(force: bool = False) -> bool:
             # 트랜잭션 시작
             conn.execute('BEGIN')
             
-            # FTS 테이블 초기화
-            cursor.execute("DELETE FROM subtitles_fts")
-            
-            # 자막 데이터 가져오기
-            cursor.execute("SELECT id, content FROM subtitles")
-            subtitles = cursor.fetchall()
-            
-            # 배치 크기 설정 (메모리 효율성을 위해)
-            batch_size = 1000
-            total_indexed = 0
-            
-            for i in range(0, len(subtitles), batch_size):
-                batch = subtitles[i:i + batch_size]
-                
-                # 배치 삽입
-                cursor.executemany(
-                    "INSERT INTO subtitles_fts(rowid, content) VALUES (?, ?)",
-                    batch
-                )
-                
-                total_indexed += len(batch)
-                logger.info(f"진행 중: {total_indexed}/{len(subtitles)}")
+            # 외부 콘텐츠 FTS는 subtitles에서 인덱스를 다시 만듦
+            # (FTS에 없는 행을 DELETE하면 "database disk image is malformed" 오류가 나므로 DELETE로 비우지 않음)
+            cursor.execute("INSERT INTO subtitles_fts(subtitles_fts) VALUES('rebuild')")
             
             # 트랜잭션 커밋
             conn.commit()
             
             # 결과 확인
-            cursor.execute("SELECT count(*) FROM subtitles_fts")
-            new_fts_count = cursor.fetchone()[0]
+            new_fts_count = _count_fts_rows(cursor, "subtitles_fts")
             logger.info(f"인덱스 재구축 완료: {new_fts_count}/{subtitles_count} 항목 인덱싱됨")
             
             # 인덱스 최적화
@@ -289,7 +460,9 @@ def reset_database() -> bool:
         cursor = conn.cursor()
         
         # 기존 테이블 삭제
-        tables = ["subtitle_bookmarks", "subtitle_tags", "subtitles_fts", "subtitles", "media_files"]
+        tables = ["subtitle_bookmarks", "subtitle_tags", "subtitle_sentences_fts", "subtitle_sentences",
+                  "subtitles_fts", "fts_index_status", "subtitles", "subtitle_files", "indexing_files", "media_aliases", "media_files",
+                  "directories", "scan_files", "scan_directories"]
         
         for table in tables:
             cursor.execute(f"DROP TABLE IF EXISTS {table}")
@@ -332,24 +505,23 @@ def init_db() -> None:
         cursor = conn.cursor()
         
         # 자막 테이블이 존재하는지 확인
-        cursor.execute("SELECT count(*) FROM sqlite_master WHERE type='table' AND name='subtitles'")
-        if cursor.fetchone()[0] == 0:
+        cursor.execute("SELECT count(*) AS count FROM sqlite_master WHERE type='table' AND name='subtitles'")
+        if cursor.fetchone()["count"] == 0:
             logger.debug("자막 테이블이 아직 존재하지 않습니다.")
             return
         
         # 자막과 FTS 테이블의 레코드 수 비교
-        cursor.execute("SELECT count(*) FROM subtitles")
-        subtitles_count = cursor.fetchone()[0]
+        cursor.execute("SELECT count(*) AS count FROM subtitles")
+        subtitles_count = cursor.fetchone()["count"]
         
-        cursor.execute("SELECT count(*) FROM sqlite_master WHERE type='table' AND name='subtitles_fts'")
-        if cursor.fetchone()[0] == 0:
+        cursor.execute("SELECT count(*) AS count FROM sqlite_master WHERE type='table' AND name='subtitles_fts'")
+        if cursor.fetchone()["count"] == 0:
             logger.info("FTS 테이블이 존재하지 않습니다. 생성합니다.")
             create_fts_table()
             rebuild_fts_index(force=False)
             return
         
-        cursor.execute("SELECT count(*) FROM subtitles_fts")
-        fts_count = cursor.fetchone()[0]
+        fts_count = _count_fts_rows(cursor, "subtitles_fts")
         
         if subtitles_count != fts_count:
             logger.warning(f"FTS 인덱스가 불일치합니다. (자막: {subtitles_count}, FTS: {fts_count})")
@@ -5,11 +5,13 @@
 """
 
 from app.database.subtitles.init import init_subtitle_db
-from app.database.subtitles.insert import insert_subtitle
+from app.database.subtitles.insert import insert_subtitle, insert_subtitle_batch
 from app.database.subtitles.info import (
     get_subtitle_info, save_subtitle_info,
     get_media_subtitle_info, save_media_subtitle_info,
-    log_processing, get_subtitles_for_media
+    log_processing, get_subtitles_for_media,
+    get_subtitle_file_encoding, get_subtitle_file_record, save_subtitle_file_encoding,
+    get_normalized_subtitle_files, save_subtitle_normalize_result
 )
 from app.database.subtitles.stats import (
     get_encoding_stats, get_subtitles_by_encoding,
@@ -20,7 +22,10 @@ from app.database.subtitles.search import (
     search_subtitles, estimate_total_count
 )
 from app.database.subtitles.fts import (
-    rebuild_fts_index, add_subtitle_to_fts
+    rebuild_fts_index, add_subtitle_to_fts, add_subtitle_range_to_fts
+)
+from app.database.subtitles.sentences import (
+    add_sentences_for_range, clear_sentences_for_media, rebuild_sentence_index
 )
 from app.database.subtitles.cleanup import (
     clear_subtitles_for_media
@@ -40,9 +45,11 @@ __all__ = [
     'get_subtitle_info', 'save_subtitle_info',
     'get_media_subtitle_info', 'save_media_subtitle_info',
     'log_processing', 'get_subtitles_for_media',
+    'get_subtitle_file_encoding', 'get_subtitle_file_record', 'save_subtitle_file_encoding',
+    'get_normalized_subtitle_files', 'save_subtitle_normalize_result',
     
     # 자막 삽입
-    'insert_subtitle',
+    'insert_subtitle', 'insert_subtitle_batch',
     
     # 통계
     'get_encoding_stats', 'get_subtitles_by_encoding',
@@ -53,7 +60,10 @@ __all__ = [
     'search_subtitles', 'estimate_total_count',
     
     # FTS
-    'rebuild_fts_index', 'add_subtitle_to_fts',
+    'rebuild_fts_index', 'add_subtitle_to_fts', 'add_subtitle_range_to_fts',
+    
+    # 문장 인덱스
+    'add_sentences_for_range', 'clear_sentences_for_media', 'rebuild_sentence_index',
     
     # 정리
     'clear_subtitles_for_media',
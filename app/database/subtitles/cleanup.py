@@ -27,14 +27,13 @@ def clear_subtitles_for_media(media_id: int) -> bool:
         conn = get_connection()
         cursor = conn.cursor()
         
-        # FTS 테이블에서 삭제
-        cursor.execute('''
-        DELETE FROM subtitles_fts
-        WHERE rowid IN (SELECT id FROM subtitles WHERE media_id = ?)
-        ''', (media_id,))
+        # 문장 인덱스 삭제
+        from app.database.subtitles.sentences import clear_sentences_for_media
+        clear_sentences_for_media(media_id, conn)
         
-        # 자막 테이블에서 삭제
-        cursor.execute('DELETE FROM subtitles WHERE media_id = ?', (media_id,))
+        # FTS와 자막 테이블에서 삭제
+        from app.database.subtitles.fts import delete_rows_with_fts
+        delete_rows_with_fts(cursor, "subtitles", "subtitles_fts", "media_id = ?", (media_id,))
         
         # 미디어 파일 has_subtitle 상태 업데이트
         cursor.execute('UPDATE media_files SET has_subtitle = 0 WHERE id = ?', (media_id,))
@@ -3,6 +3,7 @@ FTS 전용 (재인덱싱, 상태 확인) 모듈
 """
 
 import logging
+import sqlite3
 from typing import List, Dict, Any, Optional, Tuple, Union
 
 from app.utils.logging import setup_module_logger
@@ -57,7 +58,8 @@ def rebuild_fts_index(force: bool = False) -> bool:
         
         # FTS 테이블 초기화 (강제 재구축인 경우)
         if force:
-            cursor.execute("DELETE FROM subtitles_fts")
+            # 외부 콘텐츠 FTS는 DELETE 대신 delete-all로 비움 (FTS에 없는 행이 있어도 오류 없음)
+            cursor.execute("INSERT INTO subtitles_fts(subtitles_fts) VALUES('delete-all')")
             
         # 배치 크기 설정
         batch_size = 1000
@@ -197,3 +199,78 @@ def add_subtitle_to_fts(subtitle_id: int, content: str, external_conn=None) -> b
         # 외부에서 연결을 전달받은 경우 연결을 닫지 않음 (외부에서 관리)
         if conn_created and conn:
             conn.close()
+
+def add_subtitle_range_to_fts(after_id: int, external_conn) -> int:
+    """
+    지정한 ID 이후에 삽입된 자막을 한 번의 쿼리로 FTS 인덱스에 추가
+    
+    배치 삽입 직후 같은 트랜잭션 안에서 호출하는 용도로, 커밋은 호출자가 관리합니다.
+    오류는 호출자에게 그대로 전달되어 자막 삽입과 함께 롤백됩니다.
+    
+    Args:
+        after_id: 배치 삽입 전 자막 테이블의 마지막 ID
+        external_conn: 배치 삽입에 사용한 데이터베이스 연결
+        
+    Returns:
+        int: FTS 인덱스에 추가된 자막 수
+    """
+    cursor = external_conn.cursor()
+    
+    cursor.execute('''
+    INSERT OR REPLACE INTO subtitles_fts(rowid, content)
+    SELECT id, content FROM subtitles WHERE id > ?
+    ''', (after_id,))
+    added_count = cursor.rowcount
+    
+    # 인덱스 상태 업데이트
+    cursor.execute('''
+    UPDATE fts_index_status
+    SET last_indexed_id = MAX(last_indexed_id, (SELECT COALESCE(MAX(id), 0) FROM subtitles)),
+        last_indexed_at = CURRENT_TIMESTAMP
+    WHERE id = 1
+    ''')
+    
+    return added_count
+
+def delete_rows_with_fts(cursor, content_table: str, fts_table: str, where_sql: str, params: Tuple = ()) -> int:
+    """
+    외부 콘텐츠 FTS 항목과 원본 행을 함께 삭제 (트랜잭션은 호출자가 관리)
+
+    FTS 토큰은 원본 행이 남아 있을 때 지워야 하므로 FTS를 먼저 삭제합니다.
+    FTS에 들어가지 않은 행이 섞여 있으면 SQLite가 "database disk image is malformed" 오류를 내는데,
+    이 경우 FTS 삭제만 되돌리고 원본 행을 지운 뒤 FTS를 원본 테이블 기준으로 재구축합니다.
+    FTS 오류 때문에 원본 행 삭제가 롤백되지는 않습니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        content_table: 원본 테이블 (subtitles, subtitle_sentences)
+        fts_table: 원본 테이블의 FTS 테이블
+        where_sql: 삭제할 원본 행 조건 (예: "media_id = ?")
+        params: 조건 매개변수
+
+    Returns:
+        int: 삭제된 원본 행 수
+    """
+    cursor.execute("SAVEPOINT fts_delete")
+    try:
+        cursor.execute(f'''
+        DELETE FROM {fts_table}
+        WHERE rowid IN (SELECT id FROM {content_table} WHERE {where_sql})
+        ''', params)
+        fts_deleted = True
+    except sqlite3.DatabaseError as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT fts_delete")
+        logger.warning(f"{fts_table} 항목 삭제 중 오류 발생, 원본 삭제 후 FTS를 재구축합니다: {e}")
+        fts_deleted = False
+    cursor.execute("RELEASE SAVEPOINT fts_delete")
+
+    cursor.execute(f"DELETE FROM {content_table} WHERE {where_sql}", params)
+    deleted = cursor.rowcount
+
+    if not fts_deleted:
+        try:
+            cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES('rebuild')")
+        except sqlite3.DatabaseError as e:
+            logger.error(f"{fts_table} 재구축 중 오류 발생 (rebuild_fts_index로 다시 재구축 필요): {e}")
+
+    return deleted
@@ -380,3 +380,166 @@ def get_subtitles_for_media(media_id: int, limit: int = 1000, offset: int = 0) -
         import traceback
         logger.error(traceback.format_exc())
         return []
+
+def get_subtitle_file_encoding(subtitle_path: str, size: int, mtime: float) -> Optional[str]:
+    """
+    저장된 자막 파일 인코딩 조회
+    
+    파일 크기와 수정 시간이 기록과 같을 때만 인코딩을 반환하므로,
+    재인덱싱 시 변경되지 않은 파일은 인코딩 감지를 건너뛸 수 있습니다.
+    
+    Args:
+        subtitle_path: 자막 파일 경로
+        size: 현재 파일 크기 (바이트)
+        mtime: 현재 파일 수정 시간 (epoch 초)
+        
+    Returns:
+        Optional[str]: 저장된 인코딩 또는 None (기록이 없거나 파일이 변경된 경우)
+    """
+    try:
+        result = fetch_one(
+            "SELECT encoding, size, mtime FROM subtitle_files WHERE path = ?",
+            (subtitle_path,)
+        )
+        
+        if not result or not result["encoding"]:
+            return None
+            
+        if result["size"] != size or result["mtime"] != mtime:
+            return None
+            
+        return result["encoding"]
+        
+    except Exception as e:
+        logger.error(f"자막 파일 인코딩 조회 중 오류 발생: {e}")
+        return None
+
+def get_subtitle_file_record(subtitle_path: str, size: int, mtime: float) -> Optional[Dict[str, Any]]:
+    """
+    저장된 자막 파일 기록(인코딩, 언어) 조회
+    
+    파일 크기와 수정 시간이 기록과 같을 때만 반환하므로, 변경되지 않은 파일은
+    인코딩 감지와 언어 판별을 모두 건너뛸 수 있습니다.
+    
+    Args:
+        subtitle_path: 자막 파일 경로
+        size: 현재 파일 크기 (바이트)
+        mtime: 현재 파일 수정 시간 (epoch 초)
+        
+    Returns:
+        Optional[Dict[str, Any]]: encoding, lang, multi_language 또는 None
+    """
+    try:
+        result = fetch_one(
+            "SELECT encoding, lang, multi_language, size, mtime FROM subtitle_files WHERE path = ?",
+            (subtitle_path,)
+        )
+        
+        if not result or result["size"] != size or result["mtime"] != mtime:
+            return None
+            
+        return {
+            "encoding": result["encoding"],
+            "lang": result["lang"],
+            "multi_language": bool(result["multi_language"])
+        }
+        
+    except Exception as e:
+        logger.error(f"자막 파일 기록 조회 중 오류 발생: {e}")
+        return None
+
+def save_subtitle_file_encoding(subtitle_path: str, media_id: Optional[int], encoding: str,
+                                encoding_score: float, size: int, mtime: float,
+                                lang: Optional[str] = None, multi_language: bool = False) -> bool:
+    """
+    자막 파일 인코딩/언어 기록 저장 (있으면 갱신)
+    
+    Args:
+        subtitle_path: 자막 파일 경로
+        media_id: 미디어 ID
+        encoding: 디코딩에 사용된 인코딩
+        encoding_score: 깨진 문자 비율 (0이면 정상)
+        size: 파일 크기 (바이트)
+        mtime: 파일 수정 시간 (epoch 초)
+        lang: 판별된 파일 언어 (None이면 기존 값 유지)
+        multi_language: 다국어 파일 여부
+        
+    Returns:
+        bool: 성공 여부
+    """
+    try:
+        cursor = execute_query('''
+        INSERT INTO subtitle_files (path, media_id, encoding, encoding_score, size, mtime, lang, multi_language)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(path) DO UPDATE SET
+            media_id = excluded.media_id,
+            encoding = excluded.encoding,
+            encoding_score = excluded.encoding_score,
+            size = excluded.size,
+            mtime = excluded.mtime,
+            lang = COALESCE(excluded.lang, subtitle_files.lang),
+            multi_language = excluded.multi_language,
+            updated_at = CURRENT_TIMESTAMP
+        ''', (subtitle_path, media_id, encoding, encoding_score, size, mtime, lang, int(multi_language)))
+        
+        return cursor is not None
+        
+    except Exception as e:
+        logger.error(f"자막 파일 인코딩 저장 중 오류 발생: {e}")
+        return False
+
+def get_normalized_subtitle_files() -> Dict[str, Tuple[int, float]]:
+    """
+    UTF-8 정규화가 끝난 자막 파일 목록 조회 (작업 재개용)
+    
+    Returns:
+        Dict[str, Tuple[int, float]]: 경로별 (파일 크기, 수정 시간)
+    """
+    try:
+        results = fetch_all(
+            "SELECT path, size, mtime FROM subtitle_files WHERE normalize_status IN ('converted', 'skipped')"
+        )
+        return {row["path"]: (row["size"], row["mtime"]) for row in results or []}
+        
+    except Exception as e:
+        logger.error(f"정규화된 자막 파일 목록 조회 중 오류 발생: {e}")
+        return {}
+
+def save_subtitle_normalize_result(result: Dict[str, Any]) -> bool:
+    """
+    자막 파일 UTF-8 정규화 결과 저장 (있으면 갱신)
+    
+    원본을 덮어썼거나 이미 UTF-8인 파일은 인코딩을 utf-8로 기록하고 변환 후 파일 크기/수정 시간을
+    저장하므로, 이후 인덱싱에서 인코딩 감지를 건너뜁니다.
+    
+    Args:
+        result: convert_subtitle_encoding 반환값
+        
+    Returns:
+        bool: 성공 여부
+    """
+    try:
+        status = result["status"]
+        # 원본을 덮어쓴 경우에만 원본 경로의 인코딩이 utf-8로 바뀜
+        rewritten = status == 'skipped' or result.get("output_path") == result["path"]
+        encoding = 'utf-8' if rewritten else result.get("encoding")
+        
+        cursor = execute_query('''
+        INSERT INTO subtitle_files (path, encoding, encoding_score, size, mtime, normalize_status, normalized_at)
+        VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(path) DO UPDATE SET
+            encoding = COALESCE(excluded.encoding, subtitle_files.encoding),
+            encoding_score = excluded.encoding_score,
+            size = COALESCE(excluded.size, subtitle_files.size),
+            mtime = COALESCE(excluded.mtime, subtitle_files.mtime),
+            normalize_status = excluded.normalize_status,
+            normalized_at = excluded.normalized_at,
+            updated_at = CURRENT_TIMESTAMP
+        ''', (result["path"], encoding, result.get("encoding_score", 0.0),
+              result.get("size"), result.get("mtime"), status))
+        
+        return cursor is not None
+        
+    except Exception as e:
+        logger.error(f"자막 파일 정규화 결과 저장 중 오류 발생: {e}")
+        return False
@@ -85,3 +85,89 @@ def insert_subtitle(media_id: int, start_ms: int, end_ms: int,
         # 외부에서 연결을 전달받은 경우 연결을 닫지 않음 (외부에서 관리)
         if conn_created and conn:
             conn.close()
+
+def insert_subtitle_batch(media_id: int, batch, lang: str = 'en', state_path: Optional[str] = None) -> int:
+    """
+    파싱된 자막 큐 묶음을 하나의 트랜잭션으로 삽입
+    
+    자막 행은 executemany로 한 번에 삽입하고, FTS 인덱스는 삽입된 ID 범위를
+    한 번의 INSERT ... SELECT로 갱신합니다. 같은 트랜잭션에서 문장 인덱스도 함께 저장합니다.
+    
+    Args:
+        media_id: 미디어 ID
+        batch: 자막 큐 묶음 (app.subtitle.cue_batch.CueBatch)
+        lang: 언어가 지정되지 않은 큐에 사용할 기본 언어 코드
+        state_path: 인덱싱 상태를 같은 트랜잭션에서 written으로 기록할 자막 파일 경로
+        
+    Returns:
+        int: 삽입된 자막 수 (실패 시 0)
+    """
+    if not len(batch):
+        return 0
+        
+    from app.utils.helpers import ms_to_srt_timestamp
+    from app.database.subtitles.fts import add_subtitle_range_to_fts
+    from app.database.subtitles.sentences import add_sentences_for_range
+    
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        # 쓰기 잠금을 먼저 잡아 삽입 ID가 연속되도록 보장
+        cursor.execute("BEGIN IMMEDIATE")
+        
+        cursor.execute("SELECT COALESCE(MAX(id), 0) AS last_id FROM subtitles")
+        last_id = cursor.fetchone()["last_id"]
+        
+        cursor.executemany('''
+        INSERT INTO subtitles (media_id, start_time, end_time, content, lang, start_time_text, end_time_text)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            (media_id, start_ms, end_ms, text, cue_lang or lang,
+             ms_to_srt_timestamp(start_ms), ms_to_srt_timestamp(end_ms))
+            for start_ms, end_ms, text, cue_lang in batch
+        ))
+        
+        # FTS 인덱스 추가 - 같은 트랜잭션이므로 실패하면 묶음 전체를 롤백 (FTS에 없는 자막을 남기지 않음)
+        add_subtitle_range_to_fts(last_id, conn)
+        
+        # 문장 인덱스 추가 (큐에 걸쳐 나뉜 문장 검색용) - 오류가 발생해도 자막 삽입은 유지
+        if config.get("index_sentences", True):
+            cursor.execute("SAVEPOINT sentence_batch")
+            try:
+                add_sentences_for_range(media_id, last_id, lang, conn)
+                cursor.execute("RELEASE SAVEPOINT sentence_batch")
+            except Exception as sentence_error:
+                cursor.execute("ROLLBACK TO SAVEPOINT sentence_batch")
+                cursor.execute("RELEASE SAVEPOINT sentence_batch")
+                logger.warning(f"문장 인덱스 추가 중 오류 발생 (자막은 정상적으로 삽입됨): {sentence_error}")
+        
+        # 미디어 파일 has_subtitle 상태 업데이트
+        cursor.execute('''
+        UPDATE media_files SET has_subtitle = 1
+        WHERE id = ?
+        ''', (media_id,))
+        
+        # 자막 파일 인덱싱 상태도 같은 트랜잭션에서 완료로 기록 (중단 후 재개 시 저장된 파일은 다시 처리하지 않음)
+        if state_path:
+            from app.database.jobs.indexing_files import mark_indexing_file_written
+            mark_indexing_file_written(state_path, len(batch), conn)
+        
+        cursor.execute("COMMIT")
+        return len(batch)
+        
+    except Exception as e:
+        if conn:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"자막 일괄 삽입 중 오류: {str(e)} - media_id={media_id}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return 0
+        
+    finally:
+        if conn:
+            conn.close()
@@ -12,8 +12,52 @@ from app.database.connection import get_connection, execute_query, fetch_one, fe
 # 로거 초기화
 logger = setup_module_logger("database.subtitles.search")
 
+# 문장 단위 검색 결과 컬럼 (첫 큐 ID와 시간 텍스트를 함께 반환하여 원래 큐로 이동 가능)
+_SENTENCE_COLUMNS = "s.first_subtitle_id AS id, s.media_id, s.start_time, s.end_time, fc.start_time_text, lc.end_time_text, s.content, s.lang, m.path as media_path, m.has_subtitle, m.available as media_available"
+_SENTENCE_JOINS = "JOIN subtitles fc ON fc.id = s.first_subtitle_id JOIN subtitles lc ON lc.id = s.last_subtitle_id"
+
+def _build_search_source(search_method: str, scope: str, count_only: bool = False) -> Tuple[str, str]:
+    """
+    검색 방식과 범위에 맞는 SELECT ... WHERE 절 생성
+    
+    문장 범위에서도 테이블 별칭을 s로 두므로 언어/시간 필터를 그대로 적용할 수 있습니다.
+    
+    Args:
+        search_method: 검색 방식 ('like' 또는 'fts')
+        scope: 검색 범위 ('cue' 또는 'sentence')
+        count_only: 결과 수만 조회할지 여부
+        
+    Returns:
+        Tuple[str, str]: (SQL, 검색 조건 종류 'match' 또는 'like')
+    """
+    sentence = scope == 'sentence'
+    table = "subtitle_sentences" if sentence else "subtitles"
+    fts_table = f"{table}_fts"
+    
+    if count_only:
+        columns, joins = "COUNT(*) as count", ""
+    elif sentence:
+        columns, joins = _SENTENCE_COLUMNS, f"{_SENTENCE_JOINS} JOIN media_files m ON s.media_id = m.id"
+    else:
+        columns = "s.id, s.media_id, s.start_time, s.end_time, s.start_time_text, s.end_time_text, s.content, s.lang, m.path as media_path, m.has_subtitle, m.available as media_available"
+        joins = "JOIN media_files m ON s.media_id = m.id"
+    
+    if search_method.lower() == 'fts':
+        # FTS 테이블 존재 확인
+        fts_exists = fetch_one("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (fts_table,))
+        if not fts_exists:
+            raise ValueError(f"FTS 테이블이 존재하지 않습니다: {fts_table}")
+        
+        sql = f"SELECT {columns} FROM {fts_table} fts JOIN {table} s ON fts.rowid = s.id {joins} WHERE {fts_table} MATCH ?"
+        return sql, 'match'
+    
+    sql = f"SELECT {columns} FROM {table} s {joins} WHERE s.content LIKE ?"
+    return sql, 'like'
+
 def search_subtitles(query: str, lang: str = None, start_time: str = None, end_time: str = None, 
-                  page: int = 1, per_page: int = 50, search_method: str = 'fts') -> List[Dict[str, Any]]:
+                  page: int = 1, per_page: int = 50, search_method: str = 'fts',
+                  scope: str = 'cue', show: str = None, season: int = None, episode: int = None,
+                  year: int = None, resolution: str = None, root: str = None) -> List[Dict[str, Any]]:
     """
     자막 내용 검색
 
@@ -25,6 +69,13 @@ def search_subtitles(query: str, lang: str = None, start_time: str = None, end_t
         page: 페이지 번호 (1부터 시작)
         per_page: 페이지당 결과 수
         search_method: 검색 방식 ('like' 또는 'fts', 기본값: 'fts')
+        scope: 검색 범위 ('cue': 큐 단위, 'sentence': 여러 큐에 걸친 문장 단위)
+        show: 작품 제목 필터 (파일/폴더 이름에서 추출한 제목)
+        season: 시즌 번호 필터
+        episode: 에피소드 번호 필터
+        year: 연도 필터
+        resolution: 해상도 필터 (예: '1080p')
+        root: 미디어 루트 필터 (이 루트 아래 미디어만)
         
     Returns:
         List[Dict[str, Any]]: 검색 결과 목록
@@ -48,21 +99,15 @@ def search_subtitles(query: str, lang: str = None, start_time: str = None, end_t
     offset = (page - 1) * per_page
     
     try:
-        # 검색 방식에 따른 쿼리 작성
-        if search_method.lower() == 'fts':
-            # FTS 테이블 존재 확인
-            fts_exists = fetch_one("SELECT name FROM sqlite_master WHERE type='table' AND name='subtitles_fts'")
-            if not fts_exists:
-                raise ValueError("FTS 테이블이 존재하지 않습니다.")
-                
-            # FTS 쿼리 작성 (실제 DB 컬럼명에 맞게 수정)
-            sql = "SELECT s.id, s.media_id, s.start_time, s.end_time, s.start_time_text, s.end_time_text, s.content, s.lang, m.path as media_path, m.has_subtitle FROM subtitles_fts fts JOIN subtitles s ON fts.rowid = s.id JOIN media_files m ON s.media_id = m.id WHERE subtitles_fts MATCH ?"
-            params = [query]
-            
-        else:  # 'like' 검색 방식
-            # LIKE 쿼리 작성 (실제 DB 컬럼명에 맞게 수정)
-            sql = "SELECT s.id, s.media_id, s.start_time, s.end_time, s.start_time_text, s.end_time_text, s.content, s.lang, m.path as media_path, m.has_subtitle FROM subtitles s JOIN media_files m ON s.media_id = m.id WHERE s.content LIKE ?"
-            params = [f"%{query}%"]
+        # 검색 방식과 범위에 따른 쿼리 작성
+        sql, condition = _build_search_source(search_method, scope)
+        params = [query] if condition == 'match' else [f"%{query}%"]
+        
+        # 미디어 메타데이터 필터 (인덱스로 대상 미디어를 먼저 좁힘)
+        from app.database.media.metadata import build_media_filter
+        media_filter, media_params = build_media_filter(show, season, episode, year, resolution, root)
+        sql += media_filter
+        params.extend(media_params)
         
         # 추가 필터 적용
         if lang:
@@ -104,7 +149,8 @@ def search_subtitles(query: str, lang: str = None, start_time: str = None, end_t
         return []
 
 def estimate_total_count(query: str, lang: str = None, start_time: str = None, end_time: str = None, 
-                     search_method: str = 'fts') -> int:
+                     search_method: str = 'fts', scope: str = 'cue', show: str = None, season: int = None,
+                     episode: int = None, year: int = None, resolution: str = None, root: str = None) -> int:
     """
     검색 조건에 맞는 총 결과 수 추정
 
@@ -114,6 +160,13 @@ def estimate_total_count(query: str, lang: str = None, start_time: str = None, e
         start_time: 시작 시간 필터 (HH:MM:SS)
         end_time: 종료 시간 필터 (HH:MM:SS)
         search_method: 검색 방식 ('like' 또는 'fts', 기본값: 'fts')
+        scope: 검색 범위 ('cue': 큐 단위, 'sentence': 여러 큐에 걸친 문장 단위)
+        show: 작품 제목 필터 (파일/폴더 이름에서 추출한 제목)
+        season: 시즌 번호 필터
+        episode: 에피소드 번호 필터
+        year: 연도 필터
+        resolution: 해상도 필터 (예: '1080p')
+        root: 미디어 루트 필터 (이 루트 아래 미디어만)
         
     Returns:
         int: 총 결과 수 추정값
@@ -134,21 +187,15 @@ def estimate_total_count(query: str, lang: str = None, start_time: str = None, e
         return 0
     
     try:
-        # 검색 방식에 따른 쿼리 작성
-        if search_method.lower() == 'fts':
-            # FTS 테이블 존재 확인
-            fts_exists = fetch_one("SELECT name FROM sqlite_master WHERE type='table' AND name='subtitles_fts'")
-            if not fts_exists:
-                raise ValueError("FTS 테이블이 존재하지 않습니다.")
-                
-            # FTS 쿼리 작성 (실제 DB 컬럼명에 맞게 수정)
-            sql = "SELECT COUNT(*) as count FROM subtitles_fts fts JOIN subtitles s ON fts.rowid = s.id WHERE subtitles_fts MATCH ?"
-            params = [query]
-            
-        else:  # 'like' 검색 방식
-            # LIKE 쿼리 작성 (실제 DB 컬럼명에 맞게 수정)
-            sql = "SELECT COUNT(*) as count FROM subtitles s WHERE s.content LIKE ?"
-            params = [f"%{query}%"]
+        # 검색 방식과 범위에 따른 쿼리 작성
+        sql, condition = _build_search_source(search_method, scope, count_only=True)
+        params = [query] if condition == 'match' else [f"%{query}%"]
+        
+        # 미디어 메타데이터 필터 (인덱스로 대상 미디어를 먼저 좁힘)
+        from app.database.media.metadata import build_media_filter
+        media_filter, media_params = build_media_filter(show, season, episode, year, resolution, root)
+        sql += media_filter
+        params.extend(media_params)
         
         # 추가 필터 적용
         if lang:
@@ -0,0 +1,146 @@
+"""
+문장 단위 자막 인덱스 모듈
+
+여러 큐에 걸쳐 나뉜 문장을 subtitle_sentences 테이블과 FTS 인덱스에 저장합니다.
+각 문장은 첫 큐 ID를 가지므로 검색 결과에서 원래 큐의 시간으로 이동할 수 있습니다.
+"""
+
+import logging
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+from app.utils.logging import setup_module_logger
+from app.config import config
+from app.database.connection import get_connection, execute_query, fetch_one, fetch_all, connection_context
+from app.subtitle.sentences import iter_sentences
+
+# 로거 초기화
+logger = setup_module_logger("database.subtitles.sentences")
+
+def add_sentences_for_range(media_id: int, after_id: int, default_lang: str, external_conn) -> int:
+    """
+    지정한 ID 이후에 삽입된 자막 큐를 문장으로 병합하여 저장하고 FTS 인덱스에 추가
+
+    배치 삽입 직후 같은 트랜잭션 안에서 호출하는 용도로, 커밋은 호출자가 관리합니다.
+
+    Args:
+        media_id: 미디어 ID
+        after_id: 배치 삽입 전 자막 테이블의 마지막 ID
+        default_lang: 언어가 없는 문장에 사용할 기본 언어 코드
+        external_conn: 배치 삽입에 사용한 데이터베이스 연결
+
+    Returns:
+        int: 저장된 문장 수
+    """
+    cursor = external_conn.cursor()
+
+    cursor.execute('''
+    SELECT id, start_time, end_time, content, lang FROM subtitles
+    WHERE id > ? AND media_id = ?
+    ORDER BY id
+    ''', (after_id, media_id))
+    rows = cursor.fetchall()
+
+    return _insert_sentences(cursor, media_id, rows, default_lang)
+
+def _insert_sentences(cursor, media_id: int, rows: List[Dict[str, Any]], default_lang: str) -> int:
+    """
+    자막 행 목록을 문장으로 병합하여 저장하고 FTS 인덱스에 추가
+
+    Args:
+        cursor: 데이터베이스 커서 (트랜잭션은 호출자가 관리)
+        media_id: 미디어 ID
+        rows: id 순서로 정렬된 자막 행 (id, start_time, end_time, content, lang)
+        default_lang: 언어가 없는 문장에 사용할 기본 언어 코드
+
+    Returns:
+        int: 저장된 문장 수
+    """
+    if not rows:
+        return 0
+
+    cursor.execute("SELECT COALESCE(MAX(id), 0) AS last_id FROM subtitle_sentences")
+    last_sentence_id = cursor.fetchone()["last_id"]
+
+    cues = ((row["start_time"], row["end_time"], row["content"], row["lang"]) for row in rows)
+    cursor.executemany('''
+    INSERT INTO subtitle_sentences (media_id, first_subtitle_id, last_subtitle_id, start_time, end_time, content, lang)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        (media_id, rows[sentence.first_index]["id"], rows[sentence.last_index]["id"],
+         sentence.start_ms, sentence.end_ms, sentence.text, sentence.lang or default_lang)
+        for sentence in iter_sentences(cues)
+    ))
+    sentence_count = cursor.rowcount
+
+    cursor.execute('''
+    INSERT OR REPLACE INTO subtitle_sentences_fts(rowid, content)
+    SELECT id, content FROM subtitle_sentences WHERE id > ?
+    ''', (last_sentence_id,))
+
+    return sentence_count
+
+def clear_sentences_for_media(media_id: int, external_conn) -> None:
+    """
+    특정 미디어의 문장 인덱스 삭제 (커밋은 호출자가 관리)
+
+    Args:
+        media_id: 미디어 ID
+        external_conn: 데이터베이스 연결
+    """
+    from app.database.subtitles.fts import delete_rows_with_fts
+
+    # 외부 콘텐츠 FTS는 원본 행이 남아 있을 때 삭제해야 토큰이 함께 지워짐
+    delete_rows_with_fts(external_conn.cursor(), "subtitle_sentences", "subtitle_sentences_fts",
+                         "media_id = ?", (media_id,))
+
+def rebuild_sentence_index() -> Dict[str, Any]:
+    """
+    기존 자막 데이터로 문장 인덱스 전체 재구축
+
+    문장 인덱스 도입 전에 인덱싱된 자막에도 문장 단위 검색을 적용할 때 사용합니다.
+
+    Returns:
+        Dict[str, Any]: 재구축 결과 (success, media_count, sentence_count)
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("DELETE FROM subtitle_sentences")
+        cursor.execute("INSERT INTO subtitle_sentences_fts(subtitle_sentences_fts) VALUES('delete-all')")
+        cursor.execute("COMMIT")
+
+        cursor.execute("SELECT DISTINCT media_id FROM subtitles ORDER BY media_id")
+        media_ids = [row["media_id"] for row in cursor.fetchall()]
+
+        sentence_count = 0
+        for media_id in media_ids:
+            # 미디어 단위로 커밋하여 쓰기 잠금을 오래 잡지 않음
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute('''
+            SELECT id, start_time, end_time, content, lang FROM subtitles
+            WHERE media_id = ?
+            ORDER BY id
+            ''', (media_id,))
+            sentence_count += _insert_sentences(cursor, media_id, cursor.fetchall(), 'en')
+            cursor.execute("COMMIT")
+
+        logger.info(f"문장 인덱스 재구축 완료: 미디어 {len(media_ids)}개, 문장 {sentence_count}개")
+        return {"success": True, "media_count": len(media_ids), "sentence_count": sentence_count}
+
+    except Exception as e:
+        if conn:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+        logger.error(f"문장 인덱스 재구축 중 오류 발생: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return {"success": False, "message": str(e)}
+
+    finally:
+        if conn:
+            conn.close()
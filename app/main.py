@@ -24,6 +24,7 @@ from app.database.schema import init_db
 from app.database.connection import get_connection, close_connection  # 풀링 제거, 단일 연결 함수로 변경
 from app.routes import search, stats, indexing, settings, database  # database 라우트 추가
 from app.routes import docs  # 문서 라우터 추가
+from app.routes import encoding  # 인코딩 정규화 라우터 추가
 from app.services.indexer import indexer_service
 
 
@@ -97,6 +98,9 @@ app.include_router(database.router)
 # 문서 라우터 등록
 app.include_router(docs.router)
 
+# 인코딩 정규화 라우터 등록
+app.include_router(encoding.router)
+
 
 @app.on_event("startup")
 async def startup_event():
@@ -110,6 +114,11 @@ async def startup_event():
         init_db()
         logger.info("데이터베이스가 성공적으로 초기화되었습니다.")
         
+        # 이전 실행에서 끝나지 않은 인덱싱 이어서 처리 (자동 재시작 설정 시, 끝나지 않은 파일만)
+        if config.get("auto_restart_indexing", False):
+            resume_result = indexer_service.resume_unfinished_files()
+            logger.info(f"인덱싱 자동 재시작: {resume_result.get('message') or resume_result.get('error')}")
+        
 
         
         # 무거운 자동 작업은 설정에 따라 선택적으로 실행
@@ -117,8 +126,8 @@ async def startup_event():
             # FTS 인덱스 상태 확인 및 필요시 복구
             logger.info("FTS 인덱스 상태 확인 중...")
             try:
-                from app.services.indexer import update_fts_index
-                update_result = update_fts_index(force=False)  # 필요한 경우에만 재구축
+                from app.database.schema import rebuild_fts_index
+                update_result = rebuild_fts_index(force=False)  # 필요한 경우에만 재구축
                 if update_result:
                     logger.info("FTS 인덱스가 정상 상태입니다.")
                 else:
@@ -133,6 +142,11 @@ async def startup_event():
             else:
                 logger.info("인덱싱 상태 확인 - 진행 중인 인덱싱이 없습니다.")
             
+            # 감시 모드 (설정한 경우에만)
+            if config.get("watch_enabled", False):
+                watch_result = indexer_service.start_watch()
+                logger.info(f"감시 모드: {watch_result.get('message')}")
+            
 
         else:
             logger.info("자동 워치독 및 무거운 작업이 비활성화되어 있습니다. 필요할 때 수동으로 활성화 가능합니다.")
@@ -147,6 +161,10 @@ async def startup_event():
 async def shutdown_event():
     """애플리케이션 종료 시 실행할 작업들"""
     try:
+        # 감시 모드 중지
+        if indexer_service.get_watch_status().get("running"):
+            indexer_service.stop_watch()
+        
         # 데이터베이스 연결 종료
         close_connection()
         logger.info("데이터베이스 연결을 정상적으로 종료했습니다.")
@@ -46,6 +46,7 @@ class SubtitleInDB(SubtitleBase):
 class Subtitle(SubtitleInDB):
     """자막 응답 모델"""
     media_path: Optional[str] = None
+    media_available: bool = True  # False면 연결이 끊긴 미디어 루트의 파일 (재생 불가, 인덱스는 유지)
     highlight: Optional[str] = None  # 검색 결과에서 강조 표시된 텍스트
     
     @classmethod
@@ -67,6 +68,9 @@ class Subtitle(SubtitleInDB):
         if 'media_path' in db_model:
             subtitle.media_path = db_model['media_path']
         
+        if db_model.get('media_available') is not None:
+            subtitle.media_available = bool(db_model['media_available'])
+        
         if 'highlight' in db_model:
             subtitle.highlight = db_model['highlight']
             
@@ -90,6 +94,13 @@ class SearchQuery(BaseModel):
     end_time: Optional[str] = None
     page: int = 1
     per_page: int = 50
+    scope: str = 'cue'  # 'cue' 또는 'sentence' (여러 큐에 걸친 문장 단위 검색)
+    show: Optional[str] = None  # 작품 제목 (파일/폴더 이름에서 추출)
+    season: Optional[int] = None
+    episode: Optional[int] = None
+    year: Optional[int] = None
+    resolution: Optional[str] = None  # 예: '1080p'
+    root: Optional[str] = None  # 미디어 루트 (이 루트 아래 미디어만)
 
 
 class SearchResult(BaseModel):
@@ -9,6 +9,7 @@ from fastapi.responses import JSONResponse
 from typing import Dict, Any
 
 from app.database import db, remove_duplicate_media_files
+from app.database.subtitles import rebuild_sentence_index
 
 # 라우터 생성
 router = APIRouter(prefix="/api/database", tags=["database"])
@@ -39,3 +40,29 @@ async def cleanup_duplicate_media():
             }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"중복 미디어 파일 정리 중 오류가 발생했습니다: {str(e)}")
+
+
+@router.post("/sentences/rebuild", response_model=Dict[str, Any])
+async def rebuild_sentences():
+    """
+    기존 자막 데이터로 문장 단위 검색 인덱스를 재구축합니다.
+    
+    Returns:
+        Dict[str, Any]: 재구축 결과 정보
+    """
+    try:
+        result = rebuild_sentence_index()
+        if result["success"]:
+            return {
+                "success": True,
+                "message": f"문장 인덱스 재구축 완료: 미디어 {result['media_count']}개, 문장 {result['sentence_count']}개",
+                "details": result
+            }
+        else:
+            return {
+                "success": False,
+                "message": result.get("message", "문장 인덱스 재구축 중 오류가 발생했습니다."),
+                "details": result
+            }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"문장 인덱스 재구축 중 오류가 발생했습니다: {str(e)}")
@@ -0,0 +1,53 @@
+"""
+인코딩 정규화 라우트 모듈
+
+자막 파일 UTF-8 정규화 작업 관련 API 엔드포인트를 정의합니다.
+"""
+
+from fastapi import APIRouter
+from typing import Dict, Any, Optional
+
+from app.services.encoding_normalizer import encoding_normalizer_service
+
+# 라우터 생성
+router = APIRouter(prefix="/api/encoding", tags=["encoding"])
+
+
+@router.post("/normalize")
+async def start_normalization(
+    root_dir: Optional[str] = None,
+    resume: bool = True
+) -> Dict[str, Any]:
+    """
+    자막 파일 UTF-8 정규화 작업을 시작합니다.
+    
+    Args:
+        root_dir: 자막을 찾을 루트 디렉토리 (기본값: 설정의 media_dir)
+        resume: 이미 정규화된 파일 건너뛰기 여부 (기본값: True)
+        
+    Returns:
+        Dict[str, Any]: 작업 시작 결과
+    """
+    return encoding_normalizer_service.start(root_dir, resume)
+
+
+@router.get("/normalize/status")
+async def get_normalization_status() -> Dict[str, Any]:
+    """
+    가장 최근 정규화 작업 상태를 반환합니다.
+    
+    Returns:
+        Dict[str, Any]: 작업 상태 정보
+    """
+    return encoding_normalizer_service.get_status()
+
+
+@router.post("/normalize/cancel")
+async def cancel_normalization() -> Dict[str, Any]:
+    """
+    실행 중인 정규화 작업을 취소합니다.
+    
+    Returns:
+        Dict[str, Any]: 작업 취소 결과
+    """
+    return encoding_normalizer_service.cancel()
@@ -6,7 +6,7 @@
 
 from fastapi import APIRouter, HTTPException, Request, BackgroundTasks, Query, Body
 from fastapi.responses import HTMLResponse, JSONResponse
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from fastapi.templating import Jinja2Templates
 from pathlib import Path
 from datetime import datetime
@@ -243,19 +243,21 @@ async def get_indexing_status_legacy():
 
 @router.post("/indexing/start")
 async def start_indexing(
-    incremental: bool = False
+    incremental: bool = False,
+    verify: bool = False
 ):
     """
     인덱싱 작업을 시작합니다.
     
     Args:
         incremental: 증분 인덱싱 모드 (기본값: False)
+        verify: 디렉토리 매니페스트를 무시하고 모든 디렉토리를 다시 확인 (기본값: False)
         
     Returns:
         Dict[str, Any]: 인덱싱 시작 상태 정보
     """
     # 인덱싱 시작
-    result = indexer_service.start_indexing(incremental)
+    result = indexer_service.start_indexing(incremental, verify)
     
     return {
         "success": True,
@@ -275,6 +277,192 @@ async def stop_indexing():
     return indexer_service.stop_indexing()
 
 
+@router.post("/indexing/watch/start")
+async def start_watch():
+    """
+    감시 모드를 시작합니다 (변경된 파일만 바로 인덱싱).
+    
+    Returns:
+        Dict[str, Any]: 감시 모드 시작 결과
+    """
+    return indexer_service.start_watch()
+
+
+@router.post("/indexing/watch/stop")
+async def stop_watch():
+    """
+    감시 모드를 중지합니다.
+    
+    Returns:
+        Dict[str, Any]: 감시 모드 중지 결과
+    """
+    return indexer_service.stop_watch()
+
+
+@router.get("/indexing/watch/status")
+async def get_watch_status():
+    """
+    감시 모드 상태를 반환합니다.
+    
+    Returns:
+        Dict[str, Any]: 감시 모드 상태
+    """
+    return indexer_service.get_watch_status()
+
+
+@router.get("/indexing/pipeline")
+async def get_pipeline_metrics():
+    """
+    인덱싱 파이프라인 단계별 설정과 처리량, 큐 길이, 작업/대기 시간을 반환합니다.
+
+    Returns:
+        Dict[str, Any]: 단계별 설정과 통계, 병목 단계 (I/O, CPU, DB 중 무엇에 묶여 있는지)
+    """
+    return indexer_service.get_pipeline_metrics()
+
+
+@router.get("/indexing/files")
+async def get_indexing_files(failed_limit: int = Query(100, ge=0, le=1000)):
+    """
+    자막 파일별 인덱싱 상태(queued, parsing, written, failed) 집계와 실패한 파일 목록을 반환합니다.
+
+    Args:
+        failed_limit: 반환할 실패 파일 최대 수
+
+    Returns:
+        Dict[str, Any]: 상태별 파일 수, 끝나지 않은 파일 수, 실패한 파일 목록
+    """
+    return indexer_service.get_indexing_files(failed_limit)
+
+
+@router.post("/indexing/resume-unfinished")
+async def resume_unfinished_files():
+    """
+    이전 실행에서 끝나지 않은 자막 파일만 스캔 없이 이어서 인덱싱합니다.
+
+    Returns:
+        Dict[str, Any]: 시작 결과 (미디어 수, 파일 수, 반복 실패로 건너뛴 파일 수)
+    """
+    return indexer_service.resume_unfinished_files()
+
+
+@router.get("/indexing/roots")
+async def get_media_roots():
+    """
+    미디어 루트별 설정과 통계를 반환합니다.
+
+    Returns:
+        Dict[str, Any]: 루트 목록 (경로, 디렉토리 나열 스레드 수, 존재/연결 여부, 인덱싱된 미디어 수,
+            사용 불가로 표시된 미디어 수, 마지막 스캔 통계)
+    """
+    return indexer_service.get_roots()
+
+
+@router.post("/indexing/scan-rules/dry-run")
+def preview_scan_rules(
+    rules: Optional[List[str]] = Body(None, description="확인할 gitignore 형식 규칙 (없으면 설정의 scan_rules)"),
+    directory: Optional[str] = Body(None, description="이 디렉토리 아래만 확인 (없으면 모든 미디어 루트)"),
+    limit: int = Body(100, description="목록으로 반환할 최대 경로 수", ge=0, le=10000)
+):
+    """
+    스캔 규칙을 적용했을 때 스캔할 디렉토리/미디어와 제외되는 디렉토리 수를 보여 줍니다 (데이터베이스 변경 없음).
+    디렉토리를 실제로 나열하므로 이벤트 루프를 막지 않도록 동기 함수(스레드 풀 실행)로 정의합니다.
+
+    Args:
+        rules: 확인할 규칙 목록
+        directory: 확인할 디렉토리
+        limit: 목록으로 반환할 최대 경로 수
+
+    Returns:
+        Dict[str, Any]: 미리보기 결과
+    """
+    return indexer_service.preview_scan_rules(rules, directory, limit)
+
+
+@router.post("/indexing/directory/remove")
+async def remove_directory(directory: str = Body(..., embed=True)):
+    """
+    디렉토리 아래 모든 미디어와 자막, FTS 항목을 한 트랜잭션에서 인덱스에서 제거합니다.
+
+    Args:
+        directory: 디렉토리 경로 (미디어 루트 아래)
+
+    Returns:
+        Dict[str, Any]: 제거 결과 (삭제 행 수, 소요 시간)
+    """
+    return indexer_service.remove_directory(directory)
+
+
+@router.post("/indexing/directory/reindex")
+async def reindex_directory(directory: str = Body(..., embed=True)):
+    """
+    디렉토리 아래만 다시 인덱싱합니다 (기존 자막을 지우고 해당 디렉토리만 스캔).
+
+    Args:
+        directory: 디렉토리 경로 (미디어 루트 아래)
+
+    Returns:
+        Dict[str, Any]: 재인덱싱 시작 결과 (삭제 행 수, 소요 시간)
+    """
+    return indexer_service.reindex_directory(directory)
+
+
+@router.get("/indexing/priority")
+async def get_indexing_priorities(count: int = Query(10, ge=0, le=1000)):
+    """
+    인덱싱 우선순위 설정, 요청/최근 검색 디렉토리와 다음에 인덱싱할 미디어를 반환합니다.
+
+    Args:
+        count: 반환할 대기 미디어 최대 수
+
+    Returns:
+        Dict[str, Any]: 우선순위 (인덱싱 중이면 대기 미디어와 점수 포함)
+    """
+    return indexer_service.get_priorities(count)
+
+
+@router.post("/indexing/priority")
+async def update_indexing_priorities(settings: Dict[str, Any] = Body(...)):
+    """
+    인덱싱 우선순위 설정을 변경합니다 (진행 중인 인덱싱에도 바로 적용).
+
+    Args:
+        settings: 바꿀 설정 (enabled, requested, searched, bookmarked, recency, recency_days, size)
+
+    Returns:
+        Dict[str, Any]: 변경 결과 (현재 우선순위)
+    """
+    return indexer_service.update_priorities(settings)
+
+
+@router.post("/indexing/priority/directory")
+async def prioritize_directory(directory: str = Body(..., embed=True)):
+    """
+    디렉토리를 가장 먼저 인덱싱하도록 요청합니다 (인덱싱 중이 아니면 증분 인덱싱 시작).
+
+    Args:
+        directory: 디렉토리 경로 (미디어 루트 아래)
+
+    Returns:
+        Dict[str, Any]: 요청 결과
+    """
+    return indexer_service.prioritize_directory(directory)
+
+
+@router.post("/indexing/priority/cancel")
+async def cancel_directory_priority(directory: Optional[str] = Body(None, embed=True)):
+    """
+    우선 인덱싱 요청을 취소합니다.
+
+    Args:
+        directory: 디렉토리 경로 (없으면 모든 요청)
+
+    Returns:
+        Dict[str, Any]: 취소한 요청 수
+    """
+    return indexer_service.cancel_directory_priority(directory)
+
+
 @router.post("/indexing/pause")
 async def pause_indexing():
     """
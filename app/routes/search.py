@@ -14,6 +14,7 @@ import time  # time 모듈 추가 (export_search API에서 사용)
 import urllib.parse  # URL 인코딩/디코딩에 사용
 
 from app.services.search import search_service
+from app.services.indexer.priority import indexing_priorities
 from app.models.subtitle import SearchResult, SearchQuery
 from app.database import db
 from app.config import config  # config 모듈 임포트 추가
@@ -33,7 +34,14 @@ async def search_subtitles(
     end_time: Optional[str] = None,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=1000),
-    search_method: Optional[str] = None
+    search_method: Optional[str] = None,
+    scope: str = 'cue',
+    show: Optional[str] = None,
+    season: Optional[int] = Query(None, ge=0),
+    episode: Optional[int] = Query(None, ge=0),
+    year: Optional[int] = None,
+    resolution: Optional[str] = None,
+    root: Optional[str] = None
 ):
     """
     자막을 검색하고 JSON 형식으로 결과를 반환합니다.
@@ -46,6 +54,13 @@ async def search_subtitles(
         page: 페이지 번호 (기본값: 1)
         per_page: 페이지당 결과 수 (기본값: 50)
         search_method: 검색 방식 ('like' 또는 'fts')
+        scope: 검색 범위 ('cue': 큐 단위, 'sentence': 여러 큐에 걸친 문장 단위)
+        show: 작품 제목 필터 (예: 'The Office')
+        season: 시즌 번호 필터
+        episode: 에피소드 번호 필터
+        year: 연도 필터
+        resolution: 해상도 필터 (예: '1080p')
+        root: 미디어 루트 필터 (예: '/mnt/disk2')
         
     Returns:
         JSONResponse: 검색 결과와 자막 정보
@@ -65,7 +80,14 @@ async def search_subtitles(
             start_time=start_time, 
             end_time=end_time, 
             page=page, 
-            per_page=per_page
+            per_page=per_page,
+            scope=scope,
+            show=show,
+            season=season,
+            episode=episode,
+            year=year,
+            resolution=resolution,
+            root=root
         )
         
         # 결과 로깅
@@ -75,11 +97,21 @@ async def search_subtitles(
         media_files = {}
         filtered_results = []
         
+        # 미디어 루트 연결 여부 (요청마다 루트당 한 번만 확인)
+        from app.database.media import is_root_available
+        root_available = {}
+        
         for sub in results:
             media_path = sub['media_path']
             
-            # 실제 미디어 파일이 존재하는지 확인
-            if not os.path.exists(media_path):
+            # 연결이 끊긴 루트의 미디어는 파일 확인 없이 사용 불가로 표시하여 반환
+            media_root = config.find_media_root(media_path)
+            if media_root and media_root not in root_available:
+                root_available[media_root] = is_root_available(media_root)
+            available = root_available.get(media_root, True)
+            
+            # 연결된 루트에서 실제 미디어 파일이 존재하는지 확인
+            if available and not os.path.exists(media_path):
                 logger.warning(f"미디어 파일이 존재하지 않음: {media_path}")
                 continue
                 
@@ -109,6 +141,7 @@ async def search_subtitles(
                     'mediaPath': media_path,  # 원본 경로 (클라이언트 참조용)
                     'streamingUrl': streaming_url,  # 스트리밍 URL (URL 인코딩 적용)
                     'fileName': os.path.basename(media_path),
+                    'available': available,  # False면 미디어 루트가 연결되지 않아 재생 불가
                     'subtitles': []
                 }
                 
@@ -129,8 +162,11 @@ async def search_subtitles(
         # 결과 포맷 정리
         formatted_results = list(media_files.values())
         
+        # 검색 결과에 나온 폴더(와 루트 필터)를 먼저 인덱싱하도록 기록
+        indexing_priorities.record_search(media_files.keys(), [root] if root else [])
+        
         # 필터링 결과 로그
-        logger.info(f"필터링 후 결과: {len(filtered_results)}개 (실제 미디어 파일이 존재하는 자막)")
+        logger.info(f"필터링 후 결과: {len(filtered_results)}개 (실제 미디어 파일이 존재하거나 루트가 연결되지 않은 자막)")
         
         return JSONResponse({
             "success": True,
@@ -152,7 +188,14 @@ async def search_subtitles_json(
     start_time: Optional[str] = None,
     end_time: Optional[str] = None,
     page: int = Query(1, ge=1),
-    per_page: int = Query(50, ge=1, le=1000)
+    per_page: int = Query(50, ge=1, le=1000),
+    scope: str = 'cue',
+    show: Optional[str] = None,
+    season: Optional[int] = Query(None, ge=0),
+    episode: Optional[int] = Query(None, ge=0),
+    year: Optional[int] = None,
+    resolution: Optional[str] = None,
+    root: Optional[str] = None
 ):
     """
     자막을 검색하고 JSON 형식으로 결과를 반환합니다.
@@ -164,6 +207,13 @@ async def search_subtitles_json(
         end_time: 종료 시간 필터 (HH:MM:SS 형식)
         page: 페이지 번호 (기본값: 1)
         per_page: 페이지당 결과 수 (기본값: 50)
+        scope: 검색 범위 ('cue': 큐 단위, 'sentence': 여러 큐에 걸친 문장 단위)
+        show: 작품 제목 필터 (예: 'The Office')
+        season: 시즌 번호 필터
+        episode: 에피소드 번호 필터
+        year: 연도 필터
+        resolution: 해상도 필터 (예: '1080p')
+        root: 미디어 루트 필터 (예: '/mnt/disk2')
         
     Returns:
         SearchResult: JSON 형식의 검색 결과
@@ -176,9 +226,20 @@ async def search_subtitles_json(
             start_time=start_time,
             end_time=end_time,
             page=page,
-            per_page=per_page
+            per_page=per_page,
+            scope=scope,
+            show=show,
+            season=season,
+            episode=episode,
+            year=year,
+            resolution=resolution,
+            root=root
         )
         
+        # 검색 결과에 나온 폴더(와 루트 필터)를 먼저 인덱싱하도록 기록
+        indexing_priorities.record_search((item.media_path for item in search_results.items),
+                                          [root] if root else [])
+        
         return search_results
         
     except Exception as e:
@@ -204,7 +265,14 @@ async def advanced_search(search_query: SearchQuery):
             start_time=search_query.start_time,
             end_time=search_query.end_time,
             page=search_query.page,
-            per_page=search_query.per_page
+            per_page=search_query.per_page,
+            scope=search_query.scope,
+            show=search_query.show,
+            season=search_query.season,
+            episode=search_query.episode,
+            year=search_query.year,
+            resolution=search_query.resolution,
+            root=search_query.root
         )
         
         return search_results
@@ -0,0 +1,242 @@
+"""
+자막 인코딩 정규화 서비스 모듈
+
+라이브러리 전체 자막 파일을 별도 프로세스에서 병렬로 UTF-8로 변환하는 작업을 관리합니다.
+진행 상황은 job_manager로 보고하고, 결과는 subtitle_files 테이블에 기록하므로
+중단된 작업은 변환이 끝난 파일을 건너뛰고 이어서 실행할 수 있습니다.
+"""
+
+import os
+import threading
+import traceback
+import multiprocessing
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from app.config import config
+from app.job_manager import job_manager, JobStatus
+from app.database.subtitles import (
+    get_subtitle_file_encoding, get_normalized_subtitle_files, save_subtitle_normalize_result
+)
+from app.services.indexer.parse_pool import get_parse_worker_count
+from app.subtitle.encodings.converter import convert_subtitle_encoding
+from app.subtitle.mkv import EMBEDDED_SUBTITLE_EXTENSIONS
+from app.utils.logging import setup_module_logger
+
+# 로거 초기화
+logger = setup_module_logger("services.encoding_normalizer")
+
+# 작업 유형
+JOB_TYPE = "encoding_normalization"
+
+
+class EncodingNormalizerService:
+    """자막 인코딩 정규화 서비스"""
+
+    # 프로세스당 동시에 제출해 둘 최대 작업 수
+    IN_FLIGHT_PER_WORKER = 4
+
+    def __init__(self):
+        """서비스 초기화"""
+        self.job_id: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    def is_running(self) -> bool:
+        """
+        정규화 작업 실행 여부 확인
+
+        Returns:
+            bool: 실행 중이면 True
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, root_dir: Optional[str] = None, resume: bool = True) -> Dict[str, Any]:
+        """
+        정규화 작업 시작
+
+        Args:
+            root_dir: 자막을 찾을 루트 디렉토리 (None이면 설정의 media_dir)
+            resume: 이미 정규화된 파일(크기/수정 시간이 같은 경우) 건너뛰기 여부
+
+        Returns:
+            Dict[str, Any]: 시작 결과
+        """
+        with self._lock:
+            if self.is_running():
+                return {"success": False, "message": "이미 인코딩 정규화 작업이 실행 중입니다.", "job_id": self.job_id}
+
+            root_dir = root_dir or config.get("media_dir") or config.get("root_dir", "")
+            if not root_dir or not os.path.isdir(root_dir):
+                return {"success": False, "message": f"디렉토리가 존재하지 않습니다: {root_dir}"}
+
+            params = {
+                "root_dir": root_dir,
+                "resume": resume,
+                "overwrite": config.get("overwrite", True),
+                "output_suffix": config.get("output_suffix", "_utf8"),
+                "convert_broken": config.get("convert_broken", True)
+            }
+
+            self._stop_event.clear()
+            self.job_id = job_manager.create_job(JOB_TYPE, params)
+            self._thread = threading.Thread(target=self._run, args=(self.job_id, params), daemon=True)
+            self._thread.start()
+
+        return {"success": True, "message": "인코딩 정규화 작업이 시작되었습니다.", "job_id": self.job_id}
+
+    def cancel(self) -> Dict[str, Any]:
+        """
+        실행 중인 정규화 작업 취소 (변환이 끝난 파일은 유지되며 다음 실행 시 건너뜀)
+
+        Returns:
+            Dict[str, Any]: 취소 결과
+        """
+        if not self.is_running():
+            return {"success": False, "message": "실행 중인 인코딩 정규화 작업이 없습니다."}
+
+        self._stop_event.set()
+        return {"success": True, "message": "인코딩 정규화 작업 취소를 요청했습니다.", "job_id": self.job_id}
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        가장 최근 정규화 작업 상태 조회
+
+        Returns:
+            Dict[str, Any]: 작업 상태 (작업이 없으면 idle)
+        """
+        job = job_manager.get_latest_job(JOB_TYPE)
+        if not job:
+            return {"status": JobStatus.IDLE, "job_type": JOB_TYPE}
+
+        status = job.get_status_dict()
+        status["result"] = job.result
+        return status
+
+    def find_subtitle_files(self, root_dir: str) -> List[str]:
+        """
+        루트 디렉토리 아래의 자막 파일 목록 수집 (MKV 같은 내장 자막 컨테이너 제외)
+
+        Args:
+            root_dir: 루트 디렉토리
+
+        Returns:
+            List[str]: 자막 파일 경로 목록
+        """
+        extensions = set(config.get_subtitle_extensions()) - set(EMBEDDED_SUBTITLE_EXTENSIONS)
+
+        subtitle_files = []
+        for dirpath, dirnames, filenames in os.walk(root_dir):
+            if self._stop_event.is_set():
+                break
+
+            for filename in filenames:
+                if filename.startswith('.'):
+                    continue
+                if os.path.splitext(filename)[1].lower() in extensions:
+                    subtitle_files.append(os.path.join(dirpath, filename))
+
+        subtitle_files.sort()
+        return subtitle_files
+
+    def _run(self, job_id: str, params: Dict[str, Any]) -> None:
+        """
+        정규화 작업 실행 (백그라운드 스레드)
+
+        Args:
+            job_id: 작업 ID
+            params: 작업 파라미터
+        """
+        counts: Counter = Counter()
+        executor = None
+        pending = deque()
+
+        def collect_oldest():
+            """가장 먼저 제출한 변환 결과를 받아 기록"""
+            future, subtitle_path = pending.popleft()
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"path": subtitle_path, "status": "failed", "error": str(e)}
+
+            counts[result["status"]] += 1
+            if result["status"] == "failed":
+                logger.error(f"자막 인코딩 변환 실패: {subtitle_path} - {result.get('error')}")
+            else:
+                save_subtitle_normalize_result(result)
+
+            job_manager.increment_job_progress(job_id, result["status"] != "failed", subtitle_path)
+
+        try:
+            job_manager.start_job(job_id)
+
+            subtitle_files = self.find_subtitle_files(params["root_dir"])
+            normalized = get_normalized_subtitle_files() if params["resume"] else {}
+
+            # 작업 목록 구성 (변경되지 않은 정규화 완료 파일은 건너뜀)
+            targets = []
+            for subtitle_path in subtitle_files:
+                try:
+                    file_stat = os.stat(subtitle_path)
+                except OSError:
+                    counts["failed"] += 1
+                    continue
+
+                if normalized.get(subtitle_path) == (file_stat.st_size, file_stat.st_mtime):
+                    counts["resumed"] += 1
+                    continue
+
+                targets.append((subtitle_path, file_stat.st_size, file_stat.st_mtime))
+
+            total = len(targets)
+            job_manager.update_job_progress(job_id, 0, total)
+            logger.info(f"인코딩 정규화 대상: {total}개 (이미 완료: {counts['resumed']}개)")
+
+            max_workers = get_parse_worker_count()
+            max_in_flight = max_workers * self.IN_FLIGHT_PER_WORKER
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+
+            for subtitle_path, size, mtime in targets:
+                while len(pending) >= max_in_flight and not self._stop_event.is_set():
+                    collect_oldest()
+
+                if self._stop_event.is_set():
+                    break
+
+                known_encoding = get_subtitle_file_encoding(subtitle_path, size, mtime)
+                future = executor.submit(
+                    convert_subtitle_encoding, subtitle_path,
+                    params["overwrite"], params["output_suffix"], params["convert_broken"], known_encoding
+                )
+                pending.append((future, subtitle_path))
+
+            # 남은 결과 기록
+            while pending and not self._stop_event.is_set():
+                collect_oldest()
+
+            result = dict(counts, total=total)
+            if self._stop_event.is_set():
+                job_manager.cancel_job(job_id)
+                logger.info(f"인코딩 정규화 작업 취소: {result}")
+            else:
+                job_manager.complete_job(job_id, result)
+                logger.info(f"인코딩 정규화 작업 완료: {result}")
+
+        except Exception as e:
+            logger.error(f"인코딩 정규화 작업 중 오류 발생: {e}")
+            logger.error(traceback.format_exc())
+            job_manager.fail_job(job_id, str(e))
+
+        finally:
+            # 취소된 경우 대기 중인 변환 작업은 버림 (실행 중인 변환은 원자적으로 끝남)
+            if executor is not None:
+                executor.shutdown(wait=not pending, cancel_futures=True)
+
+
+# 싱글톤 인스턴스 생성
+encoding_normalizer_service = EncodingNormalizerService()
@@ -2,8 +2,8 @@
 인덱서 패키지 초기화 모듈
 """
 
-# 표준 인덱싱 전략에서 생성된 indexer_service 인스턴스 가져오기
-from app.services.indexer.strategy_standard import indexer_service
+# 인덱싱 서비스 싱글톤 가져오기
+from app.services.indexer.indexing_service import indexer_service
 
 # 전략 클래스 가져오기
 from app.services.indexer.indexing_strategy import IndexingStrategy
\ No newline at end of file
@@ -0,0 +1,390 @@
+"""
+디렉토리 인덱스 모듈
+
+각 디렉토리를 os.scandir로 한 번만 나열하여 미디어/자막 파일 목록을 만들고,
+자막 파일은 미디어 파일 이름(확장자 제외) 기준 딕셔너리에 등록해 조회 한 번으로 연결합니다.
+미디어 파일마다 glob으로 디렉토리를 다시 나열하던 방식을 대체합니다.
+"""
+
+import os
+import time
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 언어 표시 접미사 (예: movie_eng.srt, movie_en.srt)
+LANGUAGE_SUFFIXES = ('_eng', '_en')
+
+# 이 수만큼 항목을 처리할 때마다 다른 스레드에 CPU 양보
+YIELD_EVERY_ENTRIES = 1000
+
+# 동시 나열 시 스레드당 미리 요청해 둘 디렉토리 수
+PREFETCH_PER_WORKER = 4
+
+logger = logging.getLogger(__name__)
+
+
+def subtitle_match_keys(subtitle_stem: str) -> List[str]:
+    """
+    자막 파일 이름(확장자 제외)이 연결될 수 있는 미디어 이름 목록
+
+    movie.srt, movie.en.srt, movie.forced.en.srt, movie_eng.srt 같은 이름을 모두
+    미디어 이름 "movie"에 연결합니다 (기존 glob 패턴 "{이름}{확장자}", "{이름}.*{확장자}",
+    "{이름}_eng{확장자}", "{이름}_en{확장자}"와 같은 규칙).
+
+    Args:
+        subtitle_stem: 자막 파일 이름 (확장자 제외)
+
+    Returns:
+        List[str]: 미디어 이름 후보 목록
+    """
+    keys = [subtitle_stem]
+
+    # "{이름}.*" 패턴 - 점 위치마다 앞부분이 미디어 이름 후보
+    position = subtitle_stem.find('.', 1)
+    while position != -1:
+        keys.append(subtitle_stem[:position])
+        position = subtitle_stem.find('.', position + 1)
+
+    for suffix in LANGUAGE_SUFFIXES:
+        if subtitle_stem.endswith(suffix) and len(subtitle_stem) > len(suffix):
+            keys.append(subtitle_stem[:-len(suffix)])
+
+    return keys
+
+
+class DirectoryListing:
+    """디렉토리 한 곳의 미디어/자막 파일 목록 클래스"""
+
+    __slots__ = ('path', 'media_files', 'subtitle_files', 'subdirectories', 'mtime', 'failed', '_subtitle_index')
+
+    def __init__(self, path: str, mtime: Optional[float] = None):
+        """
+        디렉토리 목록 초기화
+
+        Args:
+            path: 디렉토리 경로
+            mtime: 디렉토리 수정 시간 (없으면 None)
+        """
+        self.path = path
+        self.mtime = mtime
+        self.media_files: List[str] = []
+        self.subtitle_files: List[str] = []
+        self.subdirectories: List[str] = []
+        # 나열하지 못한 디렉토리 (권한 오류, 시간 초과 등) - 목록이 비어 있어도 파일이 없다는 뜻이 아님
+        self.failed = False
+        self._subtitle_index: Dict[str, List[str]] = {}
+
+    def add_subtitle(self, filename: str, stem: str) -> None:
+        """
+        자막 파일을 미디어 이름 후보별로 등록
+
+        Args:
+            filename: 자막 파일 이름
+            stem: 확장자를 뺀 자막 파일 이름
+        """
+        subtitle_path = os.path.join(self.path, filename)
+        self.subtitle_files.append(subtitle_path)
+        for key in subtitle_match_keys(stem):
+            self._subtitle_index.setdefault(key, []).append(subtitle_path)
+
+    def find_subtitles(self, media_path: str) -> List[str]:
+        """
+        미디어 파일에 연결된 자막 파일 조회
+
+        Args:
+            media_path: 미디어 파일 경로
+
+        Returns:
+            List[str]: 자막 파일 경로 목록 (이름이 완전히 같은 자막 먼저)
+        """
+        media_basename = os.path.splitext(os.path.basename(media_path))[0]
+        matches = self._subtitle_index.get(media_basename)
+        if not matches:
+            return []
+
+        # 확장자만 다른 자막(movie.srt)을 언어 표시 자막(movie.en.srt)보다 앞에 둠
+        def sort_key(path: str) -> Tuple[bool, str]:
+            stem = os.path.splitext(os.path.basename(path))[0]
+            return stem != media_basename, path
+
+        return sorted(set(matches), key=sort_key)
+
+
+def list_directory(path: str, media_extensions: Iterable[str],
+                   subtitle_extensions: Iterable[str]) -> DirectoryListing:
+    """
+    디렉토리를 한 번 나열하여 미디어/자막 파일 목록 생성
+
+    Args:
+        path: 디렉토리 경로
+        media_extensions: 미디어 파일 확장자 목록
+        subtitle_extensions: 자막 파일 확장자 목록
+
+    Returns:
+        DirectoryListing: 디렉토리 목록 (읽을 수 없으면 빈 목록)
+    """
+    media_extensions = {ext.lower() for ext in media_extensions}
+    subtitle_extensions = {ext.lower() for ext in subtitle_extensions}
+
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        mtime = None
+
+    listing = DirectoryListing(path, mtime)
+
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        listing.subdirectories.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                stem, ext = os.path.splitext(name)
+                ext = ext.lower()
+                if ext in media_extensions:
+                    listing.media_files.append(entry.path)
+                if ext in subtitle_extensions:
+                    listing.add_subtitle(name, stem)
+    except OSError:
+        listing.failed = True
+        return listing
+
+    listing.media_files.sort()
+    listing.subtitle_files.sort()
+    listing.subdirectories.sort()
+    return listing
+
+
+def _subdirectories_to_visit(listing: DirectoryListing,
+                             skip_directory: Optional[Callable[[str], bool]]) -> List[str]:
+    """
+    나열할 하위 디렉토리 목록 (listing.subdirectories는 매니페스트에 그대로 저장되므로 바꾸지 않음)
+
+    Args:
+        listing: 디렉토리 목록
+        skip_directory: True를 반환하는 디렉토리는 제외
+
+    Returns:
+        List[str]: 하위 디렉토리 경로 목록
+    """
+    if not skip_directory:
+        return listing.subdirectories
+    return [path for path in listing.subdirectories if not skip_directory(path)]
+
+
+def _push_subdirectories(stack: List[str], subdirectories: List[str], prioritizer=None) -> None:
+    """
+    하위 디렉토리를 방문 순서대로 스택에 쌓음 (이름 순, 우선순위가 있으면 높은 디렉토리 먼저)
+
+    Args:
+        stack: 방문할 디렉토리 스택 (마지막 항목을 먼저 방문)
+        subdirectories: 하위 디렉토리 목록 (이름 순)
+        prioritizer: directory_priority(path)를 제공하는 우선순위 (None이면 이름 순만)
+    """
+    ordered = list(reversed(subdirectories))
+    if prioritizer is not None and len(ordered) > 1:
+        # 안정 정렬이므로 우선순위가 같으면 이름 순 유지
+        ordered.sort(key=prioritizer.directory_priority)
+    stack.extend(ordered)
+
+
+def _reprioritize(stack: List[str], prioritizer, version: Optional[int]) -> Optional[int]:
+    """
+    우선순위가 바뀌었으면 아직 방문하지 않은 디렉토리를 다시 정렬
+
+    Args:
+        stack: 방문할 디렉토리 스택
+        prioritizer: directory_priority(path)와 version을 제공하는 우선순위 (None이면 그대로)
+        version: 마지막으로 정렬한 우선순위 버전
+
+    Returns:
+        Optional[int]: 현재 우선순위 버전
+    """
+    if prioritizer is None or prioritizer.version == version:
+        return version
+    # 안정 정렬이므로 우선순위가 같은 디렉토리는 기존 깊이 우선 순서 유지
+    stack.sort(key=prioritizer.directory_priority)
+    return prioritizer.version
+
+
+def iter_directory_listings(root_dir: str, media_extensions: Iterable[str],
+                            subtitle_extensions: Iterable[str],
+                            should_stop: Optional[Callable[[], bool]] = None,
+                            skip_directory: Optional[Callable[[str], bool]] = None,
+                            list_func: Optional[Callable[[str, List[str], List[str]], DirectoryListing]] = None,
+                            prioritizer=None) -> Iterator[DirectoryListing]:
+    """
+    루트 디렉토리 아래 모든 디렉토리를 한 번씩 나열 (깊이 우선, 이름 순)
+
+    파일마다 잠들지 않고, YIELD_EVERY_ENTRIES개 항목마다 time.sleep(0)으로 GIL을 양보하여
+    웹 서버 스레드가 응답할 수 있게 합니다.
+
+    Args:
+        root_dir: 루트 디렉토리
+        media_extensions: 미디어 파일 확장자 목록
+        subtitle_extensions: 자막 파일 확장자 목록
+        should_stop: True를 반환하면 나열 중단
+        skip_directory: True를 반환하는 하위 디렉토리는 나열하지 않음 (그 아래 전체 포함, 디렉토리마다 한 번만 호출)
+        list_func: 디렉토리 한 곳을 나열하는 함수 (기본값 list_directory, 매니페스트 재사용 시 교체)
+        prioritizer: 디렉토리 우선순위 (directory_priority(path), version 제공) - 있으면 우선순위가 높은
+                     하위 디렉토리를 먼저 방문하고, 나열 중 우선순위가 바뀌면 남은 디렉토리를 다시 정렬
+
+    Yields:
+        DirectoryListing: 디렉토리 목록
+    """
+    media_extensions = list(media_extensions)
+    subtitle_extensions = list(subtitle_extensions)
+
+    list_func = list_func or list_directory
+
+    stack = [root_dir]
+    processed_entries = 0
+    version = prioritizer.version if prioritizer is not None else None
+
+    while stack:
+        if should_stop and should_stop():
+            return
+
+        version = _reprioritize(stack, prioritizer, version)
+        path = stack.pop()
+        listing = list_func(path, media_extensions, subtitle_extensions)
+
+        _push_subdirectories(stack, _subdirectories_to_visit(listing, skip_directory), prioritizer)
+
+        processed_entries += len(listing.media_files) + len(listing.subdirectories) + 1
+        if processed_entries >= YIELD_EVERY_ENTRIES:
+            processed_entries = 0
+            time.sleep(0)
+
+        yield listing
+
+
+def iter_directory_listings_concurrent(root_dir: str, media_extensions: Iterable[str],
+                                       subtitle_extensions: Iterable[str],
+                                       should_stop: Optional[Callable[[], bool]] = None,
+                                       skip_directory: Optional[Callable[[str], bool]] = None,
+                                       list_func: Optional[Callable[[str, List[str], List[str]], DirectoryListing]] = None,
+                                       max_workers: int = 8,
+                                       timeout: Optional[float] = None,
+                                       prioritizer=None) -> Iterator[DirectoryListing]:
+    """
+    루트 디렉토리 아래 모든 디렉토리를 스레드 풀로 동시에 나열 (결과 순서는 iter_directory_listings와 같음)
+
+    네트워크/외장 볼륨처럼 listdir/stat 한 번에 수 밀리초가 걸리는 경우를 위한 방식입니다.
+    깊이 우선 순서에서 다음에 방문할 디렉토리들을 최대 max_workers * PREFETCH_PER_WORKER개까지
+    미리 요청해 두고, 결과는 항상 순서대로 하나씩 기다려 반환합니다.
+
+    Args:
+        root_dir: 루트 디렉토리
+        media_extensions: 미디어 파일 확장자 목록
+        subtitle_extensions: 자막 파일 확장자 목록
+        should_stop: True를 반환하면 나열 중단
+        skip_directory: True를 반환하는 하위 디렉토리는 나열하지 않음 (그 아래 전체 포함, 디렉토리마다 한 번만 호출)
+        list_func: 디렉토리 한 곳을 나열하는 함수 (여러 스레드에서 호출됨)
+        max_workers: 동시에 나열할 디렉토리 수
+        timeout: 디렉토리 하나를 나열하는 최대 시간 (초, None이면 무제한) -
+                 넘으면 빈 목록으로 건너뜀 (응답 없는 마운트가 스캔 전체를 막지 않도록).
+                 멈춘 호출은 취소할 수 없으므로 해당 스레드는 끝날 때까지 풀에서 빠집니다.
+        prioritizer: 디렉토리 우선순위 (iter_directory_listings와 같음)
+
+    Yields:
+        DirectoryListing: 디렉토리 목록
+    """
+    media_extensions = list(media_extensions)
+    subtitle_extensions = list(subtitle_extensions)
+    list_func = list_func or list_directory
+    prefetch_limit = max(1, max_workers) * PREFETCH_PER_WORKER
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="dir-lister")
+    futures: Dict[str, Future] = {}
+    started: Dict[str, float] = {}
+
+    def run(path: str) -> DirectoryListing:
+        # 시간 초과는 대기열에서 기다린 시간이 아니라 실제 나열 시작부터 계산
+        started[path] = time.monotonic()
+        return list_func(path, media_extensions, subtitle_extensions)
+
+    def submit(path: str) -> None:
+        if path not in futures:
+            futures[path] = executor.submit(run, path)
+
+    def wait(path: str, future: Future) -> DirectoryListing:
+        if timeout is None:
+            return future.result()
+
+        queued_since = time.monotonic()
+        while True:
+            if future.done():
+                return future.result()
+
+            now = time.monotonic()
+            started_at = started.get(path)
+            if started_at is not None:
+                remaining = started_at + timeout - now
+            else:
+                # 모든 스레드가 응답 없는 디렉토리에 묶인 경우에도 스캔이 끝나도록 대기열 시간도 제한
+                remaining = queued_since + timeout * 2 - now
+            if remaining <= 0:
+                raise FutureTimeoutError()
+            try:
+                return future.result(timeout=min(remaining, 0.5))
+            except FutureTimeoutError:
+                continue
+
+    def prefetch(stack: List[str]) -> None:
+        # 스택 위쪽(곧 방문할 순서)부터 요청
+        for path in reversed(stack):
+            if len(futures) >= prefetch_limit:
+                break
+            if path in futures:
+                continue
+            submit(path)
+
+    stack = [root_dir]
+    processed_entries = 0
+    version = prioritizer.version if prioritizer is not None else None
+
+    try:
+        while stack:
+            if should_stop and should_stop():
+                return
+
+            version = _reprioritize(stack, prioritizer, version)
+            path = stack.pop()
+            submit(path)
+            future = futures.pop(path)
+            prefetch(stack)
+
+            try:
+                listing = wait(path, future)
+            except FutureTimeoutError:
+                logger.warning(f"디렉토리 나열 시간 초과 ({timeout}초), 건너뜀: {path}")
+                future.cancel()
+                listing = DirectoryListing(path)
+                listing.failed = True
+            finally:
+                started.pop(path, None)
+
+            _push_subdirectories(stack, _subdirectories_to_visit(listing, skip_directory), prioritizer)
+            prefetch(stack)
+
+            processed_entries += len(listing.media_files) + len(listing.subdirectories) + 1
+            if processed_entries >= YIELD_EVERY_ENTRIES:
+                processed_entries = 0
+                time.sleep(0)
+
+            yield listing
+
+    finally:
+        for future in futures.values():
+            future.cancel()
+        # 시간 초과로 멈춘 스레드를 기다리지 않음
+        executor.shutdown(wait=False)
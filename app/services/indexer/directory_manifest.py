@@ -0,0 +1,154 @@
+"""
+디렉토리 매니페스트 모듈
+
+이전 스캔에서 저장한 디렉토리 목록(scan_directories, scan_files)을 불러와,
+수정 시간이 바뀌지 않은 디렉토리는 os.scandir 없이 저장된 목록으로 DirectoryListing을 만듭니다.
+
+디렉토리 수정 시간은 바로 아래 항목의 추가/삭제/이름 변경만 반영하므로,
+하위 디렉토리는 저장된 목록을 따라가며 각각 stat으로 다시 확인합니다.
+"""
+
+import os
+import time
+import threading
+from typing import Any, Dict, List, Optional
+
+from app.services.indexer.directory_index import DirectoryListing, list_directory
+from app.utils.logging import get_indexer_logger
+
+logger = get_indexer_logger()
+
+# 스캔 시작 직전에 수정된 디렉토리는 같은 수정 시간 안에 또 바뀔 수 있으므로 저장하지 않음 (초)
+RACY_MTIME_WINDOW = 2.0
+
+
+class DirectoryManifest:
+    """디렉토리 매니페스트 클래스"""
+
+    def __init__(self, root_dir: str, reuse: bool = True):
+        """
+        매니페스트 초기화
+
+        Args:
+            root_dir: 루트 디렉토리
+            reuse: 저장된 목록 재사용 여부 (False면 모든 디렉토리를 나열하고 매니페스트만 갱신)
+        """
+        self.root_dir = root_dir
+        self.reuse = reuse
+        self.scan_start_time = time.time()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.changed: List[Dict[str, Any]] = []
+        self.visited: List[str] = []
+        self.reused_count = 0
+        self.listed_count = 0
+
+        # 동시 나열(iter_directory_listings_concurrent)에서 여러 스레드가 호출
+        self._lock = threading.Lock()
+
+        if reuse:
+            from app.database.media import load_scan_manifest
+            self.entries = load_scan_manifest(root_dir)
+            logger.info(f"디렉토리 매니페스트 로드: {len(self.entries)}개 디렉토리")
+            self.expected_directories = len(self.entries)
+        else:
+            from app.database.media import count_scan_directories
+            self.expected_directories = count_scan_directories(root_dir)
+
+    def list_directory(self, path: str, media_extensions: List[str],
+                       subtitle_extensions: List[str]) -> DirectoryListing:
+        """
+        디렉토리 목록 조회 (수정 시간이 같으면 저장된 목록 사용)
+
+        iter_directory_listings의 list_func로 사용합니다 (여러 스레드에서 동시에 호출 가능).
+
+        Args:
+            path: 디렉토리 경로
+            media_extensions: 미디어 파일 확장자 목록
+            subtitle_extensions: 자막 파일 확장자 목록
+
+        Returns:
+            DirectoryListing: 디렉토리 목록
+        """
+        with self._lock:
+            self.visited.append(path)
+
+        entry = self.entries.get(path)
+        if entry is not None and entry["mtime"] is not None:
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                mtime = None
+
+            if mtime is not None and mtime == entry["mtime"]:
+                with self._lock:
+                    self.reused_count += 1
+                return self._listing_from_entry(path, mtime, entry)
+
+        listing = list_directory(path, media_extensions, subtitle_extensions)
+        with self._lock:
+            self.listed_count += 1
+            self._record(listing)
+        return listing
+
+    def _listing_from_entry(self, path: str, mtime: float, entry: Dict[str, Any]) -> DirectoryListing:
+        """
+        저장된 기록으로 디렉토리 목록 생성
+
+        Args:
+            path: 디렉토리 경로
+            mtime: 디렉토리 수정 시간
+            entry: 매니페스트 기록
+
+        Returns:
+            DirectoryListing: 디렉토리 목록
+        """
+        listing = DirectoryListing(path, mtime)
+        listing.media_files = sorted(entry["media_files"])
+        listing.subdirectories = sorted(entry["subdirectories"])
+
+        for subtitle_path in sorted(entry["subtitle_files"]):
+            filename = os.path.basename(subtitle_path)
+            listing.add_subtitle(filename, os.path.splitext(filename)[0])
+
+        return listing
+
+    def _record(self, listing: DirectoryListing) -> None:
+        """
+        새로 나열한 디렉토리를 저장 대상에 추가
+
+        Args:
+            listing: 디렉토리 목록
+        """
+        mtime = listing.mtime
+        if listing.failed or (mtime is not None and mtime >= self.scan_start_time - RACY_MTIME_WINDOW):
+            # 다음 스캔에서 다시 나열하도록 수정 시간을 비워 둠
+            mtime = None
+
+        # 하위 디렉토리만 다시 스캔해도 상위 디렉토리 기록과 연결되도록 실제 상위 경로 저장
+        parent_path = os.path.dirname(listing.path)
+        if parent_path == listing.path:
+            parent_path = None
+        self.changed.append({
+            "path": listing.path,
+            "parent_path": parent_path,
+            "mtime": mtime,
+            "media_files": listing.media_files,
+            "subtitle_files": listing.subtitle_files,
+            "subdir_count": len(listing.subdirectories),
+        })
+
+    def save(self, complete: bool) -> bool:
+        """
+        새로 나열한 디렉토리 기록 저장
+
+        Args:
+            complete: 스캔이 끝까지 진행되었는지 여부 (True면 이번에 방문하지 않은 디렉토리 기록 삭제)
+
+        Returns:
+            bool: 성공 여부
+        """
+        from app.database.media import save_scan_manifest
+
+        success = save_scan_manifest(self.root_dir, self.changed, self.visited if complete else None)
+        logger.info(f"디렉토리 매니페스트 저장: 재사용 {self.reused_count}개, 새로 나열 {self.listed_count}개")
+        return success
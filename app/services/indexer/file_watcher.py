@@ -0,0 +1,453 @@
+"""
+파일 감시 모듈
+
+루트 디렉토리 아래 미디어/자막 파일의 생성, 변경, 삭제, 이름 변경을 감지합니다.
+Linux에서는 ctypes로 inotify를 직접 사용하고, 사용할 수 없으면(다른 OS, 감시 수 한도 초과 등)
+주기적으로 파일 목록을 비교하는 폴링 방식으로 대체합니다.
+"""
+
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from app.utils.logging import get_indexer_logger
+
+logger = get_indexer_logger()
+
+# 이벤트 종류
+EVENT_MODIFIED = "modified"   # 생성 또는 내용 변경
+EVENT_DELETED = "deleted"
+EVENT_MOVED = "moved"
+EVENT_OVERFLOW = "overflow"   # 이벤트 유실 (전체 증분 스캔 필요)
+
+# inotify 상수 (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_DELETE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW)
+
+_EVENT_HEADER = struct.Struct('iIII')
+_READ_SIZE = 64 * 1024
+
+
+class FileEvent(NamedTuple):
+    """파일 변경 이벤트"""
+    kind: str
+    path: str
+    is_dir: bool = False
+    dest_path: Optional[str] = None
+
+
+class _BaseWatcher:
+    """감시기 공통 클래스"""
+
+    backend = "base"
+
+    def __init__(self, root_dir: str, extensions: Iterable[str]):
+        """
+        감시기 초기화
+
+        Args:
+            root_dir: 감시할 루트 디렉토리
+            extensions: 감시할 파일 확장자 목록 (미디어 + 자막)
+        """
+        self.root_dir = os.path.abspath(root_dir)
+        self.extensions = {ext.lower() for ext in extensions}
+
+    def is_relevant(self, path: str) -> bool:
+        """
+        감시 대상 파일인지 확인
+
+        Args:
+            path: 파일 경로
+
+        Returns:
+            bool: 확장자가 감시 대상이면 True
+        """
+        return os.path.splitext(path)[1].lower() in self.extensions
+
+    def iter_files(self, directory: str) -> Iterable[str]:
+        """
+        디렉토리 아래의 감시 대상 파일 나열
+
+        Args:
+            directory: 디렉토리 경로
+
+        Yields:
+            str: 파일 경로
+        """
+        for dirpath, dirnames, filenames in os.walk(directory):
+            for filename in filenames:
+                if self.is_relevant(filename):
+                    yield os.path.join(dirpath, filename)
+
+    def poll(self, timeout: float) -> List[FileEvent]:
+        """
+        변경 이벤트 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            List[FileEvent]: 이벤트 목록 (없으면 빈 목록)
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """감시 종료"""
+
+
+class InotifyWatcher(_BaseWatcher):
+    """inotify 기반 감시기 (Linux)"""
+
+    backend = "inotify"
+
+    def __init__(self, root_dir: str, extensions: Iterable[str]):
+        """
+        inotify 감시기 초기화 (루트 아래 모든 디렉토리에 감시 등록)
+
+        Args:
+            root_dir: 감시할 루트 디렉토리
+            extensions: 감시할 파일 확장자 목록
+
+        Raises:
+            OSError: inotify를 사용할 수 없거나 감시 수 한도를 초과한 경우
+        """
+        super().__init__(root_dir, extensions)
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._libc.inotify_init1.argtypes = [ctypes.c_int]
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+
+        fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, f"inotify_init1 실패: {os.strerror(error)}")
+        self._fd = fd
+
+        # 감시 디스크립터 <-> 디렉토리 경로
+        self._paths: Dict[int, str] = {}
+        self._watches: Dict[str, int] = {}
+
+        try:
+            self._add_tree(self.root_dir)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, path: str) -> None:
+        """
+        디렉토리 하나에 감시 등록
+
+        Args:
+            path: 디렉토리 경로
+
+        Raises:
+            OSError: 감시 수 한도 초과 (ENOSPC) 등
+        """
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                # 그 사이 삭제되었거나 읽을 수 없는 디렉토리는 건너뜀
+                return
+            raise OSError(error, f"inotify_add_watch 실패: {os.strerror(error)} - {path}")
+
+        self._paths[wd] = path
+        self._watches[path] = wd
+
+    def _add_tree(self, directory: str) -> None:
+        """
+        디렉토리와 모든 하위 디렉토리에 감시 등록
+
+        Args:
+            directory: 디렉토리 경로
+        """
+        self._add_watch(directory)
+        for dirpath, dirnames, filenames in os.walk(directory):
+            for dirname in dirnames:
+                self._add_watch(os.path.join(dirpath, dirname))
+
+    def _forget_tree(self, directory: str) -> None:
+        """
+        삭제되었거나 밖으로 이동한 디렉토리의 감시 정보 제거
+
+        Args:
+            directory: 디렉토리 경로
+        """
+        prefix = directory + os.sep
+        for path in [p for p in self._watches if p == directory or p.startswith(prefix)]:
+            wd = self._watches.pop(path)
+            self._paths.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _move_tree(self, old_dir: str, new_dir: str) -> None:
+        """
+        감시 중인 디렉토리 이름 변경 반영 (감시 디스크립터는 그대로 유지됨)
+
+        Args:
+            old_dir: 이전 경로
+            new_dir: 새 경로
+        """
+        prefix = old_dir + os.sep
+        for path in [p for p in self._watches if p == old_dir or p.startswith(prefix)]:
+            wd = self._watches.pop(path)
+            moved_path = new_dir + path[len(old_dir):]
+            self._watches[moved_path] = wd
+            self._paths[wd] = moved_path
+
+    def _read_events(self) -> List[Tuple[str, int, int]]:
+        """
+        inotify 디스크립터에서 읽을 수 있는 이벤트를 모두 읽음
+
+        Returns:
+            List[Tuple[str, int, int]]: (경로, 마스크, 쿠키) 목록
+        """
+        raw_events = []
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    raw_events.append(("", mask, cookie))
+                    continue
+
+                directory = self._paths.get(wd)
+                if directory is None:
+                    continue
+                path = os.path.join(directory, os.fsdecode(name)) if name else directory
+                raw_events.append((path, mask, cookie))
+
+            if len(data) < _READ_SIZE:
+                break
+
+        return raw_events
+
+    def poll(self, timeout: float) -> List[FileEvent]:
+        """
+        변경 이벤트 대기
+
+        이름 변경은 같은 쿠키의 IN_MOVED_FROM/IN_MOVED_TO 쌍으로 묶고,
+        짝이 없는 이동은 감시 범위 밖과의 이동이므로 삭제 또는 생성으로 처리합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            List[FileEvent]: 이벤트 목록
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+
+        events: List[FileEvent] = []
+        moved_from: Dict[int, Tuple[str, bool]] = {}
+
+        for path, mask, cookie in self._read_events():
+            is_dir = bool(mask & IN_ISDIR)
+
+            if mask & IN_Q_OVERFLOW:
+                logger.warning("inotify 이벤트 큐가 넘쳐 일부 변경을 놓쳤습니다.")
+                events.append(FileEvent(EVENT_OVERFLOW, self.root_dir, True))
+
+            elif mask & IN_MOVED_FROM:
+                moved_from[cookie] = (path, is_dir)
+
+            elif mask & IN_MOVED_TO:
+                source = moved_from.pop(cookie, None)
+                if source and is_dir:
+                    self._move_tree(source[0], path)
+                    events.append(FileEvent(EVENT_MOVED, source[0], True, path))
+                elif is_dir:
+                    # 감시 범위 밖에서 들어온 디렉토리
+                    self._add_tree(path)
+                    events.extend(FileEvent(EVENT_MODIFIED, file_path) for file_path in self.iter_files(path))
+                elif source and self.is_relevant(source[0]) and self.is_relevant(path):
+                    events.append(FileEvent(EVENT_MOVED, source[0], False, path))
+                else:
+                    if source and self.is_relevant(source[0]):
+                        events.append(FileEvent(EVENT_DELETED, source[0]))
+                    if self.is_relevant(path):
+                        # 임시 파일을 저장 후 이름 변경하는 편집기 저장 방식 포함
+                        events.append(FileEvent(EVENT_MODIFIED, path))
+
+            elif mask & IN_CREATE and is_dir:
+                # 감시 등록 전에 생긴 파일은 이벤트가 없으므로 직접 나열
+                self._add_tree(path)
+                events.extend(FileEvent(EVENT_MODIFIED, file_path) for file_path in self.iter_files(path))
+
+            elif mask & (IN_CLOSE_WRITE | IN_CREATE) and not is_dir:
+                if self.is_relevant(path):
+                    events.append(FileEvent(EVENT_MODIFIED, path))
+
+            elif mask & IN_DELETE:
+                if is_dir:
+                    events.append(FileEvent(EVENT_DELETED, path, True))
+                elif self.is_relevant(path):
+                    events.append(FileEvent(EVENT_DELETED, path))
+
+            elif mask & (IN_DELETE_SELF | IN_IGNORED):
+                if path in self._watches:
+                    self._forget_tree(path)
+
+        # 짝이 없는 IN_MOVED_FROM은 감시 범위 밖으로 이동한 것
+        for path, is_dir in moved_from.values():
+            if is_dir:
+                self._forget_tree(path)
+                events.append(FileEvent(EVENT_DELETED, path, True))
+            elif self.is_relevant(path):
+                events.append(FileEvent(EVENT_DELETED, path))
+
+        return events
+
+    def close(self) -> None:
+        """감시 종료"""
+        fd = getattr(self, '_fd', None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+            self._fd = None
+
+
+class PollingWatcher(_BaseWatcher):
+    """파일 목록 비교 기반 감시기 (inotify를 사용할 수 없을 때)"""
+
+    backend = "polling"
+
+    def __init__(self, root_dir: str, extensions: Iterable[str], interval: float = 10.0):
+        """
+        폴링 감시기 초기화 (현재 파일 목록 저장)
+
+        Args:
+            root_dir: 감시할 루트 디렉토리
+            extensions: 감시할 파일 확장자 목록
+            interval: 파일 목록 비교 간격 (초)
+        """
+        super().__init__(root_dir, extensions)
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+        self._next_scan = time.monotonic() + interval
+
+    def _take_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """
+        감시 대상 파일의 크기와 수정 시간 수집
+
+        Returns:
+            Dict[str, Tuple[int, int]]: 파일 경로별 (크기, 수정 시간 ns)
+        """
+        snapshot = {}
+        for path in self.iter_files(self.root_dir):
+            try:
+                file_stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (file_stat.st_size, file_stat.st_mtime_ns)
+        return snapshot
+
+    def poll(self, timeout: float) -> List[FileEvent]:
+        """
+        변경 이벤트 대기 (간격마다 파일 목록 비교)
+
+        사라진 파일과 새 파일의 확장자, 크기, 수정 시간이 같으면 이름 변경으로 처리합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            List[FileEvent]: 이벤트 목록
+        """
+        remaining = self._next_scan - time.monotonic()
+        if remaining > 0:
+            time.sleep(min(timeout, remaining))
+            if time.monotonic() < self._next_scan:
+                return []
+
+        snapshot = self._take_snapshot()
+        self._next_scan = time.monotonic() + self.interval
+
+        previous = self._snapshot
+        self._snapshot = snapshot
+
+        created = [path for path in snapshot if path not in previous]
+        deleted = [path for path in previous if path not in snapshot]
+        modified = [path for path in snapshot if path in previous and snapshot[path] != previous[path]]
+
+        # (확장자, 크기, 수정 시간)이 같은 삭제/생성 쌍은 이름 변경
+        deleted_by_signature: Dict[Tuple[str, int, int], List[str]] = {}
+        for path in deleted:
+            signature = (os.path.splitext(path)[1].lower(),) + previous[path]
+            deleted_by_signature.setdefault(signature, []).append(path)
+
+        events: List[FileEvent] = []
+        moved_sources: Set[str] = set()
+        for path in created:
+            signature = (os.path.splitext(path)[1].lower(),) + snapshot[path]
+            candidates = deleted_by_signature.get(signature)
+            if candidates:
+                source = candidates.pop(0)
+                moved_sources.add(source)
+                events.append(FileEvent(EVENT_MOVED, source, False, path))
+            else:
+                events.append(FileEvent(EVENT_MODIFIED, path))
+
+        events.extend(FileEvent(EVENT_MODIFIED, path) for path in modified)
+        events.extend(FileEvent(EVENT_DELETED, path) for path in deleted if path not in moved_sources)
+        return events
+
+
+def create_watcher(root_dir: str, extensions: Iterable[str], poll_interval: float = 10.0,
+                   use_inotify: bool = True) -> _BaseWatcher:
+    """
+    사용할 수 있는 감시기 생성 (inotify 우선, 실패하면 폴링)
+
+    Args:
+        root_dir: 감시할 루트 디렉토리
+        extensions: 감시할 파일 확장자 목록
+        poll_interval: 폴링 감시기의 파일 목록 비교 간격 (초)
+        use_inotify: inotify 사용 여부
+
+    Returns:
+        _BaseWatcher: 감시기
+    """
+    extensions = list(extensions)
+
+    if use_inotify and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(root_dir, extensions)
+        except (OSError, AttributeError) as e:
+            # AttributeError: libc에 inotify 함수가 없는 경우
+            logger.warning(f"inotify를 사용할 수 없어 폴링 방식으로 감시합니다: {e}")
+
+    return PollingWatcher(root_dir, extensions, poll_interval)
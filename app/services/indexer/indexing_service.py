@@ -15,8 +15,9 @@ from app.utils.logging import get_indexer_logger
 # 인덱싱 관련 클래스 임포트
 from app.services.indexer.indexing_worker import IndexingWorker
 from app.services.indexer.indexing_status_handler import IndexingStatusHandler
-from app.services.indexer.strategy_standard import StandardIndexingStrategy
-from app.services.indexer.strategy_parallel import ParallelIndexingStrategy
+from app.services.indexer.pipeline import PipelineIndexingStrategy, get_stage_config
+from app.services.indexer.priority import get_priority_config
+from app.services.indexer.watch_mode import IndexingWatcher
 
 logger = get_indexer_logger()
 
@@ -43,24 +44,32 @@ class IndexingService:
         # 상태 핸들러 초기화
         self.status_handler = IndexingStatusHandler()
         
+        # 이전 프로세스가 인덱싱 도중 종료되어 상태 파일에 진행 중으로 남아 있으면 정리
+        # (끝나지 않은 파일은 데이터베이스의 파일별 상태로 resume_unfinished_files에서 이어서 처리)
+        if not self.status_handler.check_running_indexing() and self.status_handler.current_status.get("is_indexing"):
+            self.status_handler.reset_status("이전 인덱싱 프로세스가 종료됨")
+        
         # 워커 초기화
         self.worker = IndexingWorker(self.status_handler)
         
-        # 인덱싱 전략 초기화
-        self.standard_strategy = StandardIndexingStrategy()
-        self.parallel_strategy = ParallelIndexingStrategy()
+        # 인덱싱 전략 초기화 (모든 인덱싱은 단계별 파이프라인으로 실행)
+        self.pipeline_strategy = PipelineIndexingStrategy()
+        
+        # 감시 모드 (변경된 파일만 바로 인덱싱)
+        self.watcher = IndexingWatcher(self.worker, self.status_handler)
         
         # 초기화 완료 표시
         self._initialized = True
         
         logger.info("인덱싱 서비스 초기화 완료")
     
-    def start_indexing(self, incremental: bool = True) -> Dict[str, Any]:
+    def start_indexing(self, incremental: bool = True, verify: bool = False) -> Dict[str, Any]:
         """
         인덱싱 시작
         
         Args:
             incremental: 증분 인덱싱 여부
+            verify: 디렉토리 매니페스트를 무시하고 모든 디렉토리를 다시 나열할지 여부
             
         Returns:
             Dict[str, Any]: 인덱싱 시작 결과
@@ -77,16 +86,18 @@ class IndexingService:
         self.status_handler.update_status(
             is_indexing=True,
             is_paused=False,
+            pid=os.getpid(),
             status_message="인덱싱 시작 중..."
         )
         
         # 워커 시작
-        self.worker.start_worker(incremental)
+        self.worker.start_worker(incremental, verify)
         
         return {
             "success": True,
             "message": "인덱싱이 시작되었습니다.",
-            "incremental": incremental
+            "incremental": incremental,
+            "verify": verify
         }
     
     def stop_indexing(self) -> Dict[str, Any]:
@@ -172,6 +183,24 @@ class IndexingService:
         """
         return self.status_handler.get_status()
     
+    def get_pipeline_metrics(self) -> Dict[str, Any]:
+        """
+        인덱싱 파이프라인 단계별 설정과 마지막(또는 진행 중인) 실행의 단계별 통계 가져오기
+        
+        Returns:
+            Dict[str, Any]: 단계별 설정(config), 단계별 통계(stages), 병목 단계(bottleneck, bound)
+        """
+        metrics = self.status_handler.current_status.get("pipeline") or {}
+        return {
+            "success": True,
+            "is_indexing": self.status_handler.current_status.get("is_indexing", False),
+            "config": get_stage_config(),
+            "stages": metrics.get("stages", []),
+            "bottleneck": metrics.get("bottleneck"),
+            "bound": metrics.get("bound"),
+            "updated_at": metrics.get("updated_at")
+        }
+    
     def get_logs(self, count: int = 100) -> List[Dict[str, Any]]:
         """
         인덱싱 로그 가져오기
@@ -203,6 +232,465 @@ class IndexingService:
             "message": "인덱싱 상태가 초기화되었습니다."
         }
     
+    def start_watch(self) -> Dict[str, Any]:
+        """
+        감시 모드 시작 (연결된 미디어 루트마다 변경을 감지하여 바뀐 파일만 인덱싱)
+        
+        Returns:
+            Dict[str, Any]: 시작 결과
+        """
+        return self.watcher.start()
+    
+    def stop_watch(self) -> Dict[str, Any]:
+        """
+        감시 모드 중지
+        
+        Returns:
+            Dict[str, Any]: 중지 결과
+        """
+        return self.watcher.stop()
+    
+    def get_watch_status(self) -> Dict[str, Any]:
+        """
+        감시 모드 상태 가져오기
+        
+        Returns:
+            Dict[str, Any]: 감시 모드 상태
+        """
+        return self.watcher.get_status()
+    
+    def _resolve_directory(self, directory: str) -> Optional[str]:
+        """
+        요청한 디렉토리 경로 정리 (어느 미디어 루트 아래도 아니면 None)
+
+        Args:
+            directory: 디렉토리 경로 (첫 번째 미디어 루트 기준 상대 경로도 가능)
+
+        Returns:
+            Optional[str]: 정리된 절대 경로
+        """
+        roots = config.get_media_roots()
+        if not directory or not roots:
+            return None
+
+        path = os.path.normpath(os.path.join(roots[0]["path"], directory))
+        if not config.find_media_root(path):
+            return None
+        return path
+
+    def get_roots(self) -> Dict[str, Any]:
+        """
+        미디어 루트별 설정과 통계 가져오기
+
+        Returns:
+            Dict[str, Any]: 루트 목록 (경로, 디렉토리 나열 스레드 수, 존재/연결 여부, 인덱싱된 미디어 수,
+                사용 불가로 표시된 미디어 수, 마지막 스캔 통계)
+        """
+        from app.database.media import count_media_under_directory, count_unavailable_media, is_root_available
+
+        root_status = self.status_handler.current_status.get("roots", {})
+        roots = []
+        for root in config.get_media_roots():
+            path = root["path"]
+            roots.append({
+                "path": path,
+                "scan_workers": root["scan_workers"],
+                "exists": os.path.isdir(path),
+                "available": is_root_available(path),
+                "media_count": count_media_under_directory(path),
+                "unavailable_media": count_unavailable_media(path),
+                "scan": root_status.get(path, {})
+            })
+
+        return {"success": True, "roots": roots}
+
+    def preview_scan_rules(self, rules: Optional[List[str]] = None, directory: Optional[str] = None,
+                           limit: int = 100) -> Dict[str, Any]:
+        """
+        스캔 규칙 미리보기 (드라이런)
+
+        데이터베이스와 매니페스트를 사용하지 않고 디렉토리를 실제로 나열하여,
+        규칙을 적용했을 때 스캔할 디렉토리/미디어와 제외되는 디렉토리를 보여 줍니다.
+        제외된 디렉토리는 실제 스캔과 마찬가지로 나열하지 않습니다.
+
+        Args:
+            rules: 확인할 규칙 목록 (기본값: 설정의 scan_rules)
+            directory: 이 디렉토리 아래만 확인 (기본값: 모든 미디어 루트)
+            limit: 목록으로 반환할 최대 경로 수 (개수는 항상 전체 기준)
+
+        Returns:
+            Dict[str, Any]: 루트별 결과 (나열한/제외한 디렉토리 수, 미디어/자막 있는 미디어/제외된 미디어 수,
+                제외된 디렉토리와 스캔할 미디어 경로 일부)
+        """
+        from app.services.indexer.media_scanner import MediaScanner
+        from app.services.indexer.scan_rules import ScanRules, ScanRuleError, get_scan_rules
+
+        try:
+            if rules is None:
+                compiled = get_scan_rules()
+            else:
+                if isinstance(rules, str):
+                    rules = rules.splitlines()
+                compiled = ScanRules(rules, bool(config.get("scan_rules_ignore_case", True)))
+        except ScanRuleError as e:
+            return {"error": str(e)}
+
+        if directory:
+            path = self._resolve_directory(directory)
+            if not path:
+                return {"error": f"미디어 루트 아래의 경로가 아닙니다: {directory}"}
+            targets = [path]
+        else:
+            targets = [root["path"] for root in config.get_media_roots()]
+
+        limit = max(0, int(limit))
+        start_time = time.time()
+        results = []
+
+        for target in targets:
+            if not os.path.isdir(target):
+                results.append({"path": target, "error": "디렉토리가 존재하지 않습니다."})
+                continue
+
+            rules_root = config.find_media_root(target) or target
+            scanner = MediaScanner(root_dir=rules_root)
+            result = {
+                "path": target,
+                "excluded": compiled.excludes_path(target, rules_root, is_dir=True),
+                "directories_scanned": 0,
+                "directories_pruned": 0,
+                "media_files": 0,
+                "media_with_subtitles": 0,
+                "files_excluded": 0,
+                "pruned_directories": [],
+                "excluded_files": [],
+                "media_samples": []
+            }
+            results.append(result)
+            if result["excluded"]:
+                continue
+
+            def skip_directory(path: str, result=result, rules_root=rules_root) -> bool:
+                if not compiled.excludes(path, rules_root, True):
+                    return False
+                result["directories_pruned"] += 1
+                if len(result["pruned_directories"]) < limit:
+                    result["pruned_directories"].append(path)
+                return True
+
+            for listing in scanner.iter_listings(None, target, skip_directory if compiled else None):
+                result["directories_scanned"] += 1
+                for filepath in listing.media_files:
+                    if compiled.excludes(filepath, rules_root, False):
+                        result["files_excluded"] += 1
+                        if len(result["excluded_files"]) < limit:
+                            result["excluded_files"].append(filepath)
+                        continue
+
+                    result["media_files"] += 1
+                    if listing.find_subtitles(filepath):
+                        result["media_with_subtitles"] += 1
+                    if len(result["media_samples"]) < limit:
+                        result["media_samples"].append(filepath)
+
+        return {
+            "success": True,
+            "rules": compiled.rules,
+            "rule_count": compiled.rule_count,
+            "roots": results,
+            "directories_scanned": sum(item.get("directories_scanned", 0) for item in results),
+            "directories_pruned": sum(item.get("directories_pruned", 0) for item in results),
+            "media_files": sum(item.get("media_files", 0) for item in results),
+            "files_excluded": sum(item.get("files_excluded", 0) for item in results),
+            "elapsed_seconds": round(time.time() - start_time, 3)
+        }
+
+    def remove_directory(self, directory: str) -> Dict[str, Any]:
+        """
+        디렉토리 아래 모든 미디어를 인덱스에서 제거 (자막, 문장, FTS 포함, 한 트랜잭션)
+
+        Args:
+            directory: 디렉토리 경로
+
+        Returns:
+            Dict[str, Any]: 제거 결과 (삭제 행 수, 소요 시간)
+        """
+        if self.status_handler.current_status["is_indexing"]:
+            return {"error": "인덱싱이 진행 중입니다. 인덱싱이 완료된 후 다시 시도하세요."}
+
+        path = self._resolve_directory(directory)
+        if not path:
+            return {"error": f"미디어 루트 아래의 경로가 아닙니다: {directory}"}
+
+        from app.database.media import delete_media_under_directory
+
+        start_time = time.time()
+        result = delete_media_under_directory(path)
+        elapsed = time.time() - start_time
+
+        if not result.get("success"):
+            return {"error": f"디렉토리 제거 중 오류가 발생했습니다: {result.get('message')}"}
+
+        self.status_handler.log("INFO", f"디렉토리 제거: {path} - 미디어 {result['media']}개, "
+                                        f"자막 {result['subtitles']}개 ({elapsed:.2f}초)")
+        return {
+            "success": True,
+            "message": f"디렉토리의 미디어 {result['media']}개를 인덱스에서 제거했습니다.",
+            "directory": path,
+            "media": result["media"],
+            "subtitles": result["subtitles"],
+            "sentences": result["sentences"],
+            "subtitle_files": result["subtitle_files"],
+            "elapsed_seconds": round(elapsed, 3)
+        }
+
+    def reindex_directory(self, directory: str) -> Dict[str, Any]:
+        """
+        디렉토리 아래만 다시 인덱싱
+
+        기존 자막, 문장, FTS를 한 트랜잭션에서 지운 뒤, 그 디렉토리만 스캔하는 일반 인덱싱 작업을 시작합니다.
+        (매니페스트를 무시하고 모두 다시 나열하며, 사라진 미디어 정리도 그 디렉토리 범위로 제한)
+
+        Args:
+            directory: 디렉토리 경로
+
+        Returns:
+            Dict[str, Any]: 시작 결과 (삭제 행 수, 소요 시간)
+        """
+        if self.status_handler.current_status["is_indexing"]:
+            return {"error": "이미 인덱싱이 진행 중입니다."}
+
+        path = self._resolve_directory(directory)
+        if not path:
+            return {"error": f"미디어 루트 아래의 경로가 아닙니다: {directory}"}
+        if not os.path.isdir(path):
+            return {"error": f"디렉토리가 존재하지 않습니다: {path}"}
+
+        from app.database.media import clear_subtitles_under_directory
+
+        start_time = time.time()
+        result = clear_subtitles_under_directory(path)
+        elapsed = time.time() - start_time
+
+        if not result.get("success"):
+            return {"error": f"기존 자막 삭제 중 오류가 발생했습니다: {result.get('message')}"}
+
+        self.status_handler.log("INFO", f"디렉토리 재인덱싱 준비: {path} - 미디어 {result['media']}개, "
+                                        f"자막 {result['subtitles']}개 삭제 ({elapsed:.2f}초)")
+
+        self.status_handler.update_status(
+            is_indexing=True,
+            is_paused=False,
+            pid=os.getpid(),
+            status_message=f"디렉토리 재인덱싱 시작 중... ({path})"
+        )
+        self.worker.start_worker(incremental=False, verify=True, scan_root=path)
+
+        return {
+            "success": True,
+            "message": "디렉토리 재인덱싱이 시작되었습니다.",
+            "directory": path,
+            "media": result["media"],
+            "subtitles_cleared": result["subtitles"],
+            "sentences_cleared": result["sentences"],
+            "elapsed_seconds": round(elapsed, 3)
+        }
+
+    def resume_unfinished_files(self) -> Dict[str, Any]:
+        """
+        이전 실행에서 끝나지 않은(queued, parsing) 자막 파일만 스캔 없이 이어서 인덱싱
+
+        자막 저장과 파일 상태(written)는 한 트랜잭션으로 기록되므로, 끝나지 않은 파일에는 저장된 자막이 없어
+        중복 없이 다시 처리할 수 있습니다. 처리 중에 프로세스가 여러 번(indexer_retry_count + 1번) 종료된 파일은
+        실패로 기록하고 건너뜁니다.
+
+        Returns:
+            Dict[str, Any]: 시작 결과 (미디어 수, 파일 수, 실패로 기록한 파일 수)
+        """
+        if self.status_handler.current_status["is_indexing"]:
+            return {"error": "이미 인덱싱이 진행 중입니다."}
+
+        from app.database.jobs import fail_exhausted_indexing_files, get_unfinished_indexing_files
+
+        max_attempts = int(config.get("indexer_retry_count", 3) or 0) + 1
+        exhausted = fail_exhausted_indexing_files(max_attempts)
+        if exhausted:
+            self.status_handler.log("WARNING", f"처리 중 프로세스가 {max_attempts}번 종료된 자막 파일 "
+                                               f"{exhausted}개를 실패로 기록하고 건너뜁니다.")
+
+        media_files = [
+            {**media, "root": config.find_media_root(media["path"])}
+            for media in get_unfinished_indexing_files().values()
+        ]
+        file_count = sum(len(media["subtitle_files"]) for media in media_files)
+
+        if not media_files:
+            return {
+                "success": True,
+                "message": "이어서 처리할 파일이 없습니다.",
+                "media": 0,
+                "files": 0,
+                "failed": exhausted
+            }
+
+        self.status_handler.update_status(
+            is_indexing=True,
+            is_paused=False,
+            pid=os.getpid(),
+            status_message=f"끝나지 않은 인덱싱 이어서 처리 중... (미디어 {len(media_files)}개, 자막 파일 {file_count}개)"
+        )
+        self.worker.start_worker(media_files=media_files)
+
+        return {
+            "success": True,
+            "message": "끝나지 않은 인덱싱을 이어서 시작했습니다.",
+            "media": len(media_files),
+            "files": file_count,
+            "failed": exhausted
+        }
+
+    def get_indexing_files(self, failed_limit: int = 100) -> Dict[str, Any]:
+        """
+        자막 파일별 인덱싱 상태 집계와 실패한 파일 목록 가져오기
+
+        Args:
+            failed_limit: 반환할 실패 파일 최대 수
+
+        Returns:
+            Dict[str, Any]: 상태별 파일 수(counts), 끝나지 않은 파일 수(unfinished), 실패한 파일 목록(failed)
+        """
+        from app.database.jobs import (
+            get_indexing_file_counts, get_failed_indexing_files, FILE_STATE_QUEUED, FILE_STATE_PARSING
+        )
+
+        counts = get_indexing_file_counts()
+        return {
+            "success": True,
+            "is_indexing": self.status_handler.current_status.get("is_indexing", False),
+            "counts": counts,
+            "unfinished": counts[FILE_STATE_QUEUED] + counts[FILE_STATE_PARSING],
+            "failed": get_failed_indexing_files(failed_limit)
+        }
+
+    def prioritize_directory(self, directory: str) -> Dict[str, Any]:
+        """
+        디렉토리를 가장 먼저 인덱싱하도록 요청 ("지금 인덱싱")
+
+        인덱싱 중이면 아직 나열하지 않은 디렉토리와 큐에 대기 중인 미디어를 바로 다시 정렬하고,
+        인덱싱 중이 아니면 증분 인덱싱을 시작합니다 (요청한 디렉토리부터 스캔).
+
+        Args:
+            directory: 디렉토리 경로
+
+        Returns:
+            Dict[str, Any]: 요청 결과
+        """
+        from app.services.indexer.priority import indexing_priorities
+
+        path = self._resolve_directory(directory)
+        if not path:
+            return {"error": f"미디어 루트 아래의 경로가 아닙니다: {directory}"}
+        if not os.path.isdir(path):
+            return {"error": f"디렉토리가 존재하지 않습니다: {path}"}
+        if not indexing_priorities.enabled:
+            return {"error": "인덱싱 우선순위가 꺼져 있습니다 (indexer_priority.enabled)."}
+
+        indexing_priorities.request_directory(path)
+        self.status_handler.log("INFO", f"우선 인덱싱 요청: {path}")
+
+        started = False
+        if not self.status_handler.current_status["is_indexing"]:
+            result = self.start_indexing(incremental=True)
+            if "error" in result:
+                return result
+            started = True
+
+        return {
+            "success": True,
+            "message": "인덱싱을 시작했습니다." if started else "진행 중인 인덱싱에서 먼저 처리합니다.",
+            "directory": path,
+            "started": started
+        }
+
+    def cancel_directory_priority(self, directory: Optional[str] = None) -> Dict[str, Any]:
+        """
+        우선 인덱싱 요청 취소
+
+        Args:
+            directory: 디렉토리 경로 (None이면 모든 요청)
+
+        Returns:
+            Dict[str, Any]: 취소한 요청 수
+        """
+        from app.services.indexer.priority import indexing_priorities
+
+        path = None
+        if directory:
+            path = self._resolve_directory(directory)
+            if not path:
+                return {"error": f"미디어 루트 아래의 경로가 아닙니다: {directory}"}
+
+        return {"success": True, "cancelled": indexing_priorities.cancel_directory(path)}
+
+    def get_priorities(self, count: int = 10) -> Dict[str, Any]:
+        """
+        인덱싱 우선순위와 다음에 인덱싱할 미디어 가져오기
+
+        Args:
+            count: 반환할 대기 미디어 최대 수
+
+        Returns:
+            Dict[str, Any]: 우선순위 설정, 요청/검색 디렉토리, 대기 미디어(next, 인덱싱 중일 때)
+        """
+        from app.services.indexer.priority import indexing_priorities, PriorityWorkQueue
+
+        result = {"success": True, **indexing_priorities.snapshot(), "next": []}
+        feed = self.worker.media_feed
+        if feed is not None and isinstance(feed.queue, PriorityWorkQueue):
+            result["next"] = feed.queue.peek(count)
+        return result
+
+    def update_priorities(self, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        인덱싱 우선순위 설정 변경 (인덱싱 중에도 바로 적용)
+
+        인덱싱을 시작할 때 우선순위가 꺼져 있었다면 그 실행에서는 켜도 적용되지 않습니다.
+
+        Args:
+            settings: 바꿀 설정 (enabled, requested, searched, bookmarked, recency, recency_days, size)
+
+        Returns:
+            Dict[str, Any]: 변경 결과 (현재 우선순위)
+        """
+        from app.services.indexer.priority import DEFAULT_PRIORITY_CONFIG, indexing_priorities
+
+        if not isinstance(settings, dict):
+            return {"error": "우선순위 설정은 딕셔너리여야 합니다."}
+
+        unknown = sorted(set(settings) - set(DEFAULT_PRIORITY_CONFIG))
+        if unknown:
+            return {"error": f"알 수 없는 우선순위 설정: {', '.join(unknown)}"}
+
+        for key, value in settings.items():
+            if key == "enabled":
+                if not isinstance(value, bool):
+                    return {"error": "enabled는 true 또는 false여야 합니다."}
+            elif isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                return {"error": f"{key}는 0 이상의 숫자여야 합니다."}
+
+        try:
+            current = config.get("indexer_priority") or {}
+            config.set("indexer_priority", {**current, **settings})
+            config.save()
+            indexing_priorities.refresh()
+
+            self.status_handler.log("INFO", f"인덱싱 우선순위 설정 변경: {settings}")
+            return {"success": True, **indexing_priorities.snapshot()}
+
+        except Exception as e:
+            logger.error(f"우선순위 설정 변경 중 오류 발생: {str(e)}")
+            return {"error": f"우선순위 설정 변경 중 오류가 발생했습니다: {str(e)}"}
+
     def update_fts_index(self) -> Dict[str, Any]:
         """
         FTS 인덱스 수동 업데이트
@@ -210,7 +698,7 @@ class IndexingService:
         Returns:
             Dict[str, Any]: 업데이트 결과
         """
-        from app.services.indexer.indexing_strategy import update_fts_index
+        from app.database.schema import rebuild_fts_index
         
         # 인덱싱 중인 경우
         if self.status_handler.current_status["is_indexing"]:
@@ -220,7 +708,7 @@ class IndexingService:
         self.status_handler.log("INFO", "FTS 인덱스 수동 업데이트 시작")
         
         # FTS 인덱스 업데이트
-        result = update_fts_index()
+        result = rebuild_fts_index(force=False)
         
         if result:
             self.status_handler.log("INFO", "FTS 인덱스 수동 업데이트 완료")
@@ -243,9 +731,15 @@ class IndexingService:
         """
         indexer_config = {
             "root_dir": config.get("root_dir", ""),
+            "media_roots": config.get("media_roots", []),
+            "scan_rules": config.get("scan_rules", []),
+            "scan_rules_ignore_case": config.get("scan_rules_ignore_case", True),
             "media_extensions": config.get("media_extensions", []),
-            "subtitle_extensions": config.get("subtitle_extensions", []),
-            "max_threads": config.get("indexer_max_threads", 1)
+            "subtitle_extensions": config.get_subtitle_extensions(),
+            "max_threads": config.get("indexer_max_threads", 1),
+            "parse_workers": config.get("indexer_parse_workers", os.cpu_count() or 1),
+            "pipeline": get_stage_config(),
+            "priority": get_priority_config()
         }
         
         return indexer_config
@@ -264,10 +758,27 @@ class IndexingService:
         if self.status_handler.current_status["is_indexing"]:
             return {"error": "인덱싱이 진행 중입니다. 인덱싱이 완료된 후 다시 시도하세요."}
         
+        # 파이프라인 설정은 단계 이름 → 설정 딕셔너리
+        pipeline_config = new_config.get("indexer_pipeline")
+        if pipeline_config is not None and not (
+                isinstance(pipeline_config, dict)
+                and all(isinstance(value, dict) for value in pipeline_config.values())):
+            return {"error": "indexer_pipeline은 단계 이름별 설정 딕셔너리여야 합니다."}
+        
+        # 스캔 규칙은 저장 전에 컴파일하여 확인
+        if "scan_rules" in new_config:
+            from app.services.indexer.scan_rules import ScanRules, ScanRuleError
+            try:
+                ScanRules(new_config["scan_rules"] or [])
+            except ScanRuleError as e:
+                return {"error": str(e)}
+        
         try:
             # 설정 업데이트
             for key, value in new_config.items():
-                if key in ["root_dir", "media_extensions", "subtitle_extensions", "indexer_max_threads"]:
+                if key in ["scan_rules", "scan_rules_ignore_case", "indexer_pipeline"]:
+                    config.set(key, value)
+                if key in ["root_dir", "media_roots", "media_extensions", "subtitle_extensions", "indexer_max_threads", "indexer_parse_workers"]:
                     config.set(key, value)
             
             # 설정 저장
@@ -287,3 +798,7 @@ class IndexingService:
             return {
                 "error": f"설정 업데이트 중 오류가 발생했습니다: {str(e)}"
             }
+
+
+# IndexerService 인스턴스 생성 (서비스 싱글톤)
+indexer_service = IndexingService()
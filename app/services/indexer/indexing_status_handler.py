@@ -8,6 +8,7 @@ import os
 import json
 import time
 import logging
+import threading
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
@@ -24,17 +25,20 @@ class IndexingStatusHandler:
         self.status_file = INDEXING_STATUS_FILE
         self.last_save_time = 0
         self.save_interval = 1.0  # 1초 간격으로 저장 (디바운싱)
+        self._roots_lock = threading.Lock()
         self.current_status = self.load_status() or {
             "is_indexing": False,
             "processed_files": 0,
             "total_files": 0,
+            "total_is_estimate": False,   # 스캔과 인덱싱이 동시에 진행되는 동안 total_files는 추정값
             "current_file": "",
             "subtitle_count": 0,
             "log_messages": [],
             "pid": None,
             "last_updated": None,
             "retry_count": 0,
-            "last_error": None
+            "last_error": None,
+            "roots": {}                   # 미디어 루트별 스캔/처리 통계
         }
     
     def load_status(self) -> Optional[Dict[str, Any]]:
@@ -186,6 +190,49 @@ class IndexingStatusHandler:
             self.current_status[key] = value
         self.save_status()
     
+    def reset_root_status(self, roots: List[str]) -> None:
+        """
+        루트별 통계 초기화 (인덱싱 시작 시 호출)
+        
+        Args:
+            roots: 이번 인덱싱에서 스캔할 미디어 루트 목록
+        """
+        with self._roots_lock:
+            self.current_status["roots"] = {
+                root: {"scanned": 0, "queued": 0, "processed": 0, "subtitle_count": 0, "complete": False}
+                for root in roots
+            }
+        self.save_status()
+    
+    def update_root_status(self, root: str, **kwargs) -> None:
+        """
+        루트별 통계 갱신 (여러 스캔 스레드에서 동시에 호출)
+        
+        Args:
+            root: 미디어 루트
+            **kwargs: 갱신할 통계 키-값 쌍
+        """
+        with self._roots_lock:
+            roots = self.current_status.setdefault("roots", {})
+            # 저장 중인 딕셔너리를 바꾸지 않도록 새 딕셔너리로 교체
+            roots[root] = {**roots.get(root, {}), **kwargs}
+        self.save_status()
+    
+    def increment_root_status(self, root: Optional[str], **increments: int) -> None:
+        """
+        루트별 통계 값 증가 (예: processed=1, subtitle_count=12)
+        
+        Args:
+            root: 미디어 루트 (None이면 무시)
+            **increments: 증가시킬 통계 키와 증가량
+        """
+        if not root:
+            return
+        with self._roots_lock:
+            roots = self.current_status.setdefault("roots", {})
+            entry = roots.get(root, {})
+            roots[root] = {**entry, **{key: entry.get(key, 0) + value for key, value in increments.items()}}
+    
     def get_status(self) -> Dict[str, Any]:
         """
         현재 인덱싱 상태 반환
@@ -8,7 +8,7 @@ import os
 import time
 import threading
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Iterable, Tuple
 
 from app.config import config
 from app.utils.logging import get_indexer_logger
@@ -18,6 +18,8 @@ from app.database.subtitles import get_subtitle_stats
 # 인덱싱 관련 클래스 임포트
 from app.services.indexer.media_scanner import MediaScanner
 from app.services.indexer.subtitle_processor import SubtitleProcessor
+from app.services.indexer.scan_feed import ScanFeed
+from app.services.indexer.priority import indexing_priorities, get_indexing_priorities
 
 logger = get_indexer_logger()
 
@@ -35,6 +37,8 @@ class IndexingWorker:
         self.scanner = MediaScanner(status_handler)
         self.processor = SubtitleProcessor(status_handler)
         self.indexing_thread = None
+        self.parse_pool = None
+        self.media_feed: Optional[ScanFeed] = None
         self.max_threads = config.get("indexer_max_threads", 1)
     
     def log(self, level: str, message: str) -> None:
@@ -82,70 +86,81 @@ class IndexingWorker:
             return self.status_handler.current_status.get("is_paused", False)
         return False
     
-    def start_worker(self, incremental: bool = True) -> None:
+    def start_worker(self, incremental: bool = True, verify: bool = False,
+                     scan_root: Optional[str] = None,
+                     media_files: Optional[List[Dict[str, Any]]] = None) -> None:
         """
         인덱싱 워커 스레드 시작
         
         Args:
             incremental: 증분 인덱싱 여부
+            verify: 디렉토리 매니페스트를 무시하고 모든 디렉토리를 다시 나열할지 여부
+            scan_root: 이 디렉토리 아래만 인덱싱 (기본값: 설정의 루트 디렉토리 전체)
+            media_files: 스캔 없이 처리할 미디어 목록 (끝나지 않은 파일 이어서 처리, 감시 모드 변경 반영)
         """
         if self.indexing_thread and self.indexing_thread.is_alive():
             self.log("WARNING", "이미 인덱싱 워커가 실행 중입니다.")
             return
         
-        self.indexing_thread = threading.Thread(target=self.run_indexing, args=(incremental,))
+        self.indexing_thread = threading.Thread(target=self.run_indexing,
+                                                args=(incremental, verify, scan_root, media_files))
         self.indexing_thread.daemon = True
         self.indexing_thread.start()
         
         self.log("INFO", f"인덱싱 워커 시작 (증분 모드: {incremental})")
     
-    def run_indexing(self, incremental: bool = True) -> None:
+    def run_indexing(self, incremental: bool = True, verify: bool = False,
+                     scan_root: Optional[str] = None,
+                     media_files: Optional[List[Dict[str, Any]]] = None) -> None:
         """
         인덱싱 작업 실행 함수
         
         Args:
             incremental: 증분 인덱싱 여부
+            verify: 디렉토리 매니페스트를 무시하고 모든 디렉토리를 다시 나열할지 여부
+            scan_root: 이 디렉토리 아래만 인덱싱 (기본값: 설정의 루트 디렉토리 전체)
+            media_files: 스캔 없이 처리할 미디어 목록 (id, path, root, subtitle_files)
         """
         try:
-            self.log("INFO", f"인덱싱 작업 시작 (증분 모드: {incremental})")
+            if media_files is not None:
+                self.log("INFO", f"스캔 없이 목록의 미디어 인덱싱: 미디어 {len(media_files)}개")
+            else:
+                self.log("INFO", f"인덱싱 작업 시작 (증분 모드: {incremental}"
+                                 f"{f', 대상 디렉토리: {scan_root}' if scan_root else ''})")
+            
+            # 설정과 북마크를 다시 읽어 우선순위 갱신
+            indexing_priorities.refresh()
             
             # 상태 업데이트
             if self.status_handler:
                 self.status_handler.update_status(
-                    status_message="미디어 파일 스캔 중...",
+                    status_message="미디어 파일 스캔 중..." if media_files is None else "목록의 미디어 처리 중...",
                     processed_files=0,
-                    total_files=0,
+                    total_files=0 if media_files is None else len(media_files),
                     current_file="",
                     subtitle_count=0
                 )
             
-            # 미디어 파일 스캔
-            media_files = self.scanner.scan_directory(incremental, self.is_indexing)
+            if media_files is not None:
+                if self.status_handler:
+                    self.status_handler.reset_root_status(
+                        sorted({media["root"] for media in media_files if media.get("root")})
+                    )
+                priorities = get_indexing_priorities()
+                if priorities is not None:
+                    media_files = priorities.sort_items(media_files)
+                start_time = time.time()
+                self._run_pipeline(media_files)
+                total_files = len(media_files)
+            else:
+                start_time, total_files = self._scan_and_index(incremental, verify, scan_root)
             
-            if not media_files:
+            if not total_files and self.is_indexing():
                 self.log("INFO", "인덱싱할 파일이 없습니다.")
                 if self.status_handler:
                     self.status_handler.reset_status("완료")
                 return
             
-            # 상태 업데이트
-            total_files = len(media_files)
-            if self.status_handler:
-                self.status_handler.update_status(
-                    total_files=total_files,
-                    status_message=f"인덱싱 중... (0/{total_files})"
-                )
-            
-            # 인덱싱 시작 시간
-            start_time = time.time()
-            
-            # 단일 스레드 인덱싱
-            if self.max_threads <= 1:
-                self._run_standard_indexing(media_files)
-            else:
-                # 병렬 인덱싱
-                self._run_parallel_indexing(media_files)
-            
             # 인덱싱 완료 후 통계 업데이트
             if self.is_indexing():
                 # 인덱싱 시간 계산
@@ -157,9 +172,13 @@ class IndexingWorker:
                 # 완료 메시지
                 self.log("INFO", f"인덱싱 완료: {total_files}개 파일, {stats.get('total_count', 0)}개 자막 ({indexing_time:.2f}초)")
                 
-                # FTS 인덱스 업데이트
-                from app.services.indexer.indexing_strategy import update_fts_index
-                update_fts_index()
+                # FTS 인덱스 확인 (자막 수와 인덱싱된 행 수가 다를 때만 재구축)
+                from app.database.schema import rebuild_fts_index
+                rebuild_fts_index(force=False)
+                
+                # 인덱싱이 끝난 범위의 "지금 인덱싱" 요청 정리
+                if media_files is None:
+                    indexing_priorities.complete_requests(scan_root)
                 
                 # 상태 초기화
                 if self.status_handler:
@@ -182,130 +201,81 @@ class IndexingWorker:
                     status_message=f"인덱싱 오류: {str(e)}"
                 )
     
-    def _run_standard_indexing(self, media_files: List[Dict[str, Any]]) -> None:
+    def _scan_and_index(self, incremental: bool, verify: bool, scan_root: Optional[str]) -> Tuple[float, int]:
         """
-        단일 스레드 인덱싱 실행
+        미디어 루트를 스캔하면서 찾은 미디어를 바로 인덱싱
         
         Args:
-            media_files: 처리할 미디어 파일 목록
+            incremental: 증분 인덱싱 여부
+            verify: 디렉토리 매니페스트를 무시하고 모든 디렉토리를 다시 나열할지 여부
+            scan_root: 이 디렉토리 아래만 인덱싱
+            
+        Returns:
+            Tuple[float, int]: (인덱싱 시작 시간, 처리 대상 미디어 수)
         """
-        total_files = len(media_files)
-        processed_files = 0
-        subtitle_count = 0
+        # 미디어 루트별 스캐너 (루트마다 스캔 스레드와 디렉토리 나열 스레드 수가 따로)
+        scanners = self._create_scanners(scan_root)
+        if self.status_handler:
+            self.status_handler.reset_root_status([scanner.root_dir for scanner in scanners])
+        if len(scanners) > 1:
+            self.log("INFO", f"미디어 루트 {len(scanners)}개 동시 스캔: "
+                             f"{', '.join(scanner.root_dir for scanner in scanners)}")
         
-        for media_file in media_files:
-            # 일시 중지 상태 확인
-            if self.is_paused():
-                while self.is_paused() and self.is_indexing():
-                    time.sleep(1)
-            
-            # 인덱싱 중단 확인
-            if not self.is_indexing():
-                break
-            
-            media_id = media_file["id"]
-            media_path = media_file["path"]
-            subtitle_files = media_file.get("subtitle_files", [])
-            
-            # 상태 업데이트
-            if self.status_handler:
-                self.status_handler.update_status(
-                    current_file=media_path,
-                    status_message=f"인덱싱 중... ({processed_files}/{total_files})"
-                )
-            
-            # 자막 파일 처리
-            for subtitle_path in subtitle_files:
-                # 인덱싱 중단 확인
-                if not self.is_indexing():
-                    break
-                
-                # 자막 처리
-                subtitles_count = self.processor.process_subtitle(subtitle_path, media_id)
-                subtitle_count += subtitles_count
-            
-            # 처리 완료된 파일 수 증가
-            processed_files += 1
-            
-            # 상태 업데이트
-            if self.status_handler:
-                self.status_handler.update_status(
-                    processed_files=processed_files,
-                    subtitle_count=subtitle_count,
-                    status_message=f"인덱싱 중... ({processed_files}/{total_files})"
-                )
+        # 미디어 파일 스캔 (스캔 스레드가 찾는 대로 큐에 넣고 바로 인덱싱)
+        # (우선순위를 사용하면 큐에 대기 중인 미디어 중 점수가 높은 것부터 인덱싱)
+        media_files = ScanFeed(scanners, incremental, self.is_indexing, verify,
+                               max_queued=config.get("scan_queue_size", 1024),
+                               root_dir=scan_root, priorities=get_indexing_priorities()).start()
+        self.media_feed = media_files
+        
+        # 인덱싱 시작 시간
+        start_time = time.time()
+        
+        try:
+            # 단계별 파이프라인 인덱싱 (discover → read → decode → parse → normalize → write)
+            self._run_pipeline(media_files)
+        finally:
+            self.media_feed = None
+            media_files.stop()
+        
+        if media_files.error:
+            raise media_files.error
+        
+        total_files = media_files.produced
+        if self.status_handler:
+            self.status_handler.update_status(total_files=total_files, total_is_estimate=False)
+        return start_time, total_files
     
-    def _run_parallel_indexing(self, media_files: List[Dict[str, Any]]) -> None:
+    def _create_scanners(self, scan_root: Optional[str] = None) -> List[MediaScanner]:
         """
-        병렬 스레드 인덱싱 실행
+        미디어 루트별 스캐너 생성
         
         Args:
-            media_files: 처리할 미디어 파일 목록
+            scan_root: 이 디렉토리 아래만 인덱싱 (그 디렉토리가 속한 루트의 스캐너 하나만 생성)
+            
+        Returns:
+            List[MediaScanner]: 스캐너 목록 (루트 설정이 없으면 기본 스캐너 하나)
         """
-        from concurrent.futures import ThreadPoolExecutor
+        roots = config.get_media_roots()
+        if scan_root:
+            root_dir = config.find_media_root(scan_root)
+            roots = [root for root in roots if root["path"] == root_dir]
         
-        total_files = len(media_files)
-        processed_files = 0
-        subtitle_count = 0
+        if not roots:
+            return [self.scanner]
         
-        # 스레드 풀 생성
-        with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
-            futures = []
-            
-            for media_file in media_files:
-                # 인덱싱 중단 확인
-                if not self.is_indexing():
-                    break
-                
-                media_id = media_file["id"]
-                media_path = media_file["path"]
-                subtitle_files = media_file.get("subtitle_files", [])
-                
-                # 상태 업데이트
-                if self.status_handler:
-                    self.status_handler.update_status(
-                        current_file=media_path,
-                        status_message=f"인덱싱 중... ({processed_files}/{total_files})"
-                    )
-                
-                # 자막 파일 병렬 처리
-                for subtitle_path in subtitle_files:
-                    # 인덱싱 중단 확인
-                    if not self.is_indexing():
-                        break
-                    
-                    # 스레드 풀에 작업 제출
-                    future = executor.submit(self.processor.process_subtitle, subtitle_path, media_id)
-                    futures.append((future, media_path))
-                
-                # 처리 완료된 파일 수 증가
-                processed_files += 1
-                
-                # 상태 업데이트
-                if self.status_handler:
-                    self.status_handler.update_status(
-                        processed_files=processed_files,
-                        status_message=f"인덱싱 중... ({processed_files}/{total_files})"
-                    )
-            
-            # 모든 작업 완료 대기
-            for future, media_path in futures:
-                # 인덱싱 중단 확인
-                if not self.is_indexing():
-                    break
-                
-                try:
-                    # 작업 결과 가져오기
-                    result = future.result()
-                    subtitle_count += result
-                    
-                    # 상태 업데이트
-                    if self.status_handler:
-                        self.status_handler.update_status(
-                            subtitle_count=subtitle_count
-                        )
-                except Exception as e:
-                    self.log("ERROR", f"자막 처리 중 오류 발생: {str(e)} - {media_path}")
+        return [MediaScanner(self.status_handler, root["path"], root["scan_workers"]) for root in roots]
+    
+    def _run_pipeline(self, media_files: Iterable[Dict[str, Any]]) -> None:
+        """
+        단계별 파이프라인으로 인덱싱 실행 (단계별 스레드 수, 큐 크기는 indexer_pipeline 설정)
+        
+        Args:
+            media_files: 처리할 미디어 파일 목록 또는 스캔 피드
+        """
+        from app.services.indexer.pipeline import PipelineIndexingStrategy
+        
+        PipelineIndexingStrategy().process(self, media_files)
     
     def stop_worker(self) -> None:
         """인덱싱 워커 중지"""
@@ -313,6 +283,10 @@ class IndexingWorker:
         if self.status_handler:
             self.status_handler.update_status(is_indexing=False)
         
+        # 파싱 프로세스 풀 종료 (대기 중인 작업 취소)
+        if self.parse_pool:
+            self.parse_pool.shutdown(wait=False)
+        
         # 스레드 종료 대기
         if self.indexing_thread and self.indexing_thread.is_alive():
             self.indexing_thread.join(timeout=5.0)
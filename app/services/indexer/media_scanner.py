@@ -6,11 +6,15 @@
 
 import os
 import time
-import glob
-from typing import List, Dict, Any, Optional, Tuple, Callable
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable, Iterator
 
 from app.config import config
-from app.utils.helpers import get_file_extension
+from app.services.indexer.directory_index import (
+    iter_directory_listings, iter_directory_listings_concurrent, list_directory
+)
+from app.services.indexer.directory_manifest import DirectoryManifest
+from app.services.indexer.path_index import IndexedPathIndex
+from app.services.indexer.scan_rules import ScanRules, get_scan_rules
 from app.utils.logging import get_indexer_logger
 
 logger = get_indexer_logger()
@@ -18,17 +22,24 @@ logger = get_indexer_logger()
 class MediaScanner:
     """미디어 파일 스캐너 클래스"""
     
-    def __init__(self, status_handler=None):
+    def __init__(self, status_handler=None, root_dir: Optional[str] = None, scan_workers: Optional[int] = None):
         """
         스캐너 초기화
         
         Args:
-            status_handler: 상태 관리자 인스턴스 (로깅용)
+            status_handler: 상태 관리자 인스턴스 (로깅, 루트별 진행 상황)
+            root_dir: 스캔할 미디어 루트 (기본값: 설정의 루트 디렉토리)
+            scan_workers: 디렉토리 동시 나열 스레드 수 (기본값: 설정의 scan_workers)
         """
         self.status_handler = status_handler
-        self.root_dir = config.get("root_dir", "")
+        self.root_dir = root_dir or config.get("root_dir", "")
+        self.scan_workers = scan_workers
         self.media_extensions = config.get("media_extensions", [".mp4", ".mkv", ".avi"])
-        self.subtitle_extension = config.get("subtitle_extension", ".srt")
+        self.subtitle_extensions = config.get_subtitle_extensions()
+        self.extract_from_media = config.get("extract_from_media", False)
+        
+        # 현재(또는 마지막) 스캔 진행 상황 - iter_media_files가 갱신
+        self.scan_progress: Dict[str, Any] = {}
     
     def log(self, level: str, message: str) -> None:
         """
@@ -53,156 +64,510 @@ class MediaScanner:
             elif level_upper == "CRITICAL":
                 logger.critical(message)
     
-    def scan_directory(self, incremental: bool = True, is_indexing_func: Optional[Callable[[], bool]] = None) -> List[Dict[str, Any]]:
+    def scan_directory(self, incremental: bool = True, is_indexing_func: Optional[Callable[[], bool]] = None,
+                       verify: bool = False, root_dir: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         지정된 디렉토리를 스캔하여 미디어 파일 목록 생성
         
+        전체 목록이 필요한 호출자용이며, 인덱싱 워커는 iter_media_files로 스캔과 처리를 동시에 진행합니다.
+        
         Args:
             incremental: 증분 인덱싱 여부
             is_indexing_func: 인덱싱 중단 여부를 확인하는 함수
+            verify: 매니페스트를 무시하고 모든 디렉토리를 다시 나열 (매니페스트는 새로 저장)
+            root_dir: 스캔할 디렉토리 (기본값: 설정의 루트 디렉토리)
             
         Returns:
             list: 처리할 미디어 파일 목록
         """
-        if not self.root_dir or not os.path.exists(self.root_dir):
-            self.log("ERROR", f"루트 디렉토리가 존재하지 않습니다: {self.root_dir}")
-            print(f"오류: 루트 디렉토리가 존재하지 않습니다: {self.root_dir}")
-            return []
+        return list(self.iter_media_files(incremental, is_indexing_func, verify, root_dir))
+    
+    def iter_media_files(self, incremental: bool = True, is_indexing_func: Optional[Callable[[], bool]] = None,
+                         verify: bool = False, root_dir: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        지정된 디렉토리를 스캔하면서 처리할 미디어 파일을 하나씩 반환
+        
+        증분 스캔에서는 디렉토리 매니페스트를 사용하여 수정 시간이 바뀌지 않은 디렉토리를 다시 나열하지 않습니다.
+        진행 상황(발견한 파일 수, 방문한/예상 디렉토리 수)은 self.scan_progress에 갱신됩니다.
+        root_dir를 지정하면 그 하위 디렉토리만 스캔하며, 매니페스트와 사라진 미디어 정리도 그 범위로 제한됩니다.
+        스캔 규칙(scan_rules)으로 제외된 디렉토리는 나열하지 않고, 제외된 미디어 파일은 스캔하지 않은 것으로 처리합니다
+        (이미 인덱싱된 미디어가 새 규칙으로 제외되면 사라진 미디어 정리에서 삭제됨).
+        루트별 진행 상황은 상태 관리자의 루트 통계(update_root_status)에도 기록됩니다.
+        
+        Args:
+            incremental: 증분 인덱싱 여부
+            is_indexing_func: 인덱싱 중단 여부를 확인하는 함수
+            verify: 매니페스트를 무시하고 모든 디렉토리를 다시 나열 (매니페스트는 새로 저장)
+            root_dir: 스캔할 디렉토리 (기본값: 설정의 루트 디렉토리)
+            
+        Yields:
+            Dict[str, Any]: 처리할 미디어 파일 (id, path, root, subtitle_files)
+        """
+        self.scan_progress = {
+            "scanned": 0,
+            "queued": 0,
+            "directories_visited": 0,
+            "directories_expected": 0,
+            "directories_pruned": 0,
+            "files_excluded": 0,
+            "complete": False,
+        }
+        
+        root_dir = root_dir or self.root_dir
+        
+        if not root_dir or not os.path.exists(root_dir):
+            self.log("ERROR", f"루트 디렉토리가 존재하지 않습니다: {root_dir}")
+            print(f"오류: 루트 디렉토리가 존재하지 않습니다: {root_dir}")
+            self.scan_progress["complete"] = True
+            self._report_progress(root_dir, error="루트 디렉토리가 존재하지 않습니다.")
+            self._mark_root_offline(root_dir)
+            return
+        
+        # 분리된 볼륨(빈 마운트 지점)은 스캔하지 않음 - 미디어는 삭제하지 않고 사용 불가로 표시
+        if not self._check_root_online(root_dir):
+            self.scan_progress["complete"] = True
+            return
+        
+        progress = self.scan_progress
+        
+        # 스캔 규칙은 루트 기준 경로로 비교 (하위 디렉토리만 스캔할 때도 같은 결과)
+        rules = get_scan_rules()
+        rules_root = self._availability_root(root_dir)
+        if rules and rules.excludes_path(root_dir, rules_root, is_dir=True):
+            self.log("WARNING", f"스캔 규칙으로 제외된 디렉토리입니다: {root_dir}")
+            progress["complete"] = True
+            self._report_progress(root_dir)
+            return
+        
+        reconcile = config.get("scan_reconcile", True)
+        detect_changes = incremental and config.get("scan_detect_changes", False)
+        dedupe = config.get("scan_dedupe", True)
+        failed_directories = []     # 나열하지 못한 디렉토리 (아래 미디어는 정리 대상에서 제외)
+        
+        # 이미 인덱싱된 경로 인덱스 (증분 건너뛰기와 사라진 미디어 정리에 사용)
+        indexed_files = None
+        if incremental or reconcile:
+            load_start = time.time()
+            indexed_files = IndexedPathIndex.load(root_dir)
+            self.log("INFO", f"이미 인덱싱된 파일: {len(indexed_files)}개 "
+                             f"(경로 인덱스 {indexed_files.memory_bytes / (1024 * 1024):.1f}MB, "
+                             f"{time.time() - load_start:.2f}초)")
+        
+        # 이전 실행에서 끝나지 않은 자막 파일 (증분 인덱싱에서도 저장되지 않은 파일은 다시 처리)
+        unfinished_files: Dict[int, Dict[str, Any]] = {}
+        if incremental:
+            from app.database.jobs import get_unfinished_indexing_files
+            unfinished_files = get_unfinished_indexing_files(root_dir)
+            if unfinished_files:
+                self.log("INFO", f"이전 인덱싱에서 끝나지 않은 미디어: {len(unfinished_files)}개")
+        
+        # 중복 미디어 별칭 경로 (대표 미디어만 인덱싱하고 별칭은 건너뜀)
+        alias_paths: Dict[str, int] = {}
+        if dedupe:
+            from app.database.media import load_alias_paths
+            alias_paths = load_alias_paths(root_dir)
+        seen_aliases = set()
         
-        # 이미 인덱싱된 파일 목록 (증분 인덱싱에 사용)
-        indexed_files = set()
         if incremental:
-            from app.database.media import get_indexed_media_paths
-            indexed_files = set(get_indexed_media_paths())
-            self.log("INFO", f"이미 인덱싱된 파일: {len(indexed_files)}개")
             print(f"\n===== 인덱싱 모드: {'증분(새 파일만)' if incremental else '전체'} =====")
             print(f"이미 인덱싱된 파일: {len(indexed_files)}개")
         else:
             print(f"\n===== 인덱싱 모드: 전체 =====")
         
-        media_files = []
         total_scanned = 0
+        excluded_count = 0
+        queued_count = 0
         skipped_count = 0
+        changed_count = 0
+        aliased_count = 0
         
-        self.log("INFO", f"디렉토리 스캔 시작: {self.root_dir}")
-        print(f"디렉토리 스캔 시작: {self.root_dir}")
+        self.log("INFO", f"디렉토리 스캔 시작: {root_dir}")
+        print(f"디렉토리 스캔 시작: {root_dir}")
         
         # 스캔 시작 시간
         scan_start_time = time.time()
         last_progress_update = time.time()
         progress_update_interval = 2.0  # 2초마다 진행 상황 업데이트
         
-        # 모든 파일 스캔
-        for dirpath, dirnames, filenames in os.walk(self.root_dir):
-            for filename in filenames:
-                # CPU 과점유 방지
-                time.sleep(0.01)
+        # 디렉토리 매니페스트 (전체/검증 스캔은 모두 나열하고 기록만 갱신)
+        reuse_manifest = incremental and not verify and config.get("scan_use_manifest", True)
+        manifest = DirectoryManifest(root_dir, reuse=reuse_manifest)
+        progress["directories_expected"] = manifest.expected_directories
+        self._report_progress(root_dir)
+        
+        # 디렉토리마다 한 번만 나열 (자막은 디렉토리별 이름 인덱스에서 조회)
+        listings = self.iter_listings(manifest.list_directory, root_dir, self._pruner(rules, rules_root))
+        for listing in listings:
+            # 인덱싱 중단 확인
+            if is_indexing_func and not is_indexing_func():
+                self.log("INFO", "스캔 중지됨")
+                print("\n스캔이 중지되었습니다.")
+                manifest.save(complete=False)
+                progress["complete"] = True
+                self._report_progress(root_dir)
+                return
+            
+            progress["directories_visited"] += 1
+            if listing.failed:
+                failed_directories.append(listing.path)
+            
+            for filepath in listing.media_files:
+                if rules and rules.excludes(filepath, rules_root, False):
+                    excluded_count += 1
+                    progress["files_excluded"] = excluded_count
+                    continue
                 
-                # 인덱싱 중단 확인
-                if is_indexing_func and not is_indexing_func():
-                    self.log("INFO", "스캔 중지됨")
-                    print("\n스캔이 중지되었습니다.")
-                    return media_files
+                total_scanned += 1
+                position = indexed_files.mark_seen(filepath) if indexed_files is not None else None
+                progress["scanned"] = total_scanned
                 
-                filepath = os.path.join(dirpath, filename)
-                file_ext = get_file_extension(filepath)
+                # 주기적으로 진행 상황 업데이트
+                current_time = time.time()
+                if current_time - last_progress_update > progress_update_interval:
+                    print(f"\r스캔 중: {total_scanned}개 미디어 파일 발견, {queued_count}개 처리 대상 식별됨...", end="")
+                    self._report_progress(root_dir)
+                    last_progress_update = current_time
                 
-                # 미디어 파일 확인
-                if file_ext in self.media_extensions:
-                    total_scanned += 1
-                    
-                    # 주기적으로 진행 상황 업데이트
-                    current_time = time.time()
-                    if current_time - last_progress_update > progress_update_interval:
-                        print(f"\r스캔 중: {total_scanned}개 미디어 파일 발견, {len(media_files)}개 처리 대상 식별됨...", end="")
-                        last_progress_update = current_time
-                    
-                    # 증분 인덱싱이고 이미 인덱싱된 파일이면 건너뜀
-                    if incremental and filepath in indexed_files:
-                        skipped_count += 1
+                # 이미 별칭으로 기록된 중복 미디어는 건너뜀
+                if position is None and filepath in alias_paths:
+                    seen_aliases.add(filepath)
+                    continue
+                
+                # 증분 인덱싱이고 이미 인덱싱된 파일이면 건너뜀 (변경 확인 시 크기/수정 시간이 바뀐 파일은 다시 처리)
+                if incremental and position is not None:
+                    if detect_changes and self._reset_if_changed(indexed_files, position, filepath):
+                        changed_count += 1
+                    else:
+                        # 자막 일부만 저장된 채 중단된 미디어는 저장되지 않은 자막 파일만 다시 처리
+                        unfinished = unfinished_files.get(indexed_files.ids[position])
+                        if not unfinished:
+                            skipped_count += 1
+                            continue
+                        queued_count += 1
+                        progress["queued"] = queued_count
+                        yield {
+                            "id": unfinished["id"],
+                            "path": filepath,
+                            "root": self.root_dir,
+                            "subtitle_files": unfinished["subtitle_files"]
+                        }
                         continue
+                
+                # 자막 파일 확인
+                subtitle_files = listing.find_subtitles(filepath)
+                
+                # 외부 자막이 없으면 MKV 내장 텍스트 자막 사용 (미디어 경로를 자막 경로로 처리)
+                if not subtitle_files and self.extract_from_media and self.has_embedded_subtitles(filepath):
+                    subtitle_files = [filepath]
+                
+                # 이미 인덱싱된 미디어와 같은 파일(하드 링크/복사본)이면 별칭으로만 기록
+                if subtitle_files and dedupe and position is None and self.record_if_duplicate(filepath):
+                    seen_aliases.add(filepath)
+                    aliased_count += 1
+                    progress["aliased"] = aliased_count
+                    continue
+                
+                # 자막 파일이 존재하면 처리 대상으로 반환
+                if subtitle_files:
+                    # 데이터베이스에 미디어 파일 정보 저장
+                    from app.database.media import upsert_media
+                    from app.database.jobs import queue_indexing_files
+                    media_id = upsert_media(filepath)
                     
-                    # 자막 파일 확인
-                    subtitle_files = self.find_subtitle_files(filepath)
-                    
-                    # 자막 파일이 존재하면 목록에 추가
-                    if subtitle_files:
-                        # 데이터베이스에 미디어 파일 정보 저장
-                        from app.database.media import upsert_media
-                        media_id = upsert_media(filepath)
-                        
-                        if media_id:
-                            media_files.append({
-                                "id": media_id,
-                                "path": filepath,
-                                "subtitle_files": subtitle_files
-                            })
+                    if media_id:
+                        # 자막 파일을 처리 대상으로 기록 (인덱싱 전에 중단되어도 다음 실행에서 이어서 처리)
+                        queue_indexing_files(media_id, subtitle_files)
+                        queued_count += 1
+                        progress["queued"] = queued_count
+                        yield {
+                            "id": media_id,
+                            "path": filepath,
+                            "root": self.root_dir,
+                            "subtitle_files": subtitle_files
+                        }
+        
+        manifest.save(complete=True)
+        
+        if reconcile:
+            progress["reconciled"] = self.reconcile_missing_media(indexed_files, total_scanned, failed_directories, root_dir,
+                                                                  alias_paths, seen_aliases)
+        
+        progress["complete"] = True
         
         # 스캔 완료 시간 및 통계
         scan_time = time.time() - scan_start_time
-        self.log("INFO", f"스캔 완료: {total_scanned}개 미디어 파일 스캔, {len(media_files)}개 처리 대상 식별됨")
+        progress["scan_seconds"] = round(scan_time, 2)
+        self._report_progress(root_dir)
+        self.log("INFO", f"스캔 완료: {total_scanned}개 미디어 파일 스캔, {queued_count}개 처리 대상 식별됨")
+        self.log("INFO", f"디렉토리: 매니페스트 재사용 {manifest.reused_count}개, 새로 나열 {manifest.listed_count}개")
+        if rules:
+            self.log("INFO", f"스캔 규칙: 디렉토리 {progress['directories_pruned']}개 제외 (하위 전체), "
+                             f"미디어 파일 {excluded_count}개 제외")
         
         print(f"\n===== 스캔 완료 =====")
         print(f"스캔된 미디어 파일: {total_scanned}개")
-        print(f"처리 대상 파일: {len(media_files)}개")
+        print(f"처리 대상 파일: {queued_count}개")
+        if rules:
+            print(f"스캔 규칙으로 제외: 디렉토리 {progress['directories_pruned']}개, 미디어 파일 {excluded_count}개")
+        if aliased_count:
+            print(f"중복 미디어 (별칭으로 기록): {aliased_count}개")
         if incremental:
             print(f"건너뛴 파일 (이미 인덱싱됨): {skipped_count}개")
+            if detect_changes:
+                print(f"변경되어 다시 처리할 파일: {changed_count}개")
         print(f"스캔 소요 시간: {scan_time:.2f}초")
         print("=====================")
         
         # 인덱싱할 파일이 없는 경우
-        if not media_files:
+        if not queued_count:
             if incremental:
                 self.log("INFO", "인덱싱할 새 파일이 없습니다.")
                 print("\n인덱싱할 새 파일이 없습니다. 모든 파일이 이미 처리되었습니다.")
             else:
                 self.log("INFO", "인덱싱할 파일이 없습니다.")
                 print("\n인덱싱할 파일이 없습니다. 자막 파일이 없는 것 같습니다.")
+    
+    def _pruner(self, rules: ScanRules, rules_root: str) -> Optional[Callable[[str], bool]]:
+        """
+        스캔 규칙으로 제외할 하위 디렉토리를 판단하는 함수 (제외한 디렉토리 수를 진행 상황에 기록)
         
-        return media_files
+        Args:
+            rules: 컴파일된 스캔 규칙
+            rules_root: 규칙 기준 미디어 루트
+            
+        Returns:
+            Optional[Callable[[str], bool]]: skip_directory 함수 (규칙이 없으면 None)
+        """
+        if not rules:
+            return None
+        
+        progress = self.scan_progress
+        
+        def skip_directory(path: str) -> bool:
+            if not rules.excludes(path, rules_root, True):
+                return False
+            progress["directories_pruned"] += 1
+            logger.debug(f"스캔 규칙으로 제외된 디렉토리: {path}")
+            return True
+        
+        return skip_directory
     
-    def find_subtitle_files(self, media_path: str) -> List[str]:
+    def _availability_root(self, root_dir: str) -> str:
+        """스캔 디렉토리가 속한 미디어 루트 (하위 디렉토리만 스캔할 때도 루트 단위로 가용성 판단)"""
+        return config.find_media_root(root_dir) or root_dir
+    
+    def _mark_root_offline(self, root_dir: str) -> None:
         """
-        미디어 파일과 관련된 자막 파일을 찾습니다.
+        연결되지 않은 루트의 미디어를 사용 불가로 표시
         
         Args:
-            media_path: 미디어 파일 경로
+            root_dir: 스캔할 디렉토리
+        """
+        from app.database.media import set_root_availability
+        
+        media_root = self._availability_root(root_dir)
+        marked = set_root_availability(media_root, False)
+        self.log("WARNING", f"미디어 루트가 연결되어 있지 않아 스캔과 정리를 건너뜁니다: {media_root} "
+                            f"(미디어 {marked}개를 사용 불가로 표시, 인덱스는 유지)")
+        self._report_progress(root_dir, available=False)
+    
+    def _check_root_online(self, root_dir: str) -> bool:
+        """
+        루트 연결 여부 확인 (연결이 끊겼으면 사용 불가로 표시, 다시 연결되었으면 표시 해제)
+        
+        Args:
+            root_dir: 스캔할 디렉토리
             
         Returns:
-            list: 자막 파일 경로 목록
+            bool: 스캔을 계속할지 여부
+        """
+        from app.database.media import is_root_available, set_root_availability
+        
+        media_root = self._availability_root(root_dir)
+        if not is_root_available(media_root):
+            self._mark_root_offline(root_dir)
+            return False
+        
+        restored = set_root_availability(media_root, True)
+        if restored:
+            self.log("INFO", f"미디어 루트가 다시 연결됨: {media_root} (미디어 {restored}개 사용 가능, 증분 스캔으로 이어서 진행)")
+        self._report_progress(root_dir, available=True)
+        return True
+    
+    def _report_progress(self, root_dir: str, **extra) -> None:
         """
-        media_dir = os.path.dirname(media_path)
-        media_filename = os.path.basename(media_path)
-        media_basename = os.path.splitext(media_filename)[0]
+        스캔 진행 상황을 상태 관리자의 루트별 통계에 기록
         
-        # 자막 파일 패턴 목록
-        patterns = [
-            # 기본 패턴 (동일한 이름)
-            f"{media_basename}{self.subtitle_extension}",
+        Args:
+            root_dir: 스캔 중인 디렉토리
+            **extra: 함께 기록할 값 (예: error)
+        """
+        if self.status_handler:
+            self.status_handler.update_root_status(self.root_dir or root_dir, **self.scan_progress, **extra)
+    
+    def record_if_duplicate(self, filepath: str) -> bool:
+        """
+        이미 인덱싱된 미디어와 같은 파일이면 별칭으로 기록
+        
+        Args:
+            filepath: 새로 발견한 미디어 파일 경로
+            
+        Returns:
+            bool: 별칭으로 기록했는지 여부 (True면 인덱싱하지 않음)
+        """
+        from app.database.media import find_duplicate_media, add_media_alias
+        
+        duplicate = find_duplicate_media(filepath)
+        if not duplicate or not add_media_alias(filepath, duplicate["id"], duplicate["reason"]):
+            return False
+        
+        self.log("INFO", f"중복 미디어 ({duplicate['reason']}): {filepath} -> {duplicate['path']}")
+        return True
+    
+    def _reset_if_changed(self, indexed_files: IndexedPathIndex, position: int, filepath: str) -> bool:
+        """
+        인덱싱된 파일의 크기/수정 시간이 바뀌었으면 기존 자막을 지우고 다시 처리하도록 표시
+        
+        Args:
+            indexed_files: 경로 인덱스
+            position: 경로 인덱스 안의 위치
+            filepath: 미디어 파일 경로
             
-            # 언어 코드가 포함된 패턴
-            f"{media_basename}.en{self.subtitle_extension}",
-            f"{media_basename}.eng{self.subtitle_extension}",
-            f"{media_basename}_eng{self.subtitle_extension}",
-            f"{media_basename}_en{self.subtitle_extension}",
-            f"{media_basename}.english{self.subtitle_extension}",
+        Returns:
+            bool: 변경되어 다시 처리해야 하는지 여부
+        """
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+        
+        if not indexed_files.is_changed(position, stat.st_size, stat.st_mtime):
+            return False
+        
+        from app.database.subtitles import clear_subtitles_for_media
+        clear_subtitles_for_media(indexed_files.ids[position])
+        return True
+    
+    def reconcile_missing_media(self, indexed_files: IndexedPathIndex, total_scanned: int,
+                                failed_directories: List[str], root_dir: Optional[str] = None,
+                                alias_paths: Optional[Dict[str, int]] = None,
+                                seen_aliases: Optional[Set[str]] = None) -> Dict[str, Any]:
+        """
+        스캔에서 확인하지 못한 미디어를 데이터베이스에서 한 번에 삭제
+        
+        사라진 대표 미디어에 남아 있는 별칭이 있으면 삭제하지 않고 별칭 경로로 옮기며,
+        디스크에서 사라진 별칭은 기록만 지웁니다.
+        
+        Args:
+            indexed_files: 스캔 중 확인 표시를 한 경로 인덱스
+            total_scanned: 스캔에서 발견한 미디어 파일 수
+            failed_directories: 나열하지 못한 디렉토리 목록
+            root_dir: 스캔한 디렉토리 (기본값: 설정의 루트 디렉토리)
+            alias_paths: 스캔 시작 시 루트 아래 별칭 경로 → 대표 미디어 ID
+            seen_aliases: 스캔에서 확인한 별칭 경로
             
-            # 기타 일반적인 패턴
-            f"{media_basename}.*{self.subtitle_extension}"
+        Returns:
+            Dict[str, Any]: 삭제 결과 (건너뛴 경우 skipped 사유)
+        """
+        from app.database.media import (
+            get_media_under_directory, delete_media_ids, delete_media_aliases, promote_media_aliases
+        )
+        
+        # 마운트가 빠진 빈 디렉토리를 스캔한 경우 전체 삭제를 막음
+        if not total_scanned and len(indexed_files):
+            self.log("WARNING", f"루트 디렉토리에서 미디어를 찾지 못해 정리를 건너뜁니다: {root_dir or self.root_dir}")
+            return {"skipped": "루트 디렉토리에 미디어 없음"}
+        
+        missing_ids = set(indexed_files.unseen_ids())
+        
+        # 나열하지 못한 디렉토리 아래 미디어는 있는 것으로 간주
+        for directory in failed_directories:
+            if not missing_ids:
+                break
+            missing_ids.difference_update(media["id"] for media in get_media_under_directory(directory))
+        
+        # 디스크에서 사라진 별칭 정리 (나열하지 못한 디렉토리 아래는 유지)
+        seen_aliases = seen_aliases or set()
+        failed_prefixes = tuple(directory.rstrip(os.sep) + os.sep for directory in failed_directories)
+        stale_aliases = [
+            path for path in (alias_paths or {})
+            if path not in seen_aliases and not (failed_prefixes and path.startswith(failed_prefixes))
         ]
+        if stale_aliases:
+            delete_media_aliases(stale_aliases)
+        
+        # 원본이 사라진 대표 미디어는 남아 있는 별칭 경로로 옮김
+        if missing_ids and seen_aliases:
+            missing_ids -= promote_media_aliases(missing_ids, seen_aliases)
         
-        subtitle_files = []
+        if not missing_ids:
+            return {"success": True, "media": 0, "subtitles": 0, "sentences": 0, "subtitle_files": 0}
+        
+        result = delete_media_ids(missing_ids)
+        if result.get("media"):
+            self.log("INFO", f"사라진 미디어 정리: 미디어 {result['media']}개, 자막 {result['subtitles']}개, "
+                             f"문장 {result['sentences']}개, 자막 파일 기록 {result['subtitle_files']}개 삭제")
+        return result
+    
+    def iter_listings(self, list_func: Optional[Callable] = None, root_dir: Optional[str] = None,
+                      skip_directory: Optional[Callable[[str], bool]] = None):
+        """
+        루트 디렉토리 아래 디렉토리 목록 순회 (scan_workers가 2 이상이면 동시 나열, 루트별 값이 우선)
         
-        for pattern in patterns:
-            # 전체 경로 패턴
-            full_pattern = os.path.join(media_dir, pattern)
+        Args:
+            list_func: 디렉토리 한 곳을 나열하는 함수 (기본값 list_directory)
+            root_dir: 순회할 디렉토리 (기본값: 설정의 루트 디렉토리)
+            skip_directory: True를 반환하는 하위 디렉토리는 나열하지 않음 (스캔 규칙)
             
-            # glob을 사용하여 패턴과 일치하는 파일 찾기
-            matching_files = glob.glob(full_pattern)
+        Returns:
+            Iterator[DirectoryListing]: 디렉토리 목록 (동시 나열도 순서는 같음, 우선순위가 높은 디렉토리 먼저)
+        """
+        from app.services.indexer.priority import get_indexing_priorities
+        
+        root_dir = root_dir or self.root_dir
+        workers = int(self.scan_workers or config.get("scan_workers", 8) or 1)
+        # 요청/검색/북마크 디렉토리를 먼저 나열 (우선순위를 사용하지 않으면 이름 순)
+        prioritizer = get_indexing_priorities()
+        if workers <= 1:
+            return iter_directory_listings(root_dir, self.media_extensions, self.subtitle_extensions,
+                                           skip_directory=skip_directory, list_func=list_func,
+                                           prioritizer=prioritizer)
+        
+        timeout = config.get("scan_directory_timeout", 60)
+        return iter_directory_listings_concurrent(
+            root_dir, self.media_extensions, self.subtitle_extensions,
+            skip_directory=skip_directory, list_func=list_func, max_workers=workers, timeout=timeout or None,
+            prioritizer=prioritizer
+        )
+    
+    def has_embedded_subtitles(self, media_path: str) -> bool:
+        """
+        미디어 파일에 내장 텍스트 자막 트랙이 있는지 확인 (헤더만 읽음)
+        
+        Args:
+            media_path: 미디어 파일 경로
             
-            # 결과 목록에 추가
-            for file_path in matching_files:
-                if os.path.exists(file_path) and file_path not in subtitle_files:
-                    subtitle_files.append(file_path)
+        Returns:
+            bool: 내장 텍스트 자막 존재 여부
+        """
+        from app.subtitle.mkv import EMBEDDED_SUBTITLE_EXTENSIONS, get_mkv_subtitle_tracks
+        
+        if not media_path.lower().endswith(EMBEDDED_SUBTITLE_EXTENSIONS):
+            return False
+        return bool(get_mkv_subtitle_tracks(media_path))
+    
+    def find_subtitle_files(self, media_path: str) -> List[str]:
+        """
+        미디어 파일과 관련된 자막 파일을 찾습니다.
         
-        return subtitle_files
+        전체 스캔에서는 scan_directory가 디렉토리 목록을 재사용하므로,
+        이 함수는 미디어 파일 하나만 확인할 때 사용합니다.
+        
+        Args:
+            media_path: 미디어 파일 경로
+            
+        Returns:
+            list: 자막 파일 경로 목록
+        """
+        listing = list_directory(os.path.dirname(media_path), self.media_extensions, self.subtitle_extensions)
+        return listing.find_subtitles(media_path)
@@ -0,0 +1,99 @@
+"""
+자막 파싱 프로세스 풀 모듈
+
+인코딩 판별, 자막 파싱, 태그 제거 같은 CPU 작업을 별도 프로세스에서 실행하여
+GIL 경합 없이 병렬 처리합니다. 부모 프로세스는 결과(CueBatch)를 받아 DB 쓰기만 담당합니다.
+"""
+
+import os
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+
+from app.config import config
+from app.utils.logging import get_indexer_logger
+from app.subtitle.cue_parser import parse_subtitle_file
+
+logger = get_indexer_logger()
+
+
+def get_parse_worker_count() -> int:
+    """
+    설정에서 파싱 프로세스 수 가져오기
+
+    Returns:
+        int: 파싱 프로세스 수 (1 이상)
+    """
+    workers = config.get("indexer_parse_workers") or os.cpu_count() or 1
+    try:
+        return max(1, int(workers))
+    except (TypeError, ValueError):
+        return os.cpu_count() or 1
+
+
+class ParsePool:
+    """자막 파싱 프로세스 풀 클래스"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        파싱 프로세스 풀 초기화
+
+        Args:
+            max_workers: 프로세스 수 (None이면 설정값 사용)
+        """
+        self.max_workers = max_workers or get_parse_worker_count()
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> None:
+        """프로세스 풀 시작 (spawn 방식으로 부모의 DB 연결/스레드를 복제하지 않음)"""
+        if self.executor is not None:
+            return
+
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.info(f"자막 파싱 프로세스 풀 시작 ({self.max_workers}개 프로세스)")
+
+    def submit(self, *args) -> Future:
+        """
+        자막 파일 파싱 작업 제출
+
+        Args:
+            *args: parse_subtitle_file 인자 (SubtitleProcessor.parse_args 반환값)
+
+        Returns:
+            Future: CueBatch를 결과로 갖는 Future
+        """
+        if self.executor is None:
+            self.start()
+        return self.executor.submit(parse_subtitle_file, *args)
+
+    def submit_call(self, func, *args) -> Future:
+        """
+        임의의 모듈 수준 함수 실행 작업 제출 (인덱싱 파이프라인의 CPU 단계용)
+
+        Args:
+            func: 실행할 함수 (자식 프로세스에서 가져올 수 있어야 함)
+            *args: 함수 인자 (pickle 가능해야 함)
+
+        Returns:
+            Future: 함수 반환값을 결과로 갖는 Future
+        """
+        if self.executor is None:
+            self.start()
+        return self.executor.submit(func, *args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        프로세스 풀 종료 (대기 중인 작업은 취소)
+
+        Args:
+            wait: 실행 중인 작업 완료까지 대기할지 여부
+        """
+        executor, self.executor = self.executor, None
+        if executor is None:
+            return
+
+        executor.shutdown(wait=wait, cancel_futures=True)
+        logger.info("자막 파싱 프로세스 풀 종료")
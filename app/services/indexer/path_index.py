@@ -0,0 +1,189 @@
+"""
+인덱싱된 경로 인덱스 모듈
+
+증분 스캔에서 이미 인덱싱된 미디어 경로를 Python 문자열 집합 대신
+64비트 경로 해시의 정렬된 배열(array('Q'))로 보관합니다.
+해시와 같은 순서로 미디어 ID, 크기, 수정 시간을 병렬 배열에 담아 변경 확인과
+사라진 미디어 정리(스캔에서 보지 못한 ID)에 사용합니다.
+
+경로 하나당 약 33바이트(해시 8 + ID 8 + 크기 8 + 수정 시간 8 + 확인 표시 1)만 사용하므로
+수백만 개의 경로도 수십 MB 안에 들어갑니다.
+64비트 해시 충돌 확률은 경로 1천만 개에서도 약 3e-6 수준입니다.
+"""
+
+import hashlib
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from typing import Iterable, Iterator, Optional, Tuple
+
+
+def path_hash(path: str) -> int:
+    """
+    경로의 64비트 해시 (실행마다 같은 값)
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        int: 부호 없는 64비트 해시
+    """
+    digest = hashlib.blake2b(path.encode("utf-8", "surrogateescape"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _parse_mtime(last_modified: Optional[str]) -> float:
+    """
+    media_files.last_modified(ISO 형식)를 타임스탬프로 변환
+
+    Args:
+        last_modified: ISO 형식 수정 시간
+
+    Returns:
+        float: 타임스탬프 (알 수 없으면 -1.0)
+    """
+    if not last_modified:
+        return -1.0
+    try:
+        return datetime.fromisoformat(last_modified).timestamp()
+    except (TypeError, ValueError):
+        return -1.0
+
+
+class IndexedPathIndex:
+    """인덱싱된 미디어 경로의 압축 인덱스 클래스"""
+
+    # 수정 시간 비교 허용 오차 (ISO 문자열 변환 시 마이크로초 반올림)
+    MTIME_TOLERANCE = 1e-3
+
+    def __init__(self, rows: Iterable[Tuple[int, str, int, Optional[str]]] = ()):
+        """
+        인덱스 생성
+
+        Args:
+            rows: (id, path, size, last_modified) 튜플 (튜플 커서에서 스트리밍)
+        """
+        hashes = array("Q")
+        ids = array("q")
+        sizes = array("q")
+        mtimes = array("d")
+
+        for media_id, path, size, last_modified in rows:
+            hashes.append(path_hash(path))
+            ids.append(media_id)
+            sizes.append(size or 0)
+            mtimes.append(_parse_mtime(last_modified))
+
+        # 해시 순서로 병렬 배열 정렬 (정렬용 인덱스 목록은 생성 중에만 사용)
+        order = sorted(range(len(hashes)), key=hashes.__getitem__)
+        self.hashes = array("Q", (hashes[i] for i in order))
+        self.ids = array("q", (ids[i] for i in order))
+        self.sizes = array("q", (sizes[i] for i in order))
+        self.mtimes = array("d", (mtimes[i] for i in order))
+        self.seen = bytearray(len(order))
+
+    @classmethod
+    def load(cls, root_dir: Optional[str] = None) -> "IndexedPathIndex":
+        """
+        데이터베이스에서 인덱스 생성
+
+        Args:
+            root_dir: 이 디렉토리 아래 미디어만 포함 (None이면 전체)
+
+        Returns:
+            IndexedPathIndex: 경로 인덱스
+        """
+        from app.database.media import iter_media_path_stats
+        return cls(iter_media_path_stats(root_dir))
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def _position(self, path: str) -> int:
+        """
+        경로의 배열 위치 (없으면 -1)
+
+        Args:
+            path: 파일 경로
+
+        Returns:
+            int: 배열 위치
+        """
+        value = path_hash(path)
+        position = bisect_left(self.hashes, value)
+        if position < len(self.hashes) and self.hashes[position] == value:
+            return position
+        return -1
+
+    def __contains__(self, path: str) -> bool:
+        return self._position(path) >= 0
+
+    def get(self, path: str) -> Optional[Tuple[int, int, float]]:
+        """
+        경로의 저장된 정보 조회
+
+        Args:
+            path: 파일 경로
+
+        Returns:
+            Optional[Tuple[int, int, float]]: (미디어 ID, 크기, 수정 타임스탬프), 없으면 None
+        """
+        position = self._position(path)
+        if position < 0:
+            return None
+        return self.ids[position], self.sizes[position], self.mtimes[position]
+
+    def mark_seen(self, path: str) -> Optional[int]:
+        """
+        스캔에서 경로를 확인했다고 표시
+
+        Args:
+            path: 파일 경로
+
+        Returns:
+            Optional[int]: 배열 위치 (인덱스에 없는 경로면 None)
+        """
+        position = self._position(path)
+        if position < 0:
+            return None
+        self.seen[position] = 1
+        return position
+
+    def is_changed(self, position: int, size: int, mtime: float) -> bool:
+        """
+        저장된 크기/수정 시간과 현재 파일 정보 비교
+
+        Args:
+            position: mark_seen이 반환한 배열 위치
+            size: 현재 파일 크기
+            mtime: 현재 수정 타임스탬프
+
+        Returns:
+            bool: 변경 여부
+        """
+        return (self.sizes[position] != size
+                or abs(self.mtimes[position] - mtime) > self.MTIME_TOLERANCE)
+
+    def unseen_ids(self) -> Iterator[int]:
+        """
+        스캔에서 확인하지 못한 미디어 ID
+
+        Yields:
+            int: 미디어 ID
+        """
+        seen = self.seen
+        for position, media_id in enumerate(self.ids):
+            if not seen[position]:
+                yield media_id
+
+    @property
+    def seen_count(self) -> int:
+        """스캔에서 확인한 경로 수"""
+        return len(self.seen) - self.seen.count(0)
+
+    @property
+    def memory_bytes(self) -> int:
+        """배열 데이터가 차지하는 메모리 (바이트)"""
+        return (sum(values.buffer_info()[1] * values.itemsize
+                    for values in (self.hashes, self.ids, self.sizes, self.mtimes))
+                + len(self.seen))
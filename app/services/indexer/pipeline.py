@@ -0,0 +1,685 @@
+"""
+인덱싱 파이프라인 모듈
+
+인덱싱을 discover → read → decode → parse → normalize → write 단계로 나누어 실행합니다.
+단계마다 작업 스레드 수와 입력 큐 크기를 따로 지정할 수 있고, 큐가 가득 차면 앞 단계가 기다리므로
+(백프레셔) 느린 단계에 맞춰 메모리 사용량이 제한됩니다.
+
+- discover: 스캔 피드에서 미디어를 받아 자막 파일마다 작업 생성
+- read: 저장된 자막 파일 기록 조회, 파일 읽기 (MKV는 내장 자막 추출)
+- decode: 인코딩 판별 및 텍스트 변환
+- parse: 포맷별 파싱, 중복 제거
+- normalize: 파일 언어 판별, 다국어 줄 태깅
+- write: 데이터베이스 저장 (SQLite는 쓰기 연결이 하나뿐이므로 스레드 하나)
+
+CPU 단계(decode, parse, normalize)는 processes 설정으로 파싱 프로세스 풀에서 실행할 수 있습니다.
+단계별 처리량, 큐 길이, 작업/대기 시간은 상태의 pipeline 항목으로 보고되어
+실행이 I/O, CPU, DB 중 어디에 묶여 있는지 확인하고 단계별 설정을 조정할 수 있습니다.
+
+자막 파일마다 인덱싱 상태(indexing_files)를 기록합니다. discover에서 parsing으로, write에서 자막과 같은
+트랜잭션으로 written(실패 시 failed)으로 기록하므로, 프로세스가 중간에 종료되면 끝나지 않은 파일만 이어서 처리할 수 있습니다.
+"""
+
+import queue
+import threading
+import time
+import traceback
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from app.config import config
+from app.utils.logging import get_indexer_logger
+from app.database.jobs import start_indexing_files, mark_indexing_file_failed, requeue_indexing_files
+from app.subtitle.cue_parser import (
+    new_subtitle_job, read_subtitle_job, decode_subtitle_job, parse_subtitle_job, normalize_subtitle_job
+)
+from app.services.indexer.indexing_strategy import IndexingStrategy
+from app.services.indexer.parse_pool import ParsePool, get_parse_worker_count
+from app.services.indexer.scan_feed import estimate_total_files
+
+logger = get_indexer_logger()
+
+# 단계 순서와 종류 (병목 단계의 종류로 실행이 무엇에 묶여 있는지 판단)
+STAGE_KINDS = {
+    "discover": "scan",
+    "read": "io",
+    "decode": "cpu",
+    "parse": "cpu",
+    "normalize": "cpu",
+    "write": "db",
+}
+
+# 단계별 기본 설정 (queue_size는 단계 입력 큐 크기, discover는 스캔 피드를 직접 순회)
+DEFAULT_STAGE_CONFIG = {
+    "discover": {"workers": 1, "queue_size": 0},
+    "read": {"workers": 4, "queue_size": 64},
+    "decode": {"workers": 1, "queue_size": 32, "processes": False},
+    "parse": {"workers": 1, "queue_size": 32, "processes": False},
+    "normalize": {"workers": 1, "queue_size": 32, "processes": False},
+    "write": {"workers": 1, "queue_size": 64},
+}
+
+# 프로세스 풀에서 실행할 수 있는 단계
+CPU_STAGES = ("decode", "parse", "normalize")
+
+# 큐 대기 중 중단 여부를 확인하는 간격 (초)
+_QUEUE_POLL_INTERVAL = 0.5
+
+# 상태에 단계별 통계를 기록하는 간격 (초)
+METRICS_INTERVAL = 2.0
+
+# 단계 종료 표시
+_END = object()
+
+
+def get_stage_config() -> Dict[str, Dict[str, Any]]:
+    """
+    설정에서 단계별 설정 가져오기 (indexer_pipeline 값이 기본값보다 우선)
+
+    indexer_pipeline에 CPU 단계 설정이 없고 indexer_max_threads가 2 이상이면
+    이전 병렬 인덱싱처럼 CPU 단계를 파싱 프로세스 풀에서 실행합니다.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: 단계 이름 → workers, queue_size, processes
+    """
+    overrides = config.get("indexer_pipeline") or {}
+    parallel = int(config.get("indexer_max_threads", 1) or 1) > 1
+
+    stages = {}
+    for name, defaults in DEFAULT_STAGE_CONFIG.items():
+        stage = dict(defaults)
+        if name in CPU_STAGES and parallel and name not in overrides:
+            stage.update(workers=get_parse_worker_count(), processes=True)
+        if isinstance(overrides.get(name), dict):
+            stage.update({key: value for key, value in overrides[name].items() if key in defaults})
+
+        stage["workers"] = max(1, int(stage.get("workers") or 1))
+        stage["queue_size"] = max(0, int(stage.get("queue_size") or 0))
+        stages[name] = stage
+
+    # 스캔 피드는 하나, 데이터베이스 쓰기 연결도 하나
+    stages["discover"]["workers"] = 1
+    stages["write"]["workers"] = 1
+    return stages
+
+
+class StageMetrics:
+    """단계별 처리 통계 클래스"""
+
+    def __init__(self, name: str, workers: int, queue_size: int, processes: bool = False):
+        """
+        단계 통계 초기화
+
+        Args:
+            name: 단계 이름
+            workers: 작업 스레드 수
+            queue_size: 입력 큐 크기 (0이면 큐 없음)
+            processes: 프로세스 풀 실행 여부
+        """
+        self.name = name
+        self.kind = STAGE_KINDS.get(name, "")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.processes = processes
+        self.processed = 0
+        self.errors = 0
+        self.busy_seconds = 0.0       # 작업 처리 시간
+        self.idle_seconds = 0.0       # 입력을 기다린 시간 (앞 단계가 느림, 일시 중지 포함)
+        self.blocked_seconds = 0.0    # 다음 단계 큐가 가득 차 기다린 시간 (뒤 단계가 느림)
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    def add(self, busy: float = 0.0, idle: float = 0.0, blocked: float = 0.0,
+            processed: int = 0, errors: int = 0) -> None:
+        """
+        통계 누적 (여러 작업 스레드에서 호출)
+
+        Args:
+            busy: 작업 처리 시간
+            idle: 입력 대기 시간
+            blocked: 출력 대기 시간
+            processed: 처리한 항목 수
+            errors: 오류 수
+        """
+        with self._lock:
+            self.busy_seconds += busy
+            self.idle_seconds += idle
+            self.blocked_seconds += blocked
+            self.processed += processed
+            self.errors += errors
+
+    def snapshot(self, queue_depth: int) -> Dict[str, Any]:
+        """
+        현재 통계
+
+        Args:
+            queue_depth: 현재 입력 큐 길이
+
+        Returns:
+            Dict[str, Any]: 처리 수, 초당 처리량, 큐 길이, 작업/대기 시간, 사용률(작업 시간 / 경과 시간 × 스레드 수)
+        """
+        elapsed = max(time.time() - self.started_at, 1e-6)
+        with self._lock:
+            return {
+                "name": self.name,
+                "kind": self.kind,
+                "workers": self.workers,
+                "processes": self.processes,
+                "processed": self.processed,
+                "errors": self.errors,
+                "items_per_second": round(self.processed / elapsed, 2),
+                "queue_depth": queue_depth,
+                "queue_size": self.queue_size,
+                "busy_seconds": round(self.busy_seconds, 2),
+                "idle_seconds": round(self.idle_seconds, 2),
+                "blocked_seconds": round(self.blocked_seconds, 2),
+                "utilization": round(min(1.0, self.busy_seconds / (elapsed * self.workers)), 3),
+            }
+
+
+class PipelineStage:
+    """파이프라인 단계 클래스 (작업 스레드 여러 개가 같은 입력 큐를 처리)"""
+
+    def __init__(self, pipeline: "IndexingPipeline", name: str, func: Callable[[Any], List[Any]],
+                 workers: int = 1, queue_size: int = 0, processes: bool = False,
+                 source: Optional[Iterable[Any]] = None):
+        """
+        단계 초기화
+
+        Args:
+            pipeline: 파이프라인 인스턴스 (중단/일시 중지 확인)
+            name: 단계 이름
+            func: 항목 하나를 처리하여 다음 단계로 보낼 항목 목록을 반환하는 함수
+            workers: 작업 스레드 수
+            queue_size: 입력 큐 크기
+            processes: func가 프로세스 풀에 작업을 제출하는지 여부 (통계 표시용)
+            source: 입력 큐 대신 순회할 항목 (첫 단계)
+        """
+        self.pipeline = pipeline
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.source = iter(source) if source is not None else None
+        self.input: Optional["queue.Queue[Any]"] = None if source is not None else queue.Queue(maxsize=max(1, queue_size))
+        self.next_stage: Optional["PipelineStage"] = None
+        self.metrics = StageMetrics(name, workers, 0 if source is not None else max(1, queue_size), processes)
+        self.threads: List[threading.Thread] = []
+        self.done = threading.Event()
+        self._active = workers
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """작업 스레드 시작"""
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"pipeline-{self.name}-{index}", daemon=True)
+            self.threads.append(thread)
+            thread.start()
+
+    def put(self, item: Any) -> float:
+        """
+        입력 큐에 항목 추가 (가득 차면 중단될 때까지 대기)
+
+        Args:
+            item: 추가할 항목
+
+        Returns:
+            float: 기다린 시간 (초)
+        """
+        started = time.time()
+        while not self.pipeline.stop_event.is_set():
+            try:
+                self.input.put(item, timeout=_QUEUE_POLL_INTERVAL)
+                break
+            except queue.Full:
+                continue
+        return time.time() - started
+
+    @property
+    def queue_depth(self) -> int:
+        """현재 입력 큐 길이"""
+        return self.input.qsize() if self.input is not None else 0
+
+    def _take(self) -> Any:
+        """
+        다음 입력 항목 (중단되었거나 입력이 끝나면 _END)
+
+        Returns:
+            Any: 입력 항목
+        """
+        if self.source is not None:
+            return next(self.source, _END)
+
+        while not self.pipeline.stop_event.is_set():
+            try:
+                return self.input.get(timeout=_QUEUE_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _run(self) -> None:
+        """작업 스레드 실행 함수"""
+        pipeline = self.pipeline
+        metrics = self.metrics
+        finished = False
+
+        try:
+            while not pipeline.stop_event.is_set():
+                # 첫 단계는 스캔 피드를 기다리는 시간이 곧 탐색 작업 시간
+                started = time.time()
+                item = self._take()
+                waited = time.time() - started
+                if item is _END:
+                    finished = not pipeline.stop_event.is_set()
+                    break
+
+                paused = pipeline.wait_while_paused()
+                if pipeline.stop_event.is_set():
+                    break
+
+                started = time.time()
+                errors = 0
+                try:
+                    outputs = self.func(item)
+                except Exception as e:
+                    errors = 1
+                    outputs = pipeline.handle_error(self.name, item, e)
+                busy = time.time() - started
+
+                blocked = 0.0
+                if self.next_stage is not None:
+                    for output in outputs:
+                        blocked += self.next_stage.put(output)
+
+                if self.source is not None:
+                    metrics.add(busy=busy + waited, idle=paused, blocked=blocked, processed=1, errors=errors)
+                else:
+                    metrics.add(busy=busy, idle=waited + paused, blocked=blocked, processed=1, errors=errors)
+
+        except Exception as e:
+            logger.error(f"파이프라인 {self.name} 단계 오류: {e}")
+            logger.error(traceback.format_exc())
+            pipeline.fail(e)
+
+        finally:
+            self._worker_done(finished)
+
+    def _worker_done(self, finished: bool) -> None:
+        """
+        작업 스레드 종료 처리 (마지막 스레드가 다음 단계에 입력 종료를 알림)
+
+        Args:
+            finished: 입력을 끝까지 처리했는지 여부
+        """
+        with self._lock:
+            self._active -= 1
+            last = self._active == 0
+
+        if not last:
+            return
+
+        if finished and self.next_stage is not None:
+            for _ in range(self.next_stage.workers):
+                self.next_stage.put(_END)
+        self.done.set()
+
+
+class IndexingPipeline:
+    """단계별 인덱싱 파이프라인 클래스"""
+
+    def __init__(self, indexer, media_files: Iterable[Dict[str, Any]],
+                 stage_config: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        파이프라인 초기화
+
+        Args:
+            indexer: 인덱싱 워커 인스턴스 (IndexingWorker - 상태, 자막 처리기, 중단/일시 중지 확인)
+            media_files: 처리할 미디어 파일 목록 또는 스캔 피드
+            stage_config: 단계별 설정 (기본값: get_stage_config())
+        """
+        self.indexer = indexer
+        self.media_files = media_files
+        self.status_handler = indexer.status_handler
+        self.processor = indexer.processor
+        self.stage_config = stage_config or get_stage_config()
+        self.stop_event = threading.Event()
+        self.error: Optional[BaseException] = None
+        self.pool: Optional[ParsePool] = None
+
+        # write 단계(스레드 하나)에서만 갱신
+        self.processed_files = 0
+        self.subtitle_count = 0
+        self._remaining: Dict[int, int] = {}
+        self._sequence = 0
+        
+        # discover에서 처리를 시작하고 write에서 아직 기록하지 않은 자막 파일 (중지 시 다시 처리 대상으로 되돌림)
+        # discover와 write 스레드가 함께 갱신하므로 잠금 사용
+        self._in_flight = set()
+        self._in_flight_lock = threading.Lock()
+
+        self.stages = self._build_stages()
+
+    def _build_stages(self) -> List[PipelineStage]:
+        """
+        단계 생성 및 연결
+
+        Returns:
+            List[PipelineStage]: 실행 순서대로 단계 목록
+        """
+        cpu_functions = {
+            "decode": decode_subtitle_job,
+            "parse": parse_subtitle_job,
+            "normalize": normalize_subtitle_job,
+        }
+
+        stages = []
+        for name in STAGE_KINDS:
+            settings = self.stage_config[name]
+            processes = bool(settings.get("processes")) and name in CPU_STAGES
+            if processes and self.pool is None:
+                self.pool = ParsePool()
+
+            if name == "discover":
+                handler = self._discover
+            elif name == "read":
+                handler = self._read
+            elif name == "write":
+                handler = self._write
+            else:
+                handler = self._cpu_handler(cpu_functions[name], offload=processes)
+
+            stage = PipelineStage(
+                self, name, handler,
+                workers=settings["workers"],
+                queue_size=settings["queue_size"],
+                processes=processes,
+                source=self.media_files if name == "discover" else None
+            )
+            if stages:
+                stages[-1].next_stage = stage
+            stages.append(stage)
+
+        return stages
+
+    def run(self) -> None:
+        """
+        파이프라인 실행 (모든 항목이 저장되거나 인덱싱이 중단될 때까지 대기)
+
+        Raises:
+            BaseException: 단계 실행 중 처리하지 못한 오류
+        """
+        indexer = self.indexer
+        write_stage = self.stages[-1]
+
+        if self.pool is not None:
+            self.pool.start()
+            indexer.parse_pool = self.pool
+
+        summary = ", ".join(
+            f"{stage.name} {stage.workers}{'(프로세스)' if stage.metrics.processes else ''}" for stage in self.stages
+        )
+        indexer.log("INFO", f"인덱싱 파이프라인 시작: {summary}")
+
+        try:
+            # 뒤 단계부터 시작하여 앞 단계가 넣는 항목을 바로 받도록 함
+            for stage in reversed(self.stages):
+                stage.start()
+
+            last_metrics = 0.0
+            while not write_stage.done.wait(_QUEUE_POLL_INTERVAL):
+                if not indexer.is_indexing() or self.error is not None:
+                    self.stop_event.set()
+                    break
+
+                if time.time() - last_metrics >= METRICS_INTERVAL:
+                    self._publish_metrics()
+                    last_metrics = time.time()
+
+        finally:
+            self.stop_event.set()
+            for stage in self.stages:
+                for thread in stage.threads:
+                    thread.join(timeout=5.0)
+
+            if self.pool is not None:
+                self.pool.shutdown(wait=False)
+                indexer.parse_pool = None
+
+            with self._in_flight_lock:
+                in_flight = list(self._in_flight)
+                self._in_flight.clear()
+            if in_flight:
+                requeued = requeue_indexing_files(in_flight)
+                indexer.log("INFO", f"처리 중이던 자막 파일 {requeued}개를 다음 실행에서 이어서 처리합니다.")
+
+            metrics = self._publish_metrics()
+            bottleneck = metrics.get("bottleneck")
+            if bottleneck:
+                indexer.log("INFO", f"인덱싱 파이프라인 종료: 병목 단계 {bottleneck} ({metrics['bound']}), " + ", ".join(
+                    f"{stage['name']} {stage['items_per_second']}/초 사용률 {stage['utilization']:.0%}"
+                    for stage in metrics["stages"]
+                ))
+
+        if self.error is not None:
+            raise self.error
+
+    def wait_while_paused(self) -> float:
+        """
+        일시 중지 상태면 재개되거나 중단될 때까지 대기
+
+        Returns:
+            float: 기다린 시간 (초)
+        """
+        started = time.time()
+        while self.indexer.is_paused() and self.indexer.is_indexing() and not self.stop_event.is_set():
+            time.sleep(_QUEUE_POLL_INTERVAL)
+        return time.time() - started
+
+    def fail(self, error: BaseException) -> None:
+        """
+        처리하지 못한 오류로 파이프라인 중단
+
+        Args:
+            error: 발생한 오류
+        """
+        if self.error is None:
+            self.error = error
+        self.stop_event.set()
+
+    def handle_error(self, stage_name: str, item: Any, error: Exception) -> List[Any]:
+        """
+        항목 처리 중 오류 (자막 작업은 오류를 기록하여 write 단계로 보내 미디어 처리 완료 집계를 맞춤)
+
+        Args:
+            stage_name: 단계 이름
+            item: 처리하던 항목
+            error: 발생한 오류
+
+        Returns:
+            List[Any]: 다음 단계로 보낼 항목 목록
+        """
+        if stage_name == "discover":
+            path = item.get("path") if isinstance(item, dict) else item
+            self.indexer.log("ERROR", f"미디어 작업 생성 중 오류 발생: {error} - {path}")
+            return []
+
+        self.indexer.log("DEBUG", traceback.format_exc())
+        if stage_name == "write":
+            self.indexer.log("ERROR", f"미디어 처리 집계 중 오류 발생: {error} - {item.get('media_path')}")
+            return []
+
+        item["error"] = f"{stage_name} 단계 오류: {error}"
+        item["job"] = None
+        return [item]
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        단계별 통계와 병목 단계
+
+        Returns:
+            Dict[str, Any]: stages(단계별 통계), bottleneck(사용률이 가장 높은 단계), bound(병목 단계 종류)
+        """
+        stages = [stage.metrics.snapshot(stage.queue_depth) for stage in self.stages]
+        busiest = max(stages, key=lambda stage: stage["utilization"]) if stages else None
+        return {
+            "stages": stages,
+            "bottleneck": busiest["name"] if busiest and busiest["utilization"] > 0 else None,
+            "bound": busiest["kind"] if busiest and busiest["utilization"] > 0 else None,
+            "updated_at": time.time(),
+        }
+
+    def _publish_metrics(self) -> Dict[str, Any]:
+        """단계별 통계를 상태에 기록"""
+        metrics = self.metrics()
+        if self.status_handler:
+            self.status_handler.update_status(pipeline=metrics)
+        return metrics
+
+    # 단계 함수
+
+    def _discover(self, media_file: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        discover 단계 - 미디어 하나를 자막 파일별 작업으로 나눔
+
+        자막이 없는 미디어도 처리 완료 집계를 위해 자막 없는 작업 하나를 만듭니다.
+        자막 파일의 인덱싱 상태는 parsing으로 기록합니다 (처리 시도 횟수 증가).
+
+        Args:
+            media_file: 스캔 피드 항목 (id, path, root, subtitle_files)
+
+        Returns:
+            List[Dict[str, Any]]: 자막 작업 목록
+        """
+        self._sequence += 1
+        subtitle_files = media_file.get("subtitle_files") or [None]
+        paths = [path for path in subtitle_files if path]
+        if paths:
+            start_indexing_files(media_file["id"], paths)
+            with self._in_flight_lock:
+                self._in_flight.update(paths)
+        
+        return [{
+            "sequence": self._sequence,
+            "media_id": media_file["id"],
+            "media_path": media_file["path"],
+            "root": media_file.get("root"),
+            "subtitle_path": subtitle_path,
+            "subtitle_total": len(subtitle_files),
+            "known": None,
+            "job": None,
+            "error": None,
+        } for subtitle_path in subtitle_files]
+
+    def _read(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        read 단계 - 저장된 자막 파일 기록 조회 후 파일 읽기
+
+        Args:
+            task: 자막 작업
+
+        Returns:
+            List[Dict[str, Any]]: 읽은 작업
+        """
+        subtitle_path = task["subtitle_path"]
+        if subtitle_path:
+            task["known"] = self.processor.get_known_file_info(subtitle_path)
+            task["job"] = read_subtitle_job(new_subtitle_job(*self.processor.parse_args(subtitle_path, task["known"])))
+        return [task]
+
+    def _cpu_handler(self, stage_func: Callable[[Dict[str, Any]], Dict[str, Any]],
+                     offload: bool = False) -> Callable[[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        CPU 단계 함수 생성 (자막 작업의 job에 cue_parser 단계 함수 적용)
+
+        Args:
+            stage_func: cue_parser 단계 함수
+            offload: 파싱 프로세스 풀에서 실행할지 여부
+
+        Returns:
+            Callable: 단계 함수
+        """
+        def handler(task: Dict[str, Any]) -> List[Dict[str, Any]]:
+            job = task["job"]
+            if job is None or job["batch"].meta.get("error"):
+                return [task]
+
+            if not offload:
+                task["job"] = stage_func(job)
+                return [task]
+
+            future = self.pool.submit_call(stage_func, job)
+            while True:
+                try:
+                    task["job"] = future.result(timeout=_QUEUE_POLL_INTERVAL)
+                    return [task]
+                except FutureTimeoutError:
+                    if self.stop_event.is_set():
+                        future.cancel()
+                        return []
+
+        return handler
+
+    def _write(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        write 단계 - 파싱 결과 저장 및 미디어별 처리 완료 집계
+
+        Args:
+            task: 자막 작업
+
+        Returns:
+            List[Dict[str, Any]]: 빈 목록 (마지막 단계)
+        """
+        written = 0
+        subtitle_path = task["subtitle_path"]
+        if task["error"]:
+            self.indexer.log("ERROR", f"자막 처리 중 오류 발생: {task['error']} - {subtitle_path}")
+            mark_indexing_file_failed(subtitle_path, task["error"])
+        elif task["job"] is not None:
+            try:
+                written = self.processor.write_batch(task["job"]["batch"], task["media_id"], task["known"])
+                self.subtitle_count += written
+            except Exception as e:
+                # 저장에 실패해도 미디어 처리 완료 집계는 계속
+                self.indexer.log("ERROR", f"자막 저장 중 오류 발생: {str(e)} - {subtitle_path}")
+                self.indexer.log("DEBUG", traceback.format_exc())
+                mark_indexing_file_failed(subtitle_path, str(e))
+        with self._in_flight_lock:
+            self._in_flight.discard(subtitle_path)
+
+        sequence = task["sequence"]
+        remaining = self._remaining.get(sequence, task["subtitle_total"]) - 1
+        finished = remaining <= 0
+        if finished:
+            self._remaining.pop(sequence, None)
+            self.processed_files += 1
+        else:
+            self._remaining[sequence] = remaining
+
+        status_handler = self.status_handler
+        if status_handler:
+            status_handler.increment_root_status(task["root"], processed=int(finished), subtitle_count=written)
+            if finished:
+                total_files = estimate_total_files(self.media_files)
+                status_handler.update_status(
+                    current_file=task["media_path"],
+                    processed_files=self.processed_files,
+                    total_files=total_files,
+                    total_is_estimate=not getattr(self.media_files, "scan_complete", True),
+                    subtitle_count=self.subtitle_count,
+                    status_message=f"인덱싱 중... ({self.processed_files}/{total_files})"
+                )
+
+        return []
+
+
+class PipelineIndexingStrategy(IndexingStrategy):
+    """파이프라인 인덱싱 전략 - 단계별 스레드/프로세스로 읽기, 디코딩, 파싱, 정규화, 저장"""
+
+    def process(self, indexer, media_files):
+        """
+        파이프라인으로 인덱싱 수행
+
+        Args:
+            indexer: 인덱싱 워커 인스턴스 (IndexingWorker)
+            media_files: 처리할 미디어 파일 목록 또는 스캔 피드 (스캔 중이면 전체 수는 추정값)
+        """
+        IndexingPipeline(indexer, media_files).run()
@@ -0,0 +1,413 @@
+"""
+인덱싱 우선순위 모듈
+
+큰 라이브러리를 처음 인덱싱할 때도 관심 있는 폴더부터 검색할 수 있도록, 스캔할 디렉토리 순서와
+스캔 → 인덱싱 사이 큐에서 꺼낼 미디어 순서를 우선순위로 정합니다.
+우선순위는 인덱싱 중에도 바꿀 수 있고, 바뀌면 아직 나열하지 않은 디렉토리와 큐에 대기 중인 미디어를
+다시 정렬합니다 (인덱싱을 다시 시작하지 않음).
+
+미디어 점수 (높을수록 먼저, 같으면 발견 순서):
+- requested: "지금 인덱싱" 요청한 디렉토리 아래 미디어
+- searched: 최근 검색 결과에 나온 미디어의 디렉토리(또는 검색에 지정한 루트) 아래 미디어
+- bookmarked: 북마크한 미디어의 디렉토리 아래 미디어
+- recency: 미디어 수정 시간이 최근일수록 (recency_days일이 지나면 0)
+- size: 자막 파일이 작을수록 (빨리 처리되어 먼저 검색 가능)
+
+가중치는 indexer_priority 설정으로 바꿀 수 있습니다.
+"""
+
+import heapq
+import itertools
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.config import config
+from app.utils.logging import get_indexer_logger
+
+logger = get_indexer_logger()
+
+# 기본 설정 (가중치는 점수에 더하는 값, recency_days는 recency 점수가 0이 되는 일수)
+DEFAULT_PRIORITY_CONFIG = {
+    "enabled": True,
+    "requested": 1000.0,
+    "searched": 100.0,
+    "bookmarked": 50.0,
+    "recency": 10.0,
+    "recency_days": 365,
+    "size": 1.0,
+}
+
+# 기억할 최근 검색 디렉토리 수
+MAX_SEARCHED_DIRECTORIES = 200
+
+# 우선순위에 반영할 최근 북마크 미디어 수
+MAX_BOOKMARKED_MEDIA = 1000
+
+# 자막 크기 점수 기준 (이 크기면 size 가중치의 절반)
+SIZE_SCORE_BYTES = 100 * 1024
+
+
+def get_priority_config() -> Dict[str, Any]:
+    """
+    설정에서 우선순위 설정 가져오기 (indexer_priority 값이 기본값보다 우선)
+
+    Returns:
+        Dict[str, Any]: enabled와 가중치
+    """
+    overrides = config.get("indexer_priority") or {}
+    settings = dict(DEFAULT_PRIORITY_CONFIG)
+    if isinstance(overrides, dict):
+        settings.update({key: value for key, value in overrides.items() if key in DEFAULT_PRIORITY_CONFIG})
+    return settings
+
+
+def _parent_directories(path: str) -> Iterable[str]:
+    """
+    경로와 상위 디렉토리를 가까운 순서로 반환
+
+    Args:
+        path: 디렉토리 경로
+
+    Yields:
+        str: 경로 자신, 부모, 조부모, ... 루트
+    """
+    while path:
+        yield path
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+
+
+class IndexingPriorities:
+    """인덱싱 우선순위 클래스 (API/검색 요청과 스캔/인덱싱 스레드가 함께 사용)"""
+
+    def __init__(self):
+        """우선순위 초기화"""
+        self._lock = threading.Lock()
+        self.requested: Dict[str, float] = {}                          # 요청 디렉토리 → 요청 시간
+        self.searched: "OrderedDict[str, float]" = OrderedDict()       # 검색 디렉토리 → 마지막 검색 시간
+        self.bookmarked: List[str] = []                                # 북마크 미디어 디렉토리
+        self.settings = get_priority_config()
+        self.version = 0
+
+        # 변경될 때마다 새로 만들어 교체 (읽는 스레드는 잠금 없이 사용)
+        self._targets: Dict[str, float] = {}      # 대상 디렉토리 → 그 아래 미디어에 더할 점수
+        self._ancestors: Dict[str, float] = {}    # 대상 디렉토리의 상위 디렉토리 → 스캔 순서 점수
+
+    @property
+    def enabled(self) -> bool:
+        """우선순위 사용 여부"""
+        return bool(self.settings.get("enabled", True))
+
+    def _rebuild(self) -> None:
+        """대상 디렉토리 점수 다시 계산 (잠금을 잡은 상태에서 호출)"""
+        settings = self.settings
+        targets: Dict[str, float] = {}
+        for directories, weight in ((self.bookmarked, settings["bookmarked"]),
+                                    (self.searched, settings["searched"]),
+                                    (self.requested, settings["requested"])):
+            weight = float(weight or 0)
+            if weight <= 0:
+                continue
+            for directory in directories:
+                targets[directory] = max(targets.get(directory, 0.0), weight)
+
+        ancestors: Dict[str, float] = {}
+        for directory, weight in targets.items():
+            for parent in _parent_directories(os.path.dirname(directory)):
+                ancestors[parent] = max(ancestors.get(parent, 0.0), weight)
+
+        self._targets = targets
+        self._ancestors = ancestors
+        self.version += 1
+
+    def refresh(self) -> None:
+        """설정과 북마크를 다시 읽어 우선순위 갱신 (인덱싱 시작, 설정 변경 시)"""
+        from app.database.media import get_bookmarked_media_paths
+
+        bookmarked = sorted({os.path.dirname(path) for path in get_bookmarked_media_paths(MAX_BOOKMARKED_MEDIA)})
+        with self._lock:
+            self.settings = get_priority_config()
+            self.bookmarked = bookmarked
+            self._rebuild()
+
+    def request_directory(self, directory: str) -> None:
+        """
+        디렉토리를 가장 먼저 인덱싱하도록 요청
+
+        Args:
+            directory: 디렉토리 절대 경로
+        """
+        directory = os.path.normpath(directory)
+        with self._lock:
+            self.requested[directory] = time.time()
+            self._rebuild()
+
+    def cancel_directory(self, directory: Optional[str] = None) -> int:
+        """
+        인덱싱 요청 취소
+
+        Args:
+            directory: 취소할 디렉토리 (None이면 모든 요청)
+
+        Returns:
+            int: 취소한 요청 수
+        """
+        with self._lock:
+            if directory is None:
+                removed = len(self.requested)
+                self.requested.clear()
+            else:
+                removed = int(self.requested.pop(os.path.normpath(directory), None) is not None)
+            if removed:
+                self._rebuild()
+            return removed
+
+    def complete_requests(self, root_dir: Optional[str] = None) -> int:
+        """
+        인덱싱이 끝난 범위의 요청 정리
+
+        Args:
+            root_dir: 인덱싱한 디렉토리 (None이면 모든 요청)
+
+        Returns:
+            int: 정리한 요청 수
+        """
+        with self._lock:
+            if root_dir is None:
+                done = list(self.requested)
+            else:
+                root_dir = os.path.normpath(root_dir)
+                prefix = root_dir.rstrip(os.sep) + os.sep
+                done = [directory for directory in self.requested
+                        if directory == root_dir or directory.startswith(prefix)]
+            for directory in done:
+                del self.requested[directory]
+            if done:
+                self._rebuild()
+            return len(done)
+
+    def sort_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        미디어 목록을 점수 순으로 정렬 (스캔 없이 처리하는 목록용)
+
+        Args:
+            items: 미디어 목록 (path, subtitle_files)
+
+        Returns:
+            List[Dict[str, Any]]: 점수가 높은 순 (같으면 기존 순서)
+        """
+        for item in items:
+            self.prepare(item)
+        return sorted(items, key=self.score, reverse=True)
+
+    def record_search(self, media_paths: Iterable[str], directories: Iterable[str] = ()) -> None:
+        """
+        검색 결과에 나온 미디어의 디렉토리를 최근 검색 디렉토리로 기록
+
+        Args:
+            media_paths: 검색 결과 미디어 경로 목록
+            directories: 검색에 지정한 디렉토리 (예: 루트 필터)
+        """
+        found = {os.path.dirname(path) for path in media_paths if path}
+        found.update(os.path.normpath(directory) for directory in directories if directory)
+        if not found:
+            return
+
+        now = time.time()
+        with self._lock:
+            added = False
+            for directory in found:
+                added = added or directory not in self.searched
+                self.searched[directory] = now
+                self.searched.move_to_end(directory)
+            while len(self.searched) > MAX_SEARCHED_DIRECTORIES:
+                self.searched.popitem(last=False)
+                added = True
+            if added:
+                self._rebuild()
+
+    def directory_weight(self, directory: str) -> float:
+        """
+        디렉토리 아래 미디어에 더할 점수 (가장 가까운 대상 디렉토리가 아니라 가장 높은 점수)
+
+        Args:
+            directory: 미디어가 있는 디렉토리
+
+        Returns:
+            float: 점수 (대상 디렉토리 아래가 아니면 0)
+        """
+        targets = self._targets
+        if not targets:
+            return 0.0
+        return max((targets.get(parent, 0.0) for parent in _parent_directories(directory)), default=0.0)
+
+    def directory_priority(self, directory: str) -> float:
+        """
+        스캔 순서 점수 (대상 디렉토리, 그 상위 디렉토리, 그 아래 디렉토리를 먼저 나열)
+
+        Args:
+            directory: 나열할 디렉토리
+
+        Returns:
+            float: 점수
+        """
+        if not self.enabled:
+            return 0.0
+        return max(self._ancestors.get(directory, 0.0), self.directory_weight(directory))
+
+    def prepare(self, item: Dict[str, Any]) -> None:
+        """
+        점수 계산에 필요한 파일 정보를 미리 조회하여 항목에 저장 (큐 잠금 밖에서 호출)
+
+        Args:
+            item: 스캔 피드 항목 (path, subtitle_files)
+        """
+        if "mtime" in item:
+            return
+        try:
+            item["mtime"] = os.stat(item["path"]).st_mtime
+        except (OSError, KeyError, TypeError):
+            item["mtime"] = 0.0
+
+        size = 0
+        for path in item.get("subtitle_files") or []:
+            try:
+                size += os.stat(path).st_size
+            except OSError:
+                pass
+        item["subtitle_size"] = size
+
+    def score(self, item: Dict[str, Any]) -> float:
+        """
+        미디어 점수 (높을수록 먼저 인덱싱)
+
+        Args:
+            item: 스캔 피드 항목 (prepare로 mtime, subtitle_size 저장)
+
+        Returns:
+            float: 점수
+        """
+        settings = self.settings
+        if not settings.get("enabled", True):
+            return 0.0
+        score = self.directory_weight(os.path.dirname(item.get("path") or ""))
+
+        recency = float(settings["recency"] or 0)
+        mtime = item.get("mtime") or 0.0
+        if recency > 0 and mtime:
+            days = max(1.0, float(settings["recency_days"] or 1))
+            age = max(0.0, time.time() - mtime) / 86400
+            score += recency * max(0.0, 1.0 - age / days)
+
+        size_weight = float(settings["size"] or 0)
+        if size_weight > 0:
+            score += size_weight * SIZE_SCORE_BYTES / (SIZE_SCORE_BYTES + (item.get("subtitle_size") or 0))
+
+        return score
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        현재 우선순위 설정
+
+        Returns:
+            Dict[str, Any]: 설정, 요청 디렉토리, 최근 검색 디렉토리(최근 순), 북마크 디렉토리 수, 버전
+        """
+        with self._lock:
+            return {
+                "settings": dict(self.settings),
+                "requested": sorted(self.requested, key=self.requested.get),
+                "searched": list(reversed(self.searched)),
+                "bookmarked": len(self.bookmarked),
+                "version": self.version,
+            }
+
+
+class PriorityWorkQueue(queue.Queue):
+    """우선순위 작업 큐 클래스 (queue.Queue와 같은 크기 제한/대기, 꺼내는 순서만 점수 순)"""
+
+    def __init__(self, maxsize: int, priorities: IndexingPriorities):
+        """
+        큐 초기화
+
+        Args:
+            maxsize: 최대 항목 수
+            priorities: 점수를 계산할 우선순위
+        """
+        self.priorities = priorities
+        self._version = priorities.version
+        self._counter = itertools.count()
+        super().__init__(maxsize)
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """항목 추가 (파일 정보 조회는 큐 잠금 밖에서)"""
+        if isinstance(item, dict):
+            self.priorities.prepare(item)
+        super().put(item, block, timeout)
+
+    def _key(self, item: Any) -> float:
+        # 종료 표시 등 미디어가 아닌 항목은 가장 나중에
+        if not isinstance(item, dict):
+            return float("inf")
+        return -self.priorities.score(item)
+
+    def _reorder_if_changed(self) -> None:
+        """우선순위가 바뀌었으면 대기 중인 항목 점수를 다시 계산 (큐 잠금을 잡은 상태)"""
+        if self.priorities.version == self._version:
+            return
+        self._version = self.priorities.version
+        self.queue = [(self._key(item), sequence, item) for _, sequence, item in self.queue]
+        heapq.heapify(self.queue)
+
+    # queue.Queue 내부 메서드 (모두 큐 잠금을 잡은 상태에서 호출됨)
+
+    def _init(self, maxsize: int) -> None:
+        self.queue: List[Tuple[float, int, Any]] = []
+
+    def _qsize(self) -> int:
+        return len(self.queue)
+
+    def _put(self, item: Any) -> None:
+        self._reorder_if_changed()
+        heapq.heappush(self.queue, (self._key(item), next(self._counter), item))
+
+    def _get(self) -> Any:
+        self._reorder_if_changed()
+        return heapq.heappop(self.queue)[2]
+
+    def peek(self, count: int = 10) -> List[Dict[str, Any]]:
+        """
+        다음에 꺼낼 미디어 (우선순위 확인용)
+
+        Args:
+            count: 최대 개수
+
+        Returns:
+            List[Dict[str, Any]]: path, score 목록
+        """
+        with self.mutex:
+            self._reorder_if_changed()
+            entries = heapq.nsmallest(count, self.queue)
+        return [
+            {"path": item.get("path"), "score": round(-key, 3)}
+            for key, _, item in entries if isinstance(item, dict)
+        ]
+
+
+# 인덱싱 우선순위 (서비스 싱글톤)
+indexing_priorities = IndexingPriorities()
+
+
+def get_indexing_priorities() -> Optional[IndexingPriorities]:
+    """
+    사용 중인 인덱싱 우선순위
+
+    Returns:
+        Optional[IndexingPriorities]: 우선순위 (indexer_priority.enabled가 False면 None)
+    """
+    return indexing_priorities if indexing_priorities.enabled else None
@@ -0,0 +1,208 @@
+"""
+스캔 피드 모듈
+
+스캐너(MediaScanner.iter_media_files)를 별도 스레드에서 실행하여 처리할 미디어 파일을
+크기가 제한된 큐에 넣고, 인덱싱 전략은 이 피드를 순회하며 바로 처리합니다.
+전체 목록을 먼저 만들지 않으므로 첫 파일부터 인덱싱이 시작되고 메모리 사용량이 일정하게 유지됩니다.
+미디어 루트가 여러 개면 루트마다 스캐너 스레드를 하나씩 실행하여 동시에 스캔하고 같은 큐에 넣습니다.
+우선순위를 전달하면 큐에서 점수가 높은 미디어부터 꺼냅니다 (app.services.indexer.priority).
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+from app.utils.logging import get_indexer_logger
+
+logger = get_indexer_logger()
+
+# 큐 대기 중 중단 여부를 확인하는 간격 (초)
+_QUEUE_POLL_INTERVAL = 0.5
+
+# 스캔 종료 표시
+_END = object()
+
+
+class ScanFeed:
+    """스캐너 → 인덱싱 전략 사이의 제한 크기 큐 클래스"""
+
+    def __init__(self, scanner: Union[Any, Sequence[Any]], incremental: bool = True,
+                 is_indexing_func: Optional[Callable[[], bool]] = None,
+                 verify: bool = False, max_queued: int = 256, root_dir: Optional[str] = None,
+                 priorities=None):
+        """
+        스캔 피드 초기화
+
+        Args:
+            scanner: 미디어 스캐너 또는 루트별 스캐너 목록 (iter_media_files, scan_progress 제공)
+            incremental: 증분 인덱싱 여부
+            is_indexing_func: 인덱싱 중단 여부를 확인하는 함수
+            verify: 매니페스트를 무시하고 모든 디렉토리를 다시 나열할지 여부
+            max_queued: 큐에 담아 둘 최대 미디어 파일 수 (가득 차면 스캔이 처리 속도에 맞춰 대기)
+            root_dir: 스캔할 디렉토리 (기본값: 각 스캐너의 루트 디렉토리)
+            priorities: 인덱싱 우선순위 (IndexingPriorities, None이면 스캔 순서대로)
+        """
+        self.scanners: List[Any] = list(scanner) if isinstance(scanner, (list, tuple)) else [scanner]
+        self.scanner = self.scanners[0]
+        self.incremental = incremental
+        self.is_indexing_func = is_indexing_func
+        self.verify = verify
+        self.root_dir = root_dir
+        if priorities is not None:
+            from app.services.indexer.priority import PriorityWorkQueue
+            self.queue: "queue.Queue[Any]" = PriorityWorkQueue(max(1, max_queued), priorities)
+        else:
+            self.queue = queue.Queue(maxsize=max(1, max_queued))
+        self.threads: List[threading.Thread] = []
+        self.produced = 0
+        self.consumed = 0
+        self.error: Optional[BaseException] = None
+        self._stopped = threading.Event()
+        self._produced_lock = threading.Lock()
+        self._ended = 0
+
+    @property
+    def scan_complete(self) -> bool:
+        """모든 스캔이 끝났는지 여부 (이후 produced가 최종 파일 수)"""
+        return all(scanner.scan_progress.get("complete") for scanner in self.scanners)
+
+    def start(self) -> "ScanFeed":
+        """
+        스캔 스레드 시작 (스캐너마다 하나)
+
+        Returns:
+            ScanFeed: 자기 자신 (연쇄 호출용)
+        """
+        for index, scanner in enumerate(self.scanners):
+            thread = threading.Thread(target=self._produce, args=(scanner,), name=f"scan-feed-{index}", daemon=True)
+            self.threads.append(thread)
+            thread.start()
+        return self
+
+    def _should_continue(self) -> bool:
+        """스캔/처리를 계속할지 확인"""
+        if self._stopped.is_set():
+            return False
+        return not self.is_indexing_func or self.is_indexing_func()
+
+    def _put(self, item: Any) -> bool:
+        """
+        큐에 항목 추가 (가득 차면 대기, 중단되면 포기)
+
+        Returns:
+            bool: 추가 성공 여부
+        """
+        while True:
+            try:
+                self.queue.put(item, timeout=_QUEUE_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                if not self._should_continue():
+                    if item is not _END:
+                        return False
+                    # 소비자가 멈춘 경우 남은 항목을 버려 종료 표시가 들어갈 자리 확보
+                    self._drain()
+
+    def _produce(self, scanner) -> None:
+        """
+        스캔 스레드 본문
+
+        Args:
+            scanner: 이 스레드에서 실행할 미디어 스캐너
+        """
+        try:
+            for media_file in scanner.iter_media_files(self.incremental, self._should_continue, self.verify,
+                                                        self.root_dir):
+                if not self._put(media_file):
+                    break
+                with self._produced_lock:
+                    self.produced += 1
+        except Exception as e:
+            self.error = e
+            logger.error(f"스캔 중 오류 발생 ({scanner.root_dir}): {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+        finally:
+            self._put(_END)
+
+    def _drain(self) -> None:
+        """큐에 남은 항목 버림"""
+        try:
+            while True:
+                self.queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """
+        스캔된 미디어 파일을 순서대로 반환 (우선순위가 있으면 점수 순, 스캔이 끝나거나 중단되면 종료)
+
+        Yields:
+            Dict[str, Any]: 미디어 파일 (id, path, subtitle_files)
+        """
+        while True:
+            try:
+                item = self.queue.get(timeout=_QUEUE_POLL_INTERVAL)
+            except queue.Empty:
+                if not self._should_continue():
+                    return
+                continue
+
+            if item is _END:
+                # 모든 스캔 스레드가 끝나야 종료
+                self._ended += 1
+                if self._ended >= len(self.scanners):
+                    return
+                continue
+
+            self.consumed += 1
+            yield item
+
+    def estimated_total(self) -> int:
+        """
+        처리할 전체 파일 수 추정
+
+        스캔 중에는 지난 스캔의 디렉토리 수 대비 방문한 디렉토리 비율로 지금까지 찾은 파일 수를 늘려 추정하고,
+        스캔이 끝나면 실제 파일 수를 반환합니다. 루트가 여러 개면 루트별 추정값을 더합니다.
+
+        Returns:
+            int: 추정 파일 수 (지금까지 찾은 수보다 작지 않음)
+        """
+        if self.scan_complete:
+            return self.produced
+
+        estimated = 0
+        for scanner in self.scanners:
+            progress = scanner.scan_progress
+            found = progress.get("queued", 0)
+            visited = progress.get("directories_visited", 0)
+            expected = progress.get("directories_expected", 0)
+
+            if not progress.get("complete") and found and visited and expected > visited:
+                found = int(found * expected / visited)
+            estimated += found
+
+        return max(self.produced, estimated)
+
+    def stop(self) -> None:
+        """스캔 중단 (대기 중인 항목은 버림)"""
+        self._stopped.set()
+        self._drain()
+        for thread in self.threads:
+            if thread.is_alive():
+                thread.join(timeout=5.0)
+
+
+def estimate_total_files(media_files) -> int:
+    """
+    처리할 전체 파일 수 (목록이면 길이, 스캔 피드면 현재 추정값)
+
+    Args:
+        media_files: 미디어 파일 목록 또는 ScanFeed
+
+    Returns:
+        int: 전체 파일 수
+    """
+    if isinstance(media_files, ScanFeed):
+        return media_files.estimated_total()
+    return len(media_files)
@@ -0,0 +1,322 @@
+"""
+스캔 규칙 모듈
+
+설정의 scan_rules(gitignore 형식 포함/제외 규칙)를 한 번 정규식으로 컴파일하여,
+스캔 중 디렉토리와 미디어 파일이 제외 대상인지 빠르게 판단합니다.
+제외된 디렉토리는 나열하지 않으므로 그 아래 전체(샘플, 부가 영상 폴더 등)를 건너뜁니다.
+
+규칙 형식 (미디어 루트 기준, gitignore와 같음):
+    Samples/          이름이 Samples인 디렉토리 (깊이 무관)
+    *sample*          이름에 sample이 들어간 디렉토리/파일
+    /Extras/          루트 바로 아래 Extras 디렉토리 (/로 시작하거나 중간에 /가 있으면 루트 기준)
+    Movies/**/Trailers/
+    !Extras/Keep/     앞선 규칙으로 제외된 경로를 다시 포함 (마지막으로 일치한 규칙이 우선)
+    # 주석            빈 줄과 #으로 시작하는 줄은 무시
+
+gitignore와 마찬가지로 제외된 디렉토리 아래 경로는 다시 포함할 수 없습니다 (디렉토리를 나열하지 않으므로).
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+from app.config import config
+
+
+class ScanRuleError(ValueError):
+    """잘못된 스캔 규칙 예외"""
+
+
+def _translate_class(pattern: str, index: int) -> Tuple[str, int]:
+    """
+    [...] 문자 클래스를 정규식으로 변환
+
+    Args:
+        pattern: 규칙 문자열
+        index: '[' 위치
+
+    Returns:
+        Tuple[str, int]: (정규식 조각, 클래스 다음 위치) - 닫는 ']'가 없으면 '['를 문자로 취급
+    """
+    end = index + 1
+    if end < len(pattern) and pattern[end] in '!^':
+        end += 1
+    if end < len(pattern) and pattern[end] == ']':
+        end += 1
+    end = pattern.find(']', end)
+    if end == -1:
+        return re.escape('['), index + 1
+
+    body = pattern[index + 1:end].replace('\\', '\\\\')
+    if body[:1] in ('!', '^'):
+        body = '^' + body[1:]
+    return f'(?!/)[{body}]', end + 1
+
+
+def _translate_pattern(pattern: str) -> str:
+    """
+    gitignore 패턴(접두사/접미사 처리 후)을 정규식으로 변환
+
+    '*'와 '?'는 '/'를 넘지 않고, '**'는 디렉토리 여러 단계와 일치합니다.
+
+    Args:
+        pattern: 규칙 문자열
+
+    Returns:
+        str: 정규식 (앵커 제외)
+    """
+    parts = []
+    index = 0
+    length = len(pattern)
+
+    while index < length:
+        char = pattern[index]
+
+        if char == '*':
+            if pattern.startswith('**', index):
+                at_start = index == 0 or pattern[index - 1] == '/'
+                after = index + 2
+                if at_start and after < length and pattern[after] == '/':
+                    # "**/" - 디렉토리 0단계 이상
+                    parts.append('(?:.*/)?')
+                    index = after + 1
+                    continue
+                if at_start and after == length:
+                    # 끝의 "**" - 아래 모든 경로
+                    parts.append('.*')
+                    index = after
+                    continue
+                # 그 밖의 "**"는 "*"와 같음
+                parts.append('[^/]*')
+                index = after
+                continue
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            fragment, index = _translate_class(pattern, index)
+            parts.append(fragment)
+            continue
+        elif char == '\\' and index + 1 < length:
+            index += 1
+            parts.append(re.escape(pattern[index]))
+        else:
+            parts.append(re.escape(char))
+        index += 1
+
+    return ''.join(parts)
+
+
+def parse_rule(line: str) -> Optional[Tuple[bool, bool, str]]:
+    """
+    규칙 한 줄 해석
+
+    Args:
+        line: 규칙 문자열
+
+    Returns:
+        Optional[Tuple[bool, bool, str]]: (포함 규칙 여부, 디렉토리 전용 여부, 정규식) - 빈 줄/주석이면 None
+    """
+    rule = line.strip()
+    if not rule or rule.startswith('#'):
+        return None
+
+    include = rule.startswith('!')
+    if include:
+        rule = rule[1:]
+    elif rule.startswith('\\!') or rule.startswith('\\#'):
+        rule = rule[1:]
+
+    directory_only = rule.endswith('/')
+    rule = rule.rstrip('/')
+
+    # 중간(또는 앞)에 '/'가 있으면 루트 기준, 없으면 어느 깊이의 이름과도 일치
+    anchored = '/' in rule
+    rule = rule.lstrip('/')
+    if not rule:
+        return None
+
+    regex = _translate_pattern(rule)
+    if not anchored:
+        regex = '(?:.*/)?' + regex
+    return include, directory_only, regex
+
+
+class ScanRules:
+    """컴파일된 스캔 규칙 클래스"""
+
+    def __init__(self, rules: Iterable[str], ignore_case: bool = True):
+        """
+        규칙 컴파일
+
+        연속된 같은 종류(제외/포함)의 규칙은 정규식 하나로 합쳐, 경로 하나를 판단할 때
+        규칙 수가 아니라 종류가 바뀌는 횟수만큼만 정규식을 실행합니다.
+
+        Args:
+            rules: gitignore 형식 규칙 목록
+            ignore_case: 대소문자 무시 여부
+
+        Raises:
+            ScanRuleError: 정규식으로 변환할 수 없는 규칙이 있는 경우
+        """
+        self.rules: List[str] = [rule for rule in rules if isinstance(rule, str)]
+        self.ignore_case = ignore_case
+
+        parsed = []
+        for rule in self.rules:
+            try:
+                item = parse_rule(rule)
+            except Exception as e:
+                raise ScanRuleError(f"스캔 규칙을 해석할 수 없습니다: {rule} ({e})")
+            if item:
+                parsed.append(item)
+
+        self.rule_count = len(parsed)
+        # 디렉토리에는 모든 규칙, 파일에는 디렉토리 전용이 아닌 규칙만 적용
+        self._directory_groups = self._compile_groups(parsed)
+        self._file_groups = self._compile_groups([item for item in parsed if not item[1]])
+
+    def _compile_groups(self, parsed: List[Tuple[bool, bool, str]]) -> List[Tuple[bool, 're.Pattern']]:
+        """
+        연속된 같은 종류의 규칙을 정규식 하나로 합침
+
+        Args:
+            parsed: parse_rule 결과 목록 (규칙 순서)
+
+        Returns:
+            List[Tuple[bool, re.Pattern]]: (포함 규칙 여부, 정규식) 목록 - 뒤에서부터 확인
+        """
+        flags = re.IGNORECASE if self.ignore_case else 0
+        groups = []
+        index = 0
+        while index < len(parsed):
+            include = parsed[index][0]
+            regexes = []
+            while index < len(parsed) and parsed[index][0] == include:
+                regexes.append(parsed[index][2])
+                index += 1
+            try:
+                compiled = re.compile('(?:' + '|'.join(regexes) + r')\Z', flags)
+            except re.error as e:
+                raise ScanRuleError(f"스캔 규칙을 컴파일할 수 없습니다: {e}")
+            groups.append((include, compiled))
+
+        groups.reverse()
+        return groups
+
+    def __bool__(self) -> bool:
+        return self.rule_count > 0
+
+    def match(self, relative_path: str, is_dir: bool) -> bool:
+        """
+        루트 기준 경로가 제외 대상인지 확인 (상위 디렉토리는 확인하지 않음)
+
+        Args:
+            relative_path: 루트 기준 경로 ('/' 구분)
+            is_dir: 디렉토리 여부
+
+        Returns:
+            bool: 제외 여부 (마지막으로 일치한 규칙 기준, 일치하는 규칙이 없으면 포함)
+        """
+        groups = self._directory_groups if is_dir else self._file_groups
+        for include, regex in groups:
+            if regex.match(relative_path):
+                return not include
+        return False
+
+    def excludes(self, path: str, root_dir: str, is_dir: bool) -> bool:
+        """
+        스캔 중인 경로가 제외 대상인지 확인 (상위 디렉토리는 이미 통과한 것으로 봄)
+
+        Args:
+            path: 절대 경로
+            root_dir: 미디어 루트
+            is_dir: 디렉토리 여부
+
+        Returns:
+            bool: 제외 여부 (루트 자체와 루트 밖 경로는 제외하지 않음)
+        """
+        if not self.rule_count:
+            return False
+        relative_path = relative_rule_path(path, root_dir)
+        return bool(relative_path) and self.match(relative_path, is_dir)
+
+    def excludes_path(self, path: str, root_dir: str, is_dir: bool = False) -> bool:
+        """
+        임의의 경로가 제외 대상인지 확인 (상위 디렉토리 중 하나라도 제외되면 제외)
+
+        감시 모드처럼 디렉토리 순회 없이 경로 하나만 확인할 때 사용합니다.
+
+        Args:
+            path: 절대 경로
+            root_dir: 미디어 루트
+            is_dir: 경로 자체가 디렉토리인지 여부
+
+        Returns:
+            bool: 제외 여부
+        """
+        if not self.rule_count:
+            return False
+        relative_path = relative_rule_path(path, root_dir)
+        if not relative_path:
+            return False
+
+        parts = relative_path.split('/')
+        for depth in range(1, len(parts)):
+            if self.match('/'.join(parts[:depth]), True):
+                return True
+        return self.match(relative_path, is_dir)
+
+
+def relative_rule_path(path: str, root_dir: str) -> str:
+    """
+    규칙 비교용 루트 기준 경로 ('/' 구분)
+
+    Args:
+        path: 절대 경로
+        root_dir: 미디어 루트
+
+    Returns:
+        str: 루트 기준 경로 (루트 자체이거나 루트 밖이면 빈 문자열)
+    """
+    root = root_dir.rstrip(os.sep)
+    if not path.startswith(root + os.sep):
+        return ''
+    relative_path = path[len(root) + 1:]
+    if os.sep != '/':
+        relative_path = relative_path.replace(os.sep, '/')
+    return relative_path
+
+
+@lru_cache(maxsize=8)
+def compile_scan_rules(rules: Tuple[str, ...], ignore_case: bool = True) -> ScanRules:
+    """
+    스캔 규칙 컴파일 (같은 규칙은 한 번만 컴파일)
+
+    Args:
+        rules: 규칙 목록
+        ignore_case: 대소문자 무시 여부
+
+    Returns:
+        ScanRules: 컴파일된 규칙
+    """
+    return ScanRules(rules, ignore_case)
+
+
+def get_scan_rules() -> ScanRules:
+    """
+    설정의 스캔 규칙 (scan_rules, scan_rules_ignore_case)
+
+    Returns:
+        ScanRules: 컴파일된 규칙 (규칙이 잘못되었으면 규칙 없음)
+    """
+    rules = config.get("scan_rules") or []
+    if isinstance(rules, str):
+        rules = rules.splitlines()
+    try:
+        return compile_scan_rules(tuple(rules), bool(config.get("scan_rules_ignore_case", True)))
+    except ScanRuleError as e:
+        from app.utils.logging import get_indexer_logger
+        get_indexer_logger().error(f"스캔 규칙 오류, 규칙 없이 스캔합니다: {e}")
+        return compile_scan_rules((), True)
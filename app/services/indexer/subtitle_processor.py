@@ -6,14 +6,17 @@
 
 import os
 import time
-import shutil
-import sqlite3
-import tempfile
 from typing import Dict, Any, Optional, List
 
 from app.utils.logging import get_indexer_logger
-from app.utils import remove_html_tags, detect_encoding, is_english_subtitle
-from app.utils.helpers import time_to_ms
+from app.config import config
+from app.subtitle.cue_batch import CueBatch
+from app.subtitle.cue_parser import parse_subtitle_file
+from app.subtitle.language import detect_subtitle_file_language
+from app.database.subtitles import (
+    get_subtitle_file_record, save_subtitle_file_encoding, insert_subtitle_batch
+)
+from app.database.jobs import mark_indexing_file_written, mark_indexing_file_failed
 
 logger = get_indexer_logger()
 
@@ -52,216 +55,117 @@ class SubtitleProcessor:
             elif level_upper == "CRITICAL":
                 logger.critical(message)
     
-    def process_subtitle(self, subtitle_path: str, media_id: int) -> int:
+    def get_known_file_info(self, subtitle_path: str) -> Optional[Dict[str, Any]]:
         """
-        자막 파일 처리 및 데이터베이스에 저장
+        이전 인덱싱에서 저장된 자막 파일 기록(인코딩, 언어) 조회
         
         Args:
             subtitle_path: 자막 파일 경로
-            media_id: 미디어 파일 ID
             
         Returns:
-            int: 처리된 자막 라인 수
+            Optional[Dict[str, Any]]: 파일 크기/수정 시간이 같으면 저장된 기록, 아니면 None
         """
-        import pysrt
-        
         try:
-            # 파일 존재 확인
-            if not os.path.exists(subtitle_path):
-                self.log("ERROR", f"자막 파일이 존재하지 않습니다: {subtitle_path}")
-                return 0
-                
-            # 파일 크기 확인 - 0바이트 파일은 건너뜀
-            if os.path.getsize(subtitle_path) == 0:
-                self.log("WARNING", f"빈 자막 파일입니다: {subtitle_path}")
-                return 0
-            
-            # 파일 인코딩 탐지
-            encoding = detect_encoding(subtitle_path)
-            
-            # 변환된 임시 파일 경로
-            temp_subtitle_path = None
-            
-            # 다양한 인코딩 시도
-            encodings_to_try = [
-                encoding,  # 감지된 인코딩 먼저 시도
-                'utf-8', 'utf-8-sig',  # UTF-8 버전들
-                'euc-kr', 'cp949',     # 한국어 인코딩
-                'latin-1', 'iso-8859-1', # 서양어 인코딩
-                'ascii'                 # 기본 ASCII
-            ]
-            
-            # 중복 제거
-            encodings_to_try = list(dict.fromkeys(encodings_to_try))
-            
-            # 인코딩 순회적으로 시도
-            subtitles = None
-            success_encoding = None
-            
-            for enc in encodings_to_try:
-                try:
-                    # 자막 파일 로드 시도
-                    subtitles = pysrt.open(subtitle_path, encoding=enc)
-                    success_encoding = enc
-                    break
-                except UnicodeDecodeError:
-                    continue
-                except Exception:
-                    continue
-            
-            # 성공한 경우에만 한 번 로깅
-            if success_encoding:
-                self.log("INFO", f"자막 파일 로드 성공 (인코딩: {success_encoding}) - {subtitle_path}")
-            
-            # 모든 인코딩 시도 실패 시 자막 변환 모듈 사용
-            if subtitles is None:
-                self.log("WARNING", f"모든 인코딩 시도 실패 - {subtitle_path}")
-                
-                # 자막 변환 모듈 임포트
-                from app.subtitle.encodings.converter import convert_subtitle_encoding
-                
-                # 임시 디렉토리 생성
-                temp_dir = tempfile.mkdtemp(prefix="subtitle_convert_")
-                
-                # 기본 변환 설정
-                conversion_config = {
-                    'media_dir': os.path.dirname(subtitle_path),
-                    'output_dir': temp_dir,
-                    'delete_original': False,  # 원본 파일 유지
-                    'convert_broken': True,    # 깨진 인코딩 변환
-                    'extract_english': False,  # 영어 자막 추출 안 함
-                    'process_multi': False     # 다중 언어 처리 안 함
-                }
-                
-                # 자막 변환 실행
-                result = convert_subtitle_encoding(subtitle_path, conversion_config)
-                
-                if result and 'output_path' in result and result['output_path'] and os.path.exists(result['output_path']):
-                    temp_subtitle_path = result['output_path']
-                    # 상세 경로 정보 제거하고 간결하게 로깅
-                    self.log("INFO", f"자막 변환 성공: {result.get('encoding', '알 수 없음')} -> utf-8 - {subtitle_path}")
-                    
-                    # 변환된 파일로 다시 시도
-                    try:
-                        subtitles = pysrt.open(temp_subtitle_path, encoding='utf-8')
-                    except Exception as conv_err:
-                        self.log("ERROR", f"변환된 자막 파일 로드 실패: {str(conv_err)} - {temp_subtitle_path}")
-                        # 임시 파일 정리
-                        if os.path.exists(temp_dir):
-                            try:
-                                shutil.rmtree(temp_dir)
-                            except Exception:
-                                pass
-                        return 0
-                else:
-                    self.log("ERROR", f"자막 변환 실패 - {subtitle_path}")
-                    # 임시 파일 정리
-                    if 'temp_dir' in locals() and os.path.exists(temp_dir):
-                        try:
-                            shutil.rmtree(temp_dir)
-                        except Exception:
-                            pass
-                    return 0
-            
-            # 자막이 로드되지 않았으면 0 반환
-            if not subtitles:
-                self.log("ERROR", f"자막을 로드할 수 없습니다: {subtitle_path}")
-                return 0
-                
-            # 자막 라인이 없거나 비어있는 경우
-            if len(subtitles) == 0:
-                self.log("WARNING", f"자막 라인이 없습니다: {subtitle_path}")
-                return 0
-            
-            # 자막 중복 제거를 위한 해시 세트
-            processed_lines = set()
-            subtitles_count = 0
-            
-            # 자막 라인 처리
-            from app.database.subtitles import insert_subtitle
-            
-            # 처리 시간 제한 - 매우 큰 파일의 경우
-            max_processing_time = 600  # 최대 10분
-            start_time = time.time()
-            
-            # 인덱싱 상태 확인 함수
-            is_indexing = lambda: True
-            if self.status_handler:
-                is_indexing = lambda: self.status_handler.current_status.get("is_indexing", True)
-            
-            for subtitle in subtitles:
-                # 최대 처리 시간 초과 확인
-                if time.time() - start_time > max_processing_time:
-                    self.log("WARNING", f"최대 처리 시간 초과, 처리 중단: {subtitle_path}")
-                    break
-                    
-                if not is_indexing():
-                    break
-                    
-                # HTML 태그 제거
-                text = remove_html_tags(subtitle.text)
-                
-                # 비어있는 텍스트는 건너뜀
-                if not text or text.isspace():
-                    continue
-                
-                # 이미 처리한 텍스트는 건너뛰 (중복 제거)
-                if text in processed_lines:
-                    continue
-                
-                processed_lines.add(text)
-                
-                # 자막 시간 정보 (밀리초 단위)
-                start_time_ms = time_to_ms(subtitle.start)
-                end_time_ms = time_to_ms(subtitle.end)
-                
-                # 시간 텍스트 형식 (HH:MM:SS,mmm)
-                start_text = str(subtitle.start)
-                end_text = str(subtitle.end)
-                
-                # 자막 라인 저장 - database.subtitles 모듈의 insert_subtitle 함수 사용
-                max_db_retries = 3
-                db_retry_count = 0
-                insert_success = False
-                
-                while db_retry_count < max_db_retries and not insert_success:
-                    try:
-                        # 데이터베이스 삽입 시도
-                        insert_subtitle(media_id, start_time_ms, end_time_ms, text, 'en', start_text, end_text)
-                        subtitles_count += 1
-                        insert_success = True
-                    except sqlite3.OperationalError as db_err:
-                        db_retry_count += 1
-                        error_msg = str(db_err).lower()
-                        
-                        # 데이터베이스 잠금 또는 손상 오류인 경우 재시도
-                        if "locked" in error_msg or "malformed" in error_msg or "busy" in error_msg:
-                            retry_delay = db_retry_count * 0.5  # 재시도마다 대기 시간 증가
-                            # 마지막 시도에서만 로깅하도록 변경
-                            if db_retry_count == max_db_retries:
-                                self.log("WARNING", f"자막 삽입 재시도 실패 ({max_db_retries}/{max_db_retries}): {error_msg}")
-                            time.sleep(retry_delay)
-                        else:
-                            # 다른 유형의 오류는 재시도하지 않음
-                            self.log("ERROR", f"자막 삽입 오류: {error_msg}")
-                            break
-                    except Exception as e:
-                        # 기타 예외 처리
-                        self.log("ERROR", f"자막 삽입 중 예외 발생: {str(e)}")
-                        break
+            file_stat = os.stat(subtitle_path)
+        except OSError:
+            return None
+        return get_subtitle_file_record(subtitle_path, file_stat.st_size, file_stat.st_mtime)
+    
+    def parse_args(self, subtitle_path: str, known: Optional[Dict[str, Any]]) -> tuple:
+        """
+        parse_subtitle_file에 전달할 인자 생성
+        
+        Args:
+            subtitle_path: 자막 파일 경로
+            known: get_known_file_info 반환값
             
-            # 임시 파일 정리
-            if temp_subtitle_path and os.path.exists(os.path.dirname(temp_subtitle_path)):
-                try:
-                    shutil.rmtree(os.path.dirname(temp_subtitle_path))
-                except Exception:
-                    pass
+        Returns:
+            tuple: (자막 경로, 저장된 인코딩, 저장된 단일 언어, 줄 단위 태깅 여부)
+        """
+        known = known or {}
+        known_lang = None if known.get("multi_language") else known.get("lang")
+        return (subtitle_path, known.get("encoding"), known_lang,
+                config.get("tag_mixed_language_lines", True))
+    
+    def write_batch(self, batch: CueBatch, media_id: int, known: Optional[Dict[str, Any]] = None) -> int:
+        """
+        파싱된 자막 큐 묶음을 데이터베이스에 저장
+        
+        자막 파일의 인덱싱 상태(indexing_files)도 함께 기록합니다. 자막이 있으면 자막 행과 같은 트랜잭션에서
+        written으로, 자막 라인이 없으면 written(0개)으로, 파싱/저장에 실패하면 failed로 기록합니다.
+        
+        Args:
+            batch: 파싱 결과 (parse_subtitle_file 반환값)
+            media_id: 미디어 파일 ID
+            known: 파싱 시 전달한 저장된 파일 기록 (get_known_file_info 반환값)
             
-            # 처리 결과 로깅 - 최종 결과만 로깅하고 처리 시간 추가
-            processing_time = time.time() - start_time
-            self.log("INFO", f"자막 처리 완료: {subtitle_path} - {subtitles_count}개 라인 처리 ({processing_time:.2f}초)")
+        Returns:
+            int: 저장된 자막 라인 수
+        """
+        meta = batch.meta
+        subtitle_path = meta.get("path", "")
+        known = known or {}
+        
+        if meta.get("error"):
+            self.log("WARNING", f"{meta['error']} - {subtitle_path}")
+            mark_indexing_file_failed(subtitle_path, meta["error"])
+            return 0
+        
+        encoding = meta.get("encoding")
+        encoding_score = meta.get("encoding_score", 0.0)
+        known_encoding = known.get("encoding")
+        lang = meta.get("lang") or 'en'
+        multi_language = meta.get("multi_language", False)
+        
+        if (encoding != known_encoding or lang != known.get("lang")
+                or multi_language != known.get("multi_language")):
+            save_subtitle_file_encoding(
+                subtitle_path, media_id, encoding, encoding_score,
+                meta.get("size"), meta.get("mtime"), lang, multi_language
+            )
+        
+        if encoding_score > 0:
+            self.log("WARNING", f"깨진 문자 포함 (인코딩: {encoding}, 비율: {encoding_score:.2%}) - {subtitle_path}")
+        elif known_encoding:
+            self.log("DEBUG", f"저장된 인코딩 사용 (인코딩: {encoding}) - {subtitle_path}")
+        else:
+            self.log("INFO", f"자막 파일 로드 성공 (인코딩: {encoding}, 언어: {lang}"
+                             f"{', 다국어' if multi_language else ''}) - {subtitle_path}")
+        
+        if not len(batch):
+            self.log("WARNING", f"자막 라인이 없습니다: {subtitle_path}")
+            mark_indexing_file_written(subtitle_path, 0)
+            return 0
+        
+        # 한 번의 트랜잭션으로 자막, FTS 인덱스, 파일 인덱싱 상태 저장 (언어가 없는 큐는 파일 언어 사용)
+        start_time = time.time()
+        subtitles_count = insert_subtitle_batch(media_id, batch, lang, state_path=subtitle_path)
+        if not subtitles_count:
+            mark_indexing_file_failed(subtitle_path, "자막 저장 실패")
+            return 0
+        
+        write_time = time.time() - start_time
+        parse_time = meta.get("parse_time", 0.0)
+        self.log("INFO", f"자막 처리 완료: {subtitle_path} - {subtitles_count}개 라인 처리 "
+                         f"(파싱 {parse_time:.2f}초, 저장 {write_time:.2f}초)")
+        
+        return subtitles_count
+    
+    def process_subtitle(self, subtitle_path: str, media_id: int) -> int:
+        """
+        자막 파일 처리 및 데이터베이스에 저장 (현재 프로세스에서 파싱)
+        
+        Args:
+            subtitle_path: 자막 파일 경로
+            media_id: 미디어 파일 ID
             
-            return subtitles_count
+        Returns:
+            int: 처리된 자막 라인 수
+        """
+        try:
+            known = self.get_known_file_info(subtitle_path)
+            batch = parse_subtitle_file(*self.parse_args(subtitle_path, known))
+            return self.write_batch(batch, media_id, known)
                 
         except Exception as e:
             self.log("ERROR", f"자막 처리 중 오류 발생: {str(e)} - {subtitle_path}")
@@ -269,7 +173,7 @@ class SubtitleProcessor:
     
     def detect_subtitle_language(self, subtitle_path: str) -> str:
         """
-        자막 파일의 언어 감지
+        자막 파일의 언어 감지 (표본 큐로 판별, 파일 지문별 캐시)
         
         Args:
             subtitle_path: 자막 파일 경로
@@ -278,9 +182,12 @@ class SubtitleProcessor:
             str: 감지된 언어 코드 (기본값: 'en')
         """
         try:
-            # 영어 자막 여부 확인
-            is_english = is_english_subtitle(subtitle_path)
-            return 'en' if is_english else 'ko'
+            known = self.get_known_file_info(subtitle_path) or {}
+            if known.get("lang"):
+                return known["lang"]
+            
+            result = detect_subtitle_file_language(subtitle_path, known.get("encoding"))
+            return result["lang"] or 'en'
         except Exception as e:
             self.log("WARNING", f"자막 언어 감지 중 오류: {str(e)} - {subtitle_path}")
             return 'en'  # 기본값은 영어
@@ -0,0 +1,448 @@
+"""
+감시 모드 모듈
+
+파일 감시기(file_watcher)의 이벤트를 받아 전체 디렉토리 스캔 없이 바뀐 파일만 인덱싱합니다.
+- 연결된 미디어 루트마다 감시기 하나를 사용
+- 미디어/디렉토리 이름 변경과 삭제는 즉시 media_files에 반영
+- 자막/미디어 생성과 변경은 "디렉토리 + 미디어 이름(확장자 제외)" 단위로 모아,
+  마지막 이벤트 후 일정 시간(디바운스) 동안 조용하면 한 번만 다시 인덱싱
+"""
+
+import os
+import time
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.config import config
+from app.utils.logging import get_indexer_logger
+from app.services.indexer.directory_index import list_directory, subtitle_match_keys
+from app.services.indexer.scan_rules import get_scan_rules
+from app.services.indexer.file_watcher import (
+    EVENT_DELETED, EVENT_MODIFIED, EVENT_MOVED, EVENT_OVERFLOW, FileEvent, create_watcher
+)
+
+logger = get_indexer_logger()
+
+# 이벤트 대기 간격 (초) - 디바운스 만료 확인 주기
+POLL_TIMEOUT = 0.5
+
+
+class IndexingWatcher:
+    """감시 모드 인덱서 클래스"""
+
+    def __init__(self, worker, status_handler=None):
+        """
+        감시 모드 초기화
+
+        Args:
+            worker: 자막 처리기(processor)와 스캐너(scanner)를 가진 인덱싱 워커
+            status_handler: 상태 관리자 인스턴스 (로깅 및 전체 인덱싱 진행 여부 확인)
+        """
+        self.worker = worker
+        self.status_handler = status_handler
+        self.watchers: List[Any] = []
+        self.thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
+
+        # (디렉토리, 미디어 이름) -> 처리 예정 시각
+        self.pending: Dict[Tuple[str, str], float] = {}
+
+        self.stats = {
+            "events": 0,
+            "reindexed": 0,
+            "renamed": 0,
+            "deleted": 0,
+            "overflows": 0,
+            "started_at": None,
+            "last_event_at": None,
+        }
+
+    def log(self, level: str, message: str) -> None:
+        """
+        로그 메시지 기록
+
+        Args:
+            level: 로그 레벨
+            message: 로그 메시지
+        """
+        if self.status_handler:
+            self.status_handler.log(level, message)
+        else:
+            getattr(logger, level.lower(), logger.info)(message)
+
+    def is_running(self) -> bool:
+        """
+        감시 중인지 확인
+
+        Returns:
+            bool: 감시 스레드가 실행 중이면 True
+        """
+        return bool(self.thread and self.thread.is_alive())
+
+    def start(self) -> Dict[str, Any]:
+        """
+        감시 시작
+
+        Returns:
+            Dict[str, Any]: 시작 결과
+        """
+        if self.is_running():
+            return {"success": False, "message": "이미 감시 모드가 실행 중입니다."}
+
+        from app.database.media import is_root_available
+
+        scanner = self.worker.scanner
+        extensions = list(scanner.media_extensions) + list(scanner.subtitle_extensions)
+
+        # 연결된 미디어 루트마다 감시기 생성 (연결되지 않은 루트는 건너뜀)
+        self.watchers = []
+        for root in config.get_media_roots():
+            root_dir = root["path"]
+            if not os.path.isdir(root_dir) or not is_root_available(root_dir):
+                self.log("WARNING", f"연결되지 않은 미디어 루트는 감시하지 않습니다: {root_dir}")
+                continue
+
+            try:
+                self.watchers.append(create_watcher(
+                    root_dir, extensions,
+                    poll_interval=config.get("watch_poll_interval", 10.0),
+                    use_inotify=config.get("watch_use_inotify", True)
+                ))
+            except Exception as e:
+                self.log("ERROR", f"감시 모드 시작 중 오류 발생: {e} - {root_dir}")
+
+        if not self.watchers:
+            return {"success": False, "message": "감시할 수 있는 미디어 루트가 없습니다."}
+
+        self.stop_event.clear()
+        self.pending.clear()
+        self.stats["started_at"] = time.time()
+
+        self.thread = threading.Thread(target=self._run, name="indexing-watcher", daemon=True)
+        self.thread.start()
+
+        for watcher in self.watchers:
+            self.log("INFO", f"감시 모드 시작 ({watcher.backend}): {watcher.root_dir}")
+        return {
+            "success": True,
+            "message": "감시 모드가 시작되었습니다.",
+            "backend": self.watchers[0].backend,
+            "roots": [watcher.root_dir for watcher in self.watchers]
+        }
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        감시 중지 (처리 대기 중인 변경은 버림 - 다음 증분 인덱싱에서 반영)
+
+        Returns:
+            Dict[str, Any]: 중지 결과
+        """
+        if not self.is_running():
+            return {"success": False, "message": "감시 모드가 실행 중이 아닙니다."}
+
+        self.stop_event.set()
+        self.thread.join(timeout=5.0)
+
+        self.log("INFO", "감시 모드 중지됨")
+        return {"success": True, "message": "감시 모드가 중지되었습니다."}
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        감시 상태 조회
+
+        Returns:
+            Dict[str, Any]: 상태 정보
+        """
+        return {
+            "running": self.is_running(),
+            "backend": self.watchers[0].backend if self.watchers else None,
+            "roots": [watcher.root_dir for watcher in self.watchers],
+            "pending": len(self.pending),
+            **self.stats,
+        }
+
+    def _run(self) -> None:
+        """감시 스레드 본문"""
+        debounce = config.get("watch_debounce_seconds", 2.0)
+
+        # 루트가 여러 개이면 대기 시간을 나눠 한 바퀴가 POLL_TIMEOUT 안에 끝나도록 함
+        timeout = POLL_TIMEOUT / len(self.watchers)
+
+        try:
+            while not self.stop_event.is_set():
+                for watcher in self.watchers:
+                    for event in watcher.poll(timeout):
+                        self.stats["events"] += 1
+                        self.stats["last_event_at"] = time.time()
+                        try:
+                            self._handle_event(event, debounce)
+                        except Exception as e:
+                            self.log("ERROR", f"파일 이벤트 처리 중 오류 발생: {e} - {event.path}")
+
+                self._flush_due()
+
+        except Exception as e:
+            self.log("ERROR", f"감시 모드 실행 중 오류 발생: {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+
+        finally:
+            for watcher in self.watchers:
+                watcher.close()
+
+    def _schedule(self, directory: str, name: str, debounce: float) -> None:
+        """
+        (디렉토리, 미디어 이름) 다시 인덱싱 예약 (이미 예약되어 있으면 시각만 늦춤)
+
+        Args:
+            directory: 디렉토리 경로
+            name: 미디어 이름 (확장자 제외)
+            debounce: 대기 시간 (초)
+        """
+        self.pending[(directory, name)] = time.monotonic() + debounce
+
+    def _schedule_path(self, path: str, debounce: float) -> None:
+        """
+        파일 경로로 다시 인덱싱 예약 (자막이면 연결될 수 있는 모든 미디어 이름)
+
+        Args:
+            path: 미디어 또는 자막 파일 경로
+            debounce: 대기 시간 (초)
+        """
+        directory, filename = os.path.split(path)
+        stem, ext = os.path.splitext(filename)
+
+        if ext.lower() in {e.lower() for e in self.worker.scanner.subtitle_extensions}:
+            for key in subtitle_match_keys(stem):
+                self._schedule(directory, key, debounce)
+        else:
+            self._schedule(directory, stem, debounce)
+
+    def _handle_event(self, event: FileEvent, debounce: float) -> None:
+        """
+        파일 이벤트 처리
+
+        Args:
+            event: 파일 이벤트
+            debounce: 디바운스 시간 (초)
+        """
+        from app.database.media import rename_media_path
+
+        if event.kind == EVENT_OVERFLOW:
+            # 놓친 변경이 있으므로 증분 인덱싱으로 보정
+            self.stats["overflows"] += 1
+            from app.services.indexer import indexer_service
+            indexer_service.start_indexing(incremental=True)
+            return
+
+        if event.kind == EVENT_MOVED:
+            renamed = rename_media_path(event.path, event.dest_path)
+            if renamed:
+                self.stats["renamed"] += renamed
+                self.log("INFO", f"경로 변경 반영: {event.path} -> {event.dest_path} ({renamed}개 미디어)")
+            if not event.is_dir:
+                # 이름이 바뀌면 연결되는 자막이 달라질 수 있음
+                self._schedule_path(event.path, debounce)
+                self._schedule_path(event.dest_path, debounce)
+            return
+
+        if event.kind == EVENT_DELETED:
+            # 볼륨이 분리되어 보이는 삭제는 미디어를 지우지 않고 사용 불가로 표시
+            if not self._root_available(event.path):
+                return
+            self._delete_media_under(event.path, event.is_dir)
+            if not event.is_dir:
+                self._schedule_path(event.path, debounce)
+            return
+
+        if event.kind == EVENT_MODIFIED:
+            self._schedule_path(event.path, debounce)
+
+    def _root_available(self, path: str) -> bool:
+        """
+        경로가 속한 미디어 루트가 연결되어 있는지 확인 (연결이 끊겼으면 사용 불가로 표시)
+
+        Args:
+            path: 변경된 경로
+
+        Returns:
+            bool: 연결 여부
+        """
+        from app.database.media import is_root_available, set_root_availability
+
+        media_root = config.find_media_root(path) or config.get("root_dir", "")
+        if is_root_available(media_root):
+            return True
+
+        marked = set_root_availability(media_root, False)
+        if marked:
+            self.log("WARNING", f"미디어 루트가 연결되어 있지 않아 삭제를 반영하지 않습니다: {media_root} "
+                                f"(미디어 {marked}개를 사용 불가로 표시)")
+        return False
+
+    def _delete_media_under(self, path: str, is_dir: bool) -> None:
+        """
+        삭제된 미디어 파일(또는 디렉토리 아래 모든 미디어)의 데이터 삭제
+
+        Args:
+            path: 삭제된 경로
+            is_dir: 디렉토리 여부
+        """
+        from app.database.media import get_media_by_path, get_media_under_directory, delete_media
+
+        if is_dir:
+            media_list = get_media_under_directory(path)
+        else:
+            media = get_media_by_path(path)
+            media_list = [media] if media else []
+
+        # delete_media가 자막, 문장, FTS, 자막 파일 기록을 한 트랜잭션에서 함께 삭제
+        for media in media_list:
+            if delete_media(media["id"]):
+                self.stats["deleted"] += 1
+                self.log("INFO", f"삭제된 미디어 제거: {media['path']}")
+
+    def _flush_due(self) -> None:
+        """대기 시간이 지난 예약을 디렉토리별로 모아 처리"""
+        if not self.pending:
+            return
+
+        # 전체 인덱싱 중에는 쓰기가 겹치지 않도록 미룸
+        if self.status_handler and self.status_handler.current_status.get("is_indexing"):
+            return
+
+        now = time.monotonic()
+        due = [key for key, deadline in self.pending.items() if deadline <= now]
+        if not due:
+            return
+
+        by_directory: Dict[str, Set[str]] = {}
+        for directory, name in due:
+            del self.pending[(directory, name)]
+            by_directory.setdefault(directory, set()).add(name)
+
+        media_files: List[Dict[str, Any]] = []
+        for directory, names in by_directory.items():
+            if self.stop_event.is_set():
+                return
+            media_files.extend(self._collect_directory(directory, names))
+
+        if media_files:
+            self._start_pipeline(media_files)
+
+    def _collect_directory(self, directory: str, names: Set[str]) -> List[Dict[str, Any]]:
+        """
+        디렉토리에서 지정한 이름의 미디어를 다시 인덱싱할 항목으로 준비 (디렉토리는 한 번만 나열)
+
+        Args:
+            directory: 디렉토리 경로
+            names: 미디어 이름 목록 (확장자 제외)
+
+        Returns:
+            List[Dict[str, Any]]: 파이프라인 항목 목록 (id, path, root, subtitle_files)
+        """
+        scanner = self.worker.scanner
+
+        # 스캔 규칙으로 제외된 경로는 전체 스캔과 마찬가지로 인덱싱하지 않음
+        rules = get_scan_rules()
+        rules_root = config.find_media_root(directory) or config.get("root_dir", "")
+        if rules and rules.excludes_path(directory, rules_root, is_dir=True):
+            return []
+
+        listing = list_directory(directory, scanner.media_extensions, scanner.subtitle_extensions)
+
+        media_files = []
+        for media_path in listing.media_files:
+            if os.path.splitext(os.path.basename(media_path))[0] not in names:
+                continue
+            if rules and rules.excludes(media_path, rules_root, False):
+                continue
+
+            subtitle_files = listing.find_subtitles(media_path)
+            if not subtitle_files and scanner.extract_from_media and scanner.has_embedded_subtitles(media_path):
+                subtitle_files = [media_path]
+
+            try:
+                media_file = self._prepare_media(media_path, subtitle_files, rules_root)
+            except Exception as e:
+                self.log("ERROR", f"감시 모드 인덱싱 준비 중 오류 발생: {e} - {media_path}")
+                continue
+
+            if media_file:
+                media_files.append(media_file)
+
+        return media_files
+
+    def _prepare_media(self, media_path: str, subtitle_files: List[str],
+                       root_dir: str) -> Optional[Dict[str, Any]]:
+        """
+        미디어 한 개의 기존 자막을 지우고 자막 파일을 처리 대상(queued)으로 기록
+
+        스캐너와 같은 규칙을 따릅니다: 새 미디어가 이미 인덱싱된 미디어의 복사본/하드 링크이면
+        별칭으로만 기록하고, 처리 대상 기록은 중간에 프로세스가 종료되어도 다음 실행에서 이어서 처리됩니다.
+
+        Args:
+            media_path: 미디어 파일 경로
+            subtitle_files: 연결된 자막 파일 목록
+            root_dir: 미디어가 속한 루트
+
+        Returns:
+            Optional[Dict[str, Any]]: 파이프라인 항목 (처리할 자막이 없거나 별칭으로 기록하면 None)
+        """
+        from app.database.media import get_media_by_path, upsert_media
+        from app.database.subtitles import clear_subtitles_for_media
+        from app.database.jobs import queue_indexing_files
+
+        existing = get_media_by_path(media_path)
+
+        if not subtitle_files:
+            # 자막이 없는 미디어는 저장하지 않음 (스캐너와 같은 규칙), 기존 자막만 정리
+            if existing:
+                clear_subtitles_for_media(existing["id"])
+            return None
+
+        # 아직 인덱싱되지 않은 미디어가 기존 미디어와 같은 파일이면 별칭으로만 기록
+        if not existing and config.get("scan_dedupe", True) and self.worker.scanner.record_if_duplicate(media_path):
+            return None
+
+        media_id = existing["id"] if existing else upsert_media(media_path)
+        if not media_id:
+            return None
+
+        clear_subtitles_for_media(media_id)
+        if not queue_indexing_files(media_id, subtitle_files):
+            return None
+
+        return {
+            "id": media_id,
+            "path": media_path,
+            "root": root_dir,
+            "subtitle_files": subtitle_files
+        }
+
+    def _start_pipeline(self, media_files: List[Dict[str, Any]]) -> None:
+        """
+        준비한 미디어를 스캐너와 같은 인덱싱 파이프라인으로 처리 (워커 스레드에서 실행)
+
+        전체 인덱싱이 먼저 시작되어 워커를 쓸 수 없으면 처리 대상 기록만 남기고,
+        다음 인덱싱 또는 이어서 처리에서 반영됩니다.
+
+        Args:
+            media_files: 파이프라인 항목 목록
+        """
+        if self.worker.indexing_thread and self.worker.indexing_thread.is_alive():
+            self.log("INFO", f"인덱싱 작업이 실행 중이라 변경된 미디어 {len(media_files)}개는 "
+                             f"다음 인덱싱에서 이어서 처리합니다.")
+            return
+
+        if self.status_handler:
+            self.status_handler.update_status(
+                is_indexing=True,
+                is_paused=False,
+                pid=os.getpid(),
+                status_message=f"감시 모드 변경 반영 중... (미디어 {len(media_files)}개)"
+            )
+        self.worker.start_worker(media_files=media_files)
+
+        self.stats["reindexed"] += len(media_files)
+        self.log("INFO", f"변경 반영 시작: 미디어 {len(media_files)}개")
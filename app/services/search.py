@@ -26,7 +26,14 @@ class SearchService:
         end_time: Optional[str] = None,
         page: int = 1,
         per_page: int = 50,
-        search_method: Optional[str] = None  # 파라미터 추가
+        search_method: Optional[str] = None,  # 파라미터 추가
+        scope: str = 'cue',
+        show: Optional[str] = None,
+        season: Optional[int] = None,
+        episode: Optional[int] = None,
+        year: Optional[int] = None,
+        resolution: Optional[str] = None,
+        root: Optional[str] = None
     ) -> SearchResult:
         """
         자막 내용 검색
@@ -39,14 +46,31 @@ class SearchService:
             page: 페이지 번호
             per_page: 페이지당 결과 수
             search_method: 검색 방식 ('like' 또는 'fts')
+            scope: 검색 범위 ('cue': 큐 단위, 'sentence': 여러 큐에 걸친 문장 단위)
+            show: 작품 제목 필터
+            season: 시즌 번호 필터
+            episode: 에피소드 번호 필터
+            year: 연도 필터
+            resolution: 해상도 필터 (예: '1080p')
+            root: 미디어 루트 필터 (이 루트 아래 미디어만)
             
         Returns:
             SearchResult: 검색 결과 및 메타데이터
         """
+        # 미디어 메타데이터 필터 (SQL에서 자막 검색 전에 대상 미디어를 좁힘)
+        media_filters = {
+            "show": show,
+            "season": season,
+            "episode": episode,
+            "year": year,
+            "resolution": resolution,
+            "root": root
+        }
+        
         # 결과 수 제한을 위한 추가 쿼리 (결과가 많을 수 있으므로 total_count만 가져오는 쿼리 분리)
         # 참고: 실제 구현에서는 FTS 테이블의 rowid를 활용해 더 효율적으로 구현 가능
         # 계산된 total_count는 근사치일 수 있음
-        total_count = SearchService._estimate_total_count(query, lang, start_time, end_time)
+        total_count = SearchService._estimate_total_count(query, lang, start_time, end_time, scope, media_filters)
         
         # 실제 검색 수행 - database.subtitles 모듈 함수 사용
         from app.database.subtitles import search_subtitles as db_search_subtitles
@@ -56,7 +80,9 @@ class SearchService:
             start_time=start_time,
             end_time=end_time,
             page=page,
-            per_page=per_page
+            per_page=per_page,
+            scope=scope,
+            **media_filters
         )
         
         # 모델로 변환
@@ -69,7 +95,9 @@ class SearchService:
         filters_applied = {
             "lang": lang,
             "start_time": start_time,
-            "end_time": end_time
+            "end_time": end_time,
+            "scope": scope if scope == 'sentence' else None,
+            **media_filters
         }
         
         # 필터에서 None 값 제거
@@ -90,11 +118,13 @@ class SearchService:
         query: str, 
         lang: Optional[str] = None, 
         start_time: Optional[str] = None,
-        end_time: Optional[str] = None
+        end_time: Optional[str] = None,
+        scope: str = 'cue',
+        media_filters: Optional[Dict[str, Any]] = None
     ) -> int:
         """검색 조건에 맞는 총 결과 수 추정 - database.subtitles 모듈 함수 사용"""
         from app.database.subtitles import estimate_total_count
-        return estimate_total_count(query, lang, start_time, end_time)
+        return estimate_total_count(query, lang, start_time, end_time, scope=scope, **(media_filters or {}))
     
     @staticmethod
     def format_search_results_html(results: SearchResult) -> str:
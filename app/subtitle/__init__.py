@@ -0,0 +1,6 @@
+"""
+자막 포맷 패키지
+
+SRT, VTT 등 자막 포맷의 파싱 및 인코딩 변환만 담당합니다.
+데이터베이스 접근 코드는 이 패키지에 두지 않습니다.
+"""
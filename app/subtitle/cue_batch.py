@@ -0,0 +1,81 @@
+"""
+자막 큐 묶음 모듈
+
+파싱된 자막 큐를 딕셔너리 목록 대신 배열과 하나의 텍스트 블롭으로 보관합니다.
+프로세스 간 전달(pickle) 시 크기와 직렬화 비용을 줄이기 위한 구조입니다.
+"""
+
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# 텍스트 블롭 구분자 (자막 텍스트에 포함되면 공백으로 치환)
+_TEXT_SEPARATOR = '\x00'
+
+
+class CueBatch:
+    """압축된 자막 큐 묶음 클래스"""
+
+    __slots__ = ('starts', 'ends', 'langs', '_texts', '_blob', 'meta')
+
+    def __init__(self, meta: Optional[Dict[str, Any]] = None):
+        """
+        자막 큐 묶음 초기화
+
+        Args:
+            meta: 인코딩, 파일 크기 등 부가 정보
+        """
+        self.starts = array('q')
+        self.ends = array('q')
+        self.langs: List[Optional[str]] = []
+        self._texts: List[str] = []
+        self._blob: Optional[str] = None
+        self.meta = meta or {}
+
+    def append(self, start_ms: int, end_ms: int, text: str, lang: Optional[str] = None) -> None:
+        """
+        자막 큐 추가
+
+        Args:
+            start_ms: 시작 시간 (밀리초)
+            end_ms: 종료 시간 (밀리초)
+            text: 자막 텍스트
+            lang: 언어 코드 (None이면 저장 시 기본 언어 사용)
+        """
+        self.texts.append(text.replace(_TEXT_SEPARATOR, ' '))
+        self.starts.append(start_ms)
+        self.ends.append(end_ms)
+        self.langs.append(lang)
+
+    @property
+    def texts(self) -> List[str]:
+        """자막 텍스트 목록 (역직렬화된 블롭은 처음 접근할 때 분할)"""
+        if self._blob is not None:
+            self._texts = self._blob.split(_TEXT_SEPARATOR) if len(self.starts) else []
+            self._blob = None
+        return self._texts
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, str, Optional[str]]]:
+        return zip(self.starts, self.ends, self.texts, self.langs)
+
+    def __getstate__(self):
+        return (
+            self.starts.tobytes(),
+            self.ends.tobytes(),
+            _TEXT_SEPARATOR.join(self.texts),
+            self.langs,
+            self.meta
+        )
+
+    def __setstate__(self, state) -> None:
+        starts, ends, blob, langs, meta = state
+        self.starts = array('q')
+        self.starts.frombytes(starts)
+        self.ends = array('q')
+        self.ends.frombytes(ends)
+        self.langs = langs
+        self._texts = []
+        self._blob = blob
+        self.meta = meta
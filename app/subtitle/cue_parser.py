@@ -0,0 +1,270 @@
+"""
+자막 파싱 모듈
+
+자막 파일을 읽어 디코딩, 포맷별 파싱(SRT/VTT/SMI/ASS), 중복 제거까지 수행하고 CueBatch로 반환합니다.
+데이터베이스에 접근하지 않으므로 별도 프로세스(ProcessPoolExecutor)에서 실행할 수 있습니다.
+"""
+
+import os
+import time
+from typing import Any, Dict, Optional
+
+from app.subtitle.cue_batch import CueBatch
+from app.subtitle.encodings import decode_subtitle_bytes
+from app.subtitle.parsers import iter_cues
+from app.subtitle.mkv import EMBEDDED_SUBTITLE_EXTENSIONS, MkvError, iter_mkv_cues
+from app.subtitle.language import cache_language, classify_line, detect_language, get_cached_language
+
+
+def parse_subtitle_file(subtitle_path: str, known_encoding: Optional[str] = None,
+                        known_lang: Optional[str] = None, tag_lines: bool = True) -> CueBatch:
+    """
+    자막 파일을 파싱하여 CueBatch 생성
+
+    파일 언어는 표본 큐로 판별하고(저장된 언어가 있으면 생략), 다국어 파일이면
+    언어가 지정되지 않은 큐마다 문자 종류로 언어를 태깅합니다.
+    읽기 → 디코딩 → 파싱 → 정규화 단계 함수를 차례로 실행하며,
+    인덱싱 파이프라인은 같은 단계 함수를 단계별 스레드(또는 프로세스)에서 나누어 실행합니다.
+
+    Args:
+        subtitle_path: 자막 파일 경로
+        known_encoding: subtitle_files 테이블에 저장된 인코딩 (없으면 None)
+        known_lang: subtitle_files 테이블에 저장된 단일 언어 (없거나 다국어 파일이면 None)
+        tag_lines: 다국어 파일의 줄 단위 언어 태깅 여부
+
+    Returns:
+        CueBatch: 파싱된 자막 큐 묶음 (오류 시 meta['error']에 메시지 기록)
+    """
+    job = new_subtitle_job(subtitle_path, known_encoding, known_lang, tag_lines)
+    for stage in (read_subtitle_job, decode_subtitle_job, parse_subtitle_job, normalize_subtitle_job):
+        job = stage(job)
+    return job["batch"]
+
+
+def new_subtitle_job(subtitle_path: str, known_encoding: Optional[str] = None,
+                     known_lang: Optional[str] = None, tag_lines: bool = True) -> Dict[str, Any]:
+    """
+    단계 함수에 전달할 자막 작업 생성
+
+    작업은 프로세스 간에 전달할 수 있도록 딕셔너리이며, 단계마다 raw(읽은 바이트) → text(디코딩 결과)
+    → batch(큐)를 채우고 다음 단계에 필요 없는 값은 비웁니다.
+
+    Args:
+        subtitle_path: 자막 파일 경로
+        known_encoding: 저장된 인코딩
+        known_lang: 저장된 단일 언어
+        tag_lines: 다국어 파일의 줄 단위 언어 태깅 여부
+
+    Returns:
+        Dict[str, Any]: 자막 작업
+    """
+    return {
+        "path": subtitle_path,
+        "known_encoding": known_encoding,
+        "known_lang": known_lang,
+        "tag_lines": tag_lines,
+        "raw": None,
+        "text": None,
+        "embedded": False,
+        "batch": CueBatch({"path": subtitle_path, "error": None, "parse_time": 0.0}),
+    }
+
+
+def _add_stage_time(job: Dict[str, Any], started: float) -> Dict[str, Any]:
+    """단계 소요 시간을 meta['parse_time']에 더함"""
+    meta = job["batch"].meta
+    meta["parse_time"] = meta.get("parse_time", 0.0) + time.time() - started
+    return job
+
+
+def read_subtitle_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    읽기 단계 - 자막 파일을 한 번 읽고 같은 핸들에서 크기/수정 시간 확인
+
+    미디어 컨테이너(MKV)는 내장 텍스트 자막 트랙을 이 단계에서 직접 추출합니다.
+
+    Args:
+        job: 자막 작업
+
+    Returns:
+        Dict[str, Any]: raw가 채워진 작업 (오류 시 meta['error'] 기록)
+    """
+    started = time.time()
+    batch = job["batch"]
+    subtitle_path = job["path"]
+
+    if subtitle_path.lower().endswith(EMBEDDED_SUBTITLE_EXTENSIONS):
+        job["embedded"] = True
+        _parse_embedded_subtitles(batch, subtitle_path)
+        return _add_stage_time(job, started)
+
+    try:
+        with open(subtitle_path, 'rb') as file:
+            file_stat = os.fstat(file.fileno())
+            raw = file.read()
+    except OSError as e:
+        batch.meta["error"] = f"자막 파일을 읽을 수 없습니다: {e}"
+        return job
+
+    batch.meta["size"] = file_stat.st_size
+    batch.meta["mtime"] = file_stat.st_mtime
+
+    if not raw:
+        batch.meta["error"] = "빈 자막 파일입니다"
+        return job
+
+    job["raw"] = raw
+    return _add_stage_time(job, started)
+
+
+def decode_subtitle_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    디코딩 단계 - 읽은 바이트의 인코딩 판별 및 텍스트 변환
+
+    Args:
+        job: 읽기 단계를 마친 자막 작업
+
+    Returns:
+        Dict[str, Any]: text가 채워진 작업
+    """
+    batch = job["batch"]
+    if batch.meta["error"] or job["embedded"]:
+        return job
+
+    started = time.time()
+    text, encoding, encoding_score = decode_subtitle_bytes(job["raw"], job["known_encoding"])
+    job["raw"] = None
+    job["text"] = text
+
+    batch.meta["encoding"] = encoding
+    batch.meta["encoding_score"] = encoding_score
+    return _add_stage_time(job, started)
+
+
+def parse_subtitle_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    파싱 단계 - 포맷별 파싱(SRT/VTT/SMI/ASS) 및 중복 텍스트 제거
+
+    Args:
+        job: 디코딩 단계를 마친 자막 작업
+
+    Returns:
+        Dict[str, Any]: batch에 큐가 채워진 작업
+    """
+    batch = job["batch"]
+    if batch.meta["error"] or job["embedded"]:
+        return job
+
+    started = time.time()
+    text, job["text"] = job["text"], None
+
+    # 중복 텍스트 제거 (SMI처럼 언어가 섞인 파일은 언어별로 구분)
+    processed_lines = set()
+
+    try:
+        for cue in iter_cues(text, job["path"]):
+            key = (cue.lang, cue.text)
+            if key in processed_lines:
+                continue
+
+            processed_lines.add(key)
+            batch.append(cue.start_ms, cue.end_ms, cue.text, cue.lang)
+    except Exception as e:
+        batch.meta["error"] = f"자막 파싱 실패: {e}"
+        return job
+
+    return _add_stage_time(job, started)
+
+
+def normalize_subtitle_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    정규화 단계 - 파일 언어 판별 및 다국어 파일의 줄 단위 언어 태깅
+
+    Args:
+        job: 파싱 단계를 마친 자막 작업
+
+    Returns:
+        Dict[str, Any]: batch.meta에 언어 정보가 기록된 작업
+    """
+    batch = job["batch"]
+    if batch.meta["error"]:
+        return job
+
+    started = time.time()
+    _detect_batch_language(batch, job["known_lang"], job["tag_lines"])
+    return _add_stage_time(job, started)
+
+
+def _parse_embedded_subtitles(batch: CueBatch, media_path: str) -> None:
+    """
+    MKV 내장 텍스트 자막 트랙을 CueBatch에 추가
+
+    Args:
+        batch: 결과를 채울 자막 큐 묶음
+        media_path: MKV 파일 경로
+    """
+    try:
+        file_stat = os.stat(media_path)
+    except OSError as e:
+        batch.meta["error"] = f"미디어 파일을 읽을 수 없습니다: {e}"
+        return
+
+    # MKV 텍스트 자막은 항상 UTF-8
+    batch.meta.update(size=file_stat.st_size, mtime=file_stat.st_mtime,
+                      encoding='utf-8', encoding_score=0.0)
+
+    processed_lines = set()
+    try:
+        for cue in iter_mkv_cues(media_path):
+            key = (cue.lang, cue.text)
+            if key in processed_lines:
+                continue
+
+            processed_lines.add(key)
+            batch.append(cue.start_ms, cue.end_ms, cue.text, cue.lang)
+    except (OSError, EOFError, MkvError) as e:
+        batch.meta["error"] = f"내장 자막 추출 실패: {e}"
+        return
+
+    if not len(batch):
+        batch.meta["error"] = "내장 텍스트 자막 트랙이 없습니다"
+
+
+def _detect_batch_language(batch: CueBatch, known_lang: Optional[str], tag_lines: bool) -> None:
+    """
+    CueBatch의 파일 언어 판별 및 다국어 파일의 줄 단위 언어 태깅
+
+    Args:
+        batch: 파싱된 자막 큐 묶음 (meta에 lang, lang_confidence, multi_language 기록)
+        known_lang: 저장된 단일 언어 (있으면 표본 판별 생략)
+        tag_lines: 다국어 파일의 줄 단위 언어 태깅 여부
+    """
+    texts = batch.texts
+    untagged = [i for i, lang in enumerate(batch.langs) if lang is None]
+
+    meta = batch.meta
+    cached = None if known_lang else get_cached_language(meta["path"], meta["size"], meta["mtime"])
+
+    if known_lang:
+        result = {"lang": known_lang, "confidence": 1.0, "multi_language": False}
+    elif cached is not None:
+        result = dict(cached)
+    else:
+        result = detect_language([texts[i] for i in untagged])
+
+        # SMI처럼 모든 큐에 언어가 지정된 파일
+        if result["lang"] is None and batch.langs:
+            tagged = [lang for lang in batch.langs if lang]
+            result["lang"] = max(set(tagged), key=tagged.count) if tagged else None
+            result["multi_language"] = len(set(tagged)) > 1
+
+        # 같은 파일 지문을 다시 파싱하면 표본 판별을 건너뛰도록 결과 저장
+        cache_language(meta["path"], meta["size"], meta["mtime"], dict(result))
+
+    if result["multi_language"] and tag_lines:
+        for i in untagged:
+            batch.langs[i] = classify_line(texts[i])
+
+    batch.meta["lang"] = result["lang"]
+    batch.meta["lang_confidence"] = result.get("confidence", 0.0)
+    batch.meta["multi_language"] = result["multi_language"] or len(set(filter(None, batch.langs))) > 1
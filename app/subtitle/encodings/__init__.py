@@ -0,0 +1,21 @@
+"""
+자막 인코딩 패키지
+
+자막 파일 바이트를 메모리에서 한 번에 디코딩하고, UTF-8로 변환하는 기능을 제공합니다.
+"""
+
+from app.subtitle.encodings.detector import (
+    read_subtitle_bytes,
+    decode_subtitle_bytes,
+    score_decoded_text
+)
+from app.subtitle.encodings.converter import (
+    convert_subtitle_encoding,
+    get_output_path,
+    write_file_atomic
+)
+
+__all__ = [
+    'read_subtitle_bytes', 'decode_subtitle_bytes', 'score_decoded_text',
+    'convert_subtitle_encoding', 'get_output_path', 'write_file_atomic',
+]
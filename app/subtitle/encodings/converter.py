@@ -0,0 +1,149 @@
+"""
+자막 인코딩 변환 모듈
+
+자막 파일을 UTF-8로 변환합니다. 임시 파일에 쓴 뒤 os.replace로 교체하므로
+변환 중 중단되어도 원본이 깨지지 않습니다. 데이터베이스에 접근하지 않으므로
+별도 프로세스에서 실행할 수 있습니다.
+"""
+
+import os
+import stat
+import tempfile
+from typing import Any, Dict, Optional
+
+from app.subtitle.encodings.detector import decode_subtitle_bytes
+
+# 변환 결과 상태
+STATUS_CONVERTED = 'converted'
+STATUS_SKIPPED = 'skipped'
+STATUS_BROKEN = 'broken'
+STATUS_FAILED = 'failed'
+
+
+def get_output_path(subtitle_path: str, overwrite: bool = True, output_suffix: str = '_utf8') -> str:
+    """
+    변환 결과를 저장할 경로 계산
+
+    Args:
+        subtitle_path: 원본 자막 파일 경로
+        overwrite: 원본 덮어쓰기 여부
+        output_suffix: 덮어쓰지 않을 때 파일명 뒤에 붙일 접미사
+
+    Returns:
+        str: 저장 경로
+    """
+    if overwrite:
+        return subtitle_path
+    base, ext = os.path.splitext(subtitle_path)
+    return f"{base}{output_suffix}{ext}"
+
+
+def write_file_atomic(path: str, data: bytes, mode: Optional[int] = None) -> None:
+    """
+    같은 디렉토리의 임시 파일에 쓴 뒤 이름을 바꿔 원자적으로 저장
+
+    Args:
+        path: 저장 경로
+        data: 저장할 바이트
+        mode: 파일 권한 (None이면 기본값)
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+
+    try:
+        with os.fdopen(fd, 'wb') as temp_file:
+            temp_file.write(data)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+
+        if mode is not None:
+            os.chmod(temp_path, mode)
+
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def convert_subtitle_encoding(subtitle_path: str, overwrite: bool = True,
+                              output_suffix: str = '_utf8', convert_broken: bool = True,
+                              known_encoding: Optional[str] = None) -> Dict[str, Any]:
+    """
+    자막 파일을 UTF-8(BOM 없음)로 변환
+
+    이미 UTF-8인 파일은 쓰지 않고 건너뜁니다.
+
+    Args:
+        subtitle_path: 자막 파일 경로
+        overwrite: 원본 덮어쓰기 여부 (False면 output_suffix를 붙인 파일로 저장)
+        output_suffix: 덮어쓰지 않을 때 파일명 접미사
+        convert_broken: 깨진 문자가 있어도 변환할지 여부
+        known_encoding: 저장된 인코딩 (없으면 None)
+
+    Returns:
+        Dict[str, Any]: path, output_path, status, encoding, encoding_score, size, mtime, error
+    """
+    result = {
+        "path": subtitle_path,
+        "output_path": None,
+        "status": STATUS_FAILED,
+        "encoding": None,
+        "encoding_score": 0.0,
+        "size": None,
+        "mtime": None,
+        "error": None
+    }
+
+    try:
+        with open(subtitle_path, 'rb') as file:
+            file_stat = os.fstat(file.fileno())
+            raw = file.read()
+    except OSError as e:
+        result["error"] = str(e)
+        return result
+
+    result["size"] = file_stat.st_size
+    result["mtime"] = file_stat.st_mtime
+
+    # 이미 UTF-8(BOM 없음)이면 쓰기 생략
+    if raw.isascii():
+        result.update(status=STATUS_SKIPPED, encoding='utf-8')
+        return result
+
+    text, encoding, encoding_score = decode_subtitle_bytes(raw, known_encoding)
+    result["encoding"] = encoding
+    result["encoding_score"] = encoding_score
+
+    if encoding == 'utf-8':
+        result["status"] = STATUS_SKIPPED
+        return result
+
+    if encoding_score > 0 and not convert_broken:
+        result["status"] = STATUS_BROKEN
+        return result
+
+    output_path = get_output_path(subtitle_path, overwrite, output_suffix)
+
+    try:
+        write_file_atomic(output_path, text.encode('utf-8'), stat.S_IMODE(file_stat.st_mode))
+        output_stat = os.stat(output_path)
+    except OSError as e:
+        result["error"] = str(e)
+        return result
+
+    result.update(
+        output_path=output_path,
+        status=STATUS_BROKEN if encoding_score > 0 else STATUS_CONVERTED,
+        size=output_stat.st_size,
+        mtime=output_stat.st_mtime
+    )
+
+    # 별도 파일로 저장한 경우 원본 정보 유지
+    if output_path != subtitle_path:
+        result["size"] = file_stat.st_size
+        result["mtime"] = file_stat.st_mtime
+
+    return result
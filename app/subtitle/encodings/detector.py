@@ -0,0 +1,153 @@
+"""
+자막 인코딩 판별 모듈
+
+자막 파일을 한 번만 읽어 메모리의 바이트에서 인코딩을 결정합니다.
+BOM → 저장된 인코딩 → UTF-8 순으로 빠른 경로를 먼저 시도하고,
+실패하면 후보 인코딩을 순서대로 디코딩하여 깨진 문자 비율로 가장 좋은 결과를 고릅니다.
+"""
+
+import codecs
+from typing import List, Optional, Tuple
+
+# BOM 목록 (UTF-32 LE BOM이 UTF-16 LE BOM으로 시작하므로 UTF-32를 먼저 확인)
+BOM_ENCODINGS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# UTF-8 디코딩 실패 시 시도할 후보 인코딩 (한국어 → 서양어 순)
+FALLBACK_ENCODINGS = ['cp949', 'euc-kr', 'cp1252', 'latin-1']
+
+# chardet에 넘길 샘플 크기
+DETECT_SAMPLE_SIZE = 4096
+
+# 디코딩 결과에서 깨진 문자로 취급할 C1 제어 문자 범위
+_C1_CONTROLS = frozenset(chr(c) for c in range(0x80, 0xA0))
+
+
+def read_subtitle_bytes(file_path: str) -> bytes:
+    """
+    자막 파일 전체를 한 번에 읽기
+
+    Args:
+        file_path: 자막 파일 경로
+
+    Returns:
+        bytes: 파일 내용
+    """
+    with open(file_path, 'rb') as file:
+        return file.read()
+
+
+def score_decoded_text(text: str) -> float:
+    """
+    디코딩된 텍스트의 깨짐 정도 계산
+
+    대체 문자(U+FFFD)와 C1 제어 문자의 비율을 반환합니다. 0이면 깨진 문자가 없습니다.
+
+    Args:
+        text: 디코딩된 텍스트
+
+    Returns:
+        float: 깨진 문자 비율 (0.0 ~ 1.0)
+    """
+    if not text:
+        return 0.0
+
+    if text.isascii():
+        return 0.0
+
+    broken = text.count('�')
+
+    # latin-1 계열은 절대 실패하지 않으므로 C1 제어 문자도 깨짐으로 계산
+    broken += sum(1 for ch in text if ch in _C1_CONTROLS)
+
+    return broken / len(text)
+
+
+def _detect_candidate(raw: bytes) -> Optional[str]:
+    """chardet로 후보 인코딩 하나를 추정 (라이브러리가 없으면 None)"""
+    try:
+        import chardet
+    except ImportError:
+        return None
+
+    result = chardet.detect(raw[:DETECT_SAMPLE_SIZE])
+    encoding = result.get('encoding')
+    return encoding.lower() if encoding else None
+
+
+def _candidate_encodings(raw: bytes) -> List[str]:
+    """디코딩 캐스케이드에서 시도할 인코딩 목록 (중복 제거)"""
+    candidates = []
+
+    detected = _detect_candidate(raw)
+    if detected and detected not in ('ascii', 'utf-8'):
+        candidates.append(detected)
+
+    candidates.extend(FALLBACK_ENCODINGS)
+    return list(dict.fromkeys(candidates))
+
+
+def decode_subtitle_bytes(raw: bytes, known_encoding: Optional[str] = None) -> Tuple[str, str, float]:
+    """
+    메모리의 자막 바이트를 디코딩
+
+    1. BOM이 있으면 해당 인코딩으로 디코딩
+    2. 이전에 저장된 인코딩이 있으면 그대로 시도 (감지 생략)
+    3. UTF-8 strict 디코딩 시도
+    4. 후보 인코딩을 errors='replace'로 디코딩하여 깨진 문자 비율이 가장 낮은 결과 선택
+
+    Args:
+        raw: 자막 파일 바이트
+        known_encoding: subtitle_files 테이블에 저장된 인코딩 (없으면 None)
+
+    Returns:
+        Tuple[str, str, float]: (디코딩된 텍스트, 사용된 인코딩, 깨진 문자 비율)
+    """
+    if not raw:
+        return '', 'utf-8', 0.0
+
+    # 1. BOM 빠른 경로
+    for bom, encoding in BOM_ENCODINGS:
+        if raw.startswith(bom):
+            text = raw.decode(encoding, errors='replace')
+            return text, encoding, score_decoded_text(text)
+
+    # 2. 저장된 인코딩 빠른 경로
+    if known_encoding:
+        try:
+            return raw.decode(known_encoding), known_encoding, 0.0
+        except (UnicodeDecodeError, LookupError):
+            pass
+
+    # 3. UTF-8 빠른 경로
+    try:
+        return raw.decode('utf-8'), 'utf-8', 0.0
+    except UnicodeDecodeError:
+        pass
+
+    # 4. 디코딩 캐스케이드
+    best_text, best_encoding, best_score = None, 'utf-8', 1.0
+
+    for encoding in _candidate_encodings(raw):
+        try:
+            text = raw.decode(encoding, errors='replace')
+        except LookupError:
+            continue
+
+        score = score_decoded_text(text)
+        if score == 0.0:
+            return text, encoding, score
+
+        if best_text is None or score < best_score:
+            best_text, best_encoding, best_score = text, encoding, score
+
+    if best_text is None:
+        best_text = raw.decode('utf-8', errors='replace')
+        best_score = score_decoded_text(best_text)
+
+    return best_text, best_encoding, best_score
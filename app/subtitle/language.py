@@ -0,0 +1,202 @@
+"""
+자막 언어 판별 모듈
+
+문자 종류(한글, 가나, 한자, 라틴 문자) 비율로 줄 단위 언어를 판별하는 가벼운 분류기와,
+파일 전체에서 제한된 수의 큐만 표본 추출하여 언어를 판별하는 기능을 제공합니다.
+판별 결과는 파일 지문(경로, 크기, 수정 시간)별로 캐시합니다.
+"""
+
+import os
+import random
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+# 표본 추출 설정
+MAX_SAMPLE_CUES = 200         # 파일당 최대 표본 큐 수
+MIN_SAMPLE_CUES = 20          # 조기 종료 전에 확인할 최소 큐 수
+CONFIDENCE_THRESHOLD = 0.9    # 조기 종료 기준 (최다 언어 비율)
+MIXED_LANGUAGE_RATIO = 0.2    # 두 번째 언어가 이 비율 이상이면 다국어 파일로 판단
+
+# 캐시 크기 (파일 지문 기준)
+_CACHE_SIZE = 4096
+_language_cache: "OrderedDict[Tuple[str, int, float], Dict[str, Any]]" = OrderedDict()
+
+
+def classify_line(text: str) -> Optional[str]:
+    """
+    문자 종류 비율로 한 줄의 언어 판별
+
+    Args:
+        text: 자막 텍스트
+
+    Returns:
+        Optional[str]: 언어 코드 ('en', 'ko', 'ja', 'zh') 또는 None (글자가 없는 경우)
+    """
+    hangul = kana = han = latin = 0
+
+    for ch in text:
+        if ch < '\u0080':
+            if ch.isalpha():
+                latin += 1
+            continue
+
+        code = ord(ch)
+        if 0xAC00 <= code <= 0xD7A3 or 0x1100 <= code <= 0x11FF or 0x3130 <= code <= 0x318F:
+            hangul += 1
+        elif 0x3040 <= code <= 0x30FF:
+            kana += 1
+        elif 0x4E00 <= code <= 0x9FFF:
+            han += 1
+        elif ch.isalpha():
+            latin += 1
+
+    # 한글/가나는 한 글자가 라틴 문자 여러 개에 해당하므로 가중치 적용
+    scores = {'ko': hangul * 3, 'ja': kana * 3, 'zh': han * 3, 'en': latin}
+
+    # 가나가 섞인 한자는 일본어로 취급
+    if kana and han:
+        scores['ja'] += scores.pop('zh')
+
+    lang, score = max(scores.items(), key=lambda item: item[1])
+    return lang if score else None
+
+
+def detect_language(texts: Sequence[str],
+                    max_samples: int = MAX_SAMPLE_CUES,
+                    min_samples: int = MIN_SAMPLE_CUES) -> Dict[str, Any]:
+    """
+    자막 텍스트 목록에서 표본을 추출하여 언어 판별
+
+    파일 앞뒤의 제작 정보에 치우치지 않도록 전체 구간에서 무작위 순서로 표본을 추출하며
+    (같은 입력이면 같은 순서), 최소 표본 수 이상에서 한 언어의 비율이 기준을 넘으면 즉시 종료합니다.
+
+    Args:
+        texts: 자막 텍스트 목록
+        max_samples: 최대 표본 큐 수
+        min_samples: 조기 종료 전에 확인할 최소 큐 수
+
+    Returns:
+        Dict[str, Any]: lang(언어 코드), confidence(최다 언어 비율),
+                        multi_language(다국어 여부), sampled(확인한 큐 수)
+    """
+    total = len(texts)
+    indices = random.Random(total).sample(range(total), min(total, max_samples * 2))
+    counts: Counter = Counter()
+    sampled = 0
+
+    for index in indices:
+        lang = classify_line(texts[index])
+        if lang is None:
+            continue
+
+        counts[lang] += 1
+        sampled += 1
+
+        if sampled >= max_samples:
+            break
+
+        if sampled >= min_samples:
+            top_count = counts.most_common(1)[0][1]
+            if top_count / sampled >= CONFIDENCE_THRESHOLD:
+                break
+
+    if not sampled:
+        return {"lang": None, "confidence": 0.0, "multi_language": False, "sampled": 0}
+
+    ranked = counts.most_common(2)
+    lang, top_count = ranked[0]
+    second_count = ranked[1][1] if len(ranked) > 1 else 0
+
+    return {
+        "lang": lang,
+        "confidence": top_count / sampled,
+        "multi_language": second_count / sampled >= MIXED_LANGUAGE_RATIO,
+        "sampled": sampled
+    }
+
+
+def get_cached_language(subtitle_path: str, size: int, mtime: float) -> Optional[Dict[str, Any]]:
+    """
+    파일 지문으로 캐시된 언어 판별 결과 조회
+
+    Args:
+        subtitle_path: 자막 파일 경로
+        size: 파일 크기 (바이트)
+        mtime: 파일 수정 시간 (epoch 초)
+
+    Returns:
+        Optional[Dict[str, Any]]: 캐시된 결과 또는 None
+    """
+    key = (subtitle_path, size, mtime)
+    result = _language_cache.get(key)
+    if result is not None:
+        _language_cache.move_to_end(key)
+    return result
+
+
+def cache_language(subtitle_path: str, size: int, mtime: float, result: Dict[str, Any]) -> None:
+    """
+    언어 판별 결과를 파일 지문 기준으로 캐시
+
+    Args:
+        subtitle_path: 자막 파일 경로
+        size: 파일 크기 (바이트)
+        mtime: 파일 수정 시간 (epoch 초)
+        result: detect_language 반환값
+    """
+    _language_cache[(subtitle_path, size, mtime)] = result
+    _language_cache.move_to_end((subtitle_path, size, mtime))
+
+    while len(_language_cache) > _CACHE_SIZE:
+        _language_cache.popitem(last=False)
+
+
+def detect_subtitle_file_language(subtitle_path: str, known_encoding: Optional[str] = None) -> Dict[str, Any]:
+    """
+    자막 파일의 언어 판별 (파일 지문별 캐시 사용)
+
+    Args:
+        subtitle_path: 자막 파일 경로
+        known_encoding: 저장된 인코딩 (없으면 None)
+
+    Returns:
+        Dict[str, Any]: detect_language 반환값 (파일을 읽을 수 없으면 lang이 None)
+    """
+    from app.subtitle.encodings import decode_subtitle_bytes
+    from app.subtitle.parsers import iter_cues
+
+    try:
+        with open(subtitle_path, 'rb') as file:
+            file_stat = os.fstat(file.fileno())
+
+            cached = get_cached_language(subtitle_path, file_stat.st_size, file_stat.st_mtime)
+            if cached is not None:
+                return cached
+
+            raw = file.read()
+    except OSError:
+        return {"lang": None, "confidence": 0.0, "multi_language": False, "sampled": 0}
+
+    text = decode_subtitle_bytes(raw, known_encoding)[0]
+
+    # 언어 정보가 있는 큐(SMI 등)는 그대로 집계
+    texts = []
+    tagged = Counter()
+    for cue in iter_cues(text, subtitle_path):
+        if cue.lang:
+            tagged[cue.lang] += 1
+        else:
+            texts.append(cue.text)
+
+    result = detect_language(texts)
+    if tagged and not texts:
+        lang, top_count = tagged.most_common(1)[0]
+        result = {
+            "lang": lang,
+            "confidence": top_count / sum(tagged.values()),
+            "multi_language": len(tagged) > 1,
+            "sampled": sum(tagged.values())
+        }
+
+    cache_language(subtitle_path, file_stat.st_size, file_stat.st_mtime, result)
+    return result
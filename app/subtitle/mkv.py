@@ -0,0 +1,563 @@
+"""
+MKV 내장 자막 추출 모듈
+
+ffmpeg 없이 EBML 구조를 직접 읽어 Matroska(MKV) 파일의 텍스트 자막 트랙을 추출합니다.
+SeekHead로 Tracks/Cues 위치를 찾고, Cues에 기록된 자막 블록 위치로만 이동하여 읽으므로
+영상 데이터는 읽지 않습니다. Cues에 자막 위치가 없으면 클러스터 헤더만 훑는 제한된 스캔을 사용합니다.
+"""
+
+import io
+import os
+import struct
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from app.subtitle.parsers.base import Cue, clean_cue_text
+from app.subtitle.parsers.ass import _clean_ass_text
+
+# EBML 요소 ID
+EBML_HEADER = 0x1A45DFA3
+SEGMENT = 0x18538067
+SEEK_HEAD = 0x114D9B74
+SEEK = 0x4DBB
+SEEK_ID = 0x53AB
+SEEK_POSITION = 0x53AC
+INFO = 0x1549A966
+TIMECODE_SCALE = 0x2AD7B1
+TRACKS = 0x1654AE6B
+TRACK_ENTRY = 0xAE
+TRACK_NUMBER = 0xD7
+TRACK_TYPE = 0x83
+CODEC_ID = 0x86
+LANGUAGE = 0x22B59C
+LANGUAGE_IETF = 0x22B59D
+TRACK_NAME = 0x536E
+CUES = 0x1C53BB6B
+CUE_POINT = 0xBB
+CUE_TRACK_POSITIONS = 0xB7
+CUE_TRACK = 0xF7
+CUE_CLUSTER_POSITION = 0xF1
+CUE_RELATIVE_POSITION = 0xF0
+CLUSTER = 0x1F43B675
+CLUSTER_TIMECODE = 0xE7
+SIMPLE_BLOCK = 0xA3
+BLOCK_GROUP = 0xA0
+BLOCK = 0xA1
+BLOCK_DURATION = 0x9B
+
+# 세그먼트 최상위 요소 (크기를 모르는 클러스터의 끝 판별용)
+TOP_LEVEL_IDS = {SEEK_HEAD, INFO, TRACKS, CUES, CLUSTER, 0x1043A770, 0x1254C367, 0x1941A469}
+
+SUBTITLE_TRACK_TYPE = 0x11
+
+# 내장 자막을 읽을 수 있는 컨테이너 확장자
+EMBEDDED_SUBTITLE_EXTENSIONS = ('.mkv', '.webm')
+
+# 지원하는 텍스트 자막 코덱
+TEXT_CODECS = ('S_TEXT/UTF8', 'S_TEXT/ASS', 'S_TEXT/SSA', 'S_TEXT/WEBVTT')
+
+# ISO 639-2 → 639-1 (자주 쓰는 언어만)
+LANGUAGE_CODES = {
+    'eng': 'en', 'kor': 'ko', 'jpn': 'ja', 'chi': 'zh', 'zho': 'zh',
+    'fre': 'fr', 'fra': 'fr', 'ger': 'de', 'deu': 'de', 'spa': 'es',
+}
+
+# 크기를 알 수 없는 요소 (라이브 스트림 등)
+UNKNOWN_SIZE = -1
+
+# 제한 설정
+MAX_ELEMENT_READ = 16 * 1024 * 1024   # 한 번에 메모리로 읽을 최대 요소 크기
+MAX_CLUSTER_SCAN = 50000              # Cues가 없을 때 훑을 최대 클러스터 수
+DEFAULT_CUE_DURATION_MS = 3000        # 블록 길이가 없을 때 사용할 큐 길이
+
+
+class MkvError(Exception):
+    """MKV 구조 오류"""
+
+
+def _read_vint(f: BinaryIO, keep_marker: bool) -> Tuple[int, int]:
+    """
+    EBML 가변 길이 정수 읽기
+
+    Args:
+        f: 파일 객체
+        keep_marker: True면 요소 ID처럼 길이 표시 비트를 유지
+
+    Returns:
+        Tuple[int, int]: (값, 읽은 바이트 수) - 크기 값이 모두 1이면 UNKNOWN_SIZE
+    """
+    first = f.read(1)
+    if not first:
+        raise EOFError
+
+    byte = first[0]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not byte & mask:
+        mask >>= 1
+        length += 1
+
+    if length > 8:
+        raise MkvError("잘못된 EBML 정수")
+
+    rest = f.read(length - 1)
+    if len(rest) != length - 1:
+        raise EOFError
+
+    value = byte if keep_marker else byte & (mask - 1)
+    all_ones = (byte & (mask - 1)) == mask - 1
+    for b in rest:
+        value = (value << 8) | b
+        all_ones = all_ones and b == 0xFF
+
+    if not keep_marker and all_ones:
+        return UNKNOWN_SIZE, length
+    return value, length
+
+
+def _read_unsigned(data: bytes) -> int:
+    """빅엔디언 부호 없는 정수"""
+    return int.from_bytes(data, 'big') if data else 0
+
+
+def _normalize_language(code: Optional[str]) -> Optional[str]:
+    """트랙 언어 코드를 2자리 코드로 변환 ('und'는 None)"""
+    if not code or code == 'und':
+        return None
+    code = code.split('-')[0].lower()
+    return LANGUAGE_CODES.get(code, code if len(code) == 2 else None)
+
+
+class MkvSubtitleReader:
+    """MKV 텍스트 자막 트랙 읽기 클래스"""
+
+    def __init__(self, f: BinaryIO):
+        """
+        MKV 자막 읽기 초기화 (EBML 헤더, SeekHead, Info, Tracks 파싱)
+
+        Args:
+            f: 바이너리 모드로 연 MKV 파일 객체
+        """
+        self.f = f
+        self.file_size = os.fstat(f.fileno()).st_size
+        self.segment_start = 0
+        self.segment_end = self.file_size
+        self.timecode_scale = 1000000
+        self.positions: Dict[int, int] = {}
+        self.tracks: Dict[int, Dict[str, Optional[str]]] = {}
+        self.seeks = 0
+
+        self._read_layout()
+
+    # ----- 요소 단위 읽기 -----
+
+    def _seek(self, offset: int) -> None:
+        """위치 이동 (이동 횟수 집계)"""
+        self.f.seek(offset)
+        self.seeks += 1
+
+    def _read_header(self) -> Tuple[int, int, int]:
+        """현재 위치의 요소 헤더 읽기 → (요소 ID, 데이터 시작 위치, 데이터 크기)"""
+        element_id, _ = _read_vint(self.f, keep_marker=True)
+        size, _ = _read_vint(self.f, keep_marker=False)
+        return element_id, self.f.tell(), size
+
+    def _read_data(self, size: int) -> bytes:
+        """요소 데이터 읽기 (크기 제한)"""
+        if size == UNKNOWN_SIZE or size > MAX_ELEMENT_READ:
+            raise MkvError(f"요소가 너무 큽니다: {size}")
+        data = self.f.read(size)
+        if len(data) != size:
+            raise EOFError
+        return data
+
+    def _iter_children(self, start: int, end: int) -> Iterator[Tuple[int, int, int]]:
+        """
+        자식 요소 헤더 순회 (데이터는 읽지 않고 다음 요소로 이동)
+
+        크기를 모르는 부모(end=None)는 최상위 요소 ID를 만나면 종료합니다.
+        손상된 크기 값으로 파일 밖을 가리키는 자식은 읽지 않습니다 (Segment 끝에서 멈춤).
+        """
+        offset = start
+        limit = self.segment_end if end is None else min(end, self.segment_end)
+
+        while offset < limit:
+            self.f.seek(offset)
+            try:
+                element_id, data_start, size = self._read_header()
+            except EOFError:
+                return
+
+            if end is None and element_id in TOP_LEVEL_IDS:
+                return
+
+            yield element_id, data_start, size
+
+            if size == UNKNOWN_SIZE:
+                return
+            offset = data_start + size
+
+    def _read_children(self, data: bytes) -> Iterator[Tuple[int, bytes]]:
+        """메모리에 읽은 마스터 요소의 자식 순회 → (요소 ID, 데이터)"""
+        buffer = io.BytesIO(data)
+        while buffer.tell() < len(data):
+            try:
+                element_id, _ = _read_vint(buffer, keep_marker=True)
+                size, _ = _read_vint(buffer, keep_marker=False)
+            except EOFError:
+                return
+            if size == UNKNOWN_SIZE:
+                return
+            yield element_id, buffer.read(size)
+
+    # ----- 구조 파싱 -----
+
+    def _read_layout(self) -> None:
+        """EBML 헤더와 Segment를 찾고 SeekHead, Info, Tracks 파싱"""
+        self._seek(0)
+        element_id, data_start, size = self._read_header()
+        if element_id != EBML_HEADER:
+            raise MkvError("EBML 파일이 아닙니다")
+
+        self._seek(data_start + size)
+        element_id, data_start, size = self._read_header()
+        if element_id != SEGMENT:
+            raise MkvError("Segment 요소를 찾을 수 없습니다")
+
+        self.segment_start = data_start
+        if size != UNKNOWN_SIZE:
+            self.segment_end = min(self.file_size, data_start + size)
+
+        # 첫 클러스터 전까지의 최상위 요소 위치 기록 (SeekHead가 없는 파일 대비)
+        offset = self.segment_start
+        while offset < self.segment_end:
+            try:
+                element_id, data_start, size = self._read_header_at(offset)
+            except EOFError:
+                break
+
+            self.positions.setdefault(element_id, offset)
+            if element_id == CLUSTER or size == UNKNOWN_SIZE:
+                break
+            if element_id == SEEK_HEAD:
+                self._read_seek_head(data_start, size)
+            offset = data_start + size
+
+        if INFO in self.positions:
+            self._read_info()
+        if TRACKS not in self.positions:
+            raise MkvError("Tracks 요소를 찾을 수 없습니다")
+        self._read_tracks()
+
+    def _read_header_at(self, offset: int) -> Tuple[int, int, int]:
+        """지정 위치로 이동하여 요소 헤더 읽기"""
+        self._seek(offset)
+        return self._read_header()
+
+    def _read_seek_head(self, data_start: int, size: int, depth: int = 0) -> None:
+        """SeekHead에서 최상위 요소 위치 읽기 (다른 SeekHead를 가리키면 한 단계 더 읽음)"""
+        self.f.seek(data_start)
+        linked_heads = []
+        for element_id, data in self._read_children(self._read_data(size)):
+            if element_id != SEEK:
+                continue
+
+            seek_id = None
+            position = None
+            for child_id, child_data in self._read_children(data):
+                if child_id == SEEK_ID:
+                    seek_id = _read_unsigned(child_data)
+                elif child_id == SEEK_POSITION:
+                    position = _read_unsigned(child_data)
+
+            if seek_id is None or position is None:
+                continue
+
+            if seek_id == SEEK_HEAD:
+                linked_heads.append(self.segment_start + position)
+            else:
+                self.positions[seek_id] = self.segment_start + position
+
+        for offset in linked_heads:
+            if depth > 0 or offset == data_start:
+                continue
+            found_id, head_start, head_size = self._read_header_at(offset)
+            if found_id == SEEK_HEAD and head_start != data_start:
+                self._read_seek_head(head_start, head_size, depth + 1)
+
+    def _read_top_level(self, element_id: int) -> Optional[Tuple[int, int]]:
+        """기록된 최상위 요소 위치로 이동하여 (데이터 시작, 크기) 반환"""
+        offset = self.positions.get(element_id)
+        if offset is None:
+            return None
+
+        found_id, data_start, size = self._read_header_at(offset)
+        if found_id != element_id:
+            return None
+        return data_start, size
+
+    def _read_info(self) -> None:
+        """Info에서 TimecodeScale 읽기"""
+        location = self._read_top_level(INFO)
+        if not location:
+            return
+
+        data_start, size = location
+        self.f.seek(data_start)
+        for element_id, data in self._read_children(self._read_data(size)):
+            if element_id == TIMECODE_SCALE:
+                self.timecode_scale = _read_unsigned(data) or self.timecode_scale
+
+    def _read_tracks(self) -> None:
+        """Tracks에서 텍스트 자막 트랙 정보 읽기"""
+        location = self._read_top_level(TRACKS)
+        if not location:
+            raise MkvError("Tracks 요소를 읽을 수 없습니다")
+
+        data_start, size = location
+        self.f.seek(data_start)
+        for element_id, data in self._read_children(self._read_data(size)):
+            if element_id != TRACK_ENTRY:
+                continue
+
+            entry = {"number": None, "type": None, "codec": None, "language": 'eng', "name": None}
+            for child_id, child_data in self._read_children(data):
+                if child_id == TRACK_NUMBER:
+                    entry["number"] = _read_unsigned(child_data)
+                elif child_id == TRACK_TYPE:
+                    entry["type"] = _read_unsigned(child_data)
+                elif child_id == CODEC_ID:
+                    entry["codec"] = child_data.decode('ascii', errors='ignore').rstrip('\x00')
+                elif child_id == LANGUAGE:
+                    entry["language"] = child_data.decode('ascii', errors='ignore').rstrip('\x00')
+                elif child_id == LANGUAGE_IETF:
+                    entry["language"] = child_data.decode('ascii', errors='ignore').rstrip('\x00')
+                elif child_id == TRACK_NAME:
+                    entry["name"] = child_data.decode('utf-8', errors='replace')
+
+            if entry["type"] == SUBTITLE_TRACK_TYPE and entry["codec"] in TEXT_CODECS:
+                self.tracks[entry["number"]] = {
+                    "codec": entry["codec"],
+                    "lang": _normalize_language(entry["language"]),
+                    "name": entry["name"]
+                }
+
+    def _read_cue_positions(self) -> List[Tuple[int, Optional[int]]]:
+        """
+        Cues에서 자막 트랙 블록 위치 읽기 (Cues가 MAX_ELEMENT_READ보다 크면 사용하지 않음)
+
+        Returns:
+            List[Tuple[int, Optional[int]]]: (클러스터 위치, 클러스터 내 상대 위치) 목록 (정렬됨)
+        """
+        location = self._read_top_level(CUES)
+        if not location:
+            return []
+
+        data_start, size = location
+        if size == UNKNOWN_SIZE or size > MAX_ELEMENT_READ:
+            return []
+
+        self.f.seek(data_start)
+        positions = set()
+
+        for element_id, point in self._read_children(self._read_data(size)):
+            if element_id != CUE_POINT:
+                continue
+
+            for child_id, child_data in self._read_children(point):
+                if child_id != CUE_TRACK_POSITIONS:
+                    continue
+
+                track = cluster = relative = None
+                for field_id, field_data in self._read_children(child_data):
+                    if field_id == CUE_TRACK:
+                        track = _read_unsigned(field_data)
+                    elif field_id == CUE_CLUSTER_POSITION:
+                        cluster = _read_unsigned(field_data)
+                    elif field_id == CUE_RELATIVE_POSITION:
+                        relative = _read_unsigned(field_data)
+
+                if track in self.tracks and cluster is not None:
+                    positions.add((self.segment_start + cluster, relative))
+
+        return sorted(positions, key=lambda item: (item[0], item[1] or 0))
+
+    # ----- 블록 읽기 -----
+
+    def _parse_block(self, data: bytes, cluster_timecode: int,
+                     duration: Optional[int]) -> Optional[Cue]:
+        """Block/SimpleBlock 데이터를 Cue로 변환 (자막 트랙이 아니면 None)"""
+        buffer = io.BytesIO(data)
+        track_number, length = _read_vint(buffer, keep_marker=False)
+        track = self.tracks.get(track_number)
+        if not track:
+            return None
+
+        # 잘린 블록은 struct.error 대신 MkvError로 처리
+        if len(data) < length + 3:
+            raise MkvError("블록 헤더가 잘렸습니다")
+        relative_timecode, flags = struct.unpack('>hB', data[length:length + 3])
+        payload = data[length + 3:]
+
+        # 자막 트랙은 레이싱을 사용하지 않음
+        if flags & 0x06:
+            return None
+
+        scale_ms = self.timecode_scale / 1000000
+        start_ms = int((cluster_timecode + relative_timecode) * scale_ms)
+        end_ms = start_ms + (int(duration * scale_ms) if duration else DEFAULT_CUE_DURATION_MS)
+
+        text = payload.decode('utf-8', errors='replace').rstrip('\x00')
+        if track["codec"] in ('S_TEXT/ASS', 'S_TEXT/SSA'):
+            # ReadOrder, Layer, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+            text = _clean_ass_text(text.split(',', 8)[-1])
+        else:
+            text = clean_cue_text(text)
+
+        if not text:
+            return None
+        return Cue(start_ms, end_ms, text, track["lang"])
+
+    def _read_block_element(self, element_id: int, data_start: int, size: int,
+                            cluster_timecode: int) -> Optional[Cue]:
+        """SimpleBlock 또는 BlockGroup 요소를 읽어 Cue로 변환"""
+        if element_id == SIMPLE_BLOCK:
+            # 트랙 번호만 먼저 확인하여 영상/음성 블록은 읽지 않음
+            self.f.seek(data_start)
+            track_number, _ = _read_vint(self.f, keep_marker=False)
+            if track_number not in self.tracks:
+                return None
+            self.f.seek(data_start)
+            return self._parse_block(self._read_data(size), cluster_timecode, None)
+
+        if element_id == BLOCK_GROUP:
+            block = None
+            duration = None
+            for child_id, child_start, child_size in self._iter_children(data_start, data_start + size):
+                if child_id == BLOCK:
+                    self.f.seek(child_start)
+                    track_number, _ = _read_vint(self.f, keep_marker=False)
+                    if track_number not in self.tracks:
+                        return None
+                    self.f.seek(child_start)
+                    block = self._read_data(child_size)
+                elif child_id == BLOCK_DURATION:
+                    self.f.seek(child_start)
+                    duration = _read_unsigned(self._read_data(child_size))
+            if block is not None:
+                return self._parse_block(block, cluster_timecode, duration)
+
+        return None
+
+    def _read_cluster_timecode(self, data_start: int, end: Optional[int]) -> int:
+        """클러스터 Timecode 읽기 (보통 첫 번째 자식)"""
+        for element_id, child_start, child_size in self._iter_children(data_start, end):
+            if element_id == CLUSTER_TIMECODE:
+                self.f.seek(child_start)
+                return _read_unsigned(self._read_data(child_size))
+        return 0
+
+    def _scan_cluster(self, data_start: int, size: int) -> Iterator[Cue]:
+        """클러스터의 자식 헤더를 훑으며 자막 블록만 읽기"""
+        end = None if size == UNKNOWN_SIZE else data_start + size
+        cluster_timecode = self._read_cluster_timecode(data_start, end)
+
+        for element_id, child_start, child_size in self._iter_children(data_start, end):
+            if element_id in (SIMPLE_BLOCK, BLOCK_GROUP):
+                cue = self._read_block_element(element_id, child_start, child_size, cluster_timecode)
+                if cue:
+                    yield cue
+
+    def iter_cues(self) -> Iterator[Cue]:
+        """
+        자막 트랙의 큐 순회
+
+        Cues에 자막 블록 위치가 있으면 해당 블록만 읽고, 없으면 클러스터 헤더를 훑습니다.
+
+        Returns:
+            Iterator[Cue]: 트랙 언어가 지정된 자막 큐
+        """
+        if not self.tracks:
+            return
+
+        cue_positions = self._read_cue_positions()
+
+        if cue_positions:
+            cluster_timecodes: Dict[int, int] = {}
+            scanned_clusters = set()
+
+            for cluster_offset, relative in cue_positions:
+                # 손상된 Cues가 파일 밖을 가리키면 건너뜀
+                if cluster_offset >= self.segment_end:
+                    continue
+                found_id, data_start, size = self._read_header_at(cluster_offset)
+                if found_id != CLUSTER:
+                    continue
+
+                if relative is None:
+                    # 상대 위치가 없으면 클러스터 전체를 한 번만 훑음
+                    if cluster_offset not in scanned_clusters:
+                        scanned_clusters.add(cluster_offset)
+                        yield from self._scan_cluster(data_start, size)
+                    continue
+
+                if cluster_offset not in cluster_timecodes:
+                    end = None if size == UNKNOWN_SIZE else data_start + size
+                    cluster_timecodes[cluster_offset] = self._read_cluster_timecode(data_start, end)
+
+                if data_start + relative >= self.segment_end:
+                    continue
+                element_id, block_start, block_size = self._read_header_at(data_start + relative)
+                cue = self._read_block_element(element_id, block_start, block_size,
+                                               cluster_timecodes[cluster_offset])
+                if cue:
+                    yield cue
+            return
+
+        # Cues가 없거나 자막 위치가 없으면 클러스터 헤더만 훑기 (횟수 제한, Segment 끝을 넘는 위치로는 이동하지 않음)
+        offset = self.positions.get(CLUSTER)
+        scanned = 0
+        while offset is not None and offset < self.segment_end and scanned < MAX_CLUSTER_SCAN:
+            try:
+                element_id, data_start, size = self._read_header_at(offset)
+            except EOFError:
+                return
+
+            if element_id == CLUSTER:
+                scanned += 1
+                yield from self._scan_cluster(data_start, size)
+
+            if size == UNKNOWN_SIZE or data_start + size >= self.segment_end:
+                return
+            offset = data_start + size
+
+
+def get_mkv_subtitle_tracks(media_path: str) -> Dict[int, Dict[str, Optional[str]]]:
+    """
+    MKV 파일의 텍스트 자막 트랙 목록 조회
+
+    Args:
+        media_path: MKV 파일 경로
+
+    Returns:
+        Dict[int, Dict[str, Optional[str]]]: 트랙 번호 → codec, lang, name (오류 시 빈 딕셔너리)
+    """
+    try:
+        with open(media_path, 'rb') as f:
+            return MkvSubtitleReader(f).tracks
+    except (OSError, EOFError, MkvError):
+        return {}
+
+
+def iter_mkv_cues(media_path: str) -> Iterator[Cue]:
+    """
+    MKV 파일의 내장 텍스트 자막 큐 순회
+
+    Args:
+        media_path: MKV 파일 경로
+
+    Returns:
+        Iterator[Cue]: 시작 시간 순으로 정렬되지 않은 자막 큐 (트랙 언어 포함)
+    """
+    with open(media_path, 'rb') as f:
+        reader = MkvSubtitleReader(f)
+        yield from reader.iter_cues()
@@ -0,0 +1,63 @@
+"""
+자막 포맷 파서 패키지
+
+SRT, VTT, SMI, ASS 자막을 공통 큐 순회 인터페이스(iter_cues)로 파싱합니다.
+모든 파서는 디코딩된 텍스트를 받아 Cue를 하나씩 생성하며 중간 파일을 만들지 않습니다.
+"""
+
+import os
+from typing import Callable, Dict, Iterator
+
+from app.subtitle.parsers.base import Cue, clean_cue_text, parse_clock
+from app.subtitle.parsers.srt import iter_srt_cues
+from app.subtitle.parsers.vtt import iter_vtt_cues
+from app.subtitle.parsers.smi import iter_smi_cues
+from app.subtitle.parsers.ass import iter_ass_cues
+
+# 확장자별 파서
+CUE_PARSERS: Dict[str, Callable[[str], Iterator[Cue]]] = {
+    '.srt': iter_srt_cues,
+    '.vtt': iter_vtt_cues,
+    '.smi': iter_smi_cues,
+    '.sami': iter_smi_cues,
+    '.ass': iter_ass_cues,
+    '.ssa': iter_ass_cues,
+}
+
+SUPPORTED_SUBTITLE_EXTENSIONS = list(CUE_PARSERS)
+
+
+def get_cue_parser(subtitle_path: str) -> Callable[[str], Iterator[Cue]]:
+    """
+    자막 파일 경로에 맞는 파서 반환
+
+    Args:
+        subtitle_path: 자막 파일 경로
+
+    Returns:
+        Callable: 파서 함수 (알 수 없는 확장자는 SRT 파서)
+    """
+    ext = os.path.splitext(subtitle_path)[1].lower()
+    return CUE_PARSERS.get(ext, iter_srt_cues)
+
+
+def iter_cues(text: str, subtitle_path: str) -> Iterator[Cue]:
+    """
+    자막 텍스트를 포맷에 맞게 파싱하여 큐 순회
+
+    Args:
+        text: 디코딩된 자막 텍스트
+        subtitle_path: 자막 파일 경로 (확장자로 포맷 결정)
+
+    Returns:
+        Iterator[Cue]: 자막 큐
+    """
+    return get_cue_parser(subtitle_path)(text)
+
+
+__all__ = [
+    'Cue', 'clean_cue_text', 'parse_clock',
+    'iter_srt_cues', 'iter_vtt_cues', 'iter_smi_cues', 'iter_ass_cues',
+    'CUE_PARSERS', 'SUPPORTED_SUBTITLE_EXTENSIONS',
+    'get_cue_parser', 'iter_cues',
+]
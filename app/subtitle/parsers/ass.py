@@ -0,0 +1,75 @@
+"""
+ASS/SSA 자막 파서 모듈
+
+[Events] 섹션의 Format 줄로 필드 순서를 정한 뒤 Dialogue 줄을 한 줄씩 파싱합니다.
+"""
+
+import io
+import re
+from typing import Iterator, List
+
+from app.subtitle.parsers.base import Cue, clean_cue_text, parse_clock
+
+# 스타일 오버라이드 블록 ({\i1}, {\pos(10,10)} 등)
+_OVERRIDE_RE = re.compile(r'\{[^}]*\}')
+
+# Format 줄이 없는 파일에 사용할 기본 필드 순서
+_DEFAULT_FIELDS = ['layer', 'start', 'end', 'style', 'name',
+                   'marginl', 'marginr', 'marginv', 'effect', 'text']
+
+
+def _clean_ass_text(text: str) -> str:
+    """ASS 대사 텍스트에서 오버라이드 태그와 줄바꿈 코드 정리"""
+    text = _OVERRIDE_RE.sub('', text)
+    text = text.replace('\\N', '\n').replace('\\n', '\n').replace('\\h', ' ')
+    return clean_cue_text(text)
+
+
+def iter_ass_cues(text: str) -> Iterator[Cue]:
+    """
+    ASS/SSA 자막 큐 순회
+
+    Args:
+        text: 디코딩된 자막 텍스트
+
+    Returns:
+        Iterator[Cue]: 자막 큐
+    """
+    in_events = False
+    fields: List[str] = _DEFAULT_FIELDS
+
+    for line in io.StringIO(text):
+        line = line.strip()
+
+        if line.startswith('['):
+            in_events = line.lower() == '[events]'
+            continue
+
+        if not in_events:
+            continue
+
+        key, _, value = line.partition(':')
+        key = key.strip().lower()
+
+        if key == 'format':
+            fields = [field.strip().lower() for field in value.split(',')]
+            continue
+
+        # Comment 줄은 화면에 표시되지 않으므로 제외
+        if key != 'dialogue':
+            continue
+
+        # 마지막 필드(Text)에는 쉼표가 포함될 수 있으므로 필드 수만큼만 분할
+        values = value.split(',', len(fields) - 1)
+        if len(values) != len(fields):
+            continue
+
+        event = dict(zip(fields, values))
+        start_ms = parse_clock(event.get('start', ''))
+        end_ms = parse_clock(event.get('end', ''))
+        if start_ms is None or end_ms is None:
+            continue
+
+        cue_text = _clean_ass_text(event.get('text', ''))
+        if cue_text:
+            yield Cue(start_ms, end_ms, cue_text)
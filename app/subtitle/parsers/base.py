@@ -0,0 +1,73 @@
+"""
+자막 파서 공통 모듈
+
+모든 포맷 파서가 반환하는 Cue 타입과 텍스트 정리 함수를 정의합니다.
+"""
+
+import html
+import re
+from typing import NamedTuple, Optional
+
+# HTML/SMI 태그 제거용 정규식
+_TAG_RE = re.compile(r'<[^>]*>')
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_SPACE_RE = re.compile(r'[ \t\u00a0]+')
+
+
+class Cue(NamedTuple):
+    """자막 큐 (시간은 밀리초, lang이 None이면 파일 기본 언어 사용)"""
+    start_ms: int
+    end_ms: int
+    text: str
+    lang: Optional[str] = None
+
+
+def clean_cue_text(text: str) -> str:
+    """
+    자막 텍스트에서 태그와 HTML 엔티티를 정리
+
+    Args:
+        text: 원본 자막 텍스트
+
+    Returns:
+        str: 태그가 제거되고 공백이 정리된 텍스트
+    """
+    if '<' in text:
+        text = _BR_RE.sub('\n', text)
+        text = _TAG_RE.sub('', text)
+    if '&' in text:
+        text = html.unescape(text)
+
+    lines = (_SPACE_RE.sub(' ', line).strip() for line in text.splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def parse_clock(value: str) -> Optional[int]:
+    """
+    시각 문자열을 밀리초로 변환
+
+    HH:MM:SS,mmm / HH:MM:SS.mmm / MM:SS.mmm / H:MM:SS.cc(ASS) 형식을 지원합니다.
+
+    Args:
+        value: 시각 문자열
+
+    Returns:
+        Optional[int]: 밀리초 (형식이 잘못되면 None)
+    """
+    value = value.strip().replace(',', '.')
+    clock, _, fraction = value.partition('.')
+    parts = clock.split(':')
+
+    try:
+        if len(parts) == 3:
+            hours, minutes, seconds = int(parts[0]), int(parts[1]), int(parts[2])
+        elif len(parts) == 2:
+            hours, minutes, seconds = 0, int(parts[0]), int(parts[1])
+        else:
+            return None
+
+        # 소수부 자릿수에 맞춰 밀리초로 변환 (ASS는 1/100초)
+        fraction = (fraction + '000')[:3] if fraction else '000'
+        return (hours * 3600 + minutes * 60 + seconds) * 1000 + int(fraction)
+    except ValueError:
+        return None
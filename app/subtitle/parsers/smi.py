@@ -0,0 +1,104 @@
+"""
+SAMI(SMI) 자막 파서 모듈
+
+<SYNC> 블록을 한 번만 순회하면서 <P Class=...> 별로 큐를 나누어 언어별 큐 스트림을 만듭니다.
+클래스의 언어는 <STYLE> 블록의 lang 속성으로 정하고, 없으면 ENCC/KRCC 등 관례 이름을 사용합니다.
+"""
+
+import re
+from typing import Dict, Iterator, Optional, Tuple
+
+from app.subtitle.parsers.base import Cue, clean_cue_text
+
+_SYNC_RE = re.compile(r'<sync\b[^>]*?start\s*=\s*["\']?(\d+)[^>]*>', re.IGNORECASE)
+_P_RE = re.compile(r'<p\b([^>]*)>', re.IGNORECASE)
+_CLASS_RE = re.compile(r'class\s*=\s*["\']?([\w-]+)', re.IGNORECASE)
+_STYLE_RE = re.compile(r'<style\b[^>]*>(.*?)</style>', re.IGNORECASE | re.DOTALL)
+_STYLE_CLASS_RE = re.compile(r'\.([\w-]+)\s*\{([^}]*)\}')
+_STYLE_LANG_RE = re.compile(r'lang\s*:\s*([\w-]+)', re.IGNORECASE)
+_BODY_END_RE = re.compile(r'</body\s*>|</sami\s*>', re.IGNORECASE)
+
+# 스타일 정의가 없을 때 사용할 관례적인 클래스 이름 → 언어 코드
+DEFAULT_CLASS_LANGS = {
+    'encc': 'en', 'egcc': 'en', 'uscc': 'en',
+    'krcc': 'ko', 'kocc': 'ko',
+    'jpcc': 'ja', 'jacc': 'ja',
+    'cncc': 'zh', 'zhcc': 'zh',
+}
+
+# SYNC 블록의 마지막 큐 길이 (다음 SYNC가 없는 경우)
+LAST_CUE_DURATION_MS = 5000
+
+
+def _class_langs(text: str) -> Dict[str, str]:
+    """<STYLE> 블록에서 클래스별 언어 코드 추출 ('en-US' → 'en')"""
+    langs = dict(DEFAULT_CLASS_LANGS)
+
+    style = _STYLE_RE.search(text)
+    if style:
+        for name, body in _STYLE_CLASS_RE.findall(style.group(1)):
+            lang = _STYLE_LANG_RE.search(body)
+            if lang:
+                langs[name.lower()] = lang.group(1).split('-')[0].lower()
+
+    return langs
+
+
+def _split_paragraphs(block: str) -> Iterator[Tuple[Optional[str], str]]:
+    """SYNC 블록 내용을 (클래스 이름, 텍스트) 단위로 분할"""
+    matches = list(_P_RE.finditer(block))
+
+    if not matches:
+        yield None, block
+        return
+
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(block)
+        class_match = _CLASS_RE.search(match.group(1))
+        name = class_match.group(1).lower() if class_match else None
+        yield name, block[match.end():end]
+
+
+def iter_smi_cues(text: str) -> Iterator[Cue]:
+    """
+    SMI 자막 큐 순회 (언어별로 분리된 큐를 한 번의 순회로 생성)
+
+    각 클래스의 큐는 같은 클래스의 다음 SYNC(빈 &nbsp; 포함)가 시작될 때 끝납니다.
+
+    Args:
+        text: 디코딩된 자막 텍스트
+
+    Returns:
+        Iterator[Cue]: lang이 지정된 자막 큐
+    """
+    langs = _class_langs(text)
+
+    # 클래스별 아직 끝나지 않은 큐: 클래스 이름 → (시작 시간, 텍스트)
+    pending: Dict[Optional[str], Tuple[int, str]] = {}
+
+    body_end = _BODY_END_RE.search(text)
+    text_end = body_end.start() if body_end else len(text)
+
+    syncs = _SYNC_RE.finditer(text, 0, text_end)
+    current = next(syncs, None)
+
+    while current is not None:
+        following = next(syncs, None)
+        start_ms = int(current.group(1))
+        block = text[current.end():following.start() if following else text_end]
+
+        for name, raw in _split_paragraphs(block):
+            previous = pending.pop(name, None)
+            if previous and previous[0] < start_ms:
+                yield Cue(previous[0], start_ms, previous[1], langs.get(name))
+
+            # SMI의 원본 줄바꿈은 의미가 없고 <br>만 줄바꿈으로 취급
+            cue_text = clean_cue_text(raw.replace('\r', ' ').replace('\n', ' '))
+            if cue_text:
+                pending[name] = (start_ms, cue_text)
+
+        current = following
+
+    # 종료 SYNC가 없는 마지막 큐
+    for name, (start_ms, cue_text) in pending.items():
+        yield Cue(start_ms, start_ms + LAST_CUE_DURATION_MS, cue_text, langs.get(name))
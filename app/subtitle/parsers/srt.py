@@ -0,0 +1,68 @@
+"""
+SRT 자막 파서 모듈
+
+블록 단위로 한 줄씩 읽으면서 큐를 바로 생성하는 스트리밍 파서입니다.
+"""
+
+import io
+from typing import Iterator, List, Optional
+
+from app.subtitle.parsers.base import Cue, clean_cue_text, parse_clock
+
+
+def _parse_timing(line: str):
+    """'00:00:01,000 --> 00:00:02,000' 형식의 시간 줄 파싱"""
+    start_text, _, end_text = line.partition('-->')
+    start_ms = parse_clock(start_text)
+    # 종료 시간 뒤의 좌표 정보(X1:... 등)는 무시
+    end_ms = parse_clock(end_text.split()[0]) if end_text.strip() else None
+    return start_ms, end_ms
+
+
+def iter_srt_cues(text: str) -> Iterator[Cue]:
+    """
+    SRT 자막 큐 순회
+
+    Args:
+        text: 디코딩된 자막 텍스트
+
+    Returns:
+        Iterator[Cue]: 자막 큐
+    """
+    start_ms: Optional[int] = None
+    end_ms: Optional[int] = None
+    text_lines: List[str] = []
+
+    for line in io.StringIO(text):
+        line = line.rstrip('\r\n')
+
+        if '-->' in line:
+            # 빈 줄 없이 다음 큐가 시작된 경우: 직전 줄은 번호이므로 제외하고 내보냄
+            if start_ms is not None and text_lines:
+                if text_lines[-1].strip().isdigit():
+                    text_lines.pop()
+                cue_text = clean_cue_text('\n'.join(text_lines))
+                if cue_text:
+                    yield Cue(start_ms, end_ms, cue_text)
+
+            start_ms, end_ms = _parse_timing(line)
+            if end_ms is None:
+                start_ms = None
+            text_lines = []
+            continue
+
+        if start_ms is None:
+            continue
+
+        if line.strip():
+            text_lines.append(line)
+        elif text_lines:
+            cue_text = clean_cue_text('\n'.join(text_lines))
+            if cue_text:
+                yield Cue(start_ms, end_ms, cue_text)
+            start_ms, end_ms, text_lines = None, None, []
+
+    if start_ms is not None and text_lines:
+        cue_text = clean_cue_text('\n'.join(text_lines))
+        if cue_text:
+            yield Cue(start_ms, end_ms, cue_text)
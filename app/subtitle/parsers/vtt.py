@@ -0,0 +1,67 @@
+"""
+WebVTT 자막 파서 모듈
+
+NOTE, STYLE, REGION 블록은 건너뛰고 큐 블록만 한 줄씩 읽어 생성하는 스트리밍 파서입니다.
+"""
+
+import io
+from typing import Iterator, List, Optional
+
+from app.subtitle.parsers.base import Cue, clean_cue_text, parse_clock
+
+# 큐가 아닌 블록의 시작 키워드
+_SKIP_BLOCKS = ('NOTE', 'STYLE', 'REGION')
+
+
+def iter_vtt_cues(text: str) -> Iterator[Cue]:
+    """
+    WebVTT 자막 큐 순회
+
+    Args:
+        text: 디코딩된 자막 텍스트
+
+    Returns:
+        Iterator[Cue]: 자막 큐
+    """
+    start_ms: Optional[int] = None
+    end_ms: Optional[int] = None
+    text_lines: List[str] = []
+    skipping = False
+
+    for line in io.StringIO(text):
+        line = line.rstrip('\r\n')
+        stripped = line.strip()
+
+        if not stripped:
+            if start_ms is not None and text_lines:
+                cue_text = clean_cue_text('\n'.join(text_lines))
+                if cue_text:
+                    yield Cue(start_ms, end_ms, cue_text)
+            start_ms, end_ms, text_lines = None, None, []
+            skipping = False
+            continue
+
+        if skipping:
+            continue
+
+        if start_ms is None:
+            if '-->' in line:
+                start_text, _, rest = line.partition('-->')
+                # 종료 시간 뒤의 큐 설정(align:start 등)은 무시
+                rest = rest.split()
+                start_ms = parse_clock(start_text)
+                end_ms = parse_clock(rest[0]) if rest else None
+                if start_ms is None or end_ms is None:
+                    start_ms, end_ms = None, None
+                    skipping = True
+            elif stripped.startswith(_SKIP_BLOCKS) or stripped.startswith('WEBVTT'):
+                skipping = True
+            # 그 외는 큐 식별자 줄이므로 무시
+            continue
+
+        text_lines.append(line)
+
+    if start_ms is not None and text_lines:
+        cue_text = clean_cue_text('\n'.join(text_lines))
+        if cue_text:
+            yield Cue(start_ms, end_ms, cue_text)
@@ -0,0 +1,76 @@
+"""
+자막 문장 재구성 모듈
+
+여러 큐에 걸쳐 나뉜 문장("I don't think / we should go")을 문장 부호와
+큐 사이 시간 간격을 기준으로 하나의 문장으로 합칩니다.
+각 문장은 첫 큐와 마지막 큐의 위치를 함께 반환하므로 원래 큐로 되돌아갈 수 있습니다.
+"""
+
+import re
+from typing import Iterable, Iterator, NamedTuple, Optional, Tuple
+
+# 문장 병합 기준
+MAX_GAP_MS = 1500          # 큐 사이 간격이 이보다 크면 문장을 나눔
+MAX_SENTENCE_CUES = 8      # 한 문장에 합칠 최대 큐 수
+MAX_SENTENCE_LENGTH = 500  # 한 문장의 최대 글자 수
+
+# 문장 끝 (닫는 따옴표/괄호 허용)
+_SENTENCE_END_RE = re.compile(r'[.!?…。！？♪][\"\'”’)\]]*$')
+# 화자 전환 대시로 시작하는 큐는 새 문장
+_DIALOGUE_START_RE = re.compile(r'^[-–—]\s*')
+
+
+class Sentence(NamedTuple):
+    """재구성된 문장"""
+    first_index: int
+    last_index: int
+    start_ms: int
+    end_ms: int
+    text: str
+    lang: Optional[str] = None
+
+
+def iter_sentences(cues: Iterable[Tuple[int, int, str, Optional[str]]]) -> Iterator[Sentence]:
+    """
+    큐를 문장 단위로 병합
+
+    Args:
+        cues: (start_ms, end_ms, text, lang) 순서의 큐 목록 (CueBatch 그대로 사용 가능)
+
+    Yields:
+        Sentence: 첫/마지막 큐 위치, 시작/종료 시간, 문장 텍스트, 언어
+    """
+    parts = []
+    first_index = last_index = start_ms = end_ms = 0
+    lang = None
+    length = 0
+
+    for index, (cue_start, cue_end, text, cue_lang) in enumerate(cues):
+        text = ' '.join(text.split())
+        if not text:
+            continue
+
+        if parts and (
+            cue_start - end_ms > MAX_GAP_MS
+            or cue_lang != lang
+            or len(parts) >= MAX_SENTENCE_CUES
+            or length + len(text) > MAX_SENTENCE_LENGTH
+            or _DIALOGUE_START_RE.match(text)
+        ):
+            yield Sentence(first_index, last_index, start_ms, end_ms, ' '.join(parts), lang)
+            parts = []
+
+        if not parts:
+            first_index, start_ms, end_ms, lang, length = index, cue_start, cue_end, cue_lang, 0
+
+        parts.append(text)
+        last_index = index
+        end_ms = max(end_ms, cue_end)
+        length += len(text) + 1
+
+        if _SENTENCE_END_RE.search(text):
+            yield Sentence(first_index, last_index, start_ms, end_ms, ' '.join(parts), lang)
+            parts = []
+
+    if parts:
+        yield Sentence(first_index, last_index, start_ms, end_ms, ' '.join(parts), lang)
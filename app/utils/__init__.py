@@ -8,6 +8,7 @@
 from .helpers import (
     time_to_ms,
     ms_to_timestamp,
+    ms_to_srt_timestamp,
     timestamp_to_ms,
     remove_html_tags,
     detect_encoding,
@@ -49,7 +50,7 @@ from .logging import (
 
 __all__ = [
     # helpers
-    'time_to_ms', 'ms_to_timestamp', 'timestamp_to_ms',
+    'time_to_ms', 'ms_to_timestamp', 'ms_to_srt_timestamp', 'timestamp_to_ms',
     'remove_html_tags', 'detect_encoding', 'is_english_subtitle',
     'get_file_extension', 'get_file_name', 'get_relative_path',
     'get_media_paths', 'format_bytes', 'format_time_duration',
@@ -21,7 +21,7 @@ DEFAULT_MIN_ENGLISH_RATIO = 0.2
 
 # 인덱싱 관련 상수
 DEFAULT_MAX_THREADS = 8
-DEFAULT_INDEXING_STRATEGY = "standard"  # 'standard', 'batch', 'parallel', 'delayed_language'
+DEFAULT_INDEXING_STRATEGY = "standard"  # 설정 호환용 (인덱싱은 항상 단계별 파이프라인으로 실행)
 MAX_LOG_ENTRIES = 100
 INDEXING_STATUS_FILE = "indexing_status.json"
 
@@ -44,6 +44,19 @@ def ms_to_timestamp(ms: int) -> str:
     return f"{hours:02}:{minutes:02}:{seconds:02}.{milliseconds:03}"
 
 
+def ms_to_srt_timestamp(ms: int) -> str:
+    """
+    밀리초를 SRT 형식(HH:MM:SS,mmm)의 타임스탬프로 변환
+    
+    Args:
+        ms: 밀리초 단위의 시간
+        
+    Returns:
+        str: HH:MM:SS,mmm 형식의 타임스탬프
+    """
+    return ms_to_timestamp(ms).replace('.', ',')
+
+
 def timestamp_to_ms(timestamp: str) -> int:
     """
     HH:MM:SS.mmm 형식의 타임스탬프를 밀리초로 변환
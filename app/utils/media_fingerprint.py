@@ -0,0 +1,70 @@
+"""
+미디어 파일 식별 모듈
+
+같은 미디어가 여러 경로에 있는지 판단하기 위한 값을 만듭니다.
+하드 링크는 (장치, inode)가 같고, 복사본은 크기와 파일 일부(앞/가운데/끝)를 샘플링한 해시가 같습니다.
+전체 파일을 읽지 않으므로 큰 동영상도 빠르게 비교할 수 있습니다.
+"""
+
+import os
+import hashlib
+from typing import Optional, Tuple
+
+# 샘플 하나의 크기 (바이트) - 앞/가운데/끝 세 곳을 읽음
+SAMPLE_BYTES = 64 * 1024
+
+# SQLite INTEGER(부호 있는 64비트) 범위로 변환할 때 사용
+_INT64_LIMIT = 1 << 63
+
+
+def _to_signed64(value: int) -> int:
+    """부호 없는 64비트 값을 SQLite INTEGER에 저장할 수 있도록 변환"""
+    return value - (1 << 64) if value >= _INT64_LIMIT else value
+
+
+def file_identity(stat_result: os.stat_result) -> Tuple[int, int]:
+    """
+    파일의 (장치, inode) 식별값 (하드 링크는 같은 값)
+
+    Args:
+        stat_result: os.stat 결과
+
+    Returns:
+        Tuple[int, int]: (장치, inode) - SQLite에 저장 가능한 범위
+    """
+    return _to_signed64(stat_result.st_dev), _to_signed64(stat_result.st_ino)
+
+
+def sampled_fingerprint(path: str, size: Optional[int] = None, sample_bytes: int = SAMPLE_BYTES) -> Optional[str]:
+    """
+    파일 크기와 앞/가운데/끝 샘플의 해시
+
+    파일이 샘플 세 개보다 작으면 전체를 해시합니다.
+
+    Args:
+        path: 파일 경로
+        size: 파일 크기 (없으면 조회)
+        sample_bytes: 샘플 하나의 크기
+
+    Returns:
+        Optional[str]: 16진수 해시 (읽을 수 없으면 None)
+    """
+    try:
+        if size is None:
+            size = os.path.getsize(path)
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(size).encode("ascii"))
+
+        with open(path, "rb") as file:
+            if size <= sample_bytes * 3:
+                digest.update(file.read())
+            else:
+                for offset in (0, (size - sample_bytes) // 2, size - sample_bytes):
+                    file.seek(offset)
+                    digest.update(file.read(sample_bytes))
+
+        return digest.hexdigest()
+
+    except OSError:
+        return None
@@ -0,0 +1,173 @@
+"""
+미디어 파일 이름 메타데이터 모듈
+
+파일 이름과 상위 폴더 이름에서 작품 제목, 시즌, 에피소드, 연도, 해상도를 추출합니다.
+(예: "The.Office.S03E05.720p.mkv", "Friends 1x02.avi", "Heat (1995)/Heat.1080p.mkv",
+"The Office/Season 3/Episode 05.mkv")
+"""
+
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+# 추출 규칙이 바뀌면 올려서 기존 행을 다시 추출 (media_files.metadata_version)
+METADATA_VERSION = 1
+
+# 상위 폴더는 이 깊이까지만 확인
+_MAX_FOLDER_DEPTH = 3
+
+_SEASON_EPISODE_PATTERNS = [
+    re.compile(r"(?<![a-z0-9])s(\d{1,2})[ ._-]*e(\d{1,3})(?!\d)", re.IGNORECASE),
+    re.compile(r"(?<![a-z0-9])(\d{1,2})x(\d{2,3})(?!\d)", re.IGNORECASE),
+    re.compile(r"(?<![a-z0-9])season[ ._-]*(\d{1,2})[ ._-]*episode[ ._-]*(\d{1,3})(?!\d)", re.IGNORECASE),
+]
+_EPISODE_ONLY_PATTERN = re.compile(r"(?<![a-z0-9])(?:e|ep|episode)[ ._-]*(\d{1,3})(?!\d)", re.IGNORECASE)
+_SEASON_FOLDER_PATTERN = re.compile(r"^(?:season|series|s)[ ._-]*(\d{1,2})$", re.IGNORECASE)
+_YEAR_PATTERN = re.compile(r"[(\[]((?:19|20)\d{2})[)\]]|(?<![a-z0-9])((?:19|20)\d{2})(?![a-z0-9])", re.IGNORECASE)
+_RESOLUTION_PATTERN = re.compile(r"(?<![a-z0-9])(?:(\d{3,4})[pi]|(4k|uhd))(?![a-z0-9])", re.IGNORECASE)
+_TITLE_NOISE_PATTERN = re.compile(r"[._]+")
+_KEY_PATTERN = re.compile(r"[^0-9a-z가-힣]+")
+
+_RESOLUTION_ALIASES = {"4k": "2160p", "uhd": "2160p"}
+
+
+def normalize_title_key(title: Optional[str]) -> Optional[str]:
+    """
+    검색 비교용 제목 키 (소문자, 문자/숫자만 공백 하나로 연결)
+
+    Args:
+        title: 제목
+
+    Returns:
+        Optional[str]: 제목 키 (비어 있으면 None)
+    """
+    if not title:
+        return None
+    key = _KEY_PATTERN.sub(" ", title.lower()).strip()
+    return key or None
+
+
+def normalize_resolution(value: Optional[str]) -> Optional[str]:
+    """
+    해상도 표기 정리 (소문자, "4K"/"UHD"는 "2160p")
+
+    Args:
+        value: 해상도 표기
+
+    Returns:
+        Optional[str]: 정리된 해상도 (비어 있으면 None)
+    """
+    if not value:
+        return None
+    value = value.strip().lower()
+    return _RESOLUTION_ALIASES.get(value, value) or None
+
+
+def _clean_title(text: str) -> Optional[str]:
+    """
+    파일/폴더 이름 조각을 제목으로 정리 (점/밑줄을 공백으로, 끝의 구분 문자 제거)
+
+    Args:
+        text: 이름 조각
+
+    Returns:
+        Optional[str]: 제목 (비어 있으면 None)
+    """
+    text = _TITLE_NOISE_PATTERN.sub(" ", text)
+    text = re.sub(r"\s+", " ", text).strip(" -[](){}")
+    return text or None
+
+
+def _find_year(text: str) -> Optional[re.Match]:
+    """괄호로 감싼 연도를 우선으로 연도 찾기"""
+    matches = list(_YEAR_PATTERN.finditer(text))
+    for match in matches:
+        if match.group(1):
+            return match
+    return matches[0] if matches else None
+
+
+def _match_year(match: Optional[re.Match]) -> Optional[int]:
+    """연도 일치 결과를 정수로 변환"""
+    if not match:
+        return None
+    return int(match.group(1) or match.group(2))
+
+
+def parse_media_metadata(path: str) -> Dict[str, Any]:
+    """
+    미디어 경로에서 메타데이터 추출
+
+    파일 이름에 없는 정보(작품 제목, 시즌, 연도)는 가까운 상위 폴더 이름에서 찾습니다.
+
+    Args:
+        path: 미디어 파일 경로
+
+    Returns:
+        Dict[str, Any]: show_title, show_key, season, episode, year, resolution (찾지 못한 값은 None)
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    folders: List[str] = []
+    directory = os.path.dirname(path)
+    for _ in range(_MAX_FOLDER_DEPTH):
+        directory, name = os.path.split(directory)
+        if not name:
+            break
+        folders.append(name)
+
+    season = episode = None
+    title_end = None
+
+    for pattern in _SEASON_EPISODE_PATTERNS:
+        match = pattern.search(stem)
+        if match:
+            season, episode = int(match.group(1)), int(match.group(2))
+            title_end = match.start()
+            break
+
+    if episode is None:
+        match = _EPISODE_ONLY_PATTERN.search(stem)
+        if match:
+            episode = int(match.group(1))
+            title_end = match.start()
+
+    # 시즌 폴더 ("Season 3", "S03")
+    show_folders = []
+    for name in folders:
+        match = _SEASON_FOLDER_PATTERN.match(name.strip())
+        if match:
+            if season is None:
+                season = int(match.group(1))
+            continue
+        show_folders.append(name)
+
+    year_match = _find_year(stem)
+    year = _match_year(year_match)
+    if year_match and (title_end is None or year_match.start() < title_end):
+        title_end = year_match.start()
+
+    resolution = None
+    match = _RESOLUTION_PATTERN.search(stem)
+    if match:
+        resolution = normalize_resolution(match.group(0))
+        if title_end is None or match.start() < title_end:
+            title_end = match.start()
+
+    # 제목: 파일 이름의 표시(시즌/에피소드, 연도, 해상도) 앞부분, 비어 있으면 가까운 작품 폴더
+    title = _clean_title(stem[:title_end] if title_end is not None else stem)
+    if show_folders:
+        folder = show_folders[0]
+        folder_year = _find_year(folder)
+        if year is None:
+            year = _match_year(folder_year)
+        if not title:
+            title = _clean_title(folder[:folder_year.start()] if folder_year else folder)
+
+    return {
+        "show_title": title,
+        "show_key": normalize_title_key(title),
+        "season": season,
+        "episode": episode,
+        "year": year,
+        "resolution": resolution,
+    }
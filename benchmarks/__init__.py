@@ -0,0 +1,3 @@
+"""
+자막 수집 헬퍼 마이크로벤치마크 패키지
+"""
@@ -0,0 +1,83 @@
+"""
+지연 주입 가짜 파일 시스템 모듈
+
+NAS/외장 볼륨처럼 디렉토리 나열 한 번에 수 밀리초가 걸리는 환경을 로컬 디스크에서 재현합니다.
+실제 파일을 만들지 않고 메모리 안의 트리를 나열하며, 호출마다 time.sleep으로 왕복 지연을 흉내 냅니다.
+"""
+
+import os
+import time
+from typing import Dict, Iterable, List, Tuple
+
+from app.services.indexer.directory_index import DirectoryListing
+
+
+class FakeFilesystem:
+    """지연 주입 가짜 파일 시스템 클래스"""
+
+    def __init__(self, root: str = "/fake", depth: int = 3, fanout: int = 6,
+                 files_per_directory: int = 4, latency: float = 0.002):
+        """
+        가짜 트리 생성
+
+        Args:
+            root: 루트 경로
+            depth: 디렉토리 깊이
+            fanout: 디렉토리당 하위 디렉토리 수
+            files_per_directory: 디렉토리당 미디어 파일 수 (각각 같은 이름의 .srt 포함)
+            latency: 디렉토리 나열 한 번에 주입할 지연 (초)
+        """
+        self.root = root
+        self.latency = latency
+        self.tree: Dict[str, Tuple[List[str], List[str]]] = {}
+        self._build(root, depth, fanout, files_per_directory)
+
+    def _build(self, path: str, depth: int, fanout: int, files_per_directory: int) -> None:
+        """트리 생성 (디렉토리 경로 -> (하위 디렉토리 이름, 파일 이름))"""
+        subdirectories = [f"dir{index:02}" for index in range(fanout)] if depth > 0 else []
+        files = []
+        for index in range(files_per_directory):
+            files.append(f"episode{index:02}.mkv")
+            files.append(f"episode{index:02}.srt")
+        self.tree[path] = (subdirectories, files)
+
+        for name in subdirectories:
+            self._build(os.path.join(path, name), depth - 1, fanout, files_per_directory)
+
+    @property
+    def directory_count(self) -> int:
+        """디렉토리 수"""
+        return len(self.tree)
+
+    def list_directory(self, path: str, media_extensions: Iterable[str],
+                       subtitle_extensions: Iterable[str]) -> DirectoryListing:
+        """
+        directory_index.list_directory와 같은 형식으로 나열 (지연 포함)
+
+        Args:
+            path: 디렉토리 경로
+            media_extensions: 미디어 파일 확장자 목록
+            subtitle_extensions: 자막 파일 확장자 목록
+
+        Returns:
+            DirectoryListing: 디렉토리 목록
+        """
+        time.sleep(self.latency)
+
+        media_extensions = {ext.lower() for ext in media_extensions}
+        subtitle_extensions = {ext.lower() for ext in subtitle_extensions}
+
+        listing = DirectoryListing(path, 0.0)
+        subdirectories, files = self.tree.get(path, ([], []))
+
+        for filename in files:
+            stem, ext = os.path.splitext(filename)
+            if ext.lower() in media_extensions:
+                listing.media_files.append(os.path.join(path, filename))
+            if ext.lower() in subtitle_extensions:
+                listing.add_subtitle(filename, stem)
+
+        listing.subdirectories = sorted(os.path.join(path, name) for name in subdirectories)
+        listing.media_files.sort()
+        listing.subtitle_files.sort()
+        return listing
@@ -0,0 +1,148 @@
+"""
+벤치마크용 자막 픽스처 모듈
+
+실제 라이브러리에서 자주 보이는 SRT 형태를 같은 입력이면 항상 같은 결과가 나오도록 생성합니다.
+- multi_encoding: 같은 내용을 여러 인코딩(UTF-8, UTF-8 BOM, CP949, CP1252, UTF-16)으로 저장
+- tag_heavy: <font>, <i>, {\\an8} 같은 서식 태그가 많은 자막
+- huge: 큐가 아주 많은 긴 자막
+- malformed: 번호 누락, 잘못된 타임스탬프, 빈 큐, CRLF 혼용 등이 섞인 자막
+"""
+
+import os
+import random
+from typing import Dict, List, Tuple
+
+# 픽스처 크기 (큐 수)
+SMALL_CUES = 300
+HUGE_CUES = 20000
+
+_ENGLISH_LINES = [
+    "I don't think we should go.",
+    "Where were you last night?",
+    "- Wait for me!",
+    "It's not what it looks like...",
+    "We need to talk about the money.",
+    "Are you out of your mind?",
+]
+
+_KOREAN_LINES = [
+    "가지 않는 게 좋겠어.",
+    "어젯밤에 어디 있었어?",
+    "기다려!",
+    "보이는 것과 달라...",
+]
+
+
+def _timestamp(ms: int) -> str:
+    """밀리초를 SRT 타임스탬프로 변환"""
+    seconds, milliseconds = divmod(ms, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02}:{minutes:02}:{seconds:02},{milliseconds:03}"
+
+
+def build_srt(cue_count: int, seed: int = 0, tags: bool = False, korean: bool = False) -> str:
+    """
+    SRT 텍스트 생성
+
+    Args:
+        cue_count: 큐 수
+        seed: 난수 시드
+        tags: 서식 태그 포함 여부
+        korean: 한국어 줄 포함 여부
+
+    Returns:
+        str: SRT 텍스트
+    """
+    rng = random.Random(seed)
+    blocks = []
+    start = 1000
+
+    for index in range(1, cue_count + 1):
+        end = start + rng.randint(800, 4000)
+        lines = [rng.choice(_ENGLISH_LINES)]
+        if korean:
+            lines.append(rng.choice(_KOREAN_LINES))
+        if rng.random() < 0.3:
+            lines.append(rng.choice(_ENGLISH_LINES))
+
+        if tags:
+            lines = [
+                f'{{\\an8}}<font color="#ffff00"><i>{line}</i></font>' if rng.random() < 0.5
+                else f'<b>{line}</b><br>&amp; more'
+                for line in lines
+            ]
+
+        blocks.append(f"{index}\n{_timestamp(start)} --> {_timestamp(end)}\n" + "\n".join(lines) + "\n")
+        start = end + rng.randint(50, 1500)
+
+    return "\n".join(blocks)
+
+
+def build_malformed_srt(cue_count: int, seed: int = 0) -> str:
+    """
+    형식이 어긋난 SRT 텍스트 생성
+
+    Args:
+        cue_count: 큐 수
+        seed: 난수 시드
+
+    Returns:
+        str: SRT 텍스트 (CRLF 혼용)
+    """
+    rng = random.Random(seed)
+    blocks = []
+
+    for block in build_srt(cue_count, seed).split("\n\n"):
+        roll = rng.random()
+        lines = block.split("\n")
+        if roll < 0.1:
+            lines = lines[1:]                                   # 번호 누락
+        elif roll < 0.2:
+            lines[1] = lines[1].replace(",", ".")               # 쉼표 대신 점
+        elif roll < 0.25:
+            lines[1] = "00:00:xx,000 --> 00:00:01,000"          # 잘못된 타임스탬프
+        elif roll < 0.3:
+            lines = lines[:2]                                   # 빈 큐
+        separator = "\r\n" if rng.random() < 0.5 else "\n"
+        blocks.append(separator.join(lines))
+
+    return "\n\n\n".join(blocks)
+
+
+def build_corpus(directory: str) -> Dict[str, List[str]]:
+    """
+    픽스처 파일 생성
+
+    Args:
+        directory: 파일을 저장할 디렉토리
+
+    Returns:
+        Dict[str, List[str]]: 픽스처 종류별 파일 경로 목록
+    """
+    os.makedirs(directory, exist_ok=True)
+    corpus: Dict[str, List[str]] = {}
+
+    def write(kind: str, name: str, data: bytes) -> None:
+        path = os.path.join(directory, name)
+        with open(path, 'wb') as file:
+            file.write(data)
+        corpus.setdefault(kind, []).append(path)
+
+    english = build_srt(SMALL_CUES, seed=1)
+    korean = build_srt(SMALL_CUES, seed=2, korean=True)
+    encodings: List[Tuple[str, str, str]] = [
+        ("utf8.srt", english, 'utf-8'),
+        ("utf8_bom.srt", english, 'utf-8-sig'),
+        ("cp949.srt", korean, 'cp949'),
+        ("cp1252.srt", english.replace("'", "’"), 'cp1252'),
+        ("utf16.srt", korean, 'utf-16'),
+    ]
+    for name, text, encoding in encodings:
+        write("multi_encoding", name, text.encode(encoding))
+
+    write("tag_heavy", "tags.srt", build_srt(SMALL_CUES, seed=3, tags=True).encode('utf-8'))
+    write("huge", "huge.srt", build_srt(HUGE_CUES, seed=4).encode('utf-8'))
+    write("malformed", "malformed.srt", build_malformed_srt(SMALL_CUES, seed=5).encode('utf-8'))
+
+    return corpus
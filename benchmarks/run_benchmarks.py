@@ -0,0 +1,351 @@
+#!/usr/bin/env python
+"""
+자막 수집(ingestion) 헬퍼 마이크로벤치마크 스크립트
+
+픽스처 자막(다중 인코딩, 태그 과다, 대용량, 형식 오류)을 생성한 뒤 헬퍼별 초당 처리량(ops/sec)과
+호출당 메모리 할당량(tracemalloc 최대 사용량)을 측정합니다.
+디렉토리 순회는 지연을 주입한 가짜 파일 시스템(benchmarks/fake_fs.py)으로 측정하므로 로컬 디스크에서도
+네트워크 볼륨과 비슷한 순차/동시 나열 차이를 볼 수 있습니다.
+기준값(baseline)과 비교하여 처리량이 허용 비율 이상 떨어지면 종료 코드 1을 반환합니다.
+
+사용 예:
+    python benchmarks/run_benchmarks.py --save-baseline      # 현재 결과를 기준값으로 저장
+    python benchmarks/run_benchmarks.py --threshold 0.15     # 기준값 대비 15% 이상 느려지면 실패
+    python benchmarks/run_benchmarks.py --only parse          # 이름에 'parse'가 들어간 항목만 실행
+
+기준값은 실행 환경(CPU, Python 버전)에 따라 다르므로 같은 머신에서 저장한 값과 비교해야 합니다.
+앱 모듈을 불러올 때 만들어지는 데이터베이스, 로그(logs/), 인덱싱 상태 파일은 임시 디렉토리에 생성되므로
+개발 환경의 media_index.db와 로그 파일은 바뀌지 않습니다.
+"""
+
+import os
+import sys
+import json
+import timeit
+import argparse
+import tempfile
+import tracemalloc
+from collections import namedtuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 모듈 검색 경로에 추가 (스크립트로 직접 실행하는 경우)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.fixtures import build_corpus
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.2   # 기준값 대비 허용 처리량 감소 비율
+REPEAT = 5                # 측정 반복 횟수 (최솟값 사용)
+TRAVERSAL_LATENCY = 0.002 # 가짜 파일 시스템의 디렉토리 나열 지연 (초, 네트워크 볼륨 흉내)
+
+# time_to_ms 입력용 (pysrt.SubRipTime과 같은 속성)
+_SrtTime = namedtuple("_SrtTime", "hours minutes seconds milliseconds")
+
+# (이름, 준비 함수) - 준비 함수는 (측정 함수, 한 번 호출당 처리 단위 수)를 반환
+Benchmark = Tuple[str, Callable[[Dict[str, List[str]]], Tuple[Callable[[], Any], int]]]
+
+
+def _read(path: str) -> bytes:
+    """파일 전체 읽기"""
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+def _raw_cue_lines(corpus: Dict[str, List[str]], kind: str) -> List[str]:
+    """픽스처에서 번호/타임스탬프 줄을 뺀 원본 자막 줄 추출"""
+    lines = []
+    for path in corpus[kind]:
+        for line in _read(path).decode('utf-8', 'replace').splitlines():
+            if line and not line.isdigit() and '-->' not in line:
+                lines.append(line)
+    return lines
+
+
+def _setup_time_to_ms(corpus):
+    from app.utils.helpers import time_to_ms
+    times = [_SrtTime(h, m, s, ms) for h in range(2) for m in range(0, 60, 7) for s in range(0, 60, 11) for ms in (0, 500)]
+    return (lambda: [time_to_ms(t) for t in times]), len(times)
+
+
+def _setup_remove_html_tags(corpus):
+    from app.utils.helpers import remove_html_tags
+    lines = _raw_cue_lines(corpus, "tag_heavy")
+    return (lambda: [remove_html_tags(line) for line in lines]), len(lines)
+
+
+def _setup_is_english_subtitle(corpus):
+    from app.utils.helpers import is_english_subtitle
+    lines = _raw_cue_lines(corpus, "multi_encoding")[:2000]
+    return (lambda: [is_english_subtitle(line) for line in lines]), len(lines)
+
+
+def _setup_detect_encoding(corpus):
+    from app.utils.helpers import detect_encoding
+    paths = corpus["multi_encoding"]
+    return (lambda: [detect_encoding(path) for path in paths]), len(paths)
+
+
+def _setup_clean_cue_text(corpus):
+    from app.subtitle.parsers import clean_cue_text
+    lines = _raw_cue_lines(corpus, "tag_heavy")
+    return (lambda: [clean_cue_text(line) for line in lines]), len(lines)
+
+
+def _setup_decode_subtitle_bytes(corpus):
+    from app.subtitle.encodings import decode_subtitle_bytes
+    raws = [_read(path) for path in corpus["multi_encoding"]]
+    return (lambda: [decode_subtitle_bytes(raw) for raw in raws]), len(raws)
+
+
+def _count_cues(paths: List[str]) -> int:
+    """픽스처 파일의 원본 큐 수 (중복 제거 전)"""
+    from app.subtitle.encodings import decode_subtitle_bytes
+    from app.subtitle.parsers import iter_cues
+    return sum(1 for path in paths for _ in iter_cues(decode_subtitle_bytes(_read(path))[0], path))
+
+
+def _setup_iter_cues(kind: str):
+    """큐 단위 루프(파싱 + 태그 제거) 측정 - 처리 단위는 큐 수"""
+    def setup(corpus):
+        from app.subtitle.encodings import decode_subtitle_bytes
+        from app.subtitle.parsers import iter_cues
+        texts = [(decode_subtitle_bytes(_read(path))[0], path) for path in corpus[kind]]
+        return (lambda: [list(iter_cues(text, path)) for text, path in texts]), max(_count_cues(corpus[kind]), 1)
+    return setup
+
+
+def _setup_parse_subtitle_file(kind: str):
+    """파일 단위 전체 경로(읽기 → 디코딩 → 파싱 → 언어 판별) 측정 - 처리 단위는 원본 큐 수"""
+    def setup(corpus):
+        from app.subtitle.cue_parser import parse_subtitle_file
+        paths = corpus[kind]
+        return (lambda: [parse_subtitle_file(path) for path in paths]), max(_count_cues(paths), 1)
+    return setup
+
+
+def _setup_iter_sentences(corpus):
+    from app.subtitle.cue_parser import parse_subtitle_file
+    from app.subtitle.sentences import iter_sentences
+    batch = parse_subtitle_file(corpus["huge"][0])
+    return (lambda: list(iter_sentences(batch))), len(batch)
+
+
+def _setup_traversal(workers: int):
+    """지연 주입 가짜 파일 시스템 순회 측정 - 처리 단위는 디렉토리 수"""
+    def setup(corpus):
+        from benchmarks.fake_fs import FakeFilesystem
+        from app.services.indexer.directory_index import (
+            iter_directory_listings, iter_directory_listings_concurrent
+        )
+        fs = FakeFilesystem(latency=TRAVERSAL_LATENCY)
+
+        if workers <= 1:
+            def func():
+                return list(iter_directory_listings(fs.root, [".mkv"], [".srt"], list_func=fs.list_directory))
+        else:
+            def func():
+                return list(iter_directory_listings_concurrent(fs.root, [".mkv"], [".srt"],
+                                                               list_func=fs.list_directory, max_workers=workers))
+        return func, fs.directory_count
+    return setup
+
+
+BENCHMARKS: List[Benchmark] = [
+    ("helpers.time_to_ms", _setup_time_to_ms),
+    ("helpers.remove_html_tags", _setup_remove_html_tags),
+    ("helpers.is_english_subtitle", _setup_is_english_subtitle),
+    ("helpers.detect_encoding", _setup_detect_encoding),
+    ("parsers.clean_cue_text", _setup_clean_cue_text),
+    ("encodings.decode_subtitle_bytes", _setup_decode_subtitle_bytes),
+    ("parsers.iter_cues[multi_encoding]", _setup_iter_cues("multi_encoding")),
+    ("parsers.iter_cues[tag_heavy]", _setup_iter_cues("tag_heavy")),
+    ("parsers.iter_cues[huge]", _setup_iter_cues("huge")),
+    ("parsers.iter_cues[malformed]", _setup_iter_cues("malformed")),
+    ("cue_parser.parse_subtitle_file[multi_encoding]", _setup_parse_subtitle_file("multi_encoding")),
+    ("cue_parser.parse_subtitle_file[huge]", _setup_parse_subtitle_file("huge")),
+    ("cue_parser.parse_subtitle_file[malformed]", _setup_parse_subtitle_file("malformed")),
+    ("sentences.iter_sentences[huge]", _setup_iter_sentences),
+    ("directory_index.traverse[sequential]", _setup_traversal(1)),
+    ("directory_index.traverse[concurrent x8]", _setup_traversal(8)),
+    ("directory_index.traverse[concurrent x32]", _setup_traversal(32)),
+]
+
+
+def measure(func: Callable[[], Any], units: int) -> Dict[str, float]:
+    """
+    처리량과 메모리 할당량 측정
+
+    Args:
+        func: 측정할 함수 (한 번 호출에 units개 처리)
+        units: 한 번 호출당 처리 단위 수
+
+    Returns:
+        Dict[str, float]: ops_per_sec, bytes_per_op
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=REPEAT, number=number))
+
+    tracemalloc.start()
+    try:
+        baseline_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ops_per_sec": round(units * number / best, 1),
+        "bytes_per_op": round(max(peak - baseline_bytes, 0) / units, 1),
+    }
+
+
+def _isolate_runtime_files(directory: str) -> None:
+    """
+    앱 모듈이 만드는 실행 파일을 임시 디렉토리로 돌림 (앱 모듈을 불러오기 전에 호출)
+
+    로그와 인덱싱 상태 파일은 작업 디렉토리 기준 상대 경로이므로 작업 디렉토리를 옮기고,
+    데이터베이스는 설정의 db_path를 임시 경로로 덮어씁니다 (설정 파일에는 저장하지 않음).
+
+    Args:
+        directory: 임시 실행 디렉토리
+    """
+    os.makedirs(directory, exist_ok=True)
+    os.chdir(directory)
+
+    from app.config import config
+    config.data["db_path"] = os.path.join(directory, "benchmark.db")
+
+
+def run(only: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    벤치마크 실행
+
+    Args:
+        only: 이름에 이 문자열이 포함된 항목만 실행 (None이면 전체)
+
+    Returns:
+        Dict[str, Dict[str, Any]]: 항목별 측정 결과 (실행할 수 없는 항목은 skipped 사유 포함)
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    working_dir = os.getcwd()
+
+    with tempfile.TemporaryDirectory(prefix="subtitle_bench_") as directory:
+        try:
+            _isolate_runtime_files(os.path.join(directory, "runtime"))
+            corpus = build_corpus(os.path.join(directory, "corpus"))
+
+            for name, setup in BENCHMARKS:
+                if only and only not in name:
+                    continue
+
+                try:
+                    func, units = setup(corpus)
+                except ImportError as e:
+                    # 선택 의존성(chardet, bs4 등)이 없는 환경
+                    results[name] = {"skipped": f"의존성 없음: {e}"}
+                    continue
+
+                results[name] = measure(func, units)
+        finally:
+            os.chdir(working_dir)
+
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            threshold: float) -> List[str]:
+    """
+    기준값 대비 처리량 감소 확인
+
+    Args:
+        results: 현재 측정 결과
+        baseline: 기준값
+        threshold: 허용 처리량 감소 비율 (0.2 = 20%)
+
+    Returns:
+        List[str]: 허용 범위를 넘은 항목 설명 목록
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference or "ops_per_sec" not in result or "ops_per_sec" not in reference:
+            continue
+
+        change = result["ops_per_sec"] / reference["ops_per_sec"] - 1
+        result["change"] = round(change, 3)
+        if change < -threshold:
+            regressions.append(
+                f"{name}: {reference['ops_per_sec']:.1f} → {result['ops_per_sec']:.1f} ops/sec ({change:+.1%})"
+            )
+    return regressions
+
+
+def print_results(results: Dict[str, Dict[str, Any]]) -> None:
+    """측정 결과 표 출력"""
+    print(f"{'benchmark':<50} {'ops/sec':>14} {'bytes/op':>12} {'change':>9}")
+    print("-" * 88)
+    for name, result in results.items():
+        if "skipped" in result:
+            print(f"{name:<50} {'skipped':>14}  {result['skipped']}")
+            continue
+        change = f"{result['change']:+.1%}" if "change" in result else ""
+        print(f"{name:<50} {result['ops_per_sec']:>14,.1f} {result['bytes_per_op']:>12,.1f} {change:>9}")
+
+
+def main() -> int:
+    """
+    명령줄 진입점
+
+    Returns:
+        int: 종료 코드 (처리량 감소가 허용 범위를 넘으면 1)
+    """
+    parser = argparse.ArgumentParser(description="자막 수집 헬퍼 마이크로벤치마크")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준값 JSON 파일 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="현재 결과를 기준값으로 저장")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="허용 처리량 감소 비율 (기본값: 0.2 = 20%%)")
+    parser.add_argument("--only", help="이름에 이 문자열이 포함된 항목만 실행")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    results = run(args.only)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r', encoding='utf-8') as file:
+                baseline = json.load(file)
+        baseline.update({name: result for name, result in results.items() if "ops_per_sec" in result})
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(baseline, file, indent=2, ensure_ascii=False, sort_keys=True)
+        print_results(results)
+        print(f"\n기준값 저장: {args.baseline}")
+        return 0
+
+    regressions = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            regressions = compare(results, json.load(file), args.threshold)
+    else:
+        print(f"기준값 파일이 없습니다: {args.baseline} (--save-baseline으로 생성)\n")
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        print_results(results)
+
+    if regressions:
+        print(f"\n처리량 감소가 허용 범위({args.threshold:.0%})를 넘었습니다:")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())